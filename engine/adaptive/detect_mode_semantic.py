@@ -0,0 +1,329 @@
+# engine/adaptive/detect_mode_semantic.py
+# Owlume — Offline semantic mode detector (adaptive layer)
+#
+# CPU-only "embedding" path for mode detection, built from
+# data/mode_detector_seed.json — no network, no model download:
+#
+#   1) Every mode's prototypes (+ description and lexicon) are vectorized
+#      once with hashed TF-IDF over word unigrams/bigrams and char 3–5-grams.
+#   2) IDF + per-mode L2-normalized centroids are saved as one .npy
+#      (features × [idf | modes]) keyed by a hash of the seed, then
+#      memory-mapped on every later load.
+#   3) A batch of texts is scored in one vectorized sparse × dense product
+#      (gather the centroid rows of every feature, reduce per text) and
+#      softmaxed into per-mode probabilities.
+#   4) Scores are fused with rule (lexicon) scores using the seed's
+#      fusion_weights; components that are absent are renormalized away.
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import os
+import re
+import sys
+import unicodedata
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.stemmer import StemLexicon, stem  # noqa: E402
+from src.text_features import tokenize  # noqa: E402
+
+SEED_PATH = ROOT / "data" / "mode_detector_seed.json"
+CACHE_DIR = ROOT / "data" / "runtime" / "semantic"
+
+N_FEATURES = 2 ** 18
+CHAR_NGRAMS = (3, 5)
+TEMPERATURE = 0.05  # softmax temperature over cosine similarities
+_VECTORIZER_VERSION = "hashed-tfidf-v1"
+
+# distinct crc32 start values keep the three feature families apart
+_SEED_WORD, _SEED_BIGRAM, _SEED_CHAR = 0x5EED, 0xB16A, 0xC4A2
+_WORD_RE = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+
+
+def _normalize(text: str) -> str:
+    return unicodedata.normalize("NFKC", text or "").lower()
+
+
+def renormalize_weights(weights: Mapping[str, float], components: Sequence[str]) -> Dict[str, float]:
+    """fusion_weights restricted to the components present, summing to 1 (uniform if all are 0)."""
+    w = {k: float(weights.get(k, 0.0)) for k in components}
+    total = sum(w.values())
+    if total <= 0:
+        return {k: 1.0 / len(components) for k in components} if components else {}
+    return {k: v / total for k, v in w.items()}
+
+
+def _softmax_rows(x: np.ndarray) -> np.ndarray:
+    x = x - x.max(axis=1, keepdims=True)
+    e = np.exp(x)
+    return e / e.sum(axis=1, keepdims=True)
+
+
+class HashedTfidf:
+    """Stateless hashed featurizer; IDF lives in the centroid store."""
+
+    def __init__(self, n_features: int = N_FEATURES, char_ngrams: Tuple[int, int] = CHAR_NGRAMS):
+        if n_features & (n_features - 1):
+            raise ValueError("n_features must be a power of two")
+        self.n_features = n_features
+        self.mask = n_features - 1
+        self.char_ngrams = char_ngrams
+
+    def counts(self, text: str) -> Dict[int, int]:
+        """feature index -> raw term count."""
+        mask = self.mask
+        lo, hi = self.char_ngrams
+        crc = zlib.crc32
+        out: Dict[int, int] = {}
+        words = _WORD_RE.findall(_normalize(text))
+        prev = None
+        for w in words:
+            wb = w.encode("utf-8")
+            f = crc(wb, _SEED_WORD) & mask
+            out[f] = out.get(f, 0) + 1
+            if prev is not None:
+                f = crc(prev + b" " + wb, _SEED_BIGRAM) & mask
+                out[f] = out.get(f, 0) + 1
+            prev = wb
+            padded = f" {w} "
+            for n in range(lo, hi + 1):
+                for i in range(0, len(padded) - n + 1):
+                    f = crc(padded[i:i + n].encode("utf-8"), _SEED_CHAR) & mask
+                    out[f] = out.get(f, 0) + 1
+        return out
+
+    def batch(self, texts: Sequence[str]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        CSR-style batch: (indptr, indices, sublinear tf).
+        Row i's features are indices[indptr[i]:indptr[i+1]].
+        """
+        indptr = [0]
+        indices: List[int] = []
+        values: List[float] = []
+        for t in texts:
+            c = self.counts(t)
+            indices.extend(c.keys())
+            values.extend(1.0 + math.log(v) for v in c.values())
+            indptr.append(len(indices))
+        return (
+            np.asarray(indptr, dtype=np.int64),
+            np.asarray(indices, dtype=np.int64),
+            np.asarray(values, dtype=np.float32),
+        )
+
+
+@dataclass
+class ModeDetection:
+    scores: Dict[str, float]                 # fused per-mode scores (sum to 1)
+    embedding: Dict[str, float]
+    rule: Dict[str, float]
+    top_k: List[Tuple[str, float]]
+    mixed: bool                              # top-1 vs top-2 within mixed_mode_margin
+    weights_used: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def mode(self) -> str:
+        return self.top_k[0][0] if self.top_k else ""
+
+
+class SemanticModeDetector:
+    """Prototype-centroid mode detector fused with lexicon rules, per the seed config."""
+
+    def __init__(
+        self,
+        seed_path: Path = SEED_PATH,
+        cache_dir: Optional[Path] = CACHE_DIR,
+        n_features: int = N_FEATURES,
+        temperature: float = TEMPERATURE,
+    ):
+        self.seed_path = Path(seed_path)
+        raw = self.seed_path.read_bytes()
+        self.seed = json.loads(raw.decode("utf-8-sig"))
+        defaults = self.seed.get("defaults", {}) or {}
+        self.fusion_weights: Dict[str, float] = {
+            k: float(v) for k, v in (defaults.get("fusion_weights") or {}).items()
+        }
+        self.top_k_modes = int(defaults.get("top_k_modes", 2))
+        self.mixed_mode_margin = float(defaults.get("mixed_mode_margin", 0.15))
+        self.temperature = float(temperature)
+
+        self.modes: Tuple[str, ...] = tuple(m["id"] for m in self.seed.get("modes", []))
+        self.vectorizer = HashedTfidf(n_features)
+        self.store_path: Optional[Path] = None
+
+        key = hashlib.sha1(
+            raw + f"|{_VECTORIZER_VERSION}|{n_features}|{CHAR_NGRAMS}".encode("utf-8")
+        ).hexdigest()[:16]
+        self.store = self._load_or_build(cache_dir, key)  # (features, 1 + modes)
+
+        # Lexicon rule scorer: one cue per (mode, term), pre-stemmed unless rules.lemmatize is off
+        lemmatize = bool((defaults.get("rules") or {}).get("lemmatize", True))
+        self._lexicon = StemLexicon(
+            {(m["id"], term): [_normalize(term)] for m in self.seed.get("modes", []) for term in m.get("lexicon", [])},
+            stemmer=stem if lemmatize else None,
+        )
+
+    # ---------- centroid store ----------
+
+    def _build_store(self) -> np.ndarray:
+        docs: List[str] = []
+        owner: List[int] = []
+        for j, m in enumerate(self.seed.get("modes", [])):
+            mode_docs = list(m.get("prototypes", []))
+            if m.get("description"):
+                mode_docs.append(m["description"])
+            if m.get("lexicon"):
+                mode_docs.append(" ".join(m["lexicon"]))
+            docs.extend(mode_docs)
+            owner.extend([j] * len(mode_docs))
+
+        indptr, indices, tf = self.vectorizer.batch(docs)
+        n_docs = len(docs)
+        df = np.zeros(self.vectorizer.n_features, dtype=np.float32)
+        np.add.at(df, indices, 1.0)
+        idf = (np.log((1.0 + n_docs) / (1.0 + df)) + 1.0).astype(np.float32)
+
+        store = np.zeros((self.vectorizer.n_features, 1 + len(self.modes)), dtype=np.float32)
+        store[:, 0] = idf
+        w = tf * idf[indices]
+        for d in range(n_docs):
+            a, b = indptr[d], indptr[d + 1]
+            vec = w[a:b]
+            norm = float(np.linalg.norm(vec)) or 1.0
+            np.add.at(store[:, 1 + owner[d]], indices[a:b], vec / norm)
+        cent = store[:, 1:]
+        norms = np.linalg.norm(cent, axis=0)
+        norms[norms == 0] = 1.0
+        store[:, 1:] = cent / norms
+        return store
+
+    def _load_or_build(self, cache_dir: Optional[Path], key: str) -> np.ndarray:
+        if cache_dir is None:
+            return self._build_store()
+        path = Path(cache_dir) / f"mode_centroids_{key}.npy"
+        if not path.exists():
+            store = self._build_store()
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = path.with_name(f"{path.stem}.{os.getpid()}.tmp.npy")
+                np.save(tmp, store)
+                os.replace(tmp, path)
+            except OSError:
+                return store  # read-only checkout: keep it in memory
+        self.store_path = path
+        return np.load(path, mmap_mode="r")
+
+    # ---------- scoring ----------
+
+    def embedding_scores(self, texts: Sequence[str]) -> np.ndarray:
+        """(n_texts, n_modes) softmax over cosine similarity to each mode centroid."""
+        n = len(texts)
+        if n == 0:
+            return np.zeros((0, len(self.modes)), dtype=np.float32)
+        indptr, indices, tf = self.vectorizer.batch(texts)
+        if indices.size == 0:
+            return np.full((n, len(self.modes)), 1.0 / len(self.modes), dtype=np.float32)
+
+        rows = np.asarray(self.store[indices])          # (nnz, 1 + modes) gather
+        w = tf * rows[:, 0]                             # tf-idf weights
+        contrib = rows[:, 1:] * w[:, None]              # (nnz, modes)
+
+        starts = indptr[:-1]
+        nonempty = indptr[1:] > starts
+        sims = np.zeros((n, len(self.modes)), dtype=np.float32)
+        sq = np.zeros(n, dtype=np.float32)
+        if nonempty.any():
+            sims[nonempty] = np.add.reduceat(contrib, starts[nonempty], axis=0)
+            sq[nonempty] = np.add.reduceat(w * w, starts[nonempty])
+        sims /= np.sqrt(np.maximum(sq, 1e-12))[:, None]
+        return _softmax_rows(sims / self.temperature)
+
+    def rule_scores(self, texts: Sequence[str]) -> np.ndarray:
+        """(n_texts, n_modes) lexicon-hit distribution; uniform when nothing hits."""
+        col = {m: j for j, m in enumerate(self.modes)}
+        out = np.zeros((len(texts), len(self.modes)), dtype=np.float32)
+        for i, t in enumerate(texts):
+            for mode, _term in self._lexicon.match(tokenize(_normalize(t))):
+                out[i, col[mode]] += 1.0
+        totals = out.sum(axis=1, keepdims=True)
+        empty = totals[:, 0] == 0
+        out[empty] = 1.0 / max(1, len(self.modes))
+        totals[empty] = 1.0
+        return out / totals
+
+    def _fuse_weights(self, components: Sequence[str]) -> Dict[str, float]:
+        return renormalize_weights(self.fusion_weights, components)
+
+    def detect_batch(
+        self,
+        texts: Sequence[str],
+        rule_scores: Optional[Sequence[Mapping[str, float]]] = None,
+    ) -> List[ModeDetection]:
+        """
+        Score texts in one batch. rule_scores may be supplied by the caller
+        (e.g. ElenxEngine._score_linguistic_mode per text); otherwise the seed
+        lexicon is used. Missing modes in supplied rule scores count as 0.
+        """
+        emb = self.embedding_scores(texts)
+        if rule_scores is None:
+            rul = self.rule_scores(texts)
+        else:
+            rul = np.array([[float(rs.get(m, 0.0)) for m in self.modes] for rs in rule_scores],
+                           dtype=np.float32).reshape(len(texts), len(self.modes))
+        weights = self._fuse_weights(["rule", "embedding"])
+        fused = weights["rule"] * rul + weights["embedding"] * emb
+
+        out: List[ModeDetection] = []
+        k = max(1, min(self.top_k_modes, len(self.modes)))
+        for i in range(len(texts)):
+            order = np.argsort(-fused[i], kind="stable")
+            top = [(self.modes[j], float(fused[i, j])) for j in order[:k]]
+            mixed = len(order) > 1 and float(fused[i, order[0]] - fused[i, order[1]]) < self.mixed_mode_margin
+            out.append(ModeDetection(
+                scores={m: float(fused[i, j]) for j, m in enumerate(self.modes)},
+                embedding={m: float(emb[i, j]) for j, m in enumerate(self.modes)},
+                rule={m: float(rul[i, j]) for j, m in enumerate(self.modes)},
+                top_k=top,
+                mixed=mixed,
+                weights_used=dict(weights),
+            ))
+        return out
+
+    def detect(self, text: str, rule_scores: Optional[Mapping[str, float]] = None) -> ModeDetection:
+        return self.detect_batch([text], None if rule_scores is None else [rule_scores])[0]
+
+
+if __name__ == "__main__":
+    import time
+
+    if hasattr(sys.stdout, "reconfigure"):
+        try:
+            sys.stdout.reconfigure(encoding="utf-8")
+        except Exception:
+            pass
+
+    det = SemanticModeDetector()
+    texts = sys.argv[1:] or [
+        "Compare churn across cohorts and estimate the impact of the price change.",
+        "Looking back, I regret how we handled the first rollout.",
+        "Let’s brainstorm a new approach with a lightweight prototype.",
+    ]
+    for t, r in zip(texts, det.detect_batch(texts)):
+        top = ", ".join(f"{m}={s:.2f}" for m, s in r.top_k)
+        print(f"{r.mode:<10s} mixed={r.mixed!s:<5s} [{top}]  {t}")
+
+    batch = texts * max(1, 2000 // len(texts))
+    t0 = time.perf_counter()
+    det.detect_batch(batch)
+    dt = time.perf_counter() - t0
+    print(f"\n{len(batch)} texts in {dt * 1000:.1f} ms  → {dt / len(batch) * 1e6:.0f} µs/text")
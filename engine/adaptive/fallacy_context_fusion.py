@@ -0,0 +1,215 @@
+# engine/adaptive/fallacy_context_fusion.py
+# Owlume — Data-driven fallacy + context-driver tagging.
+#
+# Cue sets are compiled from the packs once, at load time:
+#   - data/fallacies.json        "fallacies": [{id, label, definition, cues?}]
+#   - data/context_drivers.json  "drivers":   [{id, label, definition, cues?}]
+#
+# Two kinds of cue feed the matcher:
+#   1) Built-in rules (BUILTIN_RULES) — the engine's long-standing keyword
+#      groups. Each is bound to whichever pack labels it describes
+#      (e.g. "incent" -> "Misaligned Incentives") when the packs load; a
+#      label that isn't in the pack is simply never produced.
+#   2) Per-item `cues` — optional list of phrases on any pack item, matched
+#      case-insensitively on word boundaries (after the same normalization
+#      as the text), tagging that item's label.
+#
+# Everything goes into one CueScanner (src/cue_scanner.py). Tagging a text is
+# one scan plus work proportional to the cues that hit, so adding drivers to
+# a pack does not add per-request cost per driver.
+#
+# Usage:
+#   fusion = FallacyContextFusion.from_files()
+#   fusion.tag("Everyone on the team is chasing the quarterly bonus")
+#   -> {"fallacies": ["Hasty Generalization"], "contexts": ["Misaligned Incentives"]}
+from __future__ import annotations
+
+import json
+import re
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.cue_scanner import CueHits, CueScanner, literal_any  # noqa: E402
+from src.text_features import normalize_text  # noqa: E402
+
+FALLACIES_PATH = ROOT / "data" / "fallacies.json"
+CONTEXT_DRIVERS_PATH = ROOT / "data" / "context_drivers.json"
+
+KINDS = ("fallacies", "contexts")
+
+
+@dataclass(frozen=True)
+class CueRule:
+    """
+    A built-in cue group and the pack labels it maps onto.
+
+    - kind: "fallacies" | "contexts"
+    - pattern: regex run on normalized text (src/text_features.normalize_text)
+    - label_contains: a pack label is tagged if it contains any of these
+      (lowercased label unless match_case)
+    - first_only: tag only the first matching label (pack order)
+    """
+    kind: str
+    id: str
+    pattern: str
+    label_contains: Tuple[str, ...]
+    first_only: bool = False
+    match_case: bool = False
+
+    def bind(self, labels: Sequence[str]) -> List[str]:
+        out: List[str] = []
+        for lab in labels:
+            hay = lab if self.match_case else lab.lower()
+            if any(x in hay for x in self.label_contains):
+                out.append(lab)
+                if self.first_only:
+                    break
+        return out
+
+
+# Substring cues keep the semantics of the engine's old `any(k in t for k in [...])` checks.
+BUILTIN_RULES: Tuple[CueRule, ...] = (
+    CueRule("fallacies", "generalization", r"\b(always|everyone|nobody|never)\b",
+            ("Generalization",), first_only=True, match_case=True),
+    CueRule("contexts", "incentive",
+            literal_any(["incentive", "commission", "bonus", "quota", "kpi", "target mis", "misaligned", "perverse incentive"]),
+            ("incent",)),
+    CueRule("contexts", "stakeholder",
+            literal_any(["stakeholder", "co-founder", "cofounder", "boss", "board", "investor", "client", "customer", "sales", "product", "team", "engineering", "marketing", "cross-functional"]),
+            ("stakeholder",), first_only=True),
+    CueRule("contexts", "time",
+            literal_any(["time pressure", "deadline", "rushed", "rush", "overload", "burnout", "too busy", "no time"]),
+            ("time", "pressure", "overload")),
+    CueRule("contexts", "conflict",
+            literal_any(["conflict", "tension", "strained", "friction", "distant", "avoid", "avoidance"]),
+            ("relationship", "interpersonal", "people", "conflict"), first_only=True),
+)
+
+
+def rule_cue_id(rule: CueRule) -> str:
+    return f"{rule.kind}:builtin:{rule.id}"
+
+
+def builtin_cues(kind: Optional[str] = None) -> Dict[str, str]:
+    """Built-in cue table {cue_id: pattern}, optionally for one kind."""
+    return {rule_cue_id(r): r.pattern for r in BUILTIN_RULES if kind is None or r.kind == kind}
+
+
+def phrase_pattern(phrases: Iterable[str]) -> Optional[str]:
+    """Word-bounded alternation of normalized phrases (None if there are none)."""
+    alts = sorted({normalize_text(p) for p in phrases if isinstance(p, str) and p.strip()}, key=lambda s: (-len(s), s))
+    if not alts:
+        return None
+    return r"\b(?:" + "|".join(re.escape(a) for a in alts) + r")\b"
+
+
+def _items(pack: Any, key: str) -> List[Dict[str, Any]]:
+    """Items of a pack dict ({key: [...]}) or a bare list; anything else is empty."""
+    if isinstance(pack, dict):
+        pack = pack.get(key, [])
+    if not isinstance(pack, list):
+        return []
+    return [it for it in pack if isinstance(it, dict)]
+
+
+def _load_json(path: Path) -> Any:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+class FallacyContextFusion:
+    """
+    Compiled fallacy/context tagger.
+
+    - cues: {cue_id: pattern} for every cue (built-in + per-item); merge it
+      into a wider scanner to share the pass (see tag_hits)
+    - item_cues: only the per-item cues from the packs
+    - tag(text) / tag_hits(hits): {"fallacies": [...], "contexts": [...]}
+      labels in rule order, then pack order; de-duplicated
+    """
+
+    def __init__(self, fallacies: Sequence[Dict[str, Any]], drivers: Sequence[Dict[str, Any]],
+                 rules: Sequence[CueRule] = BUILTIN_RULES):
+        items = {"fallacies": list(fallacies), "contexts": list(drivers)}
+        labels = {k: [str(it.get("label") or "") for it in v] for k, v in items.items()}
+
+        cues: Dict[str, str] = {}
+        item_cues: Dict[str, str] = {}
+        targets: Dict[str, Dict[str, List[Tuple[int, str]]]] = {k: {} for k in KINDS}
+        seq = 0
+
+        # 1) built-in rules -> labels present in the pack
+        for rule in rules:
+            bound = [lab for lab in rule.bind(labels[rule.kind]) if lab]
+            if not bound:
+                continue
+            cid = rule_cue_id(rule)
+            cues[cid] = rule.pattern
+            for lab in bound:
+                targets[rule.kind].setdefault(cid, []).append((seq, lab))
+                seq += 1
+
+        # 2) optional per-item `cues`
+        for kind in KINDS:
+            for i, it in enumerate(items[kind]):
+                lab = labels[kind][i]
+                pat = phrase_pattern(it.get("cues") or [])
+                if not lab or pat is None:
+                    continue
+                cid = f"{kind}:item:{it.get('id') or i}"
+                cues[cid] = item_cues[cid] = pat
+                targets[kind].setdefault(cid, []).append((seq, lab))
+                seq += 1
+
+        self.cues: Mapping[str, str] = MappingProxyType(cues)
+        self.item_cues: Mapping[str, str] = MappingProxyType(item_cues)
+        self._targets = {k: {cid: tuple(v) for cid, v in t.items()} for k, t in targets.items()}
+        self._scanner = CueScanner(cues)
+
+    @classmethod
+    def from_packs(cls, fallacies_pack: Any, context_pack: Any) -> "FallacyContextFusion":
+        """From pack dicts ({"fallacies": [...]}, {"drivers": [...]}) or bare item lists."""
+        return cls(_items(fallacies_pack, "fallacies"), _items(context_pack, "drivers"))
+
+    @classmethod
+    def from_files(cls, fallacies_path: Path = FALLACIES_PATH,
+                   context_path: Path = CONTEXT_DRIVERS_PATH) -> "FallacyContextFusion":
+        return cls.from_packs(_load_json(fallacies_path), _load_json(context_path))
+
+    def __len__(self) -> int:
+        return len(self.cues)
+
+    def labels(self, hits: CueHits, kind: str) -> List[str]:
+        """Labels of one kind tagged by the given cue hits."""
+        targets = self._targets[kind]
+        found = [t for cid in hits for t in targets.get(cid, ())]
+        if not found:
+            return []
+        found.sort()
+        out: List[str] = []
+        seen = set()
+        for _, lab in found:
+            if lab not in seen:
+                out.append(lab)
+                seen.add(lab)
+        return out
+
+    def tag_hits(self, hits: CueHits) -> Dict[str, List[str]]:
+        return {kind: self.labels(hits, kind) for kind in KINDS}
+
+    def tag(self, text: str) -> Dict[str, List[str]]:
+        return self.tag_hits(self._scanner.scan(normalize_text(text)))
+
+
+if __name__ == "__main__":
+    fusion = FallacyContextFusion.from_files()
+    print(f"cues={len(fusion)} (per-item={len(fusion.item_cues)})")
+    for line in sys.argv[1:] or ["Everyone on the team is chasing the quarterly bonus before the deadline."]:
+        print(json.dumps(fusion.tag(line), ensure_ascii=False))
@@ -0,0 +1,368 @@
+# engine/adaptive/scorer_backends.py
+# Owlume — Pluggable mode scorers, fused under a latency budget.
+#
+# The seed's fusion_weights name three components (rule, embedding, llm).
+# Each one is a ScorerBackend: a name, its own timeout and
+# score(text) -> {mode: probability}. The registry maps component names to
+# backend factories. FusedModeScorer runs the selected backends concurrently,
+# each on its own bounded thread pool, waits for each until its own timeout
+# (or the overall deadline, whichever comes first), and fuses whichever
+# distributions arrived in time with fusion_weights renormalized over them:
+#
+#   with FusedModeScorer.from_seed() as scorer:   # rule + embedding + local llm stand-in
+#       res = scorer.score("Should we pilot the new pricing?", deadline_ms=50)
+#       res.scores, res.used, res.timed_out, res.weights_used
+#
+# ElenxEngine(packs, fusion=scorer) runs it as the optional last pipeline
+# stage ("fusion", after render) on whatever is left of analyze's deadline_ms.
+#
+# LocalLLMServer is a deterministic in-process stand-in for an LLM endpoint
+# (JSON request in, JSON response out, configurable latency), so the
+# concurrency and timeout paths run offline. A late backend's thread is not
+# interrupted (Python threads can't be); its result is ignored, and while all
+# of a backend's workers are still busy it is skipped (timed out) rather than
+# queued, so a hung backend only starves itself.
+from __future__ import annotations
+
+import json
+import os
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeout
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from engine.adaptive.detect_mode_semantic import (  # noqa: E402
+    SemanticModeDetector,
+    _normalize,
+    renormalize_weights,
+)
+from src.stemmer import stems  # noqa: E402
+from src.text_features import tokenize  # noqa: E402
+
+MAX_WORKERS = int(os.getenv("ELENX_SCORER_WORKERS", "4"))
+
+# per-backend timeouts (seconds); the rule path is local and cheap, the llm path is not
+DEFAULT_TIMEOUTS: Dict[str, float] = {"rule": 0.05, "embedding": 0.25, "llm": 1.0}
+
+
+class ScorerBackend(ABC):
+    """One fusion component: score(text) -> {mode: probability}, within timeout_s."""
+
+    name = ""
+
+    def __init__(self, timeout_s: Optional[float] = None):
+        self.timeout_s = float(DEFAULT_TIMEOUTS.get(self.name, 1.0) if timeout_s is None else timeout_s)
+
+    @abstractmethod
+    def score(self, text: str) -> Dict[str, float]:
+        ...
+
+
+class RuleBackend(ScorerBackend):
+    """Seed lexicon hits (SemanticModeDetector.rule_scores)."""
+
+    name = "rule"
+
+    def __init__(self, detector: SemanticModeDetector, timeout_s: Optional[float] = None):
+        super().__init__(timeout_s)
+        self.detector = detector
+
+    def score(self, text: str) -> Dict[str, float]:
+        row = self.detector.rule_scores([text])[0]
+        return {m: float(x) for m, x in zip(self.detector.modes, row)}
+
+
+class EmbeddingBackend(ScorerBackend):
+    """Hashed TF-IDF centroid similarity (SemanticModeDetector.embedding_scores)."""
+
+    name = "embedding"
+
+    def __init__(self, detector: SemanticModeDetector, timeout_s: Optional[float] = None):
+        super().__init__(timeout_s)
+        self.detector = detector
+
+    def score(self, text: str) -> Dict[str, float]:
+        row = self.detector.embedding_scores([text])[0]
+        return {m: float(x) for m, x in zip(self.detector.modes, row)}
+
+
+class LocalLLMServer:
+    """
+    Deterministic stand-in for an LLM classification endpoint.
+
+    complete(request_json) -> response_json, after `latency_s`. The "model"
+    votes for each mode by the best stem overlap between the text and the
+    mode's seed prototypes (+1 smoothing), so the same text always gets the
+    same answer. fail=True answers with malformed JSON.
+    """
+
+    model = "owlume-local-stub"
+
+    def __init__(self, prototypes: Mapping[str, Sequence[str]], latency_s: float = 0.0, fail: bool = False):
+        self.latency_s = float(latency_s)
+        self.fail = fail
+        self.calls = 0
+        self._lock = threading.Lock()
+        self._protos: Dict[str, List[frozenset]] = {
+            mode: [frozenset(stems(tokenize(_normalize(p)))) for p in ps] for mode, ps in prototypes.items()
+        }
+
+    @classmethod
+    def from_seed(cls, seed: Mapping[str, Any], **kw: Any) -> "LocalLLMServer":
+        return cls({m["id"]: m.get("prototypes", []) for m in seed.get("modes", [])}, **kw)
+
+    def complete(self, request: str) -> str:
+        with self._lock:
+            self.calls += 1
+        if self.latency_s > 0:
+            time.sleep(self.latency_s)
+        if self.fail:
+            return "{not json"
+        req = json.loads(request)
+        words = frozenset(stems(tokenize(_normalize(req.get("text", "")))))
+        votes = {
+            mode: 1.0 + max((len(words & p) for p in protos), default=0)
+            for mode, protos in self._protos.items()
+            if mode in req.get("modes", self._protos)
+        }
+        total = sum(votes.values()) or 1.0
+        return json.dumps({"model": self.model, "mode_scores": {m: v / total for m, v in votes.items()}})
+
+
+class LLMBackend(ScorerBackend):
+    """Mode distribution from an LLM-style client: client.complete(request_json) -> response_json."""
+
+    name = "llm"
+
+    def __init__(self, client: Any, modes: Sequence[str], timeout_s: Optional[float] = None):
+        super().__init__(timeout_s)
+        self.client = client
+        self.modes: Tuple[str, ...] = tuple(modes)
+
+    def score(self, text: str) -> Dict[str, float]:
+        request = json.dumps({"task": "classify_mode", "modes": list(self.modes), "text": text})
+        resp = json.loads(self.client.complete(request))
+        raw = resp.get("mode_scores") if isinstance(resp, dict) else None
+        if not isinstance(raw, dict):
+            raise ValueError("llm response has no mode_scores")
+        return {m: float(raw.get(m, 0.0)) for m in self.modes}
+
+
+BackendFactory = Callable[[SemanticModeDetector], ScorerBackend]
+
+
+class ScorerRegistry:
+    """Component name -> backend factory (called with the seed's SemanticModeDetector)."""
+
+    def __init__(self) -> None:
+        self._factories: Dict[str, BackendFactory] = {}
+
+    def register(self, name: str, factory: BackendFactory, replace: bool = False) -> None:
+        if name in self._factories and not replace:
+            raise ValueError(f"scorer backend {name!r} is already registered")
+        self._factories[name] = factory
+
+    def names(self) -> Tuple[str, ...]:
+        return tuple(self._factories)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._factories
+
+    def create(self, name: str, detector: SemanticModeDetector) -> ScorerBackend:
+        try:
+            factory = self._factories[name]
+        except KeyError:
+            raise KeyError(f"unknown scorer backend {name!r}; registered: {self.names()}") from None
+        return factory(detector)
+
+
+REGISTRY = ScorerRegistry()
+REGISTRY.register("rule", RuleBackend)
+REGISTRY.register("embedding", EmbeddingBackend)
+REGISTRY.register("llm", lambda det: LLMBackend(LocalLLMServer.from_seed(det.seed), det.modes))
+
+
+class _Lane:
+    """One backend's own pool, with at most `workers` calls in flight (never queued)."""
+
+    def __init__(self, backend: ScorerBackend, workers: int):
+        workers = max(1, int(workers))
+        self.backend = backend
+        self._slots = threading.BoundedSemaphore(workers)
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"owlume-scorer-{backend.name}")
+
+    def submit(self, text: str) -> Optional[Future]:
+        """A future for backend.score(text), or None when every worker is busy."""
+        if not self._slots.acquire(blocking=False):
+            return None
+        try:
+            return self._pool.submit(self._call, text)
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def _call(self, text: str) -> Dict[str, float]:
+        try:
+            return self.backend.score(text)
+        finally:
+            self._slots.release()
+
+    def cancel(self, fut: Future) -> None:
+        if fut.cancel():  # never started: _call won't release its slot
+            self._slots.release()
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+@dataclass
+class FusionResult:
+    scores: Dict[str, float]                     # fused per-mode scores (sum to 1)
+    components: Dict[str, Dict[str, float]]      # per backend that answered in time
+    weights_used: Dict[str, float]
+    top_k: List[Tuple[str, float]]
+    mixed: bool
+    timed_out: List[str] = field(default_factory=list)
+    errors: Dict[str, str] = field(default_factory=dict)
+    elapsed_ms: float = 0.0
+
+    @property
+    def mode(self) -> str:
+        return self.top_k[0][0] if self.top_k else ""
+
+    @property
+    def used(self) -> Tuple[str, ...]:
+        return tuple(self.components)
+
+
+class FusedModeScorer:
+    """
+    Concurrent backends + renormalized fusion.
+
+    - backends: run in this order (also the order of `components`)
+    - weights: fusion_weights (the seed's by default)
+    - max_workers: calls in flight per backend (each has its own pool); a
+      backend with every worker still busy is reported timed out right away
+    """
+
+    def __init__(
+        self,
+        backends: Sequence[ScorerBackend],
+        modes: Sequence[str],
+        weights: Mapping[str, float],
+        top_k_modes: int = 2,
+        mixed_mode_margin: float = 0.15,
+        max_workers: int = MAX_WORKERS,
+    ):
+        names = [b.name for b in backends]
+        if len(set(names)) != len(names):
+            raise ValueError(f"duplicate scorer backends: {names}")
+        self.backends: Tuple[ScorerBackend, ...] = tuple(backends)
+        self.modes: Tuple[str, ...] = tuple(modes)
+        self.weights: Dict[str, float] = dict(weights)
+        self.top_k_modes = int(top_k_modes)
+        self.mixed_mode_margin = float(mixed_mode_margin)
+        self._lanes: Dict[str, _Lane] = {b.name: _Lane(b, max_workers) for b in self.backends}
+
+    @classmethod
+    def from_seed(
+        cls,
+        detector: Optional[SemanticModeDetector] = None,
+        components: Optional[Sequence[str]] = None,
+        registry: ScorerRegistry = REGISTRY,
+        timeouts: Optional[Mapping[str, float]] = None,
+        **kw: Any,
+    ) -> "FusedModeScorer":
+        """Backends for the seed's fusion_weights components (or `components`), built from `registry`."""
+        det = detector or SemanticModeDetector()
+        names = list(components if components is not None else det.fusion_weights)
+        backends = [registry.create(n, det) for n in names]
+        for b in backends:
+            if timeouts and b.name in timeouts:
+                b.timeout_s = float(timeouts[b.name])
+        return cls(backends, det.modes, det.fusion_weights, det.top_k_modes, det.mixed_mode_margin, **kw)
+
+    def score(self, text: str, deadline_ms: Optional[float] = None) -> FusionResult:
+        start = time.perf_counter()
+        futures = [(b, self._lanes[b.name].submit(text)) for b in self.backends]
+        components: Dict[str, Dict[str, float]] = {}
+        timed_out: List[str] = []
+        errors: Dict[str, str] = {}
+        for b, fut in futures:
+            if fut is None:  # every worker of this backend is still busy
+                timed_out.append(b.name)
+                continue
+            budget = b.timeout_s if deadline_ms is None else min(b.timeout_s, deadline_ms / 1000.0)
+            try:
+                dist = fut.result(timeout=max(0.0, start + budget - time.perf_counter()))
+            except FutureTimeout:
+                self._lanes[b.name].cancel(fut)
+                timed_out.append(b.name)
+                continue
+            except Exception as e:  # a failing backend drops out of the fusion
+                errors[b.name] = f"{type(e).__name__}: {e}"
+                continue
+            components[b.name] = self._distribution(dist)
+
+        weights = renormalize_weights(self.weights, list(components))
+        if components:
+            fused = {m: sum(w * components[c][m] for c, w in weights.items()) for m in self.modes}
+        else:
+            fused = {m: 1.0 / len(self.modes) for m in self.modes} if self.modes else {}
+        ranked = sorted(fused.items(), key=lambda kv: -kv[1])  # stable: ties keep seed order
+        top = ranked[:max(1, min(self.top_k_modes, len(ranked)))]
+        mixed = len(ranked) > 1 and ranked[0][1] - ranked[1][1] < self.mixed_mode_margin
+        return FusionResult(
+            scores=fused,
+            components=components,
+            weights_used=weights,
+            top_k=top,
+            mixed=mixed,
+            timed_out=timed_out,
+            errors=errors,
+            elapsed_ms=(time.perf_counter() - start) * 1000.0,
+        )
+
+    def _distribution(self, dist: Mapping[str, float]) -> Dict[str, float]:
+        """Backend output over self.modes, summing to 1 (uniform when empty)."""
+        vals = {m: max(0.0, float(dist.get(m, 0.0))) for m in self.modes}
+        total = sum(vals.values())
+        if total <= 0:
+            return {m: 1.0 / len(self.modes) for m in self.modes}
+        return {m: v / total for m, v in vals.items()}
+
+    def close(self) -> None:
+        for lane in self._lanes.values():
+            lane.close()
+
+    def __enter__(self) -> "FusedModeScorer":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+if __name__ == "__main__":
+    if hasattr(sys.stdout, "reconfigure"):
+        try:
+            sys.stdout.reconfigure(encoding="utf-8")
+        except Exception:
+            pass
+
+    texts = sys.argv[1:] or [
+        "Compare churn across cohorts and estimate the impact of the price change.",
+        "Looking back, I regret how we handled the first rollout.",
+    ]
+    with FusedModeScorer.from_seed() as scorer:
+        for t in texts:
+            r = scorer.score(t, deadline_ms=500)
+            top = ", ".join(f"{m}={s:.2f}" for m, s in r.top_k)
+            print(f"{r.mode:<10s} [{top}] used={','.join(r.used)} {r.elapsed_ms:.1f} ms  {t}")
@@ -13,10 +13,13 @@ Outputs -> data/metrics/aggregates_YYYYMMDD_HHMMSS.json with keys:
 Back-compat: prints human summary similar to your previous version.
 """
 
-import json, glob, datetime as dt
+import json, glob, sys, datetime as dt
 from pathlib import Path
 from collections import Counter
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+from clarity_log_shards import expand_log_files  # noqa: E402
+
 PRINCIPLE_TO_MODE = {
     "Evidence & Validation": "Analytical",
     "Assumption": "Analytical",
@@ -78,8 +81,8 @@ def _as_bool(x):
     return False
 
 def load_records():
-    """Load JSONL logs from data/logs/*.jsonl; tolerant to UTF-8 BOM; print diagnostics."""
-    paths = sorted(glob.glob(str(LOG_DIR / "*.jsonl")))
+    """Load JSONL logs from data/logs/*.jsonl (segments + unmerged worker shards); tolerant to UTF-8 BOM; print diagnostics."""
+    paths = expand_log_files(sorted(glob.glob(str(LOG_DIR / "*.jsonl"))))
     recs, total_lines, skipped_empty, parse_errors = [], 0, 0, 0
     first_err = None
 
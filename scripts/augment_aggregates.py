@@ -14,6 +14,9 @@ if hasattr(sys.stdout, "reconfigure"):
 ROOT = os.path.dirname(os.path.dirname(__file__))
 METRICS_DIR = os.path.join(ROOT, "data", "metrics")
 
+sys.path.insert(0, os.path.join(ROOT, "src"))
+from clarity_log_shards import expand_log_files  # noqa: E402
+
 def _bool_from_any(v):
     if isinstance(v, bool):
         return v
@@ -26,7 +29,7 @@ def _bool_from_any(v):
 
 def _read_jsonl(path):
     # yields dicts from a jsonl file; tolerant to blank lines/commas
-    with open(path, "r", encoding="utf-8", errors="ignore") as f:
+    with open(path, "r", encoding="utf-8-sig", errors="ignore") as f:
         for line in f:
             s = line.strip().rstrip(",")
             if not s:
@@ -77,20 +80,20 @@ def augment_one(agg_path):
     empathy_on = 0
     mp_counts = {}
 
+    resolved = []
     for src in source_files:
-        # Resolve relative paths if any
-        p = src
-        if not os.path.isabs(p):
-            p = os.path.join(ROOT, p)
-        if not os.path.exists(p):
-            # Also try under data/logs relative
-            alt = os.path.join(ROOT, "data", "logs", os.path.basename(p))
-            if os.path.exists(alt):
-                p = alt
-            else:
-                print(f"  ! Missing log: {src}")
-                continue
-
+        # Resolve relative paths if any; also try under data/logs.
+        # A clarity log stands for its whole month (segment + worker shards),
+        # so a shard listed here is still found after it was merged.
+        p = src if os.path.isabs(src) else os.path.join(ROOT, src)
+        alt = os.path.join(ROOT, "data", "logs", os.path.basename(p))
+        found = expand_log_files([p]) or expand_log_files([alt])
+        if not found:
+            print(f"  ! Missing log: {src}")
+            continue
+        resolved += found
+
+    for p in expand_log_files(resolved):
         for rec in _read_jsonl(p):
             n += 1
 
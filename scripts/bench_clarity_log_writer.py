@@ -0,0 +1,81 @@
+# scripts/bench_clarity_log_writer.py
+# Owlume — request-path latency of clarity logging.
+#
+#   before: clarity_logger.log_record (gate + open / append / close per record)
+#   after:  ClarityLogWriter.log (gate + enqueue; a background thread writes
+#           in batches) for each durability policy
+#
+# Writes into a temporary directory; reports p50 / p99 µs per call on the
+# caller's thread and total wall time including the final close().
+#
+# Usage:
+#   python scripts/bench_clarity_log_writer.py [--records 5000]
+
+from __future__ import annotations
+
+import argparse
+import copy
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+if hasattr(sys.stdout, "reconfigure"):
+    try:
+        sys.stdout.reconfigure(encoding="utf-8")
+    except Exception:
+        pass
+
+from clarity_logger import ClarityLogWriter, log_record  # noqa: E402
+
+RECORD: Dict[str, Any] = {
+    "session_id": "DLM-BENCH",
+    "user_text": "My co-founder is distant. Tension is rising and I'm avoiding the hard talk.",
+    "judgment_landing": {"type": "position", "statement": "I will name the tension directly this week.",
+                         "confidence": 0.7, "acknowledged": True},
+    "detected": {"mode": "Critical", "principle": "Assumption", "drivers": ["Stakeholder"]},
+    "voices": ["Socratic"],
+    "timestamp": "2026-01-01T00:00:00Z",
+}
+
+
+def _run(log: Callable[[Dict[str, Any]], Any], n: int) -> List[float]:
+    out = []
+    for _ in range(n):
+        rec = copy.deepcopy(RECORD)
+        t0 = time.perf_counter()
+        log(rec)
+        out.append((time.perf_counter() - t0) * 1e6)
+    return sorted(out)
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Clarity log latency: log_record vs ClarityLogWriter")
+    ap.add_argument("--records", type=int, default=5000)
+    args = ap.parse_args()
+
+    print("🦉  OWLUME — CLARITY LOG WRITER BENCH (µs per record on the caller's thread)")
+    print(f"{'':22s} {'p50':>8s} {'p99':>8s} {'wall ms':>9s}")
+    with tempfile.TemporaryDirectory() as tmp:
+        t0 = time.perf_counter()
+        lat = _run(lambda r: log_record(r, f"{tmp}/sync"), args.records)
+        wall = (time.perf_counter() - t0) * 1e3
+        print(f"{'log_record':22s} {lat[len(lat) // 2]:8.1f} {lat[int(len(lat) * 0.99)]:8.1f} {wall:9.1f}")
+        for durability, every_n in (("none", 1), ("flush", 1), ("fsync", 256)):
+            t0 = time.perf_counter()
+            w = ClarityLogWriter(f"{tmp}/{durability}", durability=durability, every_n=every_n)
+            lat = _run(w.log, args.records)
+            w.close()
+            wall = (time.perf_counter() - t0) * 1e3
+            label = f"writer {durability}/{every_n}"
+            print(f"{label:22s} {lat[len(lat) // 2]:8.1f} {lat[int(len(lat) * 0.99)]:8.1f} {wall:9.1f}"
+                  f"  batches={w.stats['batches']} syncs={w.stats['syncs']}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,90 @@
+# scripts/bench_engine_analyze.py
+# Owlume — Elenx engine per-call benchmark on the smoke-test samples.
+#
+# Compares the old per-stage regex work (each stage lowercases the text and
+# runs its own re.search per pattern) against the single-pass cue scanner,
+# then times the full ElenxEngine.analyze call.
+#
+# Usage:
+#   python scripts/bench_engine_analyze.py [--repeat 2000]
+
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+if hasattr(sys.stdout, "reconfigure"):
+    try:
+        sys.stdout.reconfigure(encoding="utf-8")
+    except Exception:
+        pass
+
+import src.elenx_engine as EE  # noqa: E402
+from src.elenx_loader import load_packs  # noqa: E402
+
+# Same samples as scripts/smoke_test_engine_fusion.py
+SAMPLES = [
+    "We have some notes from two users, but I’m unsure what to do next.",
+    "Incentives are misaligned across sales and product; stakeholders are pressuring us and risk is rising.",
+    "My co-founder seems distant lately. Tension is building with the team and I worry incentives are clashing.",
+    "Let’s brainstorm a new approach. What if we imagine a lightweight prototype to explore novel possibilities?",
+    "Looking back, I regret how we handled the first rollout. What patterns do we keep repeating and what lesson is here?",
+    "I want to build a better habit around feedback and coaching. How can I evolve my mindset so improvement sticks?",
+]
+
+
+def _per_stage_regex(text: str) -> int:
+    """Pre-scanner cost model: every stage lowercases and searches its own patterns."""
+    n = 0
+    for table in (EE.PRIOR_CUES, EE.RULE_CUES, EE.FALLACY_CUES, EE.CONTEXT_CUES):
+        t = text.lower()
+        for pat in table.values():
+            if re.search(pat, t):
+                n += 1
+    t = text.lower()
+    for terms in EE.LINGUISTIC_CUES.values():
+        for entry in terms:
+            if re.search(r"\b(?:%s)\b" % "|".join(map(re.escape, entry.split("|"))), t):
+                n += 1
+    return n
+
+
+def _time_us(fn, repeat: int) -> float:
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        for s in SAMPLES:
+            fn(s)
+    return (time.perf_counter() - t0) / (repeat * len(SAMPLES)) * 1e6
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Benchmark ElenxEngine.analyze on smoke samples")
+    ap.add_argument("--repeat", type=int, default=2000)
+    args = ap.parse_args()
+
+    eng = EE.ElenxEngine(load_packs())
+
+    # sanity: scanner + stem lookups see at least what the exact-word searches see
+    for s in SAMPLES:
+        assert len(EE.scan_cues(s)) >= _per_stage_regex(s), s
+
+    per_stage = _time_us(_per_stage_regex, args.repeat)
+    single = _time_us(EE.scan_cues, args.repeat)
+    analyze = _time_us(eng.analyze, args.repeat)
+
+    print("🦉  OWLUME — ELENX ENGINE BENCH (smoke samples)")
+    print(f"samples={len(SAMPLES)} repeat={args.repeat} cues={len(EE._CUE_SCANNER)}+{len(EE._LING_LEXICON.cue_ids)} stemmed")
+    print(f"cue regex, per-stage re.search : {per_stage:8.1f} µs/text")
+    print(f"scanner + stem lexicon         : {single:8.1f} µs/text  (x{per_stage / max(single, 1e-9):.1f})")
+    print(f"ElenxEngine.analyze (full)     : {analyze:8.1f} µs/call")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
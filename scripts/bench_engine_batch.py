@@ -0,0 +1,83 @@
+# scripts/bench_engine_batch.py
+# Owlume — ElenxEngine.analyze_batch throughput vs. worker count.
+#
+# Builds a backlog from the golden dilemmas (repeated to --n texts) and
+# reports texts/sec for 1..cpu_count workers, plus speed-up over the
+# in-process loop. Scaling is bounded by the cores actually available.
+#
+# Usage:
+#   python scripts/bench_engine_batch.py [--n 20000] [--workers 1,2,4,8]
+
+from __future__ import annotations
+
+import argparse
+import csv
+import os
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+if hasattr(sys.stdout, "reconfigure"):
+    try:
+        sys.stdout.reconfigure(encoding="utf-8")
+    except Exception:
+        pass
+
+from src.elenx_engine import ElenxEngine  # noqa: E402
+from src.elenx_loader import load_packs  # noqa: E402
+
+GOLDEN_CSV = ROOT / "data" / "owlume_golden_dilemmas_v1.csv"
+
+
+def _backlog(n: int) -> list[str]:
+    with GOLDEN_CSV.open("r", encoding="utf-8-sig", newline="") as f:
+        base = [row["dilemma"] for row in csv.DictReader(f) if row.get("dilemma")]
+    # vary each copy slightly so nothing downstream can shortcut repeats
+    return [f"{base[i % len(base)]} (#{i})" for i in range(n)]
+
+
+def _default_workers() -> list[int]:
+    cpus = os.cpu_count() or 1
+    out, w = [], 1
+    while w < cpus:
+        out.append(w)
+        w *= 2
+    out.append(cpus)
+    return out
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Benchmark ElenxEngine.analyze_batch scaling")
+    ap.add_argument("--n", type=int, default=20000, help="number of texts")
+    ap.add_argument("--workers", type=str, default="", help="comma list, e.g. 1,2,4")
+    args = ap.parse_args()
+
+    texts = _backlog(args.n)
+    eng = ElenxEngine(load_packs())
+    worker_counts = [int(w) for w in args.workers.split(",") if w] or _default_workers()
+
+    print("🦉  OWLUME — ELENX BATCH BENCH")
+    print(f"texts={len(texts)} cpus={os.cpu_count()}")
+
+    baseline = None
+    expected = None
+    for w in worker_counts:
+        t0 = time.perf_counter()
+        results = eng.analyze_batch(texts, workers=w)
+        dt = time.perf_counter() - t0
+        if expected is None:
+            expected = results
+        elif results != expected:
+            print(f"[FAIL] workers={w}: results differ from workers={worker_counts[0]}")
+            return 1
+        rate = len(texts) / dt
+        baseline = baseline or rate
+        print(f"workers={w:<3d} {rate:10.0f} texts/s  speed-up x{rate / baseline:.2f}  ({dt:.2f}s)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
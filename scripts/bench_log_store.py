@@ -0,0 +1,113 @@
+# scripts/bench_log_store.py
+# Owlume — clarity log lookups: linear scan vs LogStore sidecar index.
+#
+# Writes --records synthetic records into a temporary logs dir (size-capped
+# segments + sidecars, as log_record does), then times
+#
+#   scan:        read every line of every segment, json.loads, filter
+#   store cold:  LogStore(...).get(...) in a new store (loads the sidecars)
+#   store warm:  the same store again (sidecars already in memory)
+#
+# for a session lookup and a one-hour range query.
+#
+# Usage:
+#   python scripts/bench_log_store.py [--records 50000] [--segment-kb 4096]
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, List
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+if hasattr(sys.stdout, "reconfigure"):
+    try:
+        sys.stdout.reconfigure(encoding="utf-8")
+    except Exception:
+        pass
+
+from clarity_log_shards import log_files, record_meta, record_time  # noqa: E402
+from clarity_log_store import LogStore, SegmentAppender  # noqa: E402
+
+T0 = dt.datetime(2026, 1, 1, tzinfo=dt.timezone.utc)
+
+
+def _scan(logs: str, keep: Callable[[dict], bool]) -> List[dict]:
+    out = []
+    for p in log_files(logs):
+        with open(p, "r", encoding="utf-8-sig") as f:
+            for line in f:
+                rec = json.loads(line)
+                if keep(rec):
+                    out.append(rec)
+    return out
+
+
+def _ms(fn: Callable[[], Any]) -> float:
+    t0 = time.perf_counter()
+    fn()
+    return (time.perf_counter() - t0) * 1e3
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Clarity log lookups: scan vs LogStore")
+    ap.add_argument("--records", type=int, default=50000)
+    ap.add_argument("--segment-kb", type=int, default=4096)
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as logs:
+        app = SegmentAppender(max_bytes=args.segment_kb * 1024)
+        month = f"{logs}/clarity_gain_202601.jsonl"
+        batch = []
+        for i in range(args.records):
+            rec = {"session_id": f"DLM-{i:07d}", "user_text": "I keep postponing the hard conversation. " * 4,
+                   "timestamp": (T0 + dt.timedelta(seconds=30 * i)).isoformat(),
+                   "detected": {"mode": "Critical", "principle": "Assumption"}, "cg_delta": 0.3}
+            batch.append(((json.dumps(rec) + "\n").encode(), record_meta(rec)))
+            if len(batch) == 512:
+                app.write(month, batch)
+                batch = []
+        if batch:
+            app.write(month, batch)
+        app.close()
+
+        sid = f"DLM-{args.records // 2:07d}"
+        t0 = (T0 + dt.timedelta(seconds=30 * (args.records // 3))).timestamp()
+        t1 = t0 + 3600
+        in_range = lambda r: t0 <= (record_time(r) or 0) < t1  # noqa: E731
+
+        files = log_files(logs)
+        size_mb = sum(Path(p).stat().st_size for p in files) / 1e6
+        print("🦉  OWLUME — CLARITY LOG STORE BENCH")
+        print(f"records={args.records} segments={len(files)} size={size_mb:.1f} MB")
+        print(f"{'':14s} {'get ms':>9s} {'range ms':>9s}")
+
+        scan_get = _ms(lambda: _scan(logs, lambda r: r.get("session_id") == sid))
+        scan_range = _ms(lambda: _scan(logs, in_range))
+        print(f"{'scan':14s} {scan_get:9.2f} {scan_range:9.2f}")
+
+        cold = LogStore(logs)
+        cold_get = _ms(lambda: cold.get(sid))
+        cold_range = _ms(lambda: list(LogStore(logs).range(t0, t1)))
+        print(f"{'store cold':14s} {cold_get:9.2f} {cold_range:9.2f}")
+
+        warm_get = _ms(lambda: cold.get(sid))
+        warm_range = _ms(lambda: list(cold.range(t0, t1)))
+        print(f"{'store warm':14s} {warm_get:9.3f} {warm_range:9.3f}")
+
+        assert [r["session_id"] for r in cold.get(sid)] == [sid]
+        assert len(list(cold.range(t0, t1))) == len(_scan(logs, in_range)) == 120
+        print(f"warm get x{scan_get / max(warm_get, 1e-9):.0f} faster, "
+              f"range x{scan_range / max(warm_range, 1e-9):.0f} faster than a scan")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,82 @@
+# scripts/bench_pack_cold_start.py
+# Owlume — Engine cold start with and without the compiled pack bundle.
+#
+# Each sample is a fresh interpreter (what a new worker pays):
+#   import elenx_loader -> load_packs(fast=...) -> ElenxEngine(packs)
+# Reports the median of --runs samples for the loader alone and for
+# loader + engine construction, plus whole-process wall time.
+#
+# Usage:
+#   python scripts/bench_pack_cold_start.py [--runs 15]
+#   (recompiles data/runtime/packs.bundle first)
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+if hasattr(sys.stdout, "reconfigure"):
+    try:
+        sys.stdout.reconfigure(encoding="utf-8")
+    except Exception:
+        pass
+
+from src.elenx_loader import compile_packs  # noqa: E402
+
+_CHILD = """
+import json, sys, time
+t0 = time.perf_counter()
+sys.path.insert(0, {root!r})
+from src import elenx_loader
+packs = elenx_loader.load_packs(fast={fast})
+t1 = time.perf_counter()
+from src.elenx_engine import ElenxEngine
+ElenxEngine(packs)
+t2 = time.perf_counter()
+print(json.dumps({{"loader_ms": (t1 - t0) * 1e3, "engine_ms": (t2 - t0) * 1e3}}))
+"""
+
+
+def _sample(fast: bool) -> dict:
+    code = _CHILD.format(root=str(ROOT), fast=fast)
+    t0 = time.perf_counter()
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        check=True, capture_output=True, text=True,
+        env={**os.environ, "ELENX_WEIGHTS_RELOAD": "0"},
+    )
+    row = json.loads(out.stdout.strip().splitlines()[-1])
+    row["process_ms"] = (time.perf_counter() - t0) * 1e3
+    return row
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Benchmark engine cold start with/without the pack bundle")
+    ap.add_argument("--runs", type=int, default=15)
+    args = ap.parse_args()
+
+    bundle = compile_packs()
+    print("🦉  OWLUME — PACK COLD START BENCH")
+    print(f"bundle={bundle.relative_to(ROOT)} ({bundle.stat().st_size} bytes) runs={args.runs}")
+
+    _sample(False)  # warm the OS file cache and .pyc files
+    for fast in (False, True):
+        rows = [_sample(fast) for _ in range(args.runs)]
+        med = {k: statistics.median(r[k] for r in rows) for k in rows[0]}
+        label = "bundle  " if fast else "json+val"
+        print(f"{label} load_packs={med['loader_ms']:7.1f}ms  +engine={med['engine_ms']:7.1f}ms  "
+              f"process={med['process_ms']:7.1f}ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
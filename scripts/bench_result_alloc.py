@@ -0,0 +1,137 @@
+# scripts/bench_result_alloc.py
+# Owlume — per-request allocation benchmark for result types + serialization.
+#
+# One "request" = ElenxEngine.analyze (result cache on, so steady-state QPS
+# is mostly hits) + render_question_pack + to_dict. Compares:
+#
+#   before: dict-of-lists tags copied per hit, slugify regexes and uuid4 per
+#           pack, dataclasses.asdict deep copy (the previous code path,
+#           reproduced below)
+#   after:  shared immutable DetectionResult / Tags, memoized slug ids,
+#           slotted UIPayload with a hand-written to_dict
+#
+# Reports tracemalloc peak bytes per request, blocks held by its output dict,
+# and time per request.
+#
+# Usage:
+#   python scripts/bench_result_alloc.py [--repeat 2000]
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+import tracemalloc
+import uuid
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+if hasattr(sys.stdout, "reconfigure"):
+    try:
+        sys.stdout.reconfigure(encoding="utf-8")
+    except Exception:
+        pass
+
+import src.elenx_engine as EE  # noqa: E402
+from src.elenx_loader import load_packs  # noqa: E402
+from src.question_renderer import render_question_pack, slugify  # noqa: E402
+from src.result_cache import ResultCache  # noqa: E402
+
+from bench_engine_analyze import SAMPLES  # noqa: E402
+
+
+@dataclass
+class _LegacyPayload:
+    id: str
+    created_at: str
+    mode_id: str
+    mode_label: str
+    principle_id: str
+    principle_label: str
+    confidence: float
+    empathy_on: bool
+    tags: Dict[str, List[str]]
+    questions: List[Dict[str, Any]]
+
+
+def _before(eng: EE.ElenxEngine, text: str) -> Dict[str, Any]:
+    det, questions = eng.analyze(text)
+    tags = {k: list(v) for k, v in det.tags.items()}  # per-hit copy of the cached tag lists
+    mode_id = slugify(det.mode)
+    principle_id = slugify(f"{det.mode}--{det.principle}")
+    items = [{"id": f"q-{mode_id}-{principle_id}-{i}", "text": q.strip(), "order": i}
+             for i, q in enumerate(questions, 1)]
+    pack = _LegacyPayload(
+        id=f"qpack-{uuid.uuid4().hex[:12]}",
+        created_at=time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime()),
+        mode_id=mode_id, mode_label=det.mode,
+        principle_id=principle_id, principle_label=det.principle,
+        confidence=round(float(det.confidence), 2), empathy_on=bool(det.empathy_on),
+        tags=tags, questions=items,
+    )
+    return asdict(pack)
+
+
+def _after(eng: EE.ElenxEngine, text: str) -> Dict[str, Any]:
+    det, questions = eng.analyze(text)
+    return render_question_pack(
+        mode_label=det.mode, principle_label=det.principle, questions=questions,
+        confidence=det.confidence, empathy_on=det.empathy_on, tags=det.tags,
+    ).to_dict()
+
+
+def _measure(fn, eng: EE.ElenxEngine, repeat: int) -> Dict[str, float]:
+    for s in SAMPLES:  # warm caches (result cache, slug ids, question table)
+        fn(eng, s)
+    n = repeat * len(SAMPLES)
+
+    tracemalloc.start()
+    peak = blocks = 0
+    for _ in range(max(1, repeat // 10)):
+        for s in SAMPLES:
+            before = tracemalloc.take_snapshot()
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+            out = fn(eng, s)
+            peak += tracemalloc.get_traced_memory()[1] - base
+            diff = tracemalloc.take_snapshot().compare_to(before, "filename")
+            blocks += sum(max(0, d.count_diff) for d in diff)
+            del out
+    tracemalloc.stop()
+    samples = max(1, repeat // 10) * len(SAMPLES)
+
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        for s in SAMPLES:
+            fn(eng, s)
+    us = (time.perf_counter() - t0) / n * 1e6
+    return {"peak_bytes": peak / samples, "out_blocks": blocks / samples, "us": us}
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Per-request allocations: result types + to_dict")
+    ap.add_argument("--repeat", type=int, default=2000)
+    args = ap.parse_args()
+
+    eng = EE.ElenxEngine(load_packs(), result_cache=ResultCache(maxsize=64))
+    assert _before(eng, SAMPLES[0])["questions"] == _after(eng, SAMPLES[0])["questions"]
+
+    before = _measure(_before, eng, args.repeat)
+    after = _measure(_after, eng, args.repeat)
+
+    print("🦉  OWLUME — RESULT ALLOCATION BENCH (cached analyze + pack + to_dict)")
+    print(f"samples={len(SAMPLES)} repeat={args.repeat}")
+    print(f"{'':8s} {'peak B/req':>11s} {'out blocks':>11s} {'µs/req':>9s}")
+    for name, r in (("before", before), ("after", after)):
+        print(f"{name:8s} {r['peak_bytes']:11.0f} {r['out_blocks']:11.1f} {r['us']:9.1f}")
+    print(f"peak bytes x{before['peak_bytes'] / max(after['peak_bytes'], 1):.1f} less, "
+          f"time x{before['us'] / max(after['us'], 1e-9):.1f} faster")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,90 @@
+# scripts/bench_validators.py
+# Owlume — per-record schema check: compiled Draft7Validator vs generated module.
+#
+# For each schema in schema_codegen.FAST_SCHEMAS, times is_valid on the
+# schema's example records (valid path) and iter_errors on a record with a
+# few broken fields (error path):
+#
+#   before: jsonschema Draft7Validator (compiled once, as the registry does)
+#   after:  src/fast_validators/<schema>.py via SchemaRegistry.checker
+#
+# Usage:
+#   python scripts/bench_validators.py [--repeat 20000]
+
+from __future__ import annotations
+
+import argparse
+import copy
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+if hasattr(sys.stdout, "reconfigure"):
+    try:
+        sys.stdout.reconfigure(encoding="utf-8")
+    except Exception:
+        pass
+
+from jsonschema import Draft7Validator  # noqa: E402
+
+from src.schema_codegen import FAST_SCHEMAS, stale  # noqa: E402
+from src.schema_registry import SchemaRegistry  # noqa: E402
+
+JTS = {"type": "position", "statement": "We ship the smaller scope first.", "confidence": 0.7,
+       "owner": "user", "acknowledged": True, "timestamp": "2026-01-01T00:00:00Z"}
+
+
+def _records(schema: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return list(schema.get("examples") or [JTS])
+
+
+def _broken(record: Dict[str, Any]) -> Dict[str, Any]:
+    bad = copy.deepcopy(record)
+    for i, key in enumerate(list(bad)[:3]):
+        bad[key] = None if i % 2 else 12
+    bad["unexpected"] = True
+    return bad
+
+
+def _us(fn: Callable[[Any], Any], records: List[Any], repeat: int) -> float:
+    for r in records:
+        fn(r)
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        for r in records:
+            fn(r)
+    return (time.perf_counter() - t0) / (repeat * len(records)) * 1e6
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Per-record validation time: Draft7Validator vs generated module")
+    ap.add_argument("--repeat", type=int, default=20000)
+    args = ap.parse_args()
+
+    if stale():
+        print(f"generated validators are stale: {stale()} (run python src/schema_codegen.py build)")
+        return 1
+    reg = SchemaRegistry()
+    print("🦉  OWLUME — SCHEMA VALIDATION BENCH (µs per record)")
+    print(f"{'schema':26s} {'path':6s} {'draft7':>9s} {'fast':>9s} {'speedup':>8s}")
+    for name in FAST_SCHEMAS:
+        ref = Draft7Validator(reg.schema(name))
+        fast = reg.checker(name)
+        good = _records(reg.schema(name))
+        bad = [_broken(r) for r in good]
+        assert all(fast.is_valid(r) for r in good) and not any(fast.is_valid(r) for r in bad)
+        rows = (("valid", lambda r: ref.is_valid(r), lambda r: fast.is_valid(r), good),
+                ("errors", lambda r: list(ref.iter_errors(r)), lambda r: list(fast.iter_errors(r)), bad))
+        for label, before, after, recs in rows:
+            n = args.repeat if label == "valid" else max(1, args.repeat // 10)
+            b, a = _us(before, recs, n), _us(after, recs, n)
+            print(f"{name:26s} {label:6s} {b:9.2f} {a:9.2f} {b / max(a, 1e-9):7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
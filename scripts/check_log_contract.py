@@ -1,13 +1,14 @@
 # scripts/check_log_contract.py
 from __future__ import annotations
 
-import glob
 import json
 import os
 import sys
-import re
 from typing import Any, Dict
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+from clarity_log_shards import log_files  # noqa: E402
+
 
 def fail(msg: str) -> None:
     print(f"❌ {msg}")
@@ -32,17 +33,8 @@ def load_jsonl(path: str):
 
 def main() -> None:
     logs_dir = os.path.join("data", "logs")
-    files = sorted(
-        f for f in glob.glob(os.path.join(logs_dir, "clarity_gain_*.jsonl"))
-        if os.path.basename(f)[-11:-5] >= "202601"
-    )
-    LOG_PATTERN = re.compile(r"^clarity_gain_(\d{6})\.jsonl$")
-
-    files = sorted(
-        f for f in glob.glob(os.path.join(logs_dir, "clarity_gain_*.jsonl"))
-        if (m := LOG_PATTERN.match(os.path.basename(f)))
-        and m.group(1) >= "202601"
-    )
+    # monthly segments and per-worker shards (clarity_gain_YYYYMM[.wPID].jsonl)
+    files = log_files(logs_dir, since="202601")
 
     if not files:
         ok("No clarity_gain_*.jsonl files found — nothing to check.")
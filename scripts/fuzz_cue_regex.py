@@ -0,0 +1,99 @@
+# scripts/fuzz_cue_regex.py
+# Owlume — worst-case latency fuzz for every cue pattern.
+#
+# Targets:
+#   engine:<cue id>     each pattern of the engine's shared CueScanner (prior,
+#                       rule, fallacy, context tables + pack/rule-pack cues),
+#                       timed as a plain re.search
+#   engine:scanner      the whole one-pass scan, engine:lexicon the stemmed
+#                       LINGUISTIC_CUES lookup, engine:features both together
+#   engine:analyze      ElenxEngine.analyze end to end (input cap applied)
+#   t1:<stage>:<name>   T1 blueprint PriorScanner / ModeDetector /
+#                       PrincipleDetector / EmpathyOverlay patterns
+#
+# Each target runs on pathological inputs (long repeats, a huge paste,
+# Unicode edge cases, per-pattern word runs) at growing sizes; p99 latency
+# and the fitted growth exponent are printed per target. Exits 1 if any
+# target is super-linear (exponent > --max-exponent).
+#
+# Usage:
+#   python scripts/fuzz_cue_regex.py [--sizes 2000,8000,32000] [--reps 5]
+#                                    [--only engine:rule] [--json out.json]
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sys
+from dataclasses import asdict
+from pathlib import Path
+from typing import Dict
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+if hasattr(sys.stdout, "reconfigure"):
+    try:
+        sys.stdout.reconfigure(encoding="utf-8")
+    except Exception:
+        pass
+
+import src.elenx_engine as EE  # noqa: E402
+import src.T1_elenx_engine_blueprint as T1  # noqa: E402
+from src.elenx_loader import load_packs  # noqa: E402
+from src.regex_fuzz import DEFAULT_SIZES, MAX_EXPONENT, Target, fuzz_patterns  # noqa: E402
+from src.text_features import TextFeatures  # noqa: E402
+
+
+def collect_targets() -> Dict[str, Target]:
+    eng = EE.ElenxEngine(load_packs())
+    scanner, lexicon = eng._scanner, eng._lexicon
+    targets: Dict[str, Target] = {f"engine:{cid}": pat for cid, pat in scanner._compiled.items()}
+    targets["engine:scanner"] = scanner.scan
+    targets["engine:lexicon"] = lambda t: lexicon.match(t.split())
+    targets["engine:features"] = lambda t: TextFeatures.build(t, scanner, lexicon)
+    targets["engine:analyze"] = lambda t: eng.analyze(t, empathy_on=False)
+
+    priors = T1.PriorScanner({}, {})
+    for fid, pat in priors.fallacy_patterns + priors.context_patterns:
+        targets[f"t1:priors:{fid}"] = pat
+    for stage, det in (("mode", T1.ModeDetector({})), ("principle", T1.PrincipleDetector({}))):
+        for name, pats in det.cues.items():
+            for i, pat in enumerate(pats):
+                targets[f"t1:{stage}:{name}:{i}"] = re.compile(pat, re.I)
+    for i, pat in enumerate(T1.EmpathyOverlay().triggers):
+        targets[f"t1:empathy:{i}"] = pat
+    return targets
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Fuzz cue patterns for super-linear worst cases")
+    ap.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)), help="comma-separated input sizes (chars)")
+    ap.add_argument("--reps", type=int, default=5, help="calls per input (p99 / min over these)")
+    ap.add_argument("--max-exponent", type=float, default=MAX_EXPONENT)
+    ap.add_argument("--only", default="", help="only targets whose name starts with this prefix")
+    ap.add_argument("--json", default="", help="also write the reports to this path")
+    args = ap.parse_args()
+
+    sizes = tuple(int(s) for s in args.sizes.split(",") if s.strip())
+    targets = {k: v for k, v in collect_targets().items() if k.startswith(args.only)}
+    reports = fuzz_patterns(targets, sizes=sizes, reps=args.reps, max_exponent=args.max_exponent)
+
+    print("🦉  OWLUME — CUE REGEX FUZZ (worst case per pattern)")
+    print(f"targets={len(reports)} sizes={sizes} reps={args.reps} max_exponent={args.max_exponent}")
+    print(f"{'target':40s} {'k':>5s} {'p99 µs':>10s} {'max µs':>10s}  worst input")
+    for r in reports:
+        flag = "  ❌ SUPER-LINEAR" if r.superlinear else ""
+        print(f"{r.name[:40]:40s} {r.exponent:5.2f} {r.p99_us:10.1f} {r.max_us:10.1f}  {r.worst_family}{flag}")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps([asdict(r) for r in reports], indent=2), encoding="utf-8")
+
+    bad = [r.name for r in reports if r.superlinear]
+    print(f"\nFUZZ: {'FAIL ' + ', '.join(bad) if bad else 'PASS'}")
+    return 1 if bad else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,52 @@
+# scripts/merge_clarity_shards.py
+# Owlume — fold per-worker clarity log shards into the monthly segments.
+#
+# Workers logging with shard=True / ELENX_LOG_SHARDS=1 append to
+# data/logs/clarity_gain_YYYYMM.w{pid}.jsonl. This merges them, time-ordered,
+# onto the month's segments (safe to run while workers keep logging, and
+# from cron alongside another merger: a month being merged is skipped).
+#
+# Usage:
+#   python scripts/merge_clarity_shards.py [--logs-dir data/logs] [--month 202601 ...] [--every 60]
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+if hasattr(sys.stdout, "reconfigure"):
+    try:
+        sys.stdout.reconfigure(encoding="utf-8")
+    except Exception:
+        pass
+
+from clarity_log_shards import merge_shards  # noqa: E402
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Merge clarity log worker shards into monthly segments")
+    ap.add_argument("--logs-dir", default=str(ROOT / "data" / "logs"))
+    ap.add_argument("--month", action="append", help="YYYYMM (repeatable; default: every month with shards)")
+    ap.add_argument("--every", type=float, default=0.0, help="keep merging every N seconds")
+    args = ap.parse_args()
+
+    while True:
+        t0 = time.perf_counter()
+        done = merge_shards(args.logs_dir, args.month)
+        for month, n in done.items():
+            print(f"{month}: " + ("skipped (another merge holds the lock)" if n < 0 else f"merged {n} line(s)"))
+        if not done:
+            print("no shards to merge")
+        print(f"merge took {(time.perf_counter() - t0) * 1e3:.1f} ms")
+        if args.every <= 0:
+            return 0
+        time.sleep(args.every)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
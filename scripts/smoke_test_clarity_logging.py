@@ -49,6 +49,16 @@ def tier_for_delta(delta: float, thresholds_doc: dict) -> str:
 def round_opt(x, nd=2):
     return None if x is None else round(x, nd)
 
+def alt_for(det):
+    """Top-2 carry: the cascade's alternative, else the runner-up cell of the ranked scores."""
+    if det.alt_mode is not None:
+        return {"mode": det.alt_mode, "principle": det.alt_principle,
+                "confidence": round_opt(det.alt_confidence, 2)}
+    ru = det.runner_up
+    if ru is None:
+        return {"mode": None, "principle": None, "confidence": None}
+    return {"mode": ru[0], "principle": ru[1], "confidence": round(ru[2], 2)}
+
 def main():
     packs = load_packs()
     eng = ElenxEngine(packs)
@@ -84,14 +94,10 @@ def main():
             "detected": {
                 "mode": det.mode,
                 "principle": det.principle,
-                "drivers": det.tags.get("contexts", []),
+                "drivers": list(det.tags.get("contexts", ())),
                 "empathy": det.empathy_on,
                 "confidence": round(det.confidence, 2),
-                "alt": {
-                    "mode": getattr(det, "alt_mode", None),
-                    "principle": getattr(det, "alt_principle", None),
-                    "confidence": round_opt(getattr(det, "alt_confidence", None), 2),
-                },
+                "alt": alt_for(det),
             },
             "voices": ["Peterson", "Feynman"],
             "clarity_gain": {"CG_pre": cg_pre, "CG_post": cg_post, "CG_delta": cg_delta},
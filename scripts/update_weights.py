@@ -79,8 +79,11 @@ def load_json(p):
         return json.load(f)
 
 def save_json(p, obj):
-    with open(p, "w", encoding="utf-8") as f:
+    # Write-then-rename so engines hot-reloading the file never see a partial write
+    tmp = Path(str(p) + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
         json.dump(obj, f, ensure_ascii=False, indent=2)
+    os.replace(tmp, p)
 
 def roundish(d):
     return {k: (round(v, 4) if isinstance(v, (int,float)) else v) for k, v in d.items()}
@@ -26,6 +26,11 @@ import json
 import re
 import logging
 
+try:
+    from src.scan_guard import ScanGuard
+except ImportError:  # run from src/ (python T1_elenx_engine_blueprint.py)
+    from scan_guard import ScanGuard
+
 # ----------------------------------------------------------------------------
 # 0) Config & Logging
 # ----------------------------------------------------------------------------
@@ -133,7 +138,8 @@ class PriorScanner:
         # Below are illustrative placeholders:
         default_fallacies = [
             ("hasty_generalization", re.compile(r"\ball\b|\balways\b|\beveryone\b", re.I)),
-            ("false_dilemma", re.compile(r"\beither\b.*\bor\b|\bno other option\b", re.I)),
+            # bounded gap: ".*" here backtracks to the end of the text for every "either" (quadratic)
+            ("false_dilemma", re.compile(r"\beither\b.{0,160}?\bor\b|\bno other option\b", re.I)),
         ]
         default_contexts = [
             ("incentive_misalignment", re.compile(r"bonus|commission|quota", re.I)),
@@ -266,22 +272,27 @@ class EmpathyOverlay:
 # ----------------------------------------------------------------------------
 
 class ElenxEngine:
-    def __init__(self, loader: DataLoader):
+    def __init__(self, loader: DataLoader, guard: Optional[ScanGuard] = None):
         self.loader = loader
         self.priors = PriorScanner(loader.fallacies, loader.context_drivers)
         self.mode_detector = ModeDetector(loader.matrix)
         self.principle_detector = PrincipleDetector(loader.matrix)
         self.renderer = QuestionRenderer(loader.matrix, loader.voices)
         self.empathy = EmpathyOverlay()
+        # caps the text each cue stage scans ("priors", "mode", "principle", "empathy")
+        self.guard = guard or ScanGuard()
 
     def generate(self, text: str, n: int = 3, force_voice: Optional[str] = None) -> List[Question]:
+        cap = self.guard.cap
+
         # 1) pre-scan priors
-        tags = self.priors.scan(text)
+        tags = self.priors.scan(cap("priors", text))
         prior_bias = 0.15 if (tags.fallacies or tags.contexts) else 0.0
 
         # 2) detect mode/principle (fusion could incorporate LLM scores later)
-        mode_guess = self.mode_detector.detect(text, prior_bias=prior_bias)
-        principle_guess = self.principle_detector.detect(text, mode_guess.mode)
+        mode_guess = self.mode_detector.detect(cap("mode", text), prior_bias=prior_bias)
+        principle_guess = self.principle_detector.detect(cap("principle", text), mode_guess.mode)
+        apply_empathy = self.empathy.should_apply(cap("empathy", text))
 
         # 3) render questions (could produce variations)
         qs: List[Question] = []
@@ -290,7 +301,7 @@ class ElenxEngine:
 
             # 4) empathy overlay (conditional)
             applied_empathy = False
-            if self.empathy.should_apply(text):
+            if apply_empathy:
                 q_text = self.empathy.apply(q_text)
                 applied_empathy = True
 
@@ -1,9 +1,14 @@
 # src/aggregator.py
 from __future__ import annotations
-import json, os, math, datetime as dt
+import json, math, datetime as dt
 from typing import Dict, Any, Iterable, Tuple, List, Optional, DefaultDict
 from collections import defaultdict, Counter
 
+try:
+    from src.clarity_log_shards import expand_log_files
+except ImportError:  # imported with src/ on sys.path
+    from clarity_log_shards import expand_log_files
+
 def _parse_iso(ts: str) -> dt.datetime:
     # Accepts "...Z" or timezone-naive ISO; normalizes to UTC-naive for bucketing.
     ts = ts.strip().replace("Z","")
@@ -34,6 +39,8 @@ class Aggregator:
       - did (string id)
     Optional:
       - tags.contexts: [str], tags.fallacies: [str]
+    A clarity_gain_YYYYMM*.jsonl path reads that whole month: the segment
+    plus any per-worker shards not merged yet (see clarity_log_shards).
     """
     def __init__(self, log_files: Iterable[str]) -> None:
         self.log_files = list(log_files)
@@ -41,10 +48,8 @@ class Aggregator:
 
     def load(self) -> int:
         count = 0
-        for path in self.log_files:
-            if not os.path.exists(path):
-                continue
-            with open(path, "r", encoding="utf-8") as f:
+        for path in expand_log_files(self.log_files):
+            with open(path, "r", encoding="utf-8-sig") as f:
                 for line in f:
                     line = line.strip()
                     if not line: continue
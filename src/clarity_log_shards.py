@@ -0,0 +1,395 @@
+# src/clarity_log_shards.py
+# Per-worker clarity log shards + merge into the monthly segment.
+#
+# Several worker processes appending to one clarity_gain_YYYYMM.jsonl contend
+# on it, and buffered writers can interleave partial lines. With sharding on
+# (log_record(shard=True), ClarityLogWriter(shard=True) or ELENX_LOG_SHARDS=1)
+# each process appends to its own shard instead:
+#
+#   data/logs/clarity_gain_202601.jsonl            first segment (appended to by writers and merges)
+#   data/logs/clarity_gain_202601.s2.jsonl         further size-capped segments (clarity_log_store)
+#   data/logs/clarity_gain_202601.w4242.jsonl      shard of worker pid 4242
+#   data/logs/clarity_gain_202601.w4242.merging.jsonl   shard taken by a running merge
+#   data/logs/clarity_gain_202601.jsonl.idx        sidecar index of a segment
+#
+# - append_line(path, data): one O_APPEND write() per call, so lines from
+#   threads of one worker never interleave. Writers take a shared flock and
+#   re-check the path's inode, so a merge that renamed the shard away can't
+#   swallow a line (no fcntl, e.g. Windows: plain O_APPEND writes).
+# - merge_shards(logs_dir): renames each month's shards to *.merging, waits
+#   for in-flight writes (exclusive flock), then k-way merges them by record
+#   timestamp (heapq.merge; one line per input held in memory) and appends
+#   the result to the month's segments with SegmentAppender: O_APPEND, so
+#   writers holding a segment open lose nothing, rolling over at the segment
+#   cap, with sidecar lines. Segments are never rewritten; each merge's batch
+#   is time-ordered, the month as a whole is in append order. A merge that
+#   crashed before unlinking its *.merging shards is retried without
+#   appending their lines twice.
+# - ShardMerger: runs merge_shards every interval_s on a daemon thread.
+# - Readers call expand_log_files(paths) / log_files(logs_dir): any
+#   clarity_gain_YYYYMM[.sN|.wPID[.merging]].jsonl stands for the whole
+#   month, i.e. its segments + shards, so they see one log whether or not a
+#   merge has run. A reader listing files in the instant between a merge's
+#   append and its unlink can see that month's merged lines twice.
+from __future__ import annotations
+
+import codecs
+import datetime as dt
+import heapq
+import json
+import os
+import re
+import threading
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore[assignment]
+
+SHARD_LOGS = os.getenv("ELENX_LOG_SHARDS", "0") == "1"
+
+LOG_RX = re.compile(r"^clarity_gain_(\d{6})(?:\.s(\d+)|\.w(\d+)(\.merging)?)?\.jsonl$")
+INDEX_SUFFIX = ".idx"
+
+Meta = Tuple[Optional[float], Optional[str], Optional[str]]  # (time, session_id, did)
+_TS_RX = re.compile(r"^(\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(?:\.\d+)?)(Z|[+-]\d{2}:?\d{2})?$")
+
+
+class LogName(NamedTuple):
+    month: str
+    pid: Optional[int]   # shards only
+    merging: bool        # shard taken by a running merge
+    seq: Optional[int]   # segments only: 1 for clarity_gain_YYYYMM.jsonl, N for .sN
+
+
+def segment_name(month: str, seq: int = 1) -> str:
+    return f"clarity_gain_{month}.jsonl" if seq <= 1 else f"clarity_gain_{month}.s{seq}.jsonl"
+
+
+def canonical_name(month: str) -> str:
+    return segment_name(month, 1)
+
+
+def shard_path(logs_dir: str = "data/logs", now: Optional[dt.datetime] = None, pid: Optional[int] = None) -> str:
+    """This worker's shard for the month of `now` (default: current local time, like segment_path)."""
+    month = (now or dt.datetime.now()).strftime("%Y%m")
+    return os.path.join(logs_dir, f"clarity_gain_{month}.w{os.getpid() if pid is None else pid}.jsonl")
+
+
+def parse_log_name(name: str) -> Optional[LogName]:
+    """LogName for a clarity log file name (segment or shard), else None."""
+    m = LOG_RX.match(os.path.basename(name))
+    if not m:
+        return None
+    month, seq, pid, merging = m.groups()
+    if pid:
+        return LogName(month, int(pid), bool(merging), None)
+    return LogName(month, None, False, int(seq) if seq else 1)
+
+
+# ---------- writing ----------
+
+def append_line(path: str, data: bytes, fsync: bool = False) -> None:
+    """Append data (one or more whole lines) with a single O_APPEND write."""
+    flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+    while True:
+        fd = os.open(path, flags, 0o644)
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_SH)
+                try:
+                    same = os.stat(path).st_ino == os.fstat(fd).st_ino
+                except FileNotFoundError:
+                    same = False
+                if not same:  # a merge renamed this shard between open and lock
+                    continue
+            view = memoryview(data)
+            while view:  # regular files take the whole write; loop only for safety
+                view = view[os.write(fd, view):]
+            if fsync:
+                os.fsync(fd)
+            return
+        finally:
+            os.close(fd)
+
+
+# ---------- listing ----------
+
+def month_files(logs_dir: str, month: str) -> List[str]:
+    """Segments of one month in order, then its merging and live shards."""
+    try:
+        names = os.listdir(logs_dir)
+    except FileNotFoundError:
+        return []
+    parts = []
+    for name in names:
+        p = parse_log_name(name)
+        if p and p.month == month:
+            parts.append((0, p.seq, 0, name) if p.pid is None else (1, not p.merging, p.pid, name))
+    return [os.path.join(logs_dir, part[-1]) for part in sorted(parts)]
+
+
+def month_segments(logs_dir: str, month: str) -> List[str]:
+    return [f for f in month_files(logs_dir, month) if parse_log_name(f).pid is None]
+
+
+def log_months(logs_dir: str) -> List[str]:
+    try:
+        names = os.listdir(logs_dir)
+    except FileNotFoundError:
+        return []
+    return sorted({p.month for p in map(parse_log_name, names) if p})
+
+
+def log_files(logs_dir: str = "data/logs", since: str = "") -> List[str]:
+    """Every clarity log file (segments + shards) for months >= since (YYYYMM)."""
+    return [f for month in log_months(logs_dir) if month >= since for f in month_files(logs_dir, month)]
+
+
+def expand_log_files(paths: Iterable[str]) -> List[str]:
+    """
+    Existing files to read for `paths`: a clarity log path (segment, shard or
+    merging shard, present or not) becomes its month's full file set; other
+    paths are kept if they exist. Order kept, duplicates dropped.
+    """
+    out: List[str] = []
+    seen = set()
+    done_months = set()
+    for path in paths:
+        p = parse_log_name(path)
+        if p is None:
+            files = [path] if os.path.exists(path) else []
+        else:
+            key = (os.path.abspath(os.path.dirname(path)), p.month)
+            if key in done_months:
+                continue
+            done_months.add(key)
+            files = month_files(os.path.dirname(path) or ".", p.month)
+        for f in files:
+            k = os.path.abspath(f)
+            if k not in seen:
+                seen.add(k)
+                out.append(f)
+    return out
+
+
+# ---------- records ----------
+
+def record_time(rec: dict) -> Optional[float]:
+    """UTC epoch seconds of rec["timestamp"] (naive times are taken as UTC), or None."""
+    ts = rec.get("timestamp") if isinstance(rec, dict) else None
+    if not isinstance(ts, str):
+        return None
+    m = _TS_RX.match(ts.strip())
+    if not m:
+        return None
+    base, tz = m.group(1).replace(" ", "T"), m.group(2)
+    if tz and tz != "Z" and ":" not in tz:
+        tz = tz[:3] + ":" + tz[3:]
+    try:
+        t = dt.datetime.fromisoformat(base + ("+00:00" if tz in (None, "Z") else tz))
+    except ValueError:
+        return None
+    return t.timestamp()
+
+
+def record_meta(rec: Any) -> Meta:
+    """(time, session_id, did) of a record, as kept in the sidecar index."""
+    if not isinstance(rec, dict):
+        return None, None, None
+    sid, did = rec.get("session_id"), rec.get("did")
+    return record_time(rec), (sid if isinstance(sid, str) else None), (did if isinstance(did, str) else None)
+
+
+# ---------- sidecar index ----------
+# <segment>.idx: a header line {"v": 1, "ino": <segment inode>}, then one
+# [offset, length, time, session_id, did] line per record (see clarity_log_store).
+
+def index_path(segment: str) -> str:
+    return segment + INDEX_SUFFIX
+
+
+def index_header(ino: int) -> bytes:
+    return (json.dumps({"v": 1, "ino": ino}) + "\n").encode("utf-8")
+
+
+def index_line(offset: int, length: int, meta: Meta) -> bytes:
+    t, sid, did = meta
+    return (json.dumps([offset, length, None if t is None else round(t, 3), sid, did],
+                       ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+# ---------- merging ----------
+
+def _keyed_lines(path: str, run: int) -> Iterator[Tuple[float, int, int, bytes, Meta]]:
+    """(time, run, line no, line, meta) per non-empty line; lines without a time keep the previous one."""
+    last = float("-inf")
+    with open(path, "rb") as f:
+        for i, line in enumerate(f):
+            if i == 0 and line.startswith(codecs.BOM_UTF8):
+                line = line[len(codecs.BOM_UTF8):]
+            if not line.strip():
+                continue
+            if not line.endswith(b"\n"):
+                line += b"\n"
+            try:
+                meta = record_meta(json.loads(line))
+            except ValueError:
+                meta = (None, None, None)
+            if meta[0] is not None:
+                last = meta[0]
+            yield last, run, i, line, meta
+
+
+class _MonthLock:
+    """Exclusive, non-blocking lock so only one process merges a month at a time."""
+
+    def __init__(self, logs_dir: str, month: str):
+        self.path = os.path.join(logs_dir, f".clarity_gain_{month}.merge.lock")
+        self.fd: Optional[int] = None
+
+    def __enter__(self) -> bool:
+        if fcntl is None:
+            return True
+        self.fd = os.open(self.path, os.O_WRONLY | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(self.fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return False
+        return True
+
+    def __exit__(self, *exc: object) -> None:
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+
+
+def _take(path: str) -> str:
+    """Rename a live shard to *.merging and wait for writes already in flight."""
+    taken = path[: -len(".jsonl")] + ".merging.jsonl"
+    os.replace(path, taken)
+    if fcntl is not None:
+        fd = os.open(taken, os.O_RDONLY)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        finally:
+            os.close(fd)
+    return taken
+
+
+def merge_month(logs_dir: str, month: str, fsync: bool = True, max_bytes: Optional[int] = None) -> int:
+    """
+    Append one month's shards, time-ordered, to its segments; returns shard
+    lines merged (-1: locked). Segments are only ever appended to (by
+    SegmentAppender, so they roll over at max_bytes and get sidecar lines),
+    never rewritten: writers holding a segment open keep appending safely.
+    """
+    try:
+        from src.clarity_log_store import SEGMENT_BYTES, SegmentAppender
+    except ImportError:  # imported with src/ on sys.path
+        from clarity_log_store import SEGMENT_BYTES, SegmentAppender
+
+    with _MonthLock(logs_dir, month) as locked:
+        if not locked:
+            return -1
+        leftover, shards = [], []
+        for f in month_files(logs_dir, month):
+            p = parse_log_name(f)
+            if p.pid is not None:
+                (leftover if p.merging else shards).append(f)
+        shards = leftover + [_take(f) for f in shards]
+        if not shards:
+            return 0
+        app = SegmentAppender(SEGMENT_BYTES if max_bytes is None else max_bytes)
+        seen = _merged_before(logs_dir, month, leftover, app.max_bytes) if leftover else frozenset()
+        cap = max(1, min(1 << 20, app.max_bytes // 2))  # bytes per append; a segment holds at least one
+        target = os.path.join(logs_dir, canonical_name(month))
+        merged, batch, size = 0, [], 0
+        try:
+            for _, run, _, line, meta in heapq.merge(*(_keyed_lines(p, i) for i, p in enumerate(shards))):
+                if run < len(leftover) and line in seen:
+                    continue
+                if batch and size + len(line) > cap:
+                    app.write(target, batch)
+                    batch, size = [], 0
+                batch.append((line, meta))
+                size += len(line)
+                merged += 1
+            if batch:
+                app.write(target, batch)
+            if fsync:
+                app.fsync()
+        finally:
+            app.close()
+        for f in shards:
+            os.unlink(f)
+        return merged
+
+
+def _merged_before(logs_dir: str, month: str, leftover: List[str], max_bytes: int) -> frozenset:
+    """
+    Lines a crashed merge may already have appended: those of the newest
+    segments, back to (leftover shard bytes + max_bytes), so a retried merge
+    doesn't append them twice.
+    """
+    budget = sum(os.path.getsize(f) for f in leftover) + max_bytes
+    lines = set()
+    for seg in reversed(month_segments(logs_dir, month)):
+        with open(seg, "rb") as f:
+            for i, line in enumerate(f):
+                lines.add(line[len(codecs.BOM_UTF8):] if i == 0 and line.startswith(codecs.BOM_UTF8) else line)
+        budget -= os.path.getsize(seg)
+        if budget <= 0:
+            break
+    return frozenset(lines)
+
+
+def merge_shards(logs_dir: str = "data/logs", months: Optional[Iterable[str]] = None, fsync: bool = True,
+                 max_bytes: Optional[int] = None) -> Dict[str, int]:
+    """Merge shards of every month that has some (or just `months`); {month: shard lines merged}."""
+    out: Dict[str, int] = {}
+    todo = log_months(logs_dir) if months is None else sorted(months)
+    for month in todo:
+        if any(parse_log_name(f).pid is not None for f in month_files(logs_dir, month)):
+            out[month] = merge_month(logs_dir, month, fsync=fsync, max_bytes=max_bytes)
+    return out
+
+
+class ShardMerger:
+    """Background merge_shards every interval_s seconds (daemon thread); stop() runs a last merge."""
+
+    def __init__(self, logs_dir: str = "data/logs", interval_s: float = 60.0):
+        self.logs_dir = logs_dir
+        self.interval_s = float(interval_s)
+        self.runs = 0
+        self.last: Dict[str, int] = {}
+        self.error: Optional[BaseException] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def run_once(self) -> Dict[str, int]:
+        self.last = merge_shards(self.logs_dir)
+        self.runs += 1
+        return self.last
+
+    def start(self) -> "ShardMerger":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._loop, name="ShardMerger", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, final_merge: bool = True) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if final_merge:
+            self.run_once()
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.interval_s):
+            try:
+                self.run_once()
+            except Exception as e:  # keep merging later; last error is kept for health checks
+                self.error = e
@@ -0,0 +1,372 @@
+# src/clarity_log_store.py
+# Size-capped clarity log segments with a sidecar offset / time index.
+#
+# Monthly logs used to grow without bound, and every lookup (a share update,
+# an audit, one user's history) was a scan of the whole month. Segments are
+# now capped at SEGMENT_BYTES (ELENX_LOG_SEGMENT_BYTES, default 64 MiB) and
+# each carries a sidecar index (format in clarity_log_shards):
+#
+#   clarity_gain_202601.jsonl        first segment (the old monthly file name)
+#   clarity_gain_202601.s2.jsonl     next one once the first is full, ...
+#   clarity_gain_202601.jsonl.idx    [offset, length, time, session_id, did] per record
+#
+# - SegmentAppender (used by log_record and ClarityLogWriter) writes each
+#   record / batch with one O_APPEND write, takes offsets from the file
+#   position after it (so concurrent appenders still index correctly), then
+#   appends the index lines. A line never spans segments; a segment holds
+#   at least one batch.
+# - LogStore reads the sidecars into memory, then on later calls only the
+#   sidecar lines added since. Whatever no sidecar covers (a crash between
+#   record and index line, worker shards, a pre-segment monthly log not yet
+#   appended to; the first append backfills its sidecar) is
+#   found by scanning just those byte ranges. A sidecar naming another inode
+#   (e.g. a segment copied or restored without it) is ignored.
+#
+#   store = LogStore("data/logs")
+#   store.get("DLM-20260101-101500")    # that session's records: one seek + read each
+#   store.get_did("did:example:123")
+#   store.range(t0, t1)                 # records with t0 <= timestamp < t1, read per time bucket
+from __future__ import annotations
+
+import codecs
+import datetime as dt
+import json
+import os
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+try:
+    from src.clarity_log_shards import (
+        Meta, index_header, index_line, index_path, log_files, month_segments, parse_log_name,
+        record_meta, segment_name,
+    )
+except ImportError:  # imported with src/ on sys.path
+    from clarity_log_shards import (
+        Meta, index_header, index_line, index_path, log_files, month_segments, parse_log_name,
+        record_meta, segment_name,
+    )
+
+SEGMENT_BYTES = int(os.getenv("ELENX_LOG_SEGMENT_BYTES", str(64 << 20)))
+BUCKET_S = 3600  # time bucket width for range()
+
+_BOM = codecs.BOM_UTF8
+TimeLike = Union[float, int, dt.datetime]
+
+
+def _write_all(fd: int, data: bytes) -> int:
+    """Write data with O_APPEND semantics; returns the file position after it."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+    return os.lseek(fd, 0, os.SEEK_CUR)
+
+
+class SegmentAppender:
+    """
+    Appends lines to a month's size-capped segments and their sidecars.
+
+    write(month_path, items) takes the month's first-segment path (what
+    clarity_logger.segment_path returns) and [(line, meta)], and returns the
+    segment actually written. keep_open=False closes the segment after each
+    write (log_record); ClarityLogWriter keeps it open between batches.
+    """
+
+    def __init__(self, max_bytes: int = SEGMENT_BYTES, keep_open: bool = True):
+        self.max_bytes = int(max_bytes)
+        self.keep_open = keep_open
+        self._fd: Optional[int] = None
+        self._path: Optional[str] = None
+        self._key: Optional[Tuple[str, str]] = None   # (logs_dir, month) of the open segment
+        self._seq: Dict[Tuple[str, str], int] = {}    # last segment seen per month
+        self._lock = threading.Lock()
+
+    def write(self, month_path: str, items: Sequence[Tuple[bytes, Meta]]) -> str:
+        data = b"".join(line for line, _ in items)
+        with self._lock:
+            fd, path = self._segment(month_path, len(data))
+            try:
+                off = _write_all(fd, data) - len(data)
+                idx = []
+                for line, meta in items:
+                    idx.append(index_line(off, len(line), meta))
+                    off += len(line)
+                _append(index_path(path), b"".join(idx))
+            finally:
+                if not self.keep_open:
+                    self._close()
+            return path
+
+    def fsync(self) -> None:
+        with self._lock:
+            if self._fd is not None:
+                os.fsync(self._fd)
+
+    def close(self) -> None:
+        with self._lock:
+            self._close()
+
+    def _close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+        self._fd = self._path = self._key = None
+
+    def _segment(self, month_path: str, need: int) -> Tuple[int, str]:
+        """Open segment of month_path's month with room for `need` more bytes (rolling over when full)."""
+        logs_dir, month = os.path.dirname(month_path), parse_log_name(month_path).month
+        key = (logs_dir, month)
+        if self._key != key:
+            self._close()
+            if key not in self._seq:
+                segs = month_segments(logs_dir, month)
+                self._seq[key] = parse_log_name(segs[-1]).seq if segs else 1
+        while True:
+            if self._fd is None:
+                self._open(os.path.join(logs_dir, segment_name(month, self._seq[key])), key)
+            size = os.fstat(self._fd).st_size
+            if size <= len(_BOM) or size + need <= self.max_bytes:
+                return self._fd, self._path  # type: ignore[return-value]
+            self._close()
+            self._seq[key] += 1
+
+    def _open(self, path: str, key: Tuple[str, str]) -> None:
+        flags = os.O_WRONLY | os.O_APPEND | getattr(os, "O_BINARY", 0)
+        try:
+            fd = os.open(path, flags | os.O_CREAT | os.O_EXCL, 0o644)
+        except FileExistsError:
+            fd = os.open(path, flags)
+            _ensure_sidecar(fd, path)
+        else:  # new segment: BOM like the old monthly files, fresh sidecar naming this inode
+            _write_all(fd, _BOM)
+            with open(index_path(path), "wb") as f:
+                f.write(index_header(os.fstat(fd).st_ino))
+        self._fd, self._path, self._key = fd, path, key
+
+
+def _ensure_sidecar(fd: int, path: str) -> None:
+    """
+    Give an existing segment without a sidecar header (a monthly log from
+    before segments) one, backfilled with a single scan of what it holds.
+    Records appended meanwhile by another process may miss the new sidecar;
+    LogStore finds those by scanning, as it does any unindexed bytes.
+    """
+    idx = index_path(path)
+    try:
+        with open(idx, "rb") as f:
+            if isinstance(_parse(f.readline()), dict):
+                return
+    except FileNotFoundError:
+        pass
+    tmp = f"{idx}.{os.getpid()}.tmp"
+    with open(path, "rb") as seg, open(tmp, "wb") as out:
+        out.write(index_header(os.fstat(fd).st_ino))
+        pos = len(_BOM) if seg.read(len(_BOM)) == _BOM else 0
+        seg.seek(pos)
+        for line in seg:
+            if not line.endswith(b"\n"):
+                break  # partial last line
+            if line.strip():
+                out.write(index_line(pos, len(line), record_meta(_parse(line))))
+            pos += len(line)
+    os.replace(tmp, idx)
+
+
+def _append(path: str, data: bytes) -> None:
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        _write_all(fd, data)
+    finally:
+        os.close(fd)
+
+
+class _FileIndex:
+    """In-memory index of one log file: spans by offset, offsets by key, byte range per time bucket."""
+
+    __slots__ = ("path", "ino", "size", "done", "sidecar_pos", "spans", "by_sid", "by_did", "buckets")
+
+    def __init__(self, path: str, ino: int):
+        self.path = path
+        self.ino = ino
+        self.size = 0            # file size at the last refresh
+        self.done = 0            # every record before this offset is indexed
+        self.sidecar_pos = -1    # bytes of the sidecar consumed (-1: header not read yet)
+        self.spans: Dict[int, int] = {}
+        self.by_sid: Dict[str, List[int]] = {}
+        self.by_did: Dict[str, List[int]] = {}
+        self.buckets: Dict[int, List[int]] = {}
+
+    def add(self, off: int, length: int, meta: Meta, bucket_s: int) -> None:
+        if off in self.spans:
+            return
+        self.spans[off] = length
+        t, sid, did = meta
+        if sid:
+            self.by_sid.setdefault(sid, []).append(off)
+        if did:
+            self.by_did.setdefault(did, []).append(off)
+        if t is not None:
+            b = self.buckets.get(int(t // bucket_s))
+            if b is None:
+                self.buckets[int(t // bucket_s)] = [off, off + length]
+            else:
+                b[0], b[1] = min(b[0], off), max(b[1], off + length)
+
+
+class LogStore:
+    """
+    Indexed reads over the clarity logs in logs_dir (segments and shards).
+
+    - get(session_id) / get_did(did): every record with that key, in log order
+    - range(t0, t1): records with t0 <= timestamp < t1 (epoch seconds or
+      datetimes; naive = UTC), in log order within each file
+    - stats: files, records indexed, bytes read by lookups / scanned to index
+    """
+
+    def __init__(self, logs_dir: str = "data/logs", bucket_s: int = BUCKET_S):
+        self.logs_dir = logs_dir
+        self.bucket_s = int(bucket_s)
+        self.stats: Dict[str, int] = {"files": 0, "records": 0, "read_bytes": 0, "scanned_bytes": 0}
+        self._files: Dict[str, _FileIndex] = {}
+        self._lock = threading.Lock()
+
+    # ---------- lookups ----------
+
+    def get(self, session_id: str) -> List[Dict[str, Any]]:
+        return self._lookup("by_sid", session_id)
+
+    def get_did(self, did: str) -> List[Dict[str, Any]]:
+        return self._lookup("by_did", did)
+
+    def range(self, t0: TimeLike, t1: TimeLike) -> Iterator[Dict[str, Any]]:
+        lo_t, hi_t = _epoch(t0), _epoch(t1)
+        if hi_t <= lo_t:
+            return
+        b0, b1 = int(lo_t // self.bucket_s), int(hi_t // self.bucket_s)
+        for ix in self._indexes():
+            spans = sorted(v for b, v in ix.buckets.items() if b0 <= b <= b1)
+            merged: List[List[int]] = []
+            for lo, hi in spans:
+                if merged and lo <= merged[-1][1]:
+                    merged[-1][1] = max(merged[-1][1], hi)
+                else:
+                    merged.append([lo, hi])
+            if not merged:
+                continue
+            with open(ix.path, "rb") as f:
+                for lo, hi in merged:
+                    f.seek(lo)
+                    chunk = f.read(hi - lo)
+                    self.stats["read_bytes"] += len(chunk)
+                    for line in chunk.splitlines():
+                        rec = _parse(line)
+                        t = record_meta(rec)[0]
+                        if t is not None and lo_t <= t < hi_t:
+                            yield rec
+
+    def _lookup(self, attr: str, key: str) -> List[Dict[str, Any]]:
+        out = []
+        for ix in self._indexes():
+            offs = getattr(ix, attr).get(key)
+            if not offs:
+                continue
+            with open(ix.path, "rb") as f:
+                for off in sorted(offs):
+                    f.seek(off)
+                    line = f.read(ix.spans[off])
+                    self.stats["read_bytes"] += len(line)
+                    rec = _parse(line)
+                    if rec is not None:
+                        out.append(rec)
+        return out
+
+    # ---------- indexing ----------
+
+    def _indexes(self) -> List[_FileIndex]:
+        with self._lock:
+            paths = log_files(self.logs_dir)
+            live = set(paths)
+            for gone in [p for p in self._files if p not in live]:
+                del self._files[gone]
+            out = []
+            for p in paths:
+                ix = self._refresh(p)
+                if ix is not None:
+                    out.append(ix)
+            self.stats["files"] = len(out)
+            self.stats["records"] = sum(len(ix.spans) for ix in out)
+            return out
+
+    def _refresh(self, path: str) -> Optional[_FileIndex]:
+        ix = self._files.get(path)
+        try:
+            ino = os.stat(path).st_ino
+        except FileNotFoundError:
+            self._files.pop(path, None)
+            return None
+        if ix is None or ix.ino != ino:
+            ix = self._files[path] = _FileIndex(path, ino)
+        # sidecar first, then size: every record the sidecar names is inside `size`
+        if parse_log_name(path).pid is None:
+            self._read_sidecar(ix)
+        size = os.stat(path).st_size
+        if size < ix.size:  # truncated / rewritten in place
+            ix = self._files[path] = _FileIndex(path, ino)
+            return self._refresh(path)
+        ix.size = size
+        self._scan_gaps(ix)
+        return ix
+
+    def _read_sidecar(self, ix: _FileIndex) -> None:
+        try:
+            f = open(index_path(ix.path), "rb")
+        except FileNotFoundError:
+            return
+        with f:
+            if ix.sidecar_pos < 0:
+                header = _parse(f.readline())
+                if not isinstance(header, dict) or header.get("ino") != ix.ino:
+                    return  # another inode's sidecar (copied / restored): scan instead, look again next time
+                ix.sidecar_pos = f.tell()
+            f.seek(ix.sidecar_pos)
+            tail = f.read()
+        end = tail.rfind(b"\n") + 1  # only whole lines; a line being written is picked up next time
+        for line in tail[:end].splitlines():
+            entry = _parse(line)
+            if isinstance(entry, list) and len(entry) == 5:
+                ix.add(entry[0], entry[1], (entry[2], entry[3], entry[4]), self.bucket_s)
+        ix.sidecar_pos += end
+
+    def _scan_gaps(self, ix: _FileIndex) -> None:
+        """Index records in [done, size) that no sidecar line covered, skipping over indexed spans."""
+        if ix.done >= ix.size:
+            return
+        with open(ix.path, "rb") as f:
+            pos = ix.done
+            if pos == 0 and f.read(len(_BOM)) == _BOM:
+                pos = len(_BOM)
+            while pos < ix.size:
+                length = ix.spans.get(pos)
+                if length is not None:
+                    pos += length
+                    continue
+                f.seek(pos)
+                line = f.readline()
+                if not line.endswith(b"\n") or pos + len(line) > ix.size:
+                    break  # partial last line; wait for the rest
+                self.stats["scanned_bytes"] += len(line)
+                if line.strip():
+                    ix.add(pos, len(line), record_meta(_parse(line)), self.bucket_s)
+                pos += len(line)
+            ix.done = pos
+
+
+def _parse(line: bytes) -> Any:
+    try:
+        return json.loads(line)
+    except ValueError:
+        return None
+
+
+def _epoch(t: TimeLike) -> float:
+    if isinstance(t, dt.datetime):
+        return (t if t.tzinfo else t.replace(tzinfo=dt.timezone.utc)).timestamp()
+    return float(t)
@@ -1,18 +1,39 @@
 # src/clarity_logger.py
+#
+# log_record(record) gates, then appends one line to the month's current
+# segment, data/logs/clarity_gain_YYYYMM[.sN].jsonl (open / write / close per
+# call), and its sidecar index (segments are size-capped; see
+# clarity_log_store, whose LogStore answers get(session_id) / range(t0, t1)).
+# Servers use a ClarityLogWriter instead, which keeps the segment open and
+# writes from a background thread:
+#
+#   writer = ClarityLogWriter("data/logs", durability="fsync", every_n=64, every_ms=200)
+#   writer.log(record)     # judgment-landing gate runs here; raises like log_record
+#   writer.flush()         # wait until everything logged so far is written
+#   writer.close()         # on shutdown (also registered with atexit)
+#
+# With several worker processes, pass shard=True (or set ELENX_LOG_SHARDS=1):
+# each process then appends to its own clarity_gain_YYYYMM.w{pid}.jsonl and
+# clarity_log_shards.merge_shards / ShardMerger append shards to the segments.
 from __future__ import annotations
 
+import atexit
 import datetime
 import json
 import os
-from typing import Any, Dict
-
-from jsonschema import Draft7Validator
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple, Union
 
+from clarity_log_shards import SHARD_LOGS, append_line, record_meta, shard_path
+from clarity_log_store import SegmentAppender
 from judgment_landing import (
     JudgmentLandingError,
     build_judgment_terminal_state,
     enforce_judgment_landing_on_termination,
 )
+from schema_registry import REGISTRY, SchemaId
 
 
 def _read_json(path: str) -> Any:
@@ -29,9 +50,9 @@ def load_schema(schema_path: str) -> Dict[str, Any]:
     return _read_json(schema_path)
 
 
-def validate_record(record: Dict[str, Any], schema: Dict[str, Any]) -> None:
-    v = Draft7Validator(schema)
-    errors = sorted(v.iter_errors(record), key=lambda e: e.path)
+def validate_record(record: Dict[str, Any], schema: Union[Dict[str, Any], SchemaId] = "clarity_gain_record") -> None:
+    """schema: a loaded schema dict or a schema id / path; checked by the registry's generated / compiled validator."""
+    errors = sorted(REGISTRY.checker(schema).iter_errors(record), key=lambda e: e.path)
     if errors:
         msgs = "\n".join(
             [f"- {'/'.join([str(p) for p in e.path]) or '(root)'} → {e.message}" for e in errors]
@@ -44,12 +65,17 @@ def make_session_id(prefix: str = "DLM") -> str:
     return f"{prefix}-{ts}"
 
 
-def log_record(record: Dict[str, Any], logs_dir: str = "data/logs") -> str:
-    _ensure_dir(logs_dir)
-    month = datetime.datetime.now().strftime("%Y%m")
-    path = os.path.join(logs_dir, f"clarity_gain_{month}.jsonl")
+def segment_path(logs_dir: str = "data/logs", now: Optional[datetime.datetime] = None) -> str:
+    """First log segment of the month of `now` (default: current local time)."""
+    month = (now or datetime.datetime.now()).strftime("%Y%m")
+    return os.path.join(logs_dir, f"clarity_gain_{month}.jsonl")
 
-    # --- termination gate ---
+
+def land_record(record: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Termination gate: build + enforce the judgment terminal state and nest it
+    under detected. Raises JudgmentLandingError; mutates and returns record.
+    """
     j = record.get("judgment_landing")
     if not isinstance(j, dict):
         raise JudgmentLandingError("Missing judgment_landing; cannot log as complete.")
@@ -72,8 +98,276 @@ def log_record(record: Dict[str, Any], logs_dir: str = "data/logs") -> str:
     assert "judgment_terminal_state" not in record, (
         "BUG: root judgment_terminal_state detected; schema forbids this"
     )
+    return record
+
+
+def log_record(record: Dict[str, Any], logs_dir: str = "data/logs", shard: Optional[bool] = None) -> str:
+    _ensure_dir(logs_dir)
+    shard = SHARD_LOGS if shard is None else shard
+    path = shard_path(logs_dir) if shard else segment_path(logs_dir)
+
+    # --- termination gate ---
+    land_record(record)
+
+    line = (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+    if shard:
+        append_line(path, line)
+        return path
+    return _SEGMENTS.write(path, [(line, record_meta(record))])
+
+
+_SEGMENTS = SegmentAppender(keep_open=False)
+
+
+# ---------- buffered background writer ----------
+
+DURABILITY = ("none", "flush", "fsync")
+
+_FLUSH = object()
+_CLOSE = object()
+
+
+def _fsync_path(path: str) -> None:
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND | getattr(os, "O_BINARY", 0))
+    except FileNotFoundError:  # a merge took the shard; it syncs what it writes
+        return
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class ClarityLogWriterError(RuntimeError):
+    """Writer is closed, its queue stayed full past put_timeout, or the background write failed."""
+
+
+class ClarityLogWriter:
+    """
+    Appends gated records to the monthly segment from one background thread.
+
+    - log(record): land_record + serialize on the caller's thread (errors and
+      later mutation of record can't reach the file), then enqueue. Blocks
+      while max_queue lines are pending (backpressure); after put_timeout
+      seconds raises ClarityLogWriterError.
+    - The thread takes up to batch_size lines per wake-up; lines due for
+      writing go out with one write() per segment (group commit), then
+      their index lines.
+    - durability, with every_n lines / every_ms milliseconds (whichever
+      comes first) since the last sync:
+        "none":  lines stay in memory until batch_size are held (or flush /
+                 close); a crash loses what is held
+        "flush": held lines are written to the OS every_n / every_ms (a
+                 process crash loses at most that window)
+        "fsync": every batch is written at once and synced to disk every_n /
+                 every_ms (an OS crash loses at most that window)
+      The defaults write and flush each batch.
+    - flush(): wait until everything logged so far is written (and synced).
+    - close(): drain, sync, close the segment and stop the thread.
+
+    Lines and segments are the same as log_record's (clarity_log_store.SegmentAppender).
+    log() returns the month's first segment path; a batch that doesn't fit
+    the current segment starts the next one.
+    With shard=True batches go to this process's shard, one O_APPEND write
+    each (clarity_log_shards.append_line), under the same policies.
+    """
+
+    def __init__(
+        self,
+        logs_dir: str = "data/logs",
+        *,
+        durability: str = "flush",
+        every_n: int = 1,
+        every_ms: float = 0.0,
+        max_queue: int = 4096,
+        batch_size: int = 512,
+        put_timeout: Optional[float] = None,
+        shard: Optional[bool] = None,
+    ):
+        if durability not in DURABILITY:
+            raise ValueError(f"durability must be one of {DURABILITY}, got {durability!r}")
+        self.logs_dir = logs_dir
+        self.durability = durability
+        self.every_n = max(0, int(every_n))
+        self.every_ms = max(0.0, float(every_ms))
+        self.max_queue = max(1, int(max_queue))
+        self.batch_size = max(1, int(batch_size))
+        self.put_timeout = put_timeout
+        self.shard = SHARD_LOGS if shard is None else shard
+        self.stats: Dict[str, int] = {"logged": 0, "written": 0, "batches": 0, "syncs": 0, "waits": 0, "dropped": 0}
+
+        self._buf: Deque[Tuple[Any, Any]] = deque()
+        self._held: List[Tuple[str, Tuple[bytes, Any]]] = []  # taken off the queue, not written yet
+        self._cv = threading.Condition()
+        self._closed = False
+        self._error: Optional[BaseException] = None
+        self._segments = SegmentAppender(keep_open=True)
+        self._path: Optional[str] = None
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+        _ensure_dir(logs_dir)
+        self._thread = threading.Thread(target=self._run, name="ClarityLogWriter", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    # ---------- caller side ----------
+
+    def log(self, record: Dict[str, Any]) -> str:
+        """Gate + enqueue one record; returns the month's segment (or shard) path."""
+        land_record(record)
+        line = (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+        path = shard_path(self.logs_dir) if self.shard else segment_path(self.logs_dir)
+        self._put(path, (line, record_meta(record)))
+        return path
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        done = threading.Event()
+        self._put(_FLUSH, done, force=True)
+        if not done.wait(timeout):
+            raise ClarityLogWriterError(f"flush did not complete within {timeout}s")
+        self._raise_error()
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        with self._cv:
+            if self._closed:
+                return
+            self._closed = True
+            self._buf.append((_CLOSE, None))
+            self._cv.notify_all()
+        self._thread.join(timeout)
+        atexit.unregister(self.close)
+        self._raise_error()
+
+    def __enter__(self) -> "ClarityLogWriter":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            raise ClarityLogWriterError(f"background log write failed: {self._error!r}") from self._error
+
+    def _put(self, key: Any, value: Any, force: bool = False) -> None:
+        self._raise_error()
+        with self._cv:
+            if self._closed:
+                raise ClarityLogWriterError("ClarityLogWriter is closed")
+            if not force and len(self._buf) >= self.max_queue:
+                self.stats["waits"] += 1
+                room = self._cv.wait_for(lambda: len(self._buf) < self.max_queue or self._closed, self.put_timeout)
+                if self._closed:
+                    raise ClarityLogWriterError("ClarityLogWriter is closed")
+                if not room:
+                    raise ClarityLogWriterError(f"clarity log queue full ({self.max_queue} pending)")
+            self._buf.append((key, value))
+            if key is not _FLUSH:
+                self.stats["logged"] += 1
+            self._cv.notify_all()
+
+    # ---------- background thread ----------
+
+    def _run(self) -> None:
+        while True:
+            with self._cv:
+                while not self._buf:
+                    wait = self._sync_wait()
+                    if not self._cv.wait(wait) and wait is not None:
+                        break  # every_ms elapsed with nothing new: time-based sync
+                batch = [self._buf.popleft() for _ in range(min(len(self._buf), self.batch_size))]
+                self._cv.notify_all()  # room for blocked producers
+            if not batch:
+                self._guard(self._maybe_push)
+                continue
+            if self._process(batch):
+                return
+
+    def _sync_wait(self) -> Optional[float]:
+        pending = len(self._held) if self.durability == "flush" else self._unsynced if self.durability == "fsync" else 0
+        if not (pending and self.every_ms):
+            return None
+        return max(0.0, self._last_sync + self.every_ms / 1000.0 - time.monotonic())
+
+    def _process(self, batch: List[Tuple[Any, Any]]) -> bool:
+        """Hold / write a batch in order; True once the close marker was handled."""
+        self.stats["batches"] += 1
+        for key, value in batch:
+            if key is _FLUSH or key is _CLOSE:
+                self._guard(self._push)
+                self._guard(self._sync)
+                if key is _CLOSE:
+                    self._guard(self._close_file)
+                    return True
+                value.set()
+            else:
+                self._held.append((key, value))
+        self._guard(self._maybe_push)
+        return False
+
+    def _guard(self, fn: Any, *args: Any) -> None:
+        """Run one I/O step; after the first failure, held and later lines are counted as dropped."""
+        if self._error is None:
+            try:
+                fn(*args)
+            except Exception as e:  # surfaced to callers by log / flush / close
+                self._error = e
+        if self._error is not None and self._held:
+            self.stats["dropped"] += len(self._held)
+            self._held.clear()
+
+    def _due(self, n: int) -> bool:
+        return bool((self.every_n and n >= self.every_n) or (
+            self.every_ms and (time.monotonic() - self._last_sync) * 1000.0 >= self.every_ms))
+
+    def _maybe_push(self) -> None:
+        n = len(self._held)
+        if self.durability == "fsync":
+            self._push()
+            if self._unsynced and self._due(self._unsynced):
+                self._sync()
+        elif self.durability == "flush":
+            if n and (n >= self.batch_size or self._due(n)):
+                self._push()
+                self.stats["syncs"] += 1
+                self._last_sync = time.monotonic()
+        elif n >= self.batch_size:
+            self._push()
+
+    def _push(self) -> None:
+        """Write every held line, one write per run of lines for the same path."""
+        held = self._held
+        while held:
+            path = held[0][0]
+            n = 1
+            while n < len(held) and held[n][0] == path:
+                n += 1
+            self._write(path, [item for _, item in held[:n]])
+            del held[:n]
+
+    def _write(self, path: str, items: List[Tuple[bytes, Any]]) -> None:
+        if path != self._path:  # new month
+            self._sync()
+            self._close_file()
+            self._path = path
+        if self.shard:
+            append_line(path, b"".join(line for line, _ in items))
+        else:
+            self._segments.write(path, items)
+        self._unsynced += len(items)
+        self.stats["written"] += len(items)
 
-    with open(path, "a", encoding="utf-8-sig") as f:
-        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    def _sync(self) -> None:
+        """fsync what was written since the last sync ("fsync" durability only)."""
+        if self._path is not None and self._unsynced and self.durability == "fsync":
+            if self.shard:
+                _fsync_path(self._path)
+            else:
+                self._segments.fsync()
+            self.stats["syncs"] += 1
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
 
-    return path
+    def _close_file(self) -> None:
+        self._segments.close()
+        self._path = None
@@ -0,0 +1,303 @@
+# src/cue_scanner.py
+# Single-pass cue scanner for the Elenx engine.
+#
+# Every detection stage used to run its own re.search over a freshly
+# lowercased copy of the text. The scanner compiles all cue patterns once
+# and collects every cue hit in a single pass:
+#
+#   1) Each cue pattern is parsed for its required leading literal(s)
+#      ("anchors"), e.g. r"\b(co[- ]?founder|team)\b" -> {"co", "team"}.
+#   2) All anchors are compiled into one trie-shaped regex (a keyword
+#      automaton); one finditer over the text yields every anchor position.
+#   3) Only cues whose anchor occurs are verified, with an anchored
+#      pattern.match at that position (no re-scan of the text).
+#
+# Semantics: a cue is "hit" iff re.search(pattern, text) would match.
+# Cues without a derivable anchor fall back to a plain search.
+from __future__ import annotations
+
+import re
+from typing import Dict, FrozenSet, Hashable, Iterable, List, Mapping, Optional, Set, Tuple
+
+try:  # Python 3.11+
+    import re._parser as _sre_parse  # type: ignore
+    from re._constants import (  # type: ignore
+        AT, BRANCH, CATEGORY, CATEGORY_SPACE, IN, LITERAL, MAX_REPEAT, MIN_REPEAT, SUBPATTERN,
+    )
+except ImportError:  # pragma: no cover - older interpreters
+    import sre_parse as _sre_parse  # type: ignore
+    from sre_constants import (  # type: ignore
+        AT, BRANCH, CATEGORY, CATEGORY_SPACE, IN, LITERAL, MAX_REPEAT, MIN_REPEAT, SUBPATTERN,
+    )
+
+CueHits = FrozenSet[Hashable]
+Span = Tuple[int, int]  # (start, end) of a cue's first match
+
+
+def _leading_literals(seq) -> Optional[Set[str]]:
+    """
+    Required leading literals of a parsed pattern, or None if unknown.
+    Leading zero-width \\b / ^ are skipped (the match still starts at the literal).
+    """
+    items = list(seq)
+    i = 0
+    while i < len(items) and items[i][0] is AT:
+        i += 1
+    if i >= len(items):
+        return None
+    op, av = items[i]
+    if op is LITERAL:
+        chars = []
+        while i < len(items) and items[i][0] is LITERAL:
+            chars.append(chr(items[i][1]))
+            i += 1
+        return {"".join(chars)}
+    if op is SUBPATTERN:
+        return _leading_literals(av[-1])
+    if op is BRANCH:
+        out: Set[str] = set()
+        for branch in av[1]:
+            lits = _leading_literals(branch)
+            if not lits:
+                return None
+            out |= lits
+        return out
+    return None
+
+
+def _anchors(pattern: str, flags: int) -> Optional[Set[str]]:
+    try:
+        parsed = _sre_parse.parse(pattern, flags)
+    except Exception:
+        return None
+    if (flags | parsed.state.flags) & re.IGNORECASE:
+        return None  # keep case-folding exact: verify these with a plain search
+    return _leading_literals(parsed)
+
+
+def _max_width(pattern: str, flags: int) -> Optional[int]:
+    """Longest possible match of pattern, or None if unbounded (e.g. \\s*)."""
+    try:
+        hi = _sre_parse.parse(pattern, flags).getwidth()[1]
+    except Exception:
+        return None
+    return None if hi >= _sre_parse.MAXREPEAT else hi
+
+
+def _is_space_class(seq) -> bool:
+    """True for a repeated item that can only consume whitespace (\\s, [ \\t], ' ')."""
+    items = list(seq)
+    if len(items) != 1:
+        return False
+    op, av = items[0]
+    if op is LITERAL:
+        return chr(av).isspace()
+    if op is IN:
+        return all((o is CATEGORY and a is CATEGORY_SPACE) or (o is LITERAL and chr(a).isspace()) for o, a in av)
+    return False
+
+
+def _nonspace_width(seq) -> Optional[int]:
+    """
+    Max characters a match can consume outside unbounded whitespace runs
+    (e.g. r"what\\s*to" -> 6), or None if some other repeat is unbounded.
+    """
+    total = 0
+    for op, av in seq:
+        if op in (MAX_REPEAT, MIN_REPEAT):
+            lo, hi, sub = av
+            if hi >= _sre_parse.MAXREPEAT:
+                if _is_space_class(sub):
+                    continue
+                return None
+            w = _nonspace_width(sub)
+            if w is None:
+                return None
+            total += w * hi
+        elif op is SUBPATTERN:
+            w = _nonspace_width(av[-1])
+            if w is None:
+                return None
+            total += w
+        elif op is BRANCH:
+            ws = [_nonspace_width(b) for b in av[1]]
+            if any(w is None for w in ws):
+                return None
+            total += max(ws, default=0)
+        else:
+            w = _sre_parse.SubPattern(seq.state, [(op, av)]).getwidth()[1] if hasattr(seq, "state") else 1
+            if w >= _sre_parse.MAXREPEAT:
+                return None
+            total += w
+    return total
+
+
+def _trie_regex(words: Iterable[str]) -> str:
+    """Literal alternation shaped as a trie; greedy, so the longest anchor wins per position."""
+    trie: Dict[str, dict] = {}
+    for w in words:
+        node = trie
+        for ch in w:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def emit(node: Dict[str, dict]) -> str:
+        alts = [re.escape(ch) + emit(node[ch]) for ch in sorted(k for k in node if k)]
+        if not alts:
+            return ""
+        body = alts[0] if len(alts) == 1 else "(?:" + "|".join(alts) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return emit(trie)
+
+
+class CueScanner:
+    """
+    Compiled {cue_id: regex} table scanned in one pass.
+
+    - cue_id can be any hashable (engine uses short strings like "rule:critical").
+    - Patterns are authored exactly as they would be for re.search.
+    """
+
+    def __init__(self, cues: Mapping[Hashable, str], flags: int = 0):
+        self._ids: Tuple[Hashable, ...] = tuple(cues.keys())
+        self.flags = flags
+        self._compiled: Dict[Hashable, "re.Pattern[str]"] = {
+            cid: re.compile(cues[cid], flags) for cid in self._ids
+        }
+
+        by_anchor: Dict[str, List[Hashable]] = {}
+        unanchored: List[Hashable] = []
+        for cid in self._ids:
+            lits = _anchors(cues[cid], flags)
+            if not lits:
+                unanchored.append(cid)
+                continue
+            for lit in lits:
+                by_anchor.setdefault(lit, []).append(cid)
+
+        # An anchor found at position p implies every shorter anchor that is
+        # its prefix also occurs at p, so fold those cues in ahead of time.
+        words = sorted(by_anchor)
+        self._by_anchor: Dict[str, Tuple[Hashable, ...]] = {}
+        for w in words:
+            cids: List[Hashable] = []
+            for k in range(1, len(w) + 1):
+                v = w[:k]
+                if v in by_anchor:
+                    cids.extend(c for c in by_anchor[v] if c not in cids)
+            self._by_anchor[w] = tuple(cids)
+
+        self._unanchored: Tuple[Hashable, ...] = tuple(unanchored)
+        self._anchor_rx = re.compile(f"(?=({_trie_regex(words)}))") if words else None
+
+        # Match widths, for extend_matches: an attempt at position p of a cue
+        # with max width w reads text[p-1 : p+w+1] at most.
+        self._width: Dict[Hashable, Optional[int]] = {cid: _max_width(cues[cid], flags) for cid in self._ids}
+        self._unbounded: FrozenSet[Hashable] = frozenset(c for c, w in self._width.items() if w is None)
+        self.max_width = max((w for w in self._width.values() if w is not None), default=0)
+        # unbounded only through whitespace runs: bounded count of non-space characters
+        self._nonspace: Dict[Hashable, Optional[int]] = {}
+        for cid in self._unbounded:
+            try:
+                self._nonspace[cid] = _nonspace_width(_sre_parse.parse(cues[cid], flags))
+            except Exception:
+                self._nonspace[cid] = None
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @property
+    def cue_ids(self) -> Tuple[Hashable, ...]:
+        return self._ids
+
+    def scan(self, text: str) -> CueHits:
+        """Return the frozenset of cue ids whose pattern occurs in text."""
+        if not text or not self._ids:
+            return frozenset()
+        compiled = self._compiled
+        hits = set()
+        if self._anchor_rx is not None:
+            by_anchor = self._by_anchor
+            for m in self._anchor_rx.finditer(text):
+                pos = m.start()
+                for cid in by_anchor[m.group(1)]:
+                    if cid not in hits and compiled[cid].match(text, pos):
+                        hits.add(cid)
+        for cid in self._unanchored:
+            if compiled[cid].search(text):
+                hits.add(cid)
+        return frozenset(hits)
+
+    def first_matches(self, text: str, start: int = 0, skip: Iterable[Hashable] = ()) -> Dict[Hashable, Span]:
+        """{cue_id: span} of each cue's leftmost match starting at or after start."""
+        skip = frozenset(skip)
+        compiled = self._compiled
+        out: Dict[Hashable, Span] = {}
+        if self._anchor_rx is not None:
+            by_anchor = self._by_anchor
+            for m in self._anchor_rx.finditer(text, start):
+                pos = m.start()
+                for cid in by_anchor[m.group(1)]:
+                    if cid in out or cid in skip:
+                        continue
+                    mm = compiled[cid].match(text, pos)
+                    if mm:
+                        out[cid] = mm.span()
+        for cid in self._unanchored:
+            if cid not in skip:
+                mm = compiled[cid].search(text, start)
+                if mm:
+                    out[cid] = mm.span()
+        return out
+
+    def extend_matches(self, text: str, prev: Mapping[Hashable, Span], prev_len: int) -> Dict[Hashable, Span]:
+        """
+        first_matches(text) for a text that extends a previously scanned one.
+
+        prev are the spans found in text[:prev_len] (which must be unchanged).
+        A previous match is kept only if the attempt could not have read past
+        prev_len; everything else is rescanned from prev_len - max_width on,
+        so the cost follows the appended text, not the whole. Cues of
+        unbounded width are re-searched in full until they hold a stable match.
+        """
+        keep: Dict[Hashable, Span] = {}
+        for cid, (s, e) in prev.items():
+            w = self._width.get(cid)
+            if (s + w if w is not None else e) < prev_len:
+                keep[cid] = (s, e)
+        cut = max(0, prev_len - self.max_width)
+        out = self.first_matches(text, cut, skip=keep.keys() | self._unbounded)
+        out.update(keep)
+        for cid in self._unbounded:
+            if cid in keep:
+                continue
+            n = self._nonspace[cid]
+            start = 0 if n is None else _back_over_nonspace(text, prev_len, n + 1)
+            mm = self._compiled[cid].search(text, start)
+            if mm:
+                out[cid] = mm.span()
+        return out
+
+
+def _back_over_nonspace(text: str, end: int, n: int) -> int:
+    """Start of the shortest text[i:end] holding n non-space characters (whitespace is free)."""
+    i = end
+    while i > 0 and n > 0:
+        i -= 1
+        if not text[i].isspace():
+            n -= 1
+    return i
+
+
+def literal_any(words: Iterable[str]) -> str:
+    """Unanchored alternation of literal substrings (mirrors `any(k in t for k in words)`)."""
+    return "|".join(re.escape(w) for w in words)
+
+
+def build_scanner(tables: Iterable[Mapping[Hashable, str]], flags: int = 0) -> CueScanner:
+    """Merge several {cue_id: pattern} tables into one scanner (later ids win on clash)."""
+    merged: Dict[Hashable, str] = {}
+    for t in tables:
+        merged.update(t)
+    return CueScanner(merged, flags=flags)
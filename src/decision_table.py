@@ -0,0 +1,169 @@
+# src/decision_table.py
+# Declarative Mode × Principle detection rules, compiled against the matrix.
+#
+# data/detection_rules.json holds the detection cascade as data: each rule
+# names the cue that fires it, a mode hint, principle hints and how it
+# updates the running pick (update = max | below | alt). Rules run in pack
+# order, so a later hit can override an earlier one, as in the old cascade.
+#
+# compile_rules() resolves every rule's hints against a MatrixIndex once
+# (the same picks _pick_from_matrix / _pick_from_matrix_any used to make per
+# request) into a DecisionTable of concrete (mode, principle) rows.
+# Detection is then one pass over the rows checking cue membership; no
+# matrix walks per request. The engine recompiles whenever it rebuilds its
+# MatrixIndex (matrix pack swap or learned-weights reload).
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    from src.cue_scanner import CueHits
+    from src.matrix_index import MatrixIndex
+except ImportError:  # imported with src/ on sys.path
+    from cue_scanner import CueHits
+    from matrix_index import MatrixIndex
+
+DETECTION_RULES_PATH = Path(__file__).resolve().parents[1] / "data" / "detection_rules.json"
+
+UPDATES = ("max", "below", "alt")
+FALLBACKS = ("ranked", "first")
+DEFAULT_BASE_CONFIDENCE = 0.55
+
+
+@dataclass(frozen=True)
+class DetectionRule:
+    """
+    One rule of the pack.
+
+    - cue: engine cue id (e.g. "rule:critical"); pattern optionally defines it
+    - mode / principles: hints, resolved as MatrixIndex picks
+    - prefer: optional re-pick among the resolved mode's principles (matrix order)
+    - fallback: no principle hint matched -> "ranked" (top-weighted) or
+      "first" (matrix order) principle of the hinted mode
+    """
+    id: str
+    cue: str
+    mode: str
+    confidence: float
+    update: str = "max"
+    principles: Tuple[str, ...] = ()
+    prefer: Tuple[str, ...] = ()
+    fallback: str = "ranked"
+    pattern: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "DetectionRule":
+        update = d.get("update", "max")
+        fallback = d.get("fallback", "ranked")
+        if update not in UPDATES:
+            raise ValueError(f"detection rule {d.get('id')!r}: unknown update {update!r}")
+        if fallback not in FALLBACKS:
+            raise ValueError(f"detection rule {d.get('id')!r}: unknown fallback {fallback!r}")
+        return cls(
+            id=str(d["id"]),
+            cue=str(d["cue"]),
+            mode=str(d["mode"]),
+            confidence=float(d["confidence"]),
+            update=update,
+            principles=tuple(d.get("principles") or ()),
+            prefer=tuple(d.get("prefer") or ()),
+            fallback=fallback,
+            pattern=d.get("pattern") or None,
+        )
+
+    def resolve(self, mx: MatrixIndex) -> Tuple[str, str]:
+        """Concrete (mode, principle) for this rule on the given matrix."""
+        default = (mx.first_mode, mx.first_principle)
+        for hint in self.principles:
+            m, p = mx.pick(self.mode, hint, default)
+            if hint and p and hint.lower() in p.lower():
+                break
+        else:
+            if self.fallback == "first":
+                m = mx.mode_containing(self.mode)
+                m, p = (m, mx.principles[m][0]) if m else default
+            else:
+                m, p = mx.pick(self.mode, self.principles[0] if self.principles else None, default)
+        if self.prefer:
+            p = mx.principle_containing(m, self.prefer) or p
+        return m, p
+
+
+@dataclass(frozen=True)
+class RuleSet:
+    """Parsed detection rules pack."""
+    rules: Tuple[DetectionRule, ...]
+    base_confidence: float = DEFAULT_BASE_CONFIDENCE
+
+    @classmethod
+    def from_pack(cls, pack: Any) -> "RuleSet":
+        """From a pack dict ({"rules": [...]}), a loader (data, path) tuple, or a bare rule list."""
+        if isinstance(pack, tuple) and pack:
+            pack = pack[0]
+        base = DEFAULT_BASE_CONFIDENCE
+        if isinstance(pack, dict):
+            base = float(pack.get("base_confidence", base))
+            pack = pack.get("rules", [])
+        if not isinstance(pack, list):
+            raise ValueError("detection rules pack must hold a 'rules' list")
+        return cls(tuple(DetectionRule.from_dict(r) for r in pack if isinstance(r, dict)), base)
+
+    def cue_patterns(self) -> Dict[str, str]:
+        """{cue_id: pattern} for rules that define their own cue."""
+        return {r.cue: r.pattern for r in self.rules if r.pattern}
+
+
+@lru_cache(maxsize=1)
+def default_rules() -> RuleSet:
+    """The shipped data/detection_rules.json (engines built without a detection_rules pack)."""
+    with open(DETECTION_RULES_PATH, "r", encoding="utf-8") as f:
+        return RuleSet.from_pack(json.load(f))
+
+
+# (cue, update, mode, principle, confidence)
+Row = Tuple[str, str, str, str, float]
+
+
+@dataclass(frozen=True)
+class DecisionTable:
+    """Rules resolved against one MatrixIndex; `index` identifies it."""
+    index: MatrixIndex
+    rows: Tuple[Row, ...]
+    default: Tuple[str, str]
+    base_confidence: float
+
+    @property
+    def cues(self) -> Tuple[str, ...]:
+        return tuple(r[0] for r in self.rows)
+
+    def decide(self, hits: CueHits) -> Tuple[str, str, float, Dict[str, Any]]:
+        """(mode, principle, confidence, {"alt_mode", "alt_principle", "alt_confidence"})."""
+        mode, principle = self.default
+        confidence = self.base_confidence
+        alt_mode = alt_principle = alt_conf = None
+        for cue, update, m, p, conf in self.rows:
+            if cue not in hits:
+                continue
+            if update == "max":
+                mode, principle = m, p
+                confidence = max(confidence, conf)
+            elif update == "below":
+                if confidence < conf:
+                    mode, principle, confidence = m, p, conf
+            else:  # "alt"
+                alt_mode, alt_principle, alt_conf = m, p, conf
+        return mode, principle, confidence, {
+            "alt_mode": alt_mode,
+            "alt_principle": alt_principle,
+            "alt_confidence": alt_conf,
+        }
+
+
+def compile_rules(rules: RuleSet, mx: MatrixIndex) -> DecisionTable:
+    rows = tuple((r.cue, r.update, *r.resolve(mx), r.confidence) for r in rules.rules)
+    return DecisionTable(index=mx, rows=rows, default=(mx.first_mode, mx.first_principle),
+                         base_confidence=rules.base_confidence)
@@ -1,15 +1,60 @@
-from typing import List, Dict, Any, Optional, Tuple
-from dataclasses import dataclass   # 👈 add this import
-import re, json, os
+from typing import List, Dict, Any, Optional, Tuple, Iterable, Iterator, Mapping, TYPE_CHECKING
+from dataclasses import dataclass, field, replace   # 👈 add this import
+import re, json, os, hashlib, time
+import multiprocessing as mp
 from pathlib import Path
 
+if TYPE_CHECKING:  # numpy is only needed by score_linguistic_batch and the near-dup index
+    import numpy as np
+    from src.near_dup import NearDupIndex
+    from engine.adaptive.scorer_backends import FusedModeScorer, FusionResult
+
+try:
+    from src.cue_scanner import CueHits, build_scanner
+    from src.decision_table import DecisionTable, RuleSet, compile_rules, default_rules
+    from src.matrix_index import MatrixIndex, norm_label, valid_modes
+    from src.weights_store import WeightsStore, DEFAULT_POLL_S
+    from src.result_cache import ResultCache
+    from src.result_types import Tags
+    from src.scan_guard import cap_text
+    from src.question_renderer import precompute_slug_ids
+    from src.score_grid import CellScores, ScoreGrid
+    from src.stemmer import StemLexicon
+    from src.text_features import TextFeatures, normalize_text
+    from src import elenx_loader
+except ImportError:  # imported with src/ on sys.path (scripts, CI smoke)
+    from cue_scanner import CueHits, build_scanner
+    from decision_table import DecisionTable, RuleSet, compile_rules, default_rules
+    from matrix_index import MatrixIndex, norm_label, valid_modes
+    from weights_store import WeightsStore, DEFAULT_POLL_S
+    from result_cache import ResultCache
+    from result_types import Tags
+    from scan_guard import cap_text
+    from question_renderer import precompute_slug_ids
+    from score_grid import CellScores, ScoreGrid
+    from stemmer import StemLexicon
+    from text_features import TextFeatures, normalize_text
+    import elenx_loader
+
+try:
+    from engine.adaptive.fallacy_context_fusion import FallacyContextFusion, builtin_cues
+except ImportError:  # src/ on sys.path only: make the repo root importable too
+    import sys
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+    from engine.adaptive.fallacy_context_fusion import FallacyContextFusion, builtin_cues
+
 # === L1: Learned Weights hook ===
 _LEARNED_PATH = Path(__file__).resolve().parents[1] / "data" / "metrics" / "learned_weights.json"
-try:
-    with open(_LEARNED_PATH, "r", encoding="utf-8") as _f:
-        _LEARNED = json.load(_f).get("weights", {})
-except Exception:
-    _LEARNED = {}
+# Hot-reloadable: a watcher thread (started by ElenxEngine) re-reads the file
+# when scripts/update_weights.py rewrites it. Set ELENX_WEIGHTS_RELOAD=0 to pin
+# the weights read at import.
+_WEIGHTS = WeightsStore(_LEARNED_PATH, poll_s=float(os.getenv("ELENX_WEIGHTS_POLL_S", DEFAULT_POLL_S)))
+_WEIGHTS_RELOAD = os.getenv("ELENX_WEIGHTS_RELOAD", "1") != "0"
+
+
+def _learned() -> Mapping[str, Any]:
+    """Current learned-weights snapshot ({"mode","principle","empathy"}); lock-free read."""
+    return _WEIGHTS.snapshot.weights
 
 _ELENX_DEBUG_WEIGHTS = os.getenv("ELENX_DEBUG_WEIGHTS", "0") == "1"
 if _ELENX_DEBUG_WEIGHTS:
@@ -27,12 +72,12 @@ PRINCIPLE_ALIASES = {
 def _alias_principle(name: str) -> str:
     return PRINCIPLE_ALIASES.get(name, name)
 
-def _lw(kind: str, name: str, default: float) -> float:
+def _lw(kind: str, name: str, default: float, learned: Optional[Mapping[str, Any]] = None) -> float:
     try:
         if not name:
             return default
         key = _alias_principle(name) if kind == "principle" else name
-        w = (_LEARNED.get(kind, {}) or {}).get(key)
+        w = ((learned if learned is not None else _learned()).get(kind, {}) or {}).get(key)
         return float(w) if isinstance(w, (int, float)) else default
     except Exception:
         return default
@@ -40,7 +85,8 @@ def _lw(kind: str, name: str, default: float) -> float:
 # (rest of file unchanged below)
 
 def _lw_emp() -> dict:
-    e = _LEARNED.get("empathy", {}) if isinstance(_LEARNED, dict) else {}
+    learned = _learned()
+    e = learned.get("empathy", {}) if isinstance(learned, Mapping) else {}
     return {"bias": float(e.get("bias", 0.0)), "multiplier": float(e.get("multiplier", 1.0))}
 
 _ELENX_DEBUG_WEIGHTS = os.getenv("ELENX_DEBUG_WEIGHTS", "0") == "1"
@@ -52,9 +98,10 @@ def _apply_learned_weights(scores: dict, kind: str) -> dict:
     """Multiply scores by learned weights (mode/principle). Returns a new dict."""
     if not isinstance(scores, dict) or not scores:
         return scores
+    learned = _learned()  # one snapshot for the whole score vector
     out = {}
     for k, v in scores.items():
-        mult = _lw(kind, k, 1.0)
+        mult = _lw(kind, k, 1.0, learned)
         out[k] = float(v) * mult
     # optional re-normalize so average stays comparable
     mean = sum(out.values()) / max(1, len(out))
@@ -122,81 +169,97 @@ def _coerce_context_pack(raw) -> Dict[str, Any]:
     return {"drivers": []}
 
 
-# --- Context driver detection (label-aware, low-regret) ---
-def _detect_context_drivers(text: str, drivers_pack: Dict[str, Any]) -> List[str]:
-    """
-    Heuristic detector that matches common cues in the user text
-    to *existing* driver labels from your pack. It avoids
-    hardcoding label names — if a label isn’t present, it’s skipped.
-    """
-    t = (text or "").lower()
-    labels = [d.get("label", "") for d in (drivers_pack or {}).get("drivers", [])]
-
-    found: List[str] = []
-
-    # 1) Incentive Misalignment
-    if any(k in t for k in ["incentive", "commission", "bonus", "quota", "kpi", "target mis", "misaligned", "perverse incentive"]):
-        for lab in labels:
-            if "incent" in lab.lower():  # matches "Incentive Misalignment"
-                found.append(lab)
-
-    # 2) Stakeholder / interpersonal pressure
-    if any(k in t for k in ["stakeholder", "co-founder", "cofounder", "boss", "board", "investor", "client", "customer", "sales", "product", "team", "engineering", "marketing", "cross-functional"]):
-        stake = next((lab for lab in labels if "stakeholder" in lab.lower()), None)
-        if stake:
-            found.append(stake)
-
-    # 3) Time Pressure / Overload
-    if any(k in t for k in ["time pressure", "deadline", "rushed", "rush", "overload", "burnout", "too busy", "no time"]):
-        for lab in labels:
-            lo = lab.lower()
-            if "time" in lo or "pressure" in lo or "overload" in lo:
-                found.append(lab)
-
-    # 4) Conflict / Tension
-    if any(k in t for k in ["conflict", "tension", "strained", "friction", "distant", "avoid", "avoidance"]):
-        rel = next((lab for lab in labels if any(x in lab.lower() for x in ["relationship", "interpersonal", "people", "conflict"])), None)
-        if rel:
-            found.append(rel)
-
-    # Deduplicate while preserving order
-    out: List[str] = []
-    seen = set()
-    for f in found:
-        if f and f not in seen:
-            out.append(f)
-            seen.add(f)
-    return out
+# --- Fallacy + context driver cues ---
+# Built-in keyword groups live in engine/adaptive/fallacy_context_fusion.py and
+# are bound to pack labels (plus any per-item `cues`) once per engine.
+FALLACY_CUES = builtin_cues("fallacies")
+CONTEXT_CUES = builtin_cues("contexts")
 
 
-# --- Linguistic cue dictionaries (coverage for all modes) ---
+# --- Linguistic cue lexicons (coverage for all modes) ---
+# One cue per entry ("|" separates alternatives). Terms are stemmed once
+# (src/stemmer.py) and matched on token stems, so "improve" also covers
+# improving / improved / improvement and "regret" covers regretted.
 LINGUISTIC_CUES = {
     "Creative": [
-        r"\bbrainstorm\b", r"\bnew approach\b", r"\bnovel\b", r"\bidea(s)?\b",
-        r"\bimagin(e|ation|ative)\b", r"\bwhat if\b", r"\bpossibilit(y|ies)\b",
-        r"\bprototype\b", r"\bgreenfield\b", r"\bblue sky\b", r"\bconcept\b"
+        "brainstorm", "new approach", "novel", "idea",
+        "imagine", "what if", "possibility",
+        "prototype", "greenfield", "blue sky|blue-sky", "concept"
     ],
     "Reflective": [
-        r"\bregret(s|ted|ting)?\b", r"\bhindsight\b", r"\bpattern(s)?\b",
-        r"\blesson(s)?\b", r"\blearned\b", r"\bintrospect(ion|ive)?\b",
-        r"\blooking back\b", r"\brecap\b", r"\breflection\b"
+        "regret", "hindsight", "pattern",
+        "lesson", "learned", "introspect",
+        "looking back", "recap", "reflection"
     ],
     "Growth": [
-        r"\bhabit(s)?\b", r"\bmindset\b", r"\bdevelop(ment|ing)?\b",
-        r"\bfeedback\b", r"\bcoach(ing)?\b", r"\bevolv(e|ing|ed)\b",
-        r"\bimprov(e|ing|ement)\b", r"\bpractice\b", r"\broutine\b"
+        "habit", "mindset", "develop",
+        "feedback", "coach", "evolve",
+        "improve", "practice", "routine"
     ],
     "Analytical": [
-        r"\bevidence\b", r"\bvalidate|validation\b", r"\bmetric(s)?\b",
-        r"\btrade[- ]?off(s)?\b", r"\bmodel\b", r"\bassumption(s)?\b",
-        r"\btest\b", r"\bexperiment\b", r"\bproof\b", r"\bdata\b"
+        "evidence", "validate", "metric",
+        "trade-off|tradeoff|trade off", "model", "assumption",
+        "test", "experiment", "proof", "data"
     ],
     "Critical": [
-        r"\bincentive(s)?\b", r"\bbias\b", r"\brisk(s)?\b", r"\bsecond[- ]order\b",
-        r"\bconflict\b", r"\bcontradict\b", r"\bchallenge\b", r"\bpressure\b"
+        "incentive", "bias", "risk", "second-order|second order",
+        "conflict", "contradict", "challenge", "pressure"
     ],
 }
 
+# --- Priors + detection rule cues (run on lowercased text, no re.I) ---
+PRIOR_CUES = {
+    "prior:incentive": r"\b(incentive|bonus|commission|quota|kpi)\b",
+    "prior:stakeholder": r"\b(stakeholder|board|investor|customer|team|ops|legal)\b",
+    "prior:risk": r"\b(risk|downside|exposure|liability|compliance|safety)\b",
+}
+
+# principle hints each prior cue lends weight to in the ranked distribution (score_grid)
+PRIOR_HINTS = {
+    "prior:incentive": ("Incentive",),
+    "prior:stakeholder": ("Stakeholder",),
+    "prior:risk": ("Risk",),
+}
+
+RULE_CUES = {
+    "rule:critical": r"\b(co[- ]?founder|partner|stakeholder|board|investor|team|incentive|misalign|alignment|tension|conflict|trust|pressure)\b",
+    "rule:next_step": r"\b(unsure|uncertain|what\s*to\s*do\s*next|next\s*step|where\s*to\s*start)\b",
+    "rule:evidence": r"\b(test|validate|evidence|data|experiment|proof)\b",
+    "rule:second_order": r"\b(second[- ]order|unintended|downstream|what if)\b",
+    "rule:creative": r"\b(brainstorm|idea|imagin|new approach|possibilit|prototype|blue sky|novel|what if|concept)\b",
+    "rule:reflective": r"\b(regret|hindsight|pattern|lesson|learned|looking back|reflection|introspect|recap)\b",
+    "rule:growth": r"\b(habit|mindset|develop|feedback|coach|evolv|improv|practice|routine)\b",
+}
+
+# cue ids per mode for LINGUISTIC_CUES ("ling:<Mode>:<i>")
+_LING_CUE_IDS: Dict[str, Tuple[str, ...]] = {
+    mode: tuple(f"ling:{mode}:{i}" for i in range(len(terms)))
+    for mode, terms in LINGUISTIC_CUES.items()
+}
+
+# Pre-stemmed at import; its hits join the scanner's in TextFeatures
+_LING_LEXICON = StemLexicon({
+    f"ling:{mode}:{i}": entry.split("|") for mode, terms in LINGUISTIC_CUES.items() for i, entry in enumerate(terms)
+})
+
+# column order of ElenxEngine.score_linguistic_batch
+LINGUISTIC_MODES: Tuple[str, ...] = tuple(LINGUISTIC_CUES)
+
+# One compiled scanner for every stage; built at import like the cue tables above.
+_CUE_TABLES: Tuple[Mapping[str, str], ...] = (
+    PRIOR_CUES,
+    RULE_CUES,
+    FALLACY_CUES,
+    CONTEXT_CUES,
+)
+_CUE_SCANNER = build_scanner(_CUE_TABLES)
+
+
+def scan_cues(text: str) -> CueHits:
+    """Collect every engine cue hit (one scanner pass + linguistic stem lookups) over the normalized text."""
+    return TextFeatures.build(text, _CUE_SCANNER, _LING_LEXICON).hits
+
+
 def _softmax(scores: Dict[str, float]) -> Dict[str, float]:
     import math
     if not scores:
@@ -207,17 +270,108 @@ def _softmax(scores: Dict[str, float]) -> Dict[str, float]:
     return {k: (exps[k] / s) for k in exps}
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DetectionResult:
+    """Immutable (cached results are shared, never copied); derive variants with dataclasses.replace."""
     mode: str
     principle: str
     confidence: float
     priors_used: bool
     empathy_on: bool
-    tags: Dict[str, List[str]]  # {"fallacies": [...], "contexts": [...]}
+    tags: Tags                  # read-only {"fallacies": (...), "contexts": (...)}
     alt_mode: str | None = None
     alt_principle: str | None = None
     alt_confidence: float | None = None
+    degraded: bool = False                  # some stage was skipped (deadline) or the input was truncated
+    stages: Dict[str, str] | None = None    # stage -> "ok" | "skipped" (+ "input": "truncated"); set with deadline_ms
+    scores: CellScores | None = field(default=None, repr=False)  # ranked Mode × Principle cells; .top_k()
+    fusion: "FusionResult | None" = field(default=None, repr=False)  # fused seed-mode scores; ElenxEngine(fusion=...)
+
+    @property
+    def runner_up(self) -> Tuple[str, str, float] | None:
+        """Second-ranked (mode, principle, score) cell; None for degraded results."""
+        top = self.scores.top_k(2) if self.scores is not None else []
+        return top[1] if len(top) > 1 else None
+
+
+def _from_stored(stored: Tuple[DetectionResult, Tuple[str, ...]],
+                 report: Optional[Dict[str, str]]) -> Tuple[DetectionResult, List[str]]:
+    """
+    A cached / reused (det, questions): the shared result, a fresh question list.
+    Stored results carry neither stages nor degraded; both come from this request.
+    """
+    det, questions = stored
+    if report is not None:  # a stored result is a complete run
+        report.update(dict.fromkeys(STAGES, "ok"))
+        det = replace(det, degraded=any(v != "ok" for v in report.values()), stages=report)
+    return det, list(questions)
+
+
+# Pipeline stages in priority order; under a deadline the remaining ones are skipped
+STAGES = ("features", "priors", "rules", "contexts", "render")
+# Optional last stage: run (and reported) only by engines built with a fusion scorer
+FUSION_STAGE = "fusion"
+
+# Longer inputs are truncated before normalization/scanning (cfg["MAX_INPUT_CHARS"]; 0 = no limit)
+MAX_INPUT_CHARS = int(os.getenv("ELENX_MAX_INPUT_CHARS", "16000"))
+
+
+def _stage_due(stage: str, deadline: Optional[float], report: Optional[Dict[str, str]]) -> bool:
+    """Record stage in report; False (skip it) once the deadline has passed."""
+    if report is None:
+        return True
+    ok = deadline is None or time.perf_counter() < deadline
+    report[stage] = "ok" if ok else "skipped"
+    return ok
+
+
+QTABLE_MAX_EXTRA = 1024  # lazily rendered (off-matrix) keys kept beyond the pre-rendered table
+
+
+def _file_stamp(pack: Any) -> Optional[Tuple[int, int]]:
+    """(mtime_ns, size) of a loader pack tuple's source file; None if not file-backed."""
+    if isinstance(pack, tuple) and len(pack) == 2 and isinstance(pack[1], Path):
+        try:
+            st = pack[1].stat()
+            return st.st_mtime_ns, st.st_size
+        except OSError:
+            return None
+    return None
+
+
+# --- Batch workers (process pool) ---
+# Each worker holds one engine. Under "fork" the parent engine is inherited
+# copy-on-write (initargs are not pickled), so packs are never re-loaded.
+# Under "spawn" (Windows/macOS default) the already-loaded packs are sent once.
+_BATCH_ENGINE: Optional["ElenxEngine"] = None
+_BATCH_EMPATHY: bool = True
+
+
+def _pack_hash(packs: Mapping[str, Any]) -> str:
+    """Content hash over the engine's packs (loader tuples hash their data part)."""
+    h = hashlib.sha256()
+    for name in sorted(packs):
+        data = packs[name]
+        if isinstance(data, tuple) and data:
+            data = data[0]
+        h.update(name.encode("utf-8"))
+        h.update(json.dumps(data, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8"))
+    return h.hexdigest()
+
+
+def _batch_init(engine_or_packs: Any, empathy_on: bool) -> None:
+    global _BATCH_ENGINE, _BATCH_EMPATHY
+    if isinstance(engine_or_packs, ElenxEngine):
+        _BATCH_ENGINE = engine_or_packs
+    else:
+        _BATCH_ENGINE = ElenxEngine(engine_or_packs)
+    _BATCH_EMPATHY = empathy_on
+    if _WEIGHTS_RELOAD:
+        _WEIGHTS.start()  # the parent's watcher thread does not survive fork
+
+
+def _batch_analyze(text: str) -> Tuple[DetectionResult, List[str]]:
+    return _BATCH_ENGINE.analyze(text, empathy_on=_BATCH_EMPATHY)
 
 
 class ElenxEngine:
@@ -229,7 +383,8 @@ class ElenxEngine:
     - Contextual follow-up if incentives/stakeholders/risk are detected
     """
 
-    def __init__(self, packs: Dict[str, Any]):
+    def __init__(self, packs: Dict[str, Any], result_cache: Optional[ResultCache] = None,
+                 near_dup: Optional["NearDupIndex"] = None, fusion: Optional["FusedModeScorer"] = None):
         # Raw packs (loader may pass dict/tuple/list/str)
         self._matrix_raw: Any = packs.get("matrix", {}) or {}
         self.voices: Dict[str, Any] = packs.get("voices", {}) or {}
@@ -239,40 +394,77 @@ class ElenxEngine:
         self.context_drivers: Dict[str, Any] = self.context_pack  # alias for clarity
         self.context_drivers: Dict[str, Any] = self.context_pack
 
+        # Mode × Principle detection rules (data/detection_rules.json), compiled against the matrix in _decisions
+        _raw_rules = packs.get("detection_rules")
+        self.detection_rules: RuleSet = RuleSet.from_pack(_raw_rules) if _raw_rules else default_rules()
+        self._decision_table: Optional[DecisionTable] = None
+        self._score_grid: Optional[ScoreGrid] = None
+
+        # Fallacy/context cues compiled from the packs; per-item `cues` (and rule-pack
+        # cue patterns) join the shared scan
+        self._fusion = FallacyContextFusion.from_packs(self.fallacies_pack, self.context_pack)
+        extra_cues = {**self._fusion.item_cues, **self.detection_rules.cue_patterns()}
+        self._scanner = build_scanner([*_CUE_TABLES, extra_cues]) if extra_cues else _CUE_SCANNER
+        self._lexicon = _LING_LEXICON
+
         # Config
         self.cfg: Dict[str, Any] = {}
         self.cfg.update({
             "LINGUISTIC_STARTER_CONF": 0.60,   # starter confidence for cue-detected mode
             "LINGUISTIC_MAX_BOOST": 0.15,      # cap how much cues can boost
             "LINGUISTIC_MIN_MATCHES": 1,       # at least N regex matches to count
+            "MAX_INPUT_CHARS": MAX_INPUT_CHARS,  # truncate longer inputs (bounds scan cost); 0 = off
         })
 
+        if _WEIGHTS_RELOAD:
+            _WEIGHTS.start()
+
+        # Raw packs as received (spawn-mode batch workers rebuild from these)
+        self._packs: Dict[str, Any] = packs
+        self._pack_stamps: Dict[str, Any] = {
+            name: _file_stamp(packs.get(name)) for name in ("matrix", "voices")
+        }
+
+        # Opt-in whole-result cache (see analyze); keyed on pack content + weights version
+        self.result_cache: Optional[ResultCache] = result_cache
+        # Opt-in near-duplicate reuse (src/near_dup.py), consulted after an exact-cache miss
+        self.near_dup: Optional["NearDupIndex"] = near_dup
+        # Opt-in fusion stage (engine/adaptive/scorer_backends.py), run after render on what's left of deadline_ms
+        self.fusion: Optional["FusedModeScorer"] = fusion
+        self._packs_hash = _pack_hash(packs)
+
+        # Pre-rendered questions: (mode, principle, empathy_on, has_follow) -> questions
+        self._qtable: Dict[Tuple[str, str, bool, bool], Tuple[str, ...]] = {}
+        self._qtable_token: Tuple[Any, Any] = (None, None)
+        self._qtable_size = 0
+
         # Preferred mode bias (your Matrix order)
         self._preferred_modes = ["Analytical", "Critical", "Creative", "Reflective", "Growth"]
 
-        # Defaults from coerced + filtered matrix
-        matrix = self._matrix()
-        if self._valid_modes(matrix):
-            self._default_mode, self._default_principle = self._first_mode_principle(matrix)
-        else:
-            self._default_mode, self._default_principle = "Analytical", "Evidence & Validation"
+        # Defaults from coerced + filtered matrix (frozen index, built once)
+        self._matrix_index: Optional[MatrixIndex] = None
+        self._mx  # build eagerly so startup pays the cost, not the first request
+
+    def features(self, text: str) -> TextFeatures:
+        """
+        Normalized text + cue hits (incl. this engine's per-item pack cues), built once per request.
+        Scans at most cfg["MAX_INPUT_CHARS"] characters, like analyze().
+        """
+        return TextFeatures.build(cap_text(text, self.cfg["MAX_INPUT_CHARS"]), self._scanner, self._lexicon)
 
     # ---------- Linguistic cues ----------
 
-    def _score_linguistic_mode(self, text: str) -> Dict[str, float]:
+    def _score_linguistic_mode(self, text: str, feats: Optional[TextFeatures] = None) -> Dict[str, float]:
         """
         Returns a dict of mode -> normalized cue score based on regex hits.
         We keep it simple/robust: count distinct pattern hits (0/1 per pattern), then softmax.
         """
-        text_l = (text or "").lower()
+        hits = (feats or self.features(text)).hits
         raw: Dict[str, float] = {}
-        for mode, patterns in LINGUISTIC_CUES.items():
-            hits = 0
-            for pat in patterns:
-                if re.search(pat, text_l):
-                    hits += 1
-            if hits >= self.cfg["LINGUISTIC_MIN_MATCHES"]:
-                raw[mode] = float(hits)
+        for mode, cue_ids in _LING_CUE_IDS.items():
+            n = sum(1 for cid in cue_ids if cid in hits)
+            if n >= self.cfg["LINGUISTIC_MIN_MATCHES"]:
+                raw[mode] = float(n)
       
         # [L1] apply learned weights to mode scores BEFORE normalization
         weighted = _apply_learned_weights(raw, "mode")
@@ -286,23 +478,135 @@ class ElenxEngine:
         return _softmax(weighted)
 
 
+    def score_linguistic_batch(self, texts: Iterable[str]) -> "np.ndarray":
+        """
+        Vectorized _score_linguistic_mode over many texts.
+        Returns a len(texts) × len(LINGUISTIC_MODES) array of mode probabilities
+        (0.0 where a mode has no cue hits). Needs NumPy; imported on first use.
+        """
+        try:
+            from src.linguistic_batch import BatchLinguisticScorer
+        except ImportError:
+            from linguistic_batch import BatchLinguisticScorer
+        min_matches = self.cfg["LINGUISTIC_MIN_MATCHES"]
+        scorer = getattr(self, "_ling_batch", None)
+        if scorer is None or scorer.min_matches != min_matches:
+            scorer = self._ling_batch = BatchLinguisticScorer(_LING_CUE_IDS, min_matches)
+        learned = _learned()  # one weights snapshot for the whole batch
+        weights = [_lw("mode", m, 1.0, learned) for m in scorer.modes]
+        return scorer.score_hits((self.features(t).hits for t in texts), weights)
+
     # ---------- Public API ----------
 
-    def analyze(self, text: str, empathy_on: bool = True) -> Tuple[DetectionResult, List[str]]:
-        text = (text or "").strip()
+    def analyze(self, text: str, empathy_on: bool = True,
+                deadline_ms: Optional[float] = None) -> Tuple[DetectionResult, List[str]]:
+        """
+        Detect Mode × Principle and render questions.
+
+        - deadline_ms: latency budget. Stages run in STAGES order; once the
+          budget is spent the rest are skipped and the best result so far is
+          returned with degraded=True. det.stages reports each stage.
+        - inputs longer than cfg["MAX_INPUT_CHARS"] are truncated (degraded=True).
+        - with a near_dup index, a text similar enough to one analyzed before
+          (same packs / weights / cfg / empathy flag) reuses that result.
+        - with a fusion scorer, a final "fusion" stage scores the text with its
+          backends in the remaining budget (det.fusion); the Mode × Principle
+          pick stays the rule path's. Never cached: it runs on every call.
+        """
+        deadline = None if deadline_ms is None else time.perf_counter() + deadline_ms / 1000.0
+        text = text or ""
+        limit = self.cfg["MAX_INPUT_CHARS"]
+        truncated = 0 < limit < len(text)
+        if truncated:
+            text = cap_text(text, limit)
+        report: Optional[Dict[str, str]] = None
+        if deadline is not None or truncated:
+            report = {"input": "truncated"} if truncated else {}
+
+        norm = normalize_text(text)
+        cache = self.result_cache
+        key = self._cache_key(norm, empathy_on) if cache is not None else None
+        if key is not None:
+            hit = cache.get(key)
+            if hit is not None:
+                return self._fuse(*_from_stored(hit, report), text, deadline, report)
+        near = self.near_dup
+        if near is not None:
+            scope = self._cache_scope(empathy_on)
+            sig = near.signature(norm)
+            hit = near.lookup(sig, scope)
+            if hit is not None:
+                return self._fuse(*_from_stored(hit, report), text, deadline, report)
+
+        if _stage_due("features", deadline, report):
+            feats = TextFeatures.from_normalized(norm, self._scanner, self._lexicon)
+        else:
+            feats = TextFeatures(norm, frozenset())
+        det, questions = self._analyze(feats, empathy_on, deadline, report)
+        if (key is not None or near is not None) and (report is None or "skipped" not in report.values()):
+            if det.stages is not None or det.degraded:
+                det_stored = replace(det, degraded=False, stages=None)
+            else:
+                det_stored = det
+            stored = (det_stored, tuple(questions))
+            if key is not None:
+                cache.put(key, stored)
+            if near is not None:
+                near.add(sig, stored, scope)
+        return self._fuse(det, questions, text, deadline, report)
+
+    def _fuse(self, det: DetectionResult, questions: List[str], text: str, deadline: Optional[float],
+              report: Optional[Dict[str, str]]) -> Tuple[DetectionResult, List[str]]:
+        """The optional fusion stage: det.fusion from self.fusion, within what's left of the deadline."""
+        if self.fusion is None:
+            return det, questions
+        if not _stage_due(FUSION_STAGE, deadline, report):
+            return replace(det, degraded=True, stages=report), questions
+        left_ms = None if deadline is None else max(0.0, (deadline - time.perf_counter()) * 1000.0)
+        det = replace(det, fusion=self.fusion.score(text, deadline_ms=left_ms))
+        if report is not None:
+            det = replace(det, degraded=any(v != "ok" for v in report.values()), stages=report)
+        return det, questions
+
+    def _cache_key(self, norm_text: str, empathy_on: bool) -> Tuple[Any, ...]:
+        """
+        Results depend only on the normalized text (every stage reads its
+        TextFeatures), the packs, the learned weights and cfg.
+        """
+        digest = hashlib.blake2b(norm_text.encode("utf-8"), digest_size=16).digest()
+        return (digest, *self._cache_scope(empathy_on))
+
+    def _cache_scope(self, empathy_on: bool) -> Tuple[Any, ...]:
+        """Everything besides the text a stored result depends on."""
+        return (bool(empathy_on), self._packs_hash, _WEIGHTS.snapshot.version, tuple(sorted(self.cfg.items())))
+
+    def _analyze(self, feats: TextFeatures, empathy_on: bool, deadline: Optional[float] = None,
+                 report: Optional[Dict[str, str]] = None) -> Tuple[DetectionResult, List[str]]:
+        # 0️⃣ Features (normalized text + every cue hit) were built once for all stages
+        text = feats.text
 
         # 1️⃣ Pre-scan for priors
-        tags, priors_used = self._pre_scan_priors(text)
+        if _stage_due("priors", deadline, report):
+            tags, priors_used = self._pre_scan_priors(text, feats)
+        else:
+            tags, priors_used = {}, False
 
-        # 2️⃣ Semantic detection
-        mode, principle, confidence, alt_stub = self._detect_mode_principle(text)
+        # 2️⃣ Semantic detection (skipped: matrix defaults with zero confidence)
+        if _stage_due("rules", deadline, report):
+            mode, principle, confidence, alt_stub = self._detect_mode_principle(text, feats)
+            scores = self._grid.scores(feats.hits, (mode, principle), confidence)
+        else:
+            mode, principle, confidence, alt_stub = None, None, 0.0, {}
+            scores = None
 
         # 3️⃣ Context driver detection (NEW)
-        contexts = _detect_context_drivers(text, self.context_drivers)
-        if "contexts" in tags:
-            tags["contexts"].extend(x for x in contexts if x not in tags["contexts"])
-        else:
-            tags["contexts"] = contexts
+        if _stage_due("contexts", deadline, report):
+            contexts = self._fusion.labels(feats.hits, "contexts")
+            if "contexts" in tags:
+                tags["contexts"].extend(x for x in contexts if x not in tags["contexts"])
+            else:
+                tags["contexts"] = contexts
+        tags.setdefault("contexts", [])
         tags.setdefault("fallacies", [])
 
         # 4️⃣ Assemble DetectionResult
@@ -312,18 +616,95 @@ class ElenxEngine:
             confidence=confidence,
             priors_used=priors_used,
             empathy_on=empathy_on,
-            tags=tags,
+            tags=Tags(tags),
             alt_mode=alt_stub.get("alt_mode"),
             alt_principle=alt_stub.get("alt_principle"),
             alt_confidence=alt_stub.get("alt_confidence"),
+            scores=scores,
         )
 
         # 5️⃣ Render questions
-        questions = self._render_questions(det)
+        questions = self._render_questions(det) if _stage_due("render", deadline, report) else []
+        if report is not None:
+            det = replace(det, degraded=any(v != "ok" for v in report.values()), stages=report)
         return det, questions
 
+    def analyze_batch(
+        self,
+        texts: Iterable[str],
+        empathy_on: bool = True,
+        workers: Optional[int] = None,
+        chunksize: Optional[int] = None,
+        stream: bool = False,
+    ):
+        """
+        Analyze many texts across a process pool; results keep input order.
+
+        - workers: pool size (default: os.cpu_count()); <= 1 runs in-process.
+        - chunksize: texts per task (default: ~4 chunks per worker).
+        - stream=True returns a generator instead of a list.
+        """
+        it = self._iter_batch(texts, empathy_on, workers, chunksize)
+        return it if stream else list(it)
+
+    def _iter_batch(
+        self,
+        texts: Iterable[str],
+        empathy_on: bool,
+        workers: Optional[int],
+        chunksize: Optional[int],
+    ) -> Iterator[Tuple[DetectionResult, List[str]]]:
+        n_workers = workers if workers is not None else (os.cpu_count() or 1)
+        if n_workers <= 1:
+            for text in texts:
+                yield self.analyze(text, empathy_on=empathy_on)
+            return
+
+        if chunksize is None:
+            try:
+                chunksize = max(1, len(texts) // (n_workers * 4))  # type: ignore[arg-type]
+            except TypeError:
+                chunksize = 64
+
+        if "fork" in mp.get_all_start_methods():
+            ctx, payload = mp.get_context("fork"), self
+        else:
+            ctx, payload = mp.get_context("spawn"), self._packs
+
+        with ctx.Pool(n_workers, initializer=_batch_init, initargs=(payload, empathy_on)) as pool:
+            yield from pool.imap(_batch_analyze, texts, chunksize=chunksize)
+
     # ---------- Matrix coercion & filtering ----------
 
+    @property
+    def _default_mode(self) -> str:
+        return self._mx.first_mode
+
+    @property
+    def _default_principle(self) -> str:
+        # [L1] top-weighted principle of the default mode; follows weight reloads
+        return self._mx.first_principle
+
+    @property
+    def _mx(self) -> MatrixIndex:
+        """
+        Frozen MatrixIndex for the current matrix pack + learned weights.
+        Rebuilt only if `_matrix_raw` or the weights snapshot has been swapped.
+        """
+        idx = self._matrix_index
+        snap = _WEIGHTS.snapshot
+        if idx is None or idx.source is not self._matrix_raw or idx.weights_token is not snap:
+            idx = MatrixIndex.build(
+                self._matrix(),
+                preferred_modes=self._preferred_modes,
+                principle_weight=lambda p: _lw("principle", p, 1.0, snap.weights),
+                source=self._matrix_raw,
+                weights_token=snap,
+            )
+            self._matrix_index = idx
+            precompute_slug_ids((m, p) for m in idx.modes for p in idx.principles[m])  # UI ids per cell
+        return idx
+
     def _matrix(self) -> Dict[str, Dict[str, str]]:
         """
         Coerce loader output into {mode: {principle: question}} dict.
@@ -369,59 +750,26 @@ class ElenxEngine:
 
     def _valid_modes(self, matrix: Dict[str, Any]) -> List[str]:
         """Only real modes: dict values, non-empty, key not starting with '$'."""
-        if not isinstance(matrix, dict):
-            return []
-        out: List[str] = []
-        for k, v in matrix.items():
-            try:
-                if isinstance(v, dict) and v and not str(k).strip().startswith("$"):
-                    out.append(k)
-            except Exception:
-                continue
-        return out
+        return valid_modes(matrix)
 
     def _first_mode_principle(self, matrix: Dict[str, Dict[str, str]]) -> Tuple[str, str]:
-        modes = self._valid_modes(matrix)
-        if not modes:
-            return "Analytical", "Evidence & Validation"
-        # Use preferred order if possible
-        for pm in self._preferred_modes:
-            if pm in modes:
-                mode = pm
-                break
-        else:
-            mode = modes[0]
-        principles = matrix.get(mode, {})
-        if isinstance(principles, dict) and principles:
-             ordered = sorted(principles.keys(),
-                     key=lambda p: _lw("principle", p, 1.0),
-                     reverse=True)
-             principle = ordered[0]
-        else:
-             principle = "Evidence & Validation"
-        return mode, principle
+        idx = MatrixIndex.build(matrix, preferred_modes=self._preferred_modes,
+                                principle_weight=lambda p: _lw("principle", p, 1.0))
+        return idx.first_mode, idx.first_principle
 
     # ---------- Priors scan (light) ----------
 
-    def _pre_scan_priors(self, text: str) -> Tuple[Dict[str, List[str]], bool]:
-        t = (text or "").lower()
+    def _pre_scan_priors(self, text: str, feats: Optional[TextFeatures] = None) -> Tuple[Dict[str, List[str]], bool]:
+        hits = (feats or self.features(text)).hits
         contexts: List[str] = []
-        if re.search(r"\b(incentive|bonus|commission|quota|kpi)\b", t):
+        if "prior:incentive" in hits:
             contexts.append("Incentive (generic)")
-        if re.search(r"\b(stakeholder|board|investor|customer|team|ops|legal)\b", t):
+        if "prior:stakeholder" in hits:
             contexts.append("Stakeholder (generic)")
-        if re.search(r"\b(risk|downside|exposure|liability|compliance|safety)\b", t):
+        if "prior:risk" in hits:
             contexts.append("Risk (generic)")
 
-        fallacies: List[str] = []
-        try:
-            falls = (self.fallacies_pack or {}).get("fallacies", [])
-            if re.search(r"\b(always|everyone|nobody|never)\b", t):
-                hg = next((f.get("label") for f in falls if "Generalization" in (f.get("label") or "")), None)
-                if hg:
-                    fallacies.append(hg)
-        except Exception:
-            pass
+        fallacies = self._fusion.labels(hits, "fallacies")
 
         return {"contexts": contexts, "fallacies": fallacies}, bool(contexts or fallacies)
 
@@ -431,58 +779,10 @@ class ElenxEngine:
         """
         SAFE: choose a Mode × Principle using coerced + filtered matrix.
         Falls back cleanly and honors preferred modes.
+        [L1] principles are ranked by learned weight (desc) in the index.
         """
-        matrix = self._matrix()
-        valid_modes = self._valid_modes(matrix)
-        if not valid_modes:
-            return self._default_mode, self._default_principle
-
-        # 1) Mode selection
-        chosen_mode = None
-        # a) explicit hint wins if it matches
-        if pref_mode_contains:
-            for m in valid_modes:
-                try:
-                    if pref_mode_contains.lower() in m.lower():
-                        chosen_mode = m
-                        break
-                except Exception:
-                    continue
-        # b) otherwise, use preferred ordering if present
-        if not chosen_mode:
-            for pm in self._preferred_modes:
-                if pm in valid_modes:
-                    chosen_mode = pm
-                    break
-        # c) final fallback = first valid
-        if not chosen_mode:
-            chosen_mode = valid_modes[0]
-
-        # 2) Principle selection within chosen mode
-        chosen_principle = None
-        principles = matrix.get(chosen_mode, {})
-        # [L1] reorder principles by learned weight (desc), fallback stable
-        if isinstance(principles, dict) and principles:
-             ordered = sorted(principles.keys(),
-                     key=lambda p: _lw("principle", p, 1.0),
-                     reverse=True)
-        else:
-            ordered = []
-
-        if isinstance(principles, dict) and pref_principle_contains:
-            for p in (ordered or principles.keys()):
-                try:
-                    if pref_principle_contains.lower() in p.lower():
-                        chosen_principle = p
-                        break
-                except Exception:
-                    continue
-        if not isinstance(principles, dict) or not principles:
-            return chosen_mode, self._default_principle
-        if not chosen_principle:
-            chosen_principle = (ordered[0] if ordered else self._default_principle)
-
-        return chosen_mode, chosen_principle
+        return self._mx.pick(pref_mode_contains, pref_principle_contains,
+                             (self._default_mode, self._default_principle))
 
     def _pick_from_matrix_any(self, mode_hint: Optional[str], principle_hints: List[str]) -> Tuple[str, str]:
         """
@@ -497,19 +797,9 @@ class ElenxEngine:
                 return m, p
 
         # If we got here, hints didn't match. Prefer the hinted mode anyway.
-        matrix = self._matrix()
-        valid_modes = self._valid_modes(matrix)
-        if mode_hint:
-            for m in valid_modes:
-                try:
-                    if mode_hint.lower() in m.lower():
-                        ps = matrix.get(m, {})
-                        if isinstance(ps, dict) and ps:
-                            return m, next(iter(ps.keys()))
-                        else:
-                            return m, self._default_principle
-                except Exception:
-                    continue
+        m = self._mx.mode_containing(mode_hint)
+        if m:
+            return m, self._mx.principles[m][0]
 
         # Final fallback
         return self._default_mode, self._default_principle
@@ -520,86 +810,38 @@ class ElenxEngine:
     def _prefer_principle_within_mode(self, mode: str, hints: List[str]) -> Optional[str]:
         # If the given mode exists, return the first principle under that mode whose
         # name contains any of the hint substrings (case-insensitive). Otherwise None.
-        matrix = self._matrix()
-        principles = matrix.get(mode, {})
-        if not isinstance(principles, dict):
-            return None
-        for hint in hints:
-            h = (hint or "").strip().lower()
-            if not h:
-                continue
-            for pname in principles.keys():
-                try:
-                    if h in pname.lower():
-                        return pname
-                except Exception:
-                    continue
-        return None
+        return self._mx.principle_containing(mode, hints)
+
+    @property
+    def _decisions(self) -> DecisionTable:
+        """Detection rules compiled against the current MatrixIndex (recompiled with it)."""
+        mx = self._mx
+        table = self._decision_table
+        if table is None or table.index is not mx:
+            table = self._decision_table = compile_rules(self.detection_rules, mx)
+        return table
+
+    @property
+    def _grid(self) -> ScoreGrid:
+        """All-cells score grid for the current decision table (recompiled with it)."""
+        table = self._decisions
+        grid = self._score_grid
+        if grid is None or grid.index is not table.index:
+            learned = _learned()
+            grid = self._score_grid = ScoreGrid(
+                table, _LING_CUE_IDS, PRIOR_HINTS, weight=lambda kind, name: _lw(kind, name, 1.0, learned)
+            )
+        return grid
 
-    def _detect_mode_principle(self, text: str) -> Tuple[str, str, float, Dict[str, Any]]:
+    def _detect_mode_principle(self, text: str, feats: Optional[TextFeatures] = None) -> Tuple[str, str, float, Dict[str, Any]]:
         """
         Step 6 — Full Matrix Coverage & Mode Diversification
-        Expands detection to include Creative / Reflective / Growth Modes
-        while retaining Analytical + Critical reliability.
+        Critical / Analytical / Creative / Reflective / Growth picks from the
+        detection rules pack: each rule hit is a lookup of its precompiled
+        (mode, principle) target, applied in pack order.
         """
-        t = (text or "").lower()
-        mode, principle = self._default_mode_principle_from_matrix()
-        confidence = 0.55
-        alt_mode, alt_principle, alt_conf = None, None, None
-
-        # --- 1) Critical — Stakeholder / incentive / relationship pressure ---
-        if re.search(r"\b(co[- ]?founder|partner|stakeholder|board|investor|team|incentive|misalign|alignment|tension|conflict|trust|pressure)\b", t):
-            mode, principle = self._pick_from_matrix_any(
-                "Critical",
-                ["Stakeholder", "Stakeholders", "Incentive", "Incentives",
-                 "Alignment", "Misalignment", "Trust", "Conflict", "Tension",
-                 "Relationship", "Relational", "Dynamics", "Second"]
-            )
-            preferred = self._prefer_principle_within_mode(mode, [
-                "Stakeholder", "Stakeholders", "Incentive", "Incentives",
-                "Alignment", "Misalignment", "Trust", "Conflict", "Tension",
-                "Relationship", "Relational", "Dynamics"
-            ])
-            if preferred:
-                principle = preferred
-            confidence = max(confidence, 0.64)
-
-        # --- 2) Analytical — 'What to do next' / uncertainty ---
-        if re.search(r"\b(unsure|uncertain|what\s*to\s*do\s*next|next\s*step|where\s*to\s*start)\b", t):
-            m2, p2 = self._pick_from_matrix_any(
-                "Analytical",
-                ["Test", "Assumption", "Next", "Validation", "Experiment"]
-            )
-            if confidence < 0.60:
-                mode, principle = m2, p2
-                confidence = 0.60
-
-        # --- 3) Analytical — Evidence / validation cues ---
-        if re.search(r"\b(test|validate|evidence|data|experiment|proof)\b", t):
-            m2, p2 = self._pick_from_matrix("Analytical", "Evidence")
-            if confidence < 0.62:
-                mode, principle = m2, p2
-                confidence = 0.62
-
-        # --- 4) Critical ALT — Second-order / unintended consequences ---
-        if re.search(r"\b(second[- ]order|unintended|downstream|what if)\b", t):
-            alt_mode, alt_principle = self._pick_from_matrix("Critical", "Second")
-            alt_conf = 0.48
-
-        # --- 5) Creative — Ideation / imagination / new approaches ---
-        if re.search(r"\b(brainstorm|idea|imagin|new approach|possibilit|prototype|blue sky|novel|what if|concept)\b", t):
-            mode, principle = self._pick_from_matrix("Creative", "Exploration")
-            confidence = max(confidence, 0.60)
-
-        # --- 6) Reflective — Hindsight / lessons / introspection ---
-        if re.search(r"\b(regret|hindsight|pattern|lesson|learned|looking back|reflection|introspect|recap)\b", t):
-            mode, principle = self._pick_from_matrix("Reflective", "Root Cause")
-            confidence = max(confidence, 0.60)
-
-        # --- 7) Growth — Habits / mindset / feedback / evolution ---
-        if re.search(r"\b(habit|mindset|develop|feedback|coach|evolv|improv|practice|routine)\b", t):
-            mode, principle = self._pick_from_matrix("Growth", "Iteration")
-            confidence = max(confidence, 0.60)
+        hits = (feats or self.features(text)).hits
+        mode, principle, confidence, alt = self._decisions.decide(hits)
 
         if _ELENX_DEBUG_WEIGHTS:
             try:
@@ -611,82 +853,16 @@ class ElenxEngine:
             except Exception as _e:
                 print(f"[L1] debug print failed: {_e!r}")
 
-        # --- 8) Return result ---
-        return mode, principle, confidence, {
-            "alt_mode": alt_mode,
-            "alt_principle": alt_principle,
-            "alt_confidence": alt_conf
-        }
-        # [L1] debug — confirm learned weights being read for the chosen labels
-        if _ELENX_DEBUG_WEIGHTS:
-            try:
-                 _mw = _lw("mode", mode, 1.0)
-                 _pw = _lw("principle", principle, 1.0)
-                 _emp = _lw_emp()
-                 print(f"[L1] Final pick: mode={mode} (w={_mw:.3f})  principle={principle} (w={_pw:.3f})  "
-                       f"conf={confidence:.2f}  empathy_bias={_emp['bias']:+.3f}  emp_mult={_emp['multiplier']:.3f}")
-            except Exception as _e:
-                 print(f"[L1] debug print failed: {_e!r}")
+        return mode, principle, confidence, alt
 
     # ---------- Matrix & Voices helpers ----------
 
     def _norm(self, s: str) -> str:
-        return (s or "").strip().lower().replace("&", "and").replace("  ", " ")
+        return norm_label(s)
 
     def _get_matrix_question(self, mode: str, principle: str) -> str:
-        """Forgiving lookup against coerced + filtered Matrix dict."""
-        matrix = self._matrix()
-        valid_modes = self._valid_modes(matrix)
-        if not valid_modes:
-            return ""
-
-        # 1) Exact (only within valid modes)
-        try:
-            if mode in valid_modes:
-                q = (matrix.get(mode, {}) or {}).get(principle)
-                if q:
-                    return str(q)
-        except Exception:
-            pass
-
-        # Build normalized index only from valid modes
-        target_mode, target_pr = self._norm(mode), self._norm(principle)
-        norm_index: Dict[str, Dict[str, Any]] = {}
-        for m in valid_modes:
-            ps = matrix.get(m, {})
-            if not isinstance(ps, dict):
-                continue
-            nm = self._norm(m)
-            bucket = norm_index.setdefault(nm, {})
-            for p, qv in ps.items():
-                bucket[self._norm(p)] = qv
-
-        # 2) Normalized exact
-        if target_mode in norm_index and target_pr in norm_index[target_mode]:
-            return str(norm_index[target_mode][target_pr])
-
-        # 3) Partial within chosen mode(s)
-        for nm, bucket in norm_index.items():
-            if target_mode in nm or nm in target_mode:
-                if target_pr in bucket:
-                    return str(bucket[target_pr])
-                for np, qv in bucket.items():
-                    if target_pr in np or np in target_pr:
-                        return str(qv)
-
-        # 4) Global partial across all valid modes
-        for nm, bucket in norm_index.items():
-            for np, qv in bucket.items():
-                if target_pr in np or np in target_pr:
-                    return str(qv)
-
-        # 5) Stable fallback: first valid mode's first principle
-        try:
-            fm = self._first_mode_principle(matrix)[0]
-            fp = next(iter(matrix[fm].keys()))
-            return str(matrix[fm][fp]) or ""
-        except Exception:
-            return ""
+        """Forgiving lookup against coerced + filtered Matrix dict (precomputed in the index)."""
+        return self._mx.question(mode, principle)
 
     def _voice_line(self, base_q: str, voice_name: str, empathy_on: bool) -> str:
         """
@@ -749,11 +925,74 @@ class ElenxEngine:
 
     # ---------- Render ----------
 
+    def refresh_packs(self) -> bool:
+        """
+        Reload matrix.json / voices.json if their files changed on disk.
+        Only applies to packs passed in as loader (data, path) tuples.
+        Swapping them invalidates the MatrixIndex and the question table.
+        """
+        changed = False
+        for name in ("matrix", "voices"):
+            old = self._pack_stamps.get(name)
+            if old is None:
+                continue
+            stamp = _file_stamp(self._packs.get(name))
+            if stamp == old:
+                continue
+            pack = elenx_loader.load_pack(name)
+            self._packs[name] = pack
+            self._pack_stamps[name] = stamp
+            if name == "matrix":
+                self._matrix_raw = pack
+            else:
+                self.voices = pack
+            changed = True
+        if changed:
+            self._packs_hash = _pack_hash(self._packs)
+        return changed
+
+    def _question_table(self) -> Dict[Tuple[str, str, bool, bool], Tuple[str, ...]]:
+        """
+        Mode × Principle × empathy × follow-up → rendered questions.
+        Every valid matrix cell is pre-rendered; rebuilt when the matrix
+        index or the voices pack is swapped.
+        """
+        mx = self._mx
+        token = (mx, self.voices)
+        if self._qtable_token[0] is not token[0] or self._qtable_token[1] is not token[1]:
+            table: Dict[Tuple[str, str, bool, bool], Tuple[str, ...]] = {}
+            for mode in mx.modes:
+                for principle in mx.principles[mode]:
+                    for empathy_on in (True, False):
+                        for has_follow in (True, False):
+                            table[(mode, principle, empathy_on, has_follow)] = tuple(
+                                self._render_question_set(mode, principle, empathy_on, has_follow)
+                            )
+            self._qtable = table
+            self._qtable_token = token
+            self._qtable_size = len(table)
+        return self._qtable
+
     def _render_questions(self, det: DetectionResult) -> List[str]:
+        ctx_tags = (det.tags or {}).get("contexts", [])
+        has_follow = any(("Incentive" in t) or ("Stakeholder" in t) or ("Risk" in t) for t in ctx_tags)
+        key = (det.mode, det.principle, bool(det.empathy_on), has_follow)
+
+        table = self._question_table()
+        qs = table.get(key)
+        if qs is None:
+            qs = tuple(self._render_question_set(*key))
+            if len(table) >= self._qtable_size + QTABLE_MAX_EXTRA:
+                # drop the oldest lazily added key; pre-rendered cells stay
+                table.pop(next(k for i, k in enumerate(table) if i >= self._qtable_size))
+            table[key] = qs
+        return list(qs)
+
+    def _render_question_set(self, mode: str, principle: str, empathy_on: bool, has_follow: bool) -> List[str]:
         out: List[str] = []
 
         # 1) Primary from Matrix (best effort)
-        base_q = (self._get_matrix_question(det.mode, det.principle) or "").strip()
+        base_q = (self._get_matrix_question(mode, principle) or "").strip()
         if not base_q:
             base_q = "What evidence would most directly challenge your current conclusion?"
 
@@ -763,14 +1002,13 @@ class ElenxEngine:
         # 3) Overlays (dedup)
         seen = set()
         for v in voices_to_use:
-            q = self._voice_line(base_q, v, det.empathy_on)
+            q = self._voice_line(base_q, v, empathy_on)
             if q and q not in seen:
                 out.append(q)
                 seen.add(q)
 
         # 4) Contextual follow-up (incentives/stakeholders/risk)
-        ctx_tags = (det.tags or {}).get("contexts", [])
-        if any(("Incentive" in t) or ("Stakeholder" in t) or ("Risk" in t) for t in ctx_tags):
+        if has_follow:
             follow = "Where could incentives or stakeholder pressures distort what looks like evidence?"
             if follow not in seen:
                 out.append(follow)
@@ -1,23 +1,32 @@
 # src/elenx_loader.py
+import hashlib
+import importlib.util
 import json
+import marshal
+import os
+import sys
 from pathlib import Path
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, Optional, Tuple
 
-try:
-    import jsonschema  # type: ignore
-    HAS_JSONSCHEMA = True
-except Exception:
-    HAS_JSONSCHEMA = False
+# jsonschema is imported on first validation (it dominates import time);
+# the fast bundle path never needs it.
+HAS_JSONSCHEMA = importlib.util.find_spec("jsonschema") is not None
 
 ROOT = Path(__file__).resolve().parents[1]
 DATA_DIR = ROOT / "data"
 SCHEMA_DIR = ROOT / "schemas"
 
+# Compiled pack bundle (see compile_packs); regenerate with
+#   python src/elenx_loader.py compile-packs
+BUNDLE_PATH = DATA_DIR / "runtime" / "packs.bundle"
+BUNDLE_FORMAT = 1
+
 FILES = {
     "matrix": ("matrix.json", "matrix.schema.json"),
     "voices": ("voices.json", "voices.schema.json"),
     "fallacies": ("fallacies.json", "fallacies.schema.json"),
     "context_drivers": ("context_drivers.json", "context_drivers.schema.json"),
+    "detection_rules": ("detection_rules.json", "detection_rules.schema.json"),
 }
 
 class LoadError(RuntimeError):
@@ -37,9 +46,12 @@ def _validate(name: str, data: Any, schema_path: Path) -> None:
         return  # validation skipped if jsonschema not installed
     if not schema_path.exists():
         return  # schema optional
-    schema = _read_json(schema_path)
     try:
-        jsonschema.validate(instance=data, schema=schema)
+        from src.schema_registry import REGISTRY
+    except ImportError:  # imported with src/ on sys.path
+        from schema_registry import REGISTRY
+    try:
+        REGISTRY.validate(data, schema_path)  # compiled once per schema file
     except Exception as e:
         raise LoadError(f"Schema validation failed for {name} ({schema_path.name}): {e}") from e
 
@@ -65,6 +77,7 @@ def summary(loaded: Dict[str, Any]) -> str:
     v = loaded.get("voices", {})
     f = loaded.get("fallacies", {})
     c = loaded.get("context_drivers", {})
+    r = loaded.get("detection_rules", {})
     # heuristics for counts
     def count_matrix_nodes(mat: Dict[str, Any]) -> Tuple[int, int]:
         modes = len(mat) if isinstance(mat, dict) else 0
@@ -79,22 +92,110 @@ def summary(loaded: Dict[str, Any]) -> str:
     parts.append(f"voices: {len(v.get('voices', [])) if isinstance(v, dict) else 0}")
     parts.append(f"fallacies: {len(f.get('fallacies', [])) if isinstance(f, dict) else 0}")
     parts.append(f"context_drivers: {len(c.get('drivers', [])) if isinstance(c, dict) else 0}")
+    parts.append(f"detection_rules: {len(r.get('rules', [])) if isinstance(r, dict) else 0}")
     return " | ".join(parts)
 
-if __name__ == "__main__":
-    loaded = load_all()
-    print("Elenx loader ✓ loaded packs")
-    print(summary(loaded))
-
 # --- Convenience wrapper for full pack loading ---
-def load_packs() -> dict:
-    """Loads all four core Elenx data packs at once."""
+def load_packs(fast: bool = False, bundle: Path = BUNDLE_PATH) -> dict:
+    """
+    Loads all core Elenx data packs at once.
+    fast=True reads the compiled bundle instead (no JSON parse, no schema
+    validation) when it is still fresh; otherwise falls back to the full load.
+    """
+    if fast:
+        packs = _load_bundle(bundle)
+        if packs is not None:
+            return packs
     return {
         "matrix": load_pack("matrix"),
         "voices": load_pack("voices"),
         "fallacies": load_pack("fallacies"),
         "context_drivers": load_pack("context_drivers"),
+        "detection_rules": load_pack("detection_rules"),
     }
+
+# --- Compiled pack bundle ---
+# One marshal file holding every validated pack plus, per source file
+# (data + schema), its (size, mtime_ns, sha256). A bundle is fresh when each
+# source still matches: stat first, content hash only if the stat differs
+# (e.g. after a checkout that touched mtimes).
+SourceStamp = Tuple[int, int, Optional[str]]  # (size, mtime_ns, sha256); sha None = file absent
+
+def _source_paths(name: str) -> Tuple[Path, Path]:
+    data_fname, schema_fname = FILES[name]
+    return DATA_DIR / data_fname, SCHEMA_DIR / schema_fname
+
+def _source_stamp(path: Path) -> SourceStamp:
+    try:
+        st = path.stat()
+        with path.open("rb") as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return 0, 0, None
+    return st.st_size, st.st_mtime_ns, digest
+
+def _source_fresh(path: Path, stamp: SourceStamp) -> bool:
+    size, mtime_ns, digest = stamp
+    try:
+        st = path.stat()
+    except OSError:
+        return digest is None
+    if digest is None:
+        return False
+    if (st.st_size, st.st_mtime_ns) == (size, mtime_ns):
+        return True
+    return st.st_size == size and _source_stamp(path)[2] == digest
+
+def compile_packs(out: Path = BUNDLE_PATH) -> Path:
+    """Validate every pack once and write them as a single bundle (atomic replace)."""
+    packs: Dict[str, Any] = {}
+    sources: Dict[str, Tuple[SourceStamp, SourceStamp]] = {}
+    for name in FILES:
+        data_path, schema_path = _source_paths(name)
+        stamps = (_source_stamp(data_path), _source_stamp(schema_path))
+        packs[name], _ = load_pack(name)
+        sources[name] = stamps
+    blob = marshal.dumps({
+        "format": BUNDLE_FORMAT,
+        "python": tuple(sys.version_info[:2]),
+        "validated": HAS_JSONSCHEMA,
+        "sources": sources,
+        "packs": packs,
+    })
+    out = Path(out)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    tmp = out.with_name(out.name + ".tmp")
+    with tmp.open("wb") as f:
+        f.write(blob)
+    os.replace(tmp, out)
+    return out
+
+def _load_bundle(bundle: Path) -> Optional[Dict[str, Any]]:
+    """Packs from a fresh bundle as load_packs() returns them, or None if missing/stale."""
+    try:
+        with open(bundle, "rb") as f:
+            payload = marshal.loads(f.read())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if not isinstance(payload, dict) or payload.get("format") != BUNDLE_FORMAT:
+        return None
+    if payload.get("python") != tuple(sys.version_info[:2]):
+        return None
+    if HAS_JSONSCHEMA and not payload.get("validated"):
+        return None  # compiled without validation; validate now instead
+    sources = payload.get("sources") or {}
+    packs = payload.get("packs") or {}
+    out: Dict[str, Any] = {}
+    for name in FILES:
+        if name not in packs or name not in sources:
+            return None
+        data_path, schema_path = _source_paths(name)
+        data_stamp, schema_stamp = sources[name]
+        if not (_source_fresh(data_path, data_stamp) and _source_fresh(schema_path, schema_stamp)):
+            return None
+        out[name] = (packs[name], data_path)
+    return out
+
 # --- Clarity Gain signal picker (shim) ---
 # Provides a stable API for smoke_test_clarity_gain.py
 # Reads thresholds if available; otherwise uses sane defaults.
@@ -145,3 +246,13 @@ def pick_signal(delta: float) -> Dict[str, str]:
         label = "Strong clarity jump"
 
     return {"tier": tier, "label": label}
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["compile-packs"]:
+        path = compile_packs(Path(sys.argv[2]) if len(sys.argv) > 2 else BUNDLE_PATH)
+        print(f"Elenx loader ✓ compiled packs -> {path}")
+        sys.exit(0)
+    loaded = load_all()
+    print("Elenx loader ✓ loaded packs")
+    print(summary(loaded))
+
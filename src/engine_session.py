@@ -0,0 +1,127 @@
+# src/engine_session.py
+# Incremental, session-level analysis for multi-turn dilemmas.
+#
+# Clients used to resend the whole conversation to ElenxEngine.analyze on
+# every turn, rescanning everything said so far (O(n²) per session).
+# EngineSession keeps the cue state between turns instead:
+#
+#   session = EngineSession(engine)
+#   det, qs = session.append("My co-founder and I disagree on pricing. ")
+#   det, qs = session.append("The board wants an answer by Friday.")
+#
+# Each append normalizes only the unsettled tail (IncrementalNormalizer) and
+# rescans only the new text plus a short window of the old one
+# (CueScanner.extend_matches), stems only the tokens after the last settled
+# space (StemLexicon phrases are re-checked across that boundary), then
+# re-runs the rule stages on the updated cue hits. Results are identical to
+# engine.analyze("".join(all deltas)), including its input cap: past
+# cfg["MAX_INPUT_CHARS"] only cap_text() of the conversation is scanned and
+# results are degraded with stages["input"] == "truncated"; later appends
+# add nothing to scan.
+from __future__ import annotations
+
+from typing import Dict, Hashable, List, Set, Tuple
+
+try:
+    from src.cue_scanner import Span
+    from src.scan_guard import cap_text
+    from src.elenx_engine import DetectionResult, ElenxEngine, _LING_CUE_IDS
+    from src.result_types import EMPTY_TAGS, Tags
+    from src.text_features import IncrementalNormalizer, TextFeatures, tokenize
+except ImportError:  # imported with src/ on sys.path
+    from cue_scanner import Span
+    from scan_guard import cap_text
+    from elenx_engine import DetectionResult, ElenxEngine, _LING_CUE_IDS
+    from result_types import EMPTY_TAGS, Tags
+    from text_features import IncrementalNormalizer, TextFeatures, tokenize
+
+
+class EngineSession:
+    """
+    Stateful analysis of an append-only conversation.
+
+    - append(delta): concatenates delta verbatim (include your own separators)
+      and returns (DetectionResult, questions) for the whole text so far
+    - hits / mode_counts: current cue state (mode_counts = distinct
+      linguistic cues hit per mode, as _score_linguistic_mode counts them)
+    - tags: prior/fallacy/context tags from the last append
+    """
+
+    def __init__(self, engine: ElenxEngine, empathy_on: bool = True):
+        self.engine = engine
+        self.empathy_on = empathy_on
+        self.reset()
+
+    def reset(self) -> None:
+        self._raw = ""
+        self.turns = 0
+        self._reset_scan()
+
+    def _reset_scan(self) -> None:
+        self._normalizer = IncrementalNormalizer()
+        self._norm = ""
+        self._matches: Dict[Hashable, Span] = {}
+        self._tok_end = 0                  # norm[:_tok_end] ends at a space; its tokens are final
+        self._stems: List[str] = []        # stems of the tokens in norm[:_tok_end]
+        self._lex_hits: Set[Hashable] = set()
+        self._feats = TextFeatures("", frozenset())
+        self._tags: Tags = EMPTY_TAGS
+
+    @property
+    def text(self) -> str:
+        return self._raw
+
+    @property
+    def features(self) -> TextFeatures:
+        return self._feats
+
+    @property
+    def hits(self) -> frozenset:
+        return self._feats.hits
+
+    @property
+    def mode_counts(self) -> Dict[str, int]:
+        hits = self._feats.hits
+        return {mode: sum(1 for cid in ids if cid in hits) for mode, ids in _LING_CUE_IDS.items()}
+
+    @property
+    def tags(self) -> Tags:
+        return self._tags
+
+    def append(self, delta: str) -> Tuple[DetectionResult, List[str]]:
+        self.turns += 1
+        scanner = self.engine._scanner
+        self._raw += delta or ""
+        limit = self.engine.cfg["MAX_INPUT_CHARS"]
+        truncated = 0 < limit < len(self._raw)
+        text = cap_text(self._raw, limit) if truncated else self._raw
+        if not text.startswith(self._normalizer.raw):  # the cap cut back into text already scanned
+            self._reset_scan()
+
+        norm = self._normalizer.append(text[len(self._normalizer.raw):])
+        if norm.startswith(self._norm):
+            self._matches = scanner.extend_matches(norm, self._matches, len(self._norm))
+        else:  # normalization changed the old text (e.g. a combining mark joined across turns)
+            self._matches = scanner.first_matches(norm)
+            self._tok_end, self._stems, self._lex_hits = 0, [], set()
+        self._norm = norm
+        self._feats = TextFeatures(norm, frozenset(self._matches) | self._stem_hits(norm))
+
+        report = {"input": "truncated", "features": "ok"} if truncated else None
+        det, questions = self.engine._analyze(self._feats, self.empathy_on, None, report)
+        self._tags = det.tags
+        return det, questions
+
+    def _stem_hits(self, norm: str) -> Set[Hashable]:
+        """Lexicon hits of norm: settled tokens are stemmed once, the tail every append."""
+        lex = self.engine._lexicon
+        overlap = lex.max_n - 1  # phrases may start this many tokens before a boundary
+        cut = max(norm.rfind(" "), norm.rfind("\n")) + 1
+        if cut > self._tok_end:
+            old = len(self._stems)
+            self._stems.extend(lex.stems(tokenize(norm[self._tok_end:cut])))
+            self._lex_hits |= lex.match_stems(self._stems, max(0, old - overlap))
+            self._tok_end = cut
+        window = self._stems[max(0, len(self._stems) - overlap):] if overlap else []
+        window.extend(lex.stems(tokenize(norm[self._tok_end:])))
+        return self._lex_hits | lex.match_stems(window)
@@ -0,0 +1,1377 @@
+# GENERATED by src/schema_codegen.py from schemas/clarity_gain_record.schema.json — do not edit.
+# Regenerate with: python src/schema_codegen.py build
+# flake8: noqa
+from collections import deque
+from collections.abc import Mapping, Sequence
+from numbers import Number
+
+
+class FastError:
+    """A validation error with the fields of jsonschema.ValidationError that callers read."""
+
+    __slots__ = ("message", "path", "schema_path", "validator", "validator_value", "instance", "schema")
+
+    def __init__(self, message, path, schema_path, validator, validator_value, instance, schema):
+        self.message = message
+        self.path = deque(path)
+        self.schema_path = deque(schema_path)
+        self.validator = validator
+        self.validator_value = validator_value
+        self.instance = instance
+        self.schema = schema
+
+    def __repr__(self):
+        return f"<FastError {self.message!r} at {list(self.path)}>"
+
+    __str__ = lambda self: self.message
+
+
+def _is_number(v):
+    return isinstance(v, Number) and not isinstance(v, bool)
+
+
+def _is_integer(v):
+    if isinstance(v, bool):
+        return False
+    return isinstance(v, int) or (isinstance(v, float) and v.is_integer())
+
+
+def _unbool(v, true=object(), false=object()):
+    return true if v is True else false if v is False else v
+
+
+def _equal(one, two):
+    if one is two:
+        return True
+    if isinstance(one, str) or isinstance(two, str):
+        return one == two
+    if isinstance(one, Sequence) and isinstance(two, Sequence):
+        return len(one) == len(two) and all(_equal(i, j) for i, j in zip(one, two))
+    if isinstance(one, Mapping) and isinstance(two, Mapping):
+        return len(one) == len(two) and all(k in two and _equal(v, two[k]) for k, v in one.items())
+    return _unbool(one) == _unbool(two)
+
+
+def _extras_msg(extras):
+    extras = sorted(extras, key=str)
+    return ", ".join(repr(e) for e in extras), "was" if len(extras) == 1 else "were"
+
+SCHEMA_HASH = "69d19292892b17f0e244a0d3f8f293b4"
+
+_MISS = object()
+
+_SCHEMA = {'$schema': 'http://json-schema.org/draft-07/schema#',
+ 'title': 'Clarity Gain Record',
+ 'description': 'Schema for a single DilemmaNet clarity-gain reflection record produced in T2.',
+ 'spec': 'owlume.dilemmalog.clarity_gain_record.v2',
+ 'version': '2.0.0',
+ 'policy': {'judgment_landing': 'MANDATORY',
+            'rule': 'Owlume is incomplete unless every interaction ends with an owned conclusion.',
+            'effective_from': '2026-01-01'},
+ 'type': 'object',
+ 'additionalProperties': False,
+ 'properties': {'session_id': {'type': 'string',
+                               'description': 'Unique identifier for this reflection session '
+                                              '(e.g., DLM-20251018-084522).'},
+                'user_text': {'type': 'string',
+                              'description': 'Raw dilemma/statement provided by the user.'},
+                'judgment_landing': {'type': 'object',
+                                     'additionalProperties': False,
+                                     'required': ['type',
+                                                  'statement',
+                                                  'confidence',
+                                                  'acknowledged'],
+                                     'properties': {'type': {'type': 'string',
+                                                             'enum': ['position',
+                                                                      'constraint',
+                                                                      'next_step',
+                                                                      'defer']},
+                                                    'statement': {'type': 'string', 'minLength': 1},
+                                                    'confidence': {'type': 'number',
+                                                                   'minimum': 0.0,
+                                                                   'maximum': 1.0},
+                                                    'acknowledged': {'type': 'boolean'}}},
+                'detected': {'type': 'object',
+                             'description': 'Elenx detection result (mode × principle + '
+                                            'tags/drivers, empathy, confidences).',
+                             'additionalProperties': False,
+                             'properties': {'mode': {'type': 'string'},
+                                            'principle': {'type': 'string'},
+                                            'drivers': {'type': 'array',
+                                                        'description': 'Context drivers (e.g., '
+                                                                       'Incentive Misalignment).',
+                                                        'items': {'type': 'string'}},
+                                            'empathy': {'type': 'boolean'},
+                                            'confidence': {'type': 'number',
+                                                           'minimum': 0.0,
+                                                           'maximum': 1.0},
+                                            'alt': {'type': 'object',
+                                                    'description': 'Optional top-2 carry '
+                                                                   '(alternative mode/principle). '
+                                                                   'Values may be null.',
+                                                    'additionalProperties': False,
+                                                    'properties': {'mode': {'type': ['string',
+                                                                                     'null']},
+                                                                   'principle': {'type': ['string',
+                                                                                          'null']},
+                                                                   'confidence': {'type': ['number',
+                                                                                           'null'],
+                                                                                  'minimum': 0.0,
+                                                                                  'maximum': 1.0}},
+                                                    'required': ['mode',
+                                                                 'principle',
+                                                                 'confidence']},
+                                            'judgment_terminal_state': {'type': 'object',
+                                                                        'description': 'Derived '
+                                                                                       'terminal '
+                                                                                       'state from '
+                                                                                       'judgment '
+                                                                                       'landing '
+                                                                                       'gate; '
+                                                                                       'stored '
+                                                                                       'under '
+                                                                                       'detected '
+                                                                                       'for '
+                                                                                       'traceability.',
+                                                                        'additionalProperties': False,
+                                                                        'required': ['type',
+                                                                                     'statement',
+                                                                                     'confidence',
+                                                                                     'owner',
+                                                                                     'acknowledged',
+                                                                                     'timestamp'],
+                                                                        'properties': {'type': {'type': 'string',
+                                                                                                'enum': ['position',
+                                                                                                         'constraint',
+                                                                                                         'next_step',
+                                                                                                         'defer']},
+                                                                                       'statement': {'type': 'string',
+                                                                                                     'minLength': 1},
+                                                                                       'confidence': {'type': 'number',
+                                                                                                      'minimum': 0.0,
+                                                                                                      'maximum': 1.0},
+                                                                                       'owner': {'type': 'string',
+                                                                                                 'enum': ['user'],
+                                                                                                 'description': 'Ownership '
+                                                                                                                'marker: '
+                                                                                                                'the '
+                                                                                                                'conclusion '
+                                                                                                                'is '
+                                                                                                                'owned '
+                                                                                                                'by '
+                                                                                                                'the '
+                                                                                                                'user.'},
+                                                                                       'acknowledged': {'type': 'boolean'},
+                                                                                       'timestamp': {'type': 'string',
+                                                                                                     'format': 'date-time'}}}},
+                             'required': ['mode',
+                                          'principle',
+                                          'drivers',
+                                          'empathy',
+                                          'confidence',
+                                          'alt',
+                                          'judgment_terminal_state']},
+                'voices': {'type': 'array',
+                           'description': 'Voices used to render questions/feedback for this '
+                                          'reflection.',
+                           'items': {'type': 'string'},
+                           'minItems': 1},
+                'clarity_gain': {'type': 'object',
+                                 'description': 'Clarity scores captured for the session.',
+                                 'additionalProperties': False,
+                                 'properties': {'CG_pre': {'type': 'number',
+                                                           'minimum': 0.0,
+                                                           'maximum': 1.0,
+                                                           'description': 'Clarity at start '
+                                                                          '(0–1).'},
+                                                'CG_post': {'type': 'number',
+                                                            'minimum': 0.0,
+                                                            'maximum': 1.0,
+                                                            'description': 'Clarity at end (0–1).'},
+                                                'CG_delta': {'type': 'number',
+                                                             'minimum': -1.0,
+                                                             'maximum': 1.0,
+                                                             'description': 'Net change (post − '
+                                                                            'pre).'}},
+                                 'required': ['CG_pre', 'CG_post', 'CG_delta']},
+                'proof_signals': {'type': 'array',
+                                  'description': 'Proof-of-Clarity signals (delta/insight badges).',
+                                  'items': {'type': 'string'}},
+                'share': {'type': 'object',
+                          'description': 'Optional share metadata for Clarity Card flow '
+                                         '(privacy-first).',
+                          'additionalProperties': False,
+                          'properties': {'status': {'type': 'string',
+                                                    'enum': ['opt_in', 'skipped']},
+                                         'channel': {'type': 'string',
+                                                     'enum': ['image', 'markdown']},
+                                         'consent': {'type': 'boolean'},
+                                         'timestamp': {'type': 'string', 'format': 'date-time'}},
+                          'required': ['status'],
+                          'allOf': [{'if': {'properties': {'status': {'const': 'opt_in'}},
+                                            'required': ['status']},
+                                     'then': {'required': ['channel', 'consent', 'timestamp'],
+                                              'properties': {'consent': {'const': True}}}}]},
+                'timestamp': {'type': 'string',
+                              'format': 'date-time',
+                              'description': 'ISO-8601 timestamp when the record was created '
+                                             '(local or UTC).'}},
+ 'required': ['session_id',
+              'user_text',
+              'judgment_landing',
+              'detected',
+              'voices',
+              'clarity_gain',
+              'proof_signals',
+              'timestamp'],
+ 'examples': [{'session_id': 'DLM-2025-10-18-084522',
+               'user_text': 'My co-founder is distant. Tension is rising and I’m avoiding the hard '
+                            'talk.',
+               'judgment_landing': {'type': 'position',
+                                    'statement': 'I will name the tension directly and schedule '
+                                                 'the conversation.',
+                                    'confidence': 0.7,
+                                    'acknowledged': True},
+               'detected': {'mode': 'Critical',
+                            'principle': 'Assumption',
+                            'drivers': ['Stakeholder (generic)'],
+                            'empathy': True,
+                            'confidence': 0.64,
+                            'alt': {'mode': 'Risk & Second-Order',
+                                    'principle': 'Test Assumptions',
+                                    'confidence': 0.41},
+                            'judgment_terminal_state': {'type': 'position',
+                                                        'statement': 'I will name the tension '
+                                                                     'directly and schedule the '
+                                                                     'conversation.',
+                                                        'confidence': 0.7,
+                                                        'owner': 'user',
+                                                        'acknowledged': True,
+                                                        'timestamp': '2025-10-18T08:45:22Z'}},
+               'voices': ['Peterson', 'Feynman'],
+               'clarity_gain': {'CG_pre': 0.42, 'CG_post': 0.81, 'CG_delta': 0.39},
+               'proof_signals': ['Δ-Insight', 'Pattern Reversal'],
+               'share': {'status': 'opt_in',
+                         'channel': 'markdown',
+                         'consent': True,
+                         'timestamp': '2025-10-18T14:55:00Z'},
+               'timestamp': '2025-10-18T08:45:22+11:00'},
+              {'session_id': 'DLM-2025-10-18-084523',
+               'user_text': 'We have two customers; strategy seems solid but pressure is high.',
+               'judgment_landing': {'type': 'defer',
+                                    'statement': 'I will not decide yet; I need one more piece of '
+                                                 'evidence first.',
+                                    'confidence': 0.6,
+                                    'acknowledged': True},
+               'detected': {'mode': 'Decision',
+                            'principle': 'Evidence',
+                            'drivers': [],
+                            'empathy': False,
+                            'confidence': 0.58,
+                            'alt': {'mode': None, 'principle': None, 'confidence': None},
+                            'judgment_terminal_state': {'type': 'defer',
+                                                        'statement': 'I will not decide yet; I '
+                                                                     'need one more piece of '
+                                                                     'evidence first.',
+                                                        'confidence': 0.6,
+                                                        'owner': 'user',
+                                                        'acknowledged': True,
+                                                        'timestamp': '2025-10-18T15:02:10Z'}},
+               'voices': ['Thiel'],
+               'clarity_gain': {'CG_pre': 0.55, 'CG_post': 0.74, 'CG_delta': 0.19},
+               'proof_signals': ['Depth Bump'],
+               'share': {'status': 'skipped'},
+               'timestamp': '2025-10-18T09:02:10+11:00'}]}
+
+_S0 = _SCHEMA
+_S1 = _S0['properties']['session_id']
+_S2 = _S0['properties']['user_text']
+_S3 = _S0['properties']['judgment_landing']
+_S4 = _S3['properties']['type']
+_S5 = _S3['properties']['statement']
+_S6 = _S3['properties']['confidence']
+_S7 = _S3['properties']['acknowledged']
+_S8 = _S0['properties']['detected']
+_S9 = _S8['properties']['mode']
+_S10 = _S8['properties']['principle']
+_S11 = _S8['properties']['drivers']
+_S12 = _S11['items']
+_S13 = _S8['properties']['empathy']
+_S14 = _S8['properties']['confidence']
+_S15 = _S8['properties']['alt']
+_S16 = _S15['properties']['mode']
+_S17 = _S15['properties']['principle']
+_S18 = _S15['properties']['confidence']
+_S19 = _S8['properties']['judgment_terminal_state']
+_S20 = _S19['properties']['type']
+_S21 = _S19['properties']['statement']
+_S22 = _S19['properties']['confidence']
+_S23 = _S19['properties']['owner']
+_S24 = _S19['properties']['acknowledged']
+_S25 = _S19['properties']['timestamp']
+_S26 = _S0['properties']['voices']
+_S27 = _S26['items']
+_S28 = _S0['properties']['clarity_gain']
+_S29 = _S28['properties']['CG_pre']
+_S30 = _S28['properties']['CG_post']
+_S31 = _S28['properties']['CG_delta']
+_S32 = _S0['properties']['proof_signals']
+_S33 = _S32['items']
+_S34 = _S0['properties']['share']
+_S35 = _S34['properties']['status']
+_S36 = _S34['properties']['channel']
+_S37 = _S34['properties']['consent']
+_S38 = _S34['properties']['timestamp']
+_S39 = _S34['allOf'][0]
+_S40 = _S39['if']
+_S41 = _S40['properties']['status']
+_S42 = _S39['then']
+_S43 = _S42['properties']['consent']
+_S44 = _S0['properties']['timestamp']
+_K0 = frozenset(('constraint', 'defer', 'next_step', 'position'))
+_K1 = frozenset(('acknowledged', 'confidence', 'statement', 'type'))
+_K2 = frozenset(('confidence', 'mode', 'principle'))
+_K3 = frozenset(('user',))
+_K4 = frozenset(('acknowledged', 'confidence', 'owner', 'statement', 'timestamp', 'type'))
+_K5 = frozenset(('alt', 'confidence', 'drivers', 'empathy', 'judgment_terminal_state', 'mode', 'principle'))
+_K6 = frozenset(('CG_delta', 'CG_post', 'CG_pre'))
+_K7 = frozenset(('opt_in', 'skipped'))
+_K8 = frozenset(('image', 'markdown'))
+_K9 = 'opt_in'
+_K10 = frozenset(('channel', 'consent', 'status', 'timestamp'))
+_K11 = frozenset(('clarity_gain', 'detected', 'judgment_landing', 'proof_signals', 'session_id', 'share', 'timestamp', 'user_text', 'voices'))
+
+
+def _ok0(x):
+    if not isinstance(x, dict):
+        return False
+    if not _K11.issuperset(x):
+        return False
+    v = x.get('session_id', _MISS)
+    if v is not _MISS and not (isinstance(v, str)):
+        return False
+    v = x.get('user_text', _MISS)
+    if v is not _MISS and not (isinstance(v, str)):
+        return False
+    v = x.get('judgment_landing', _MISS)
+    if v is not _MISS and not (_ok3(v)):
+        return False
+    v = x.get('detected', _MISS)
+    if v is not _MISS and not (_ok8(v)):
+        return False
+    v = x.get('voices', _MISS)
+    if v is not _MISS and not (_ok26(v)):
+        return False
+    v = x.get('clarity_gain', _MISS)
+    if v is not _MISS and not (_ok28(v)):
+        return False
+    v = x.get('proof_signals', _MISS)
+    if v is not _MISS and not (_ok32(v)):
+        return False
+    v = x.get('share', _MISS)
+    if v is not _MISS and not (_ok34(v)):
+        return False
+    v = x.get('timestamp', _MISS)
+    if v is not _MISS and not (isinstance(v, str)):
+        return False
+    if ('session_id' not in x or 'user_text' not in x or 'judgment_landing' not in x or 'detected' not in x or 'voices' not in x or 'clarity_gain' not in x or 'proof_signals' not in x or 'timestamp' not in x):
+        return False
+    return True
+
+
+def _err0(x, path, spath):
+    S = _S0
+    if not isinstance(x, dict):
+        yield FastError(f'{x!r} is not of type ' "'object'", path, spath + ('type',), 'type', S['type'], x, S)
+    if isinstance(x, dict):
+        extras = {k for k in x if k not in _K11}
+        if extras:
+            yield FastError('Additional properties are not allowed (%s %s unexpected)' % _extras_msg(extras), path, spath + ('additionalProperties',), 'additionalProperties', S['additionalProperties'], x, S)
+    if isinstance(x, dict):
+        v = x.get('session_id', _MISS)
+        if v is not _MISS and not (isinstance(v, str)):
+            yield from _err1(v, path + ('session_id',), spath + ('properties', 'session_id'))
+        v = x.get('user_text', _MISS)
+        if v is not _MISS and not (isinstance(v, str)):
+            yield from _err2(v, path + ('user_text',), spath + ('properties', 'user_text'))
+        v = x.get('judgment_landing', _MISS)
+        if v is not _MISS and not (_ok3(v)):
+            yield from _err3(v, path + ('judgment_landing',), spath + ('properties', 'judgment_landing'))
+        v = x.get('detected', _MISS)
+        if v is not _MISS and not (_ok8(v)):
+            yield from _err8(v, path + ('detected',), spath + ('properties', 'detected'))
+        v = x.get('voices', _MISS)
+        if v is not _MISS and not (_ok26(v)):
+            yield from _err26(v, path + ('voices',), spath + ('properties', 'voices'))
+        v = x.get('clarity_gain', _MISS)
+        if v is not _MISS and not (_ok28(v)):
+            yield from _err28(v, path + ('clarity_gain',), spath + ('properties', 'clarity_gain'))
+        v = x.get('proof_signals', _MISS)
+        if v is not _MISS and not (_ok32(v)):
+            yield from _err32(v, path + ('proof_signals',), spath + ('properties', 'proof_signals'))
+        v = x.get('share', _MISS)
+        if v is not _MISS and not (_ok34(v)):
+            yield from _err34(v, path + ('share',), spath + ('properties', 'share'))
+        v = x.get('timestamp', _MISS)
+        if v is not _MISS and not (isinstance(v, str)):
+            yield from _err44(v, path + ('timestamp',), spath + ('properties', 'timestamp'))
+    if isinstance(x, dict):
+        if 'session_id' not in x:
+            yield FastError("'session_id' is a required property", path, spath + ('required',), 'required', S['required'], x, S)
+        if 'user_text' not in x:
+            yield FastError("'user_text' is a required property", path, spath + ('required',), 'required', S['required'], x, S)
+        if 'judgment_landing' not in x:
+            yield FastError("'judgment_landing' is a required property", path, spath + ('required',), 'required', S['required'], x, S)
+        if 'detected' not in x:
+            yield FastError("'detected' is a required property", path, spath + ('required',), 'required', S['required'], x, S)
+        if 'voices' not in x:
+            yield FastError("'voices' is a required property", path, spath + ('required',), 'required', S['required'], x, S)
+        if 'clarity_gain' not in x:
+            yield FastError("'clarity_gain' is a required property", path, spath + ('required',), 'required', S['required'], x, S)
+        if 'proof_signals' not in x:
+            yield FastError("'proof_signals' is a required property", path, spath + ('required',), 'required', S['required'], x, S)
+        if 'timestamp' not in x:
+            yield FastError("'timestamp' is a required property", path, spath + ('required',), 'required', S['required'], x, S)
+
+
+def _ok1(x):
+    if not isinstance(x, str):
+        return False
+    return True
+
+
+def _err1(x, path, spath):
+    S = _S1
+    if not isinstance(x, str):
+        yield FastError(f'{x!r} is not of type ' "'string'", path, spath + ('type',), 'type', S['type'], x, S)
+
+
+def _ok2(x):
+    if not isinstance(x, str):
+        return False
+    return True
+
+
+def _err2(x, path, spath):
+    S = _S2
+    if not isinstance(x, str):
+        yield FastError(f'{x!r} is not of type ' "'string'", path, spath + ('type',), 'type', S['type'], x, S)
+
+
+def _ok3(x):
+    if not isinstance(x, dict):
+        return False
+    if not _K1.issuperset(x):
+        return False
+    if ('type' not in x or 'statement' not in x or 'confidence' not in x or 'acknowledged' not in x):
+        return False
+    v = x.get('type', _MISS)
+    if v is not _MISS and not (isinstance(v, str) and (v in _K0)):
+        return False
+    v = x.get('statement', _MISS)
+    if v is not _MISS and not (isinstance(v, str) and not (len(v) < 1)):
+        return False
+    v = x.get('confidence', _MISS)
+    if v is not _MISS and not ((type(v) is float or type(v) is int or _is_number(v)) and not (v < 0.0) and not (v > 1.0)):
+        return False
+    v = x.get('acknowledged', _MISS)
+    if v is not _MISS and not (isinstance(v, bool)):
+        return False
+    return True
+
+
+def _err3(x, path, spath):
+    S = _S3
+    if not isinstance(x, dict):
+        yield FastError(f'{x!r} is not of type ' "'object'", path, spath + ('type',), 'type', S['type'], x, S)
+    if isinstance(x, dict):
+        extras = {k for k in x if k not in _K1}
+        if extras:
+            yield FastError('Additional properties are not allowed (%s %s unexpected)' % _extras_msg(extras), path, spath + ('additionalProperties',), 'additionalProperties', S['additionalProperties'], x, S)
+    if isinstance(x, dict):
+        if 'type' not in x:
+            yield FastError("'type' is a required property", path, spath + ('required',), 'required', S['required'], x, S)
+        if 'statement' not in x:
+            yield FastError("'statement' is a required property", path, spath + ('required',), 'required', S['required'], x, S)
+        if 'confidence' not in x:
+            yield FastError("'confidence' is a required property", path, spath + ('required',), 'required', S['required'], x, S)
+        if 'acknowledged' not in x:
+            yield FastError("'acknowledged' is a required property", path, spath + ('required',), 'required', S['required'], x, S)
+    if isinstance(x, dict):
+        v = x.get('type', _MISS)
+        if v is not _MISS and not (isinstance(v, str) and (v in _K0)):
+            yield from _err4(v, path + ('type',), spath + ('properties', 'type'))
+        v = x.get('statement', _MISS)
+        if v is not _MISS and not (isinstance(v, str) and not (len(v) < 1)):
+            yield from _err5(v, path + ('statement',), spath + ('properties', 'statement'))
+        v = x.get('confidence', _MISS)
+        if v is not _MISS and not ((type(v) is float or type(v) is int or _is_number(v)) and not (v < 0.0) and not (v > 1.0)):
+            yield from _err6(v, path + ('confidence',), spath + ('properties', 'confidence'))
+        v = x.get('acknowledged', _MISS)
+        if v is not _MISS and not (isinstance(v, bool)):
+            yield from _err7(v, path + ('acknowledged',), spath + ('properties', 'acknowledged'))
+
+
+def _ok4(x):
+    if not isinstance(x, str):
+        return False
+    if not (x in _K0):
+        return False
+    return True
+
+
+def _err4(x, path, spath):
+    S = _S4
+    if not isinstance(x, str):
+        yield FastError(f'{x!r} is not of type ' "'string'", path, spath + ('type',), 'type', S['type'], x, S)
+    if not (isinstance(x, str) and x in _K0):
+        yield FastError(f'{x!r} is not one of ' "['position', 'constraint', 'next_step', 'defer']", path, spath + ('enum',), 'enum', S['enum'], x, S)
+
+
+def _ok5(x):
+    if not isinstance(x, str):
+        return False
+    if len(x) < 1:
+        return False
+    return True
+
+
+def _err5(x, path, spath):
+    S = _S5
+    if not isinstance(x, str):
+        yield FastError(f'{x!r} is not of type ' "'string'", path, spath + ('type',), 'type', S['type'], x, S)
+    if isinstance(x, str) and len(x) < 1:
+        yield FastError(f'{x!r} should be non-empty', path, spath + ('minLength',), 'minLength', S['minLength'], x, S)
+
+
+def _ok6(x):
+    if not (type(x) is float or type(x) is int or _is_number(x)):
+        return False
+    if x < 0.0:
+        return False
+    if x > 1.0:
+        return False
+    return True
+
+
+def _err6(x, path, spath):
+    S = _S6
+    if not (type(x) is float or type(x) is int or _is_number(x)):
+        yield FastError(f'{x!r} is not of type ' "'number'", path, spath + ('type',), 'type', S['type'], x, S)
+    if (type(x) is float or type(x) is int or _is_number(x)) and x < 0.0:
+        yield FastError(f'{x!r} is less than the minimum of 0.0', path, spath + ('minimum',), 'minimum', S['minimum'], x, S)
+    if (type(x) is float or type(x) is int or _is_number(x)) and x > 1.0:
+        yield FastError(f'{x!r} is greater than the maximum of 1.0', path, spath + ('maximum',), 'maximum', S['maximum'], x, S)
+
+
+def _ok7(x):
+    if not isinstance(x, bool):
+        return False
+    return True
+
+
+def _err7(x, path, spath):
+    S = _S7
+    if not isinstance(x, bool):
+        yield FastError(f'{x!r} is not of type ' "'boolean'", path, spath + ('type',), 'type', S['type'], x, S)
+
+
+def _ok8(x):
+    if not isinstance(x, dict):
+        return False
+    if not _K5.issuperset(x):
+        return False
+    v = x.get('mode', _MISS)
+    if v is not _MISS and not (isinstance(v, str)):
+        return False
+    v = x.get('principle', _MISS)
+    if v is not _MISS and not (isinstance(v, str)):
+        return False
+    v = x.get('drivers', _MISS)
+    if v is not _MISS and not (_ok11(v)):
+        return False
+    v = x.get('empathy', _MISS)
+    if v is not _MISS and not (isinstance(v, bool)):
+        return False
+    v = x.get('confidence', _MISS)
+    if v is not _MISS and not ((type(v) is float or type(v) is int or _is_number(v)) and not (v < 0.0) and not (v > 1.0)):
+        return False
+    v = x.get('alt', _MISS)
+    if v is not _MISS and not (_ok15(v)):
+        return False
+    v = x.get('judgment_terminal_state', _MISS)
+    if v is not _MISS and not (_ok19(v)):
+        return False
+    if ('mode' not in x or 'principle' not in x or 'drivers' not in x or 'empathy' not in x or 'confidence' not in x or 'alt' not in x or 'judgment_terminal_state' not in x):
+        return False
+    return True
+
+
+def _err8(x, path, spath):
+    S = _S8
+    if not isinstance(x, dict):
+        yield FastError(f'{x!r} is not of type ' "'object'", path, spath + ('type',), 'type', S['type'], x, S)
+    if isinstance(x, dict):
+        extras = {k for k in x if k not in _K5}
+        if extras:
+            yield FastError('Additional properties are not allowed (%s %s unexpected)' % _extras_msg(extras), path, spath + ('additionalProperties',), 'additionalProperties', S['additionalProperties'], x, S)
+    if isinstance(x, dict):
+        v = x.get('mode', _MISS)
+        if v is not _MISS and not (isinstance(v, str)):
+            yield from _err9(v, path + ('mode',), spath + ('properties', 'mode'))
+        v = x.get('principle', _MISS)
+        if v is not _MISS and not (isinstance(v, str)):
+            yield from _err10(v, path + ('principle',), spath + ('properties', 'principle'))
+        v = x.get('drivers', _MISS)
+        if v is not _MISS and not (_ok11(v)):
+            yield from _err11(v, path + ('drivers',), spath + ('properties', 'drivers'))
+        v = x.get('empathy', _MISS)
+        if v is not _MISS and not (isinstance(v, bool)):
+            yield from _err13(v, path + ('empathy',), spath + ('properties', 'empathy'))
+        v = x.get('confidence', _MISS)
+        if v is not _MISS and not ((type(v) is float or type(v) is int or _is_number(v)) and not (v < 0.0) and not (v > 1.0)):
+            yield from _err14(v, path + ('confidence',), spath + ('properties', 'confidence'))
+        v = x.get('alt', _MISS)
+        if v is not _MISS and not (_ok15(v)):
+            yield from _err15(v, path + ('alt',), spath + ('properties', 'alt'))
+        v = x.get('judgment_terminal_state', _MISS)
+        if v is not _MISS and not (_ok19(v)):
+            yield from _err19(v, path + ('judgment_terminal_state',), spath + ('properties', 'judgment_terminal_state'))
+    if isinstance(x, dict):
+        if 'mode' not in x:
+            yield FastError("'mode' is a required property", path, spath + ('required',), 'required', S['required'], x, S)
+        if 'principle' not in x:
+            yield FastError("'principle' is a required property", path, spath + ('required',), 'required', S['required'], x, S)
+        if 'drivers' not in x:
+            yield FastError("'drivers' is a required property", path, spath + ('required',), 'required', S['required'], x, S)
+        if 'empathy' not in x:
+            yield FastError("'empathy' is a required property", path, spath + ('required',), 'required', S['required'], x, S)
+        if 'confidence' not in x:
+            yield FastError("'confidence' is a required property", path, spath + ('required',), 'required', S['required'], x, S)
+        if 'alt' not in x:
+            yield FastError("'alt' is a required property", path, spath + ('required',), 'required', S['required'], x, S)
+        if 'judgment_terminal_state' not in x:
+            yield FastError("'judgment_terminal_state' is a required property", path, spath + ('required',), 'required', S['required'], x, S)
+
+
+def _ok9(x):
+    if not isinstance(x, str):
+        return False
+    return True
+
+
+def _err9(x, path, spath):
+    S = _S9
+    if not isinstance(x, str):
+        yield FastError(f'{x!r} is not of type ' "'string'", path, spath + ('type',), 'type', S['type'], x, S)
+
+
+def _ok10(x):
+    if not isinstance(x, str):
+        return False
+    return True
+
+
+def _err10(x, path, spath):
+    S = _S10
+    if not isinstance(x, str):
+        yield FastError(f'{x!r} is not of type ' "'string'", path, spath + ('type',), 'type', S['type'], x, S)
+
+
+def _ok11(x):
+    if not isinstance(x, list):
+        return False
+    for v in x:
+        if not (isinstance(v, str)):
+            return False
+    return True
+
+
+def _err11(x, path, spath):
+    S = _S11
+    if not isinstance(x, list):
+        yield FastError(f'{x!r} is not of type ' "'array'", path, spath + ('type',), 'type', S['type'], x, S)
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            if not (isinstance(v, str)):
+                yield from _err12(v, path + (i,), spath + ('items',))
+
+
+def _ok12(x):
+    if not isinstance(x, str):
+        return False
+    return True
+
+
+def _err12(x, path, spath):
+    S = _S12
+    if not isinstance(x, str):
+        yield FastError(f'{x!r} is not of type ' "'string'", path, spath + ('type',), 'type', S['type'], x, S)
+
+
+def _ok13(x):
+    if not isinstance(x, bool):
+        return False
+    return True
+
+
+def _err13(x, path, spath):
+    S = _S13
+    if not isinstance(x, bool):
+        yield FastError(f'{x!r} is not of type ' "'boolean'", path, spath + ('type',), 'type', S['type'], x, S)
+
+
+def _ok14(x):
+    if not (type(x) is float or type(x) is int or _is_number(x)):
+        return False
+    if x < 0.0:
+        return False
+    if x > 1.0:
+        return False
+    return True
+
+
+def _err14(x, path, spath):
+    S = _S14
+    if not (type(x) is float or type(x) is int or _is_number(x)):
+        yield FastError(f'{x!r} is not of type ' "'number'", path, spath + ('type',), 'type', S['type'], x, S)
+    if (type(x) is float or type(x) is int or _is_number(x)) and x < 0.0:
+        yield FastError(f'{x!r} is less than the minimum of 0.0', path, spath + ('minimum',), 'minimum', S['minimum'], x, S)
+    if (type(x) is float or type(x) is int or _is_number(x)) and x > 1.0:
+        yield FastError(f'{x!r} is greater than the maximum of 1.0', path, spath + ('maximum',), 'maximum', S['maximum'], x, S)
+
+
+def _ok15(x):
+    if not isinstance(x, dict):
+        return False
+    if not _K2.issuperset(x):
+        return False
+    v = x.get('mode', _MISS)
+    if v is not _MISS and not ((isinstance(v, str) or v is None)):
+        return False
+    v = x.get('principle', _MISS)
+    if v is not _MISS and not ((isinstance(v, str) or v is None)):
+        return False
+    v = x.get('confidence', _MISS)
+    if v is not _MISS and not (((type(v) is float or type(v) is int or _is_number(v)) or v is None) and not ((type(v) is float or type(v) is int or _is_number(v)) and v < 0.0) and not ((type(v) is float or type(v) is int or _is_number(v)) and v > 1.0)):
+        return False
+    if ('mode' not in x or 'principle' not in x or 'confidence' not in x):
+        return False
+    return True
+
+
+def _err15(x, path, spath):
+    S = _S15
+    if not isinstance(x, dict):
+        yield FastError(f'{x!r} is not of type ' "'object'", path, spath + ('type',), 'type', S['type'], x, S)
+    if isinstance(x, dict):
+        extras = {k for k in x if k not in _K2}
+        if extras:
+            yield FastError('Additional properties are not allowed (%s %s unexpected)' % _extras_msg(extras), path, spath + ('additionalProperties',), 'additionalProperties', S['additionalProperties'], x, S)
+    if isinstance(x, dict):
+        v = x.get('mode', _MISS)
+        if v is not _MISS and not ((isinstance(v, str) or v is None)):
+            yield from _err16(v, path + ('mode',), spath + ('properties', 'mode'))
+        v = x.get('principle', _MISS)
+        if v is not _MISS and not ((isinstance(v, str) or v is None)):
+            yield from _err17(v, path + ('principle',), spath + ('properties', 'principle'))
+        v = x.get('confidence', _MISS)
+        if v is not _MISS and not (((type(v) is float or type(v) is int or _is_number(v)) or v is None) and not ((type(v) is float or type(v) is int or _is_number(v)) and v < 0.0) and not ((type(v) is float or type(v) is int or _is_number(v)) and v > 1.0)):
+            yield from _err18(v, path + ('confidence',), spath + ('properties', 'confidence'))
+    if isinstance(x, dict):
+        if 'mode' not in x:
+            yield FastError("'mode' is a required property", path, spath + ('required',), 'required', S['required'], x, S)
+        if 'principle' not in x:
+            yield FastError("'principle' is a required property", path, spath + ('required',), 'required', S['required'], x, S)
+        if 'confidence' not in x:
+            yield FastError("'confidence' is a required property", path, spath + ('required',), 'required', S['required'], x, S)
+
+
+def _ok16(x):
+    if not (isinstance(x, str) or x is None):
+        return False
+    return True
+
+
+def _err16(x, path, spath):
+    S = _S16
+    if not (isinstance(x, str) or x is None):
+        yield FastError(f'{x!r} is not of type ' "'string', 'null'", path, spath + ('type',), 'type', S['type'], x, S)
+
+
+def _ok17(x):
+    if not (isinstance(x, str) or x is None):
+        return False
+    return True
+
+
+def _err17(x, path, spath):
+    S = _S17
+    if not (isinstance(x, str) or x is None):
+        yield FastError(f'{x!r} is not of type ' "'string', 'null'", path, spath + ('type',), 'type', S['type'], x, S)
+
+
+def _ok18(x):
+    if not ((type(x) is float or type(x) is int or _is_number(x)) or x is None):
+        return False
+    if (type(x) is float or type(x) is int or _is_number(x)) and x < 0.0:
+        return False
+    if (type(x) is float or type(x) is int or _is_number(x)) and x > 1.0:
+        return False
+    return True
+
+
+def _err18(x, path, spath):
+    S = _S18
+    if not ((type(x) is float or type(x) is int or _is_number(x)) or x is None):
+        yield FastError(f'{x!r} is not of type ' "'number', 'null'", path, spath + ('type',), 'type', S['type'], x, S)
+    if (type(x) is float or type(x) is int or _is_number(x)) and x < 0.0:
+        yield FastError(f'{x!r} is less than the minimum of 0.0', path, spath + ('minimum',), 'minimum', S['minimum'], x, S)
+    if (type(x) is float or type(x) is int or _is_number(x)) and x > 1.0:
+        yield FastError(f'{x!r} is greater than the maximum of 1.0', path, spath + ('maximum',), 'maximum', S['maximum'], x, S)
+
+
+def _ok19(x):
+    if not isinstance(x, dict):
+        return False
+    if not _K4.issuperset(x):
+        return False
+    if ('type' not in x or 'statement' not in x or 'confidence' not in x or 'owner' not in x or 'acknowledged' not in x or 'timestamp' not in x):
+        return False
+    v = x.get('type', _MISS)
+    if v is not _MISS and not (isinstance(v, str) and (v in _K0)):
+        return False
+    v = x.get('statement', _MISS)
+    if v is not _MISS and not (isinstance(v, str) and not (len(v) < 1)):
+        return False
+    v = x.get('confidence', _MISS)
+    if v is not _MISS and not ((type(v) is float or type(v) is int or _is_number(v)) and not (v < 0.0) and not (v > 1.0)):
+        return False
+    v = x.get('owner', _MISS)
+    if v is not _MISS and not (isinstance(v, str) and (v in _K3)):
+        return False
+    v = x.get('acknowledged', _MISS)
+    if v is not _MISS and not (isinstance(v, bool)):
+        return False
+    v = x.get('timestamp', _MISS)
+    if v is not _MISS and not (isinstance(v, str)):
+        return False
+    return True
+
+
+def _err19(x, path, spath):
+    S = _S19
+    if not isinstance(x, dict):
+        yield FastError(f'{x!r} is not of type ' "'object'", path, spath + ('type',), 'type', S['type'], x, S)
+    if isinstance(x, dict):
+        extras = {k for k in x if k not in _K4}
+        if extras:
+            yield FastError('Additional properties are not allowed (%s %s unexpected)' % _extras_msg(extras), path, spath + ('additionalProperties',), 'additionalProperties', S['additionalProperties'], x, S)
+    if isinstance(x, dict):
+        if 'type' not in x:
+            yield FastError("'type' is a required property", path, spath + ('required',), 'required', S['required'], x, S)
+        if 'statement' not in x:
+            yield FastError("'statement' is a required property", path, spath + ('required',), 'required', S['required'], x, S)
+        if 'confidence' not in x:
+            yield FastError("'confidence' is a required property", path, spath + ('required',), 'required', S['required'], x, S)
+        if 'owner' not in x:
+            yield FastError("'owner' is a required property", path, spath + ('required',), 'required', S['required'], x, S)
+        if 'acknowledged' not in x:
+            yield FastError("'acknowledged' is a required property", path, spath + ('required',), 'required', S['required'], x, S)
+        if 'timestamp' not in x:
+            yield FastError("'timestamp' is a required property", path, spath + ('required',), 'required', S['required'], x, S)
+    if isinstance(x, dict):
+        v = x.get('type', _MISS)
+        if v is not _MISS and not (isinstance(v, str) and (v in _K0)):
+            yield from _err20(v, path + ('type',), spath + ('properties', 'type'))
+        v = x.get('statement', _MISS)
+        if v is not _MISS and not (isinstance(v, str) and not (len(v) < 1)):
+            yield from _err21(v, path + ('statement',), spath + ('properties', 'statement'))
+        v = x.get('confidence', _MISS)
+        if v is not _MISS and not ((type(v) is float or type(v) is int or _is_number(v)) and not (v < 0.0) and not (v > 1.0)):
+            yield from _err22(v, path + ('confidence',), spath + ('properties', 'confidence'))
+        v = x.get('owner', _MISS)
+        if v is not _MISS and not (isinstance(v, str) and (v in _K3)):
+            yield from _err23(v, path + ('owner',), spath + ('properties', 'owner'))
+        v = x.get('acknowledged', _MISS)
+        if v is not _MISS and not (isinstance(v, bool)):
+            yield from _err24(v, path + ('acknowledged',), spath + ('properties', 'acknowledged'))
+        v = x.get('timestamp', _MISS)
+        if v is not _MISS and not (isinstance(v, str)):
+            yield from _err25(v, path + ('timestamp',), spath + ('properties', 'timestamp'))
+
+
+def _ok20(x):
+    if not isinstance(x, str):
+        return False
+    if not (x in _K0):
+        return False
+    return True
+
+
+def _err20(x, path, spath):
+    S = _S20
+    if not isinstance(x, str):
+        yield FastError(f'{x!r} is not of type ' "'string'", path, spath + ('type',), 'type', S['type'], x, S)
+    if not (isinstance(x, str) and x in _K0):
+        yield FastError(f'{x!r} is not one of ' "['position', 'constraint', 'next_step', 'defer']", path, spath + ('enum',), 'enum', S['enum'], x, S)
+
+
+def _ok21(x):
+    if not isinstance(x, str):
+        return False
+    if len(x) < 1:
+        return False
+    return True
+
+
+def _err21(x, path, spath):
+    S = _S21
+    if not isinstance(x, str):
+        yield FastError(f'{x!r} is not of type ' "'string'", path, spath + ('type',), 'type', S['type'], x, S)
+    if isinstance(x, str) and len(x) < 1:
+        yield FastError(f'{x!r} should be non-empty', path, spath + ('minLength',), 'minLength', S['minLength'], x, S)
+
+
+def _ok22(x):
+    if not (type(x) is float or type(x) is int or _is_number(x)):
+        return False
+    if x < 0.0:
+        return False
+    if x > 1.0:
+        return False
+    return True
+
+
+def _err22(x, path, spath):
+    S = _S22
+    if not (type(x) is float or type(x) is int or _is_number(x)):
+        yield FastError(f'{x!r} is not of type ' "'number'", path, spath + ('type',), 'type', S['type'], x, S)
+    if (type(x) is float or type(x) is int or _is_number(x)) and x < 0.0:
+        yield FastError(f'{x!r} is less than the minimum of 0.0', path, spath + ('minimum',), 'minimum', S['minimum'], x, S)
+    if (type(x) is float or type(x) is int or _is_number(x)) and x > 1.0:
+        yield FastError(f'{x!r} is greater than the maximum of 1.0', path, spath + ('maximum',), 'maximum', S['maximum'], x, S)
+
+
+def _ok23(x):
+    if not isinstance(x, str):
+        return False
+    if not (x in _K3):
+        return False
+    return True
+
+
+def _err23(x, path, spath):
+    S = _S23
+    if not isinstance(x, str):
+        yield FastError(f'{x!r} is not of type ' "'string'", path, spath + ('type',), 'type', S['type'], x, S)
+    if not (isinstance(x, str) and x in _K3):
+        yield FastError(f'{x!r} is not one of ' "['user']", path, spath + ('enum',), 'enum', S['enum'], x, S)
+
+
+def _ok24(x):
+    if not isinstance(x, bool):
+        return False
+    return True
+
+
+def _err24(x, path, spath):
+    S = _S24
+    if not isinstance(x, bool):
+        yield FastError(f'{x!r} is not of type ' "'boolean'", path, spath + ('type',), 'type', S['type'], x, S)
+
+
+def _ok25(x):
+    if not isinstance(x, str):
+        return False
+    return True
+
+
+def _err25(x, path, spath):
+    S = _S25
+    if not isinstance(x, str):
+        yield FastError(f'{x!r} is not of type ' "'string'", path, spath + ('type',), 'type', S['type'], x, S)
+
+
+def _ok26(x):
+    if not isinstance(x, list):
+        return False
+    for v in x:
+        if not (isinstance(v, str)):
+            return False
+    if len(x) < 1:
+        return False
+    return True
+
+
+def _err26(x, path, spath):
+    S = _S26
+    if not isinstance(x, list):
+        yield FastError(f'{x!r} is not of type ' "'array'", path, spath + ('type',), 'type', S['type'], x, S)
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            if not (isinstance(v, str)):
+                yield from _err27(v, path + (i,), spath + ('items',))
+    if isinstance(x, list) and len(x) < 1:
+        yield FastError(f'{x!r} should be non-empty', path, spath + ('minItems',), 'minItems', S['minItems'], x, S)
+
+
+def _ok27(x):
+    if not isinstance(x, str):
+        return False
+    return True
+
+
+def _err27(x, path, spath):
+    S = _S27
+    if not isinstance(x, str):
+        yield FastError(f'{x!r} is not of type ' "'string'", path, spath + ('type',), 'type', S['type'], x, S)
+
+
+def _ok28(x):
+    if not isinstance(x, dict):
+        return False
+    if not _K6.issuperset(x):
+        return False
+    v = x.get('CG_pre', _MISS)
+    if v is not _MISS and not ((type(v) is float or type(v) is int or _is_number(v)) and not (v < 0.0) and not (v > 1.0)):
+        return False
+    v = x.get('CG_post', _MISS)
+    if v is not _MISS and not ((type(v) is float or type(v) is int or _is_number(v)) and not (v < 0.0) and not (v > 1.0)):
+        return False
+    v = x.get('CG_delta', _MISS)
+    if v is not _MISS and not ((type(v) is float or type(v) is int or _is_number(v)) and not (v < -1.0) and not (v > 1.0)):
+        return False
+    if ('CG_pre' not in x or 'CG_post' not in x or 'CG_delta' not in x):
+        return False
+    return True
+
+
+def _err28(x, path, spath):
+    S = _S28
+    if not isinstance(x, dict):
+        yield FastError(f'{x!r} is not of type ' "'object'", path, spath + ('type',), 'type', S['type'], x, S)
+    if isinstance(x, dict):
+        extras = {k for k in x if k not in _K6}
+        if extras:
+            yield FastError('Additional properties are not allowed (%s %s unexpected)' % _extras_msg(extras), path, spath + ('additionalProperties',), 'additionalProperties', S['additionalProperties'], x, S)
+    if isinstance(x, dict):
+        v = x.get('CG_pre', _MISS)
+        if v is not _MISS and not ((type(v) is float or type(v) is int or _is_number(v)) and not (v < 0.0) and not (v > 1.0)):
+            yield from _err29(v, path + ('CG_pre',), spath + ('properties', 'CG_pre'))
+        v = x.get('CG_post', _MISS)
+        if v is not _MISS and not ((type(v) is float or type(v) is int or _is_number(v)) and not (v < 0.0) and not (v > 1.0)):
+            yield from _err30(v, path + ('CG_post',), spath + ('properties', 'CG_post'))
+        v = x.get('CG_delta', _MISS)
+        if v is not _MISS and not ((type(v) is float or type(v) is int or _is_number(v)) and not (v < -1.0) and not (v > 1.0)):
+            yield from _err31(v, path + ('CG_delta',), spath + ('properties', 'CG_delta'))
+    if isinstance(x, dict):
+        if 'CG_pre' not in x:
+            yield FastError("'CG_pre' is a required property", path, spath + ('required',), 'required', S['required'], x, S)
+        if 'CG_post' not in x:
+            yield FastError("'CG_post' is a required property", path, spath + ('required',), 'required', S['required'], x, S)
+        if 'CG_delta' not in x:
+            yield FastError("'CG_delta' is a required property", path, spath + ('required',), 'required', S['required'], x, S)
+
+
+def _ok29(x):
+    if not (type(x) is float or type(x) is int or _is_number(x)):
+        return False
+    if x < 0.0:
+        return False
+    if x > 1.0:
+        return False
+    return True
+
+
+def _err29(x, path, spath):
+    S = _S29
+    if not (type(x) is float or type(x) is int or _is_number(x)):
+        yield FastError(f'{x!r} is not of type ' "'number'", path, spath + ('type',), 'type', S['type'], x, S)
+    if (type(x) is float or type(x) is int or _is_number(x)) and x < 0.0:
+        yield FastError(f'{x!r} is less than the minimum of 0.0', path, spath + ('minimum',), 'minimum', S['minimum'], x, S)
+    if (type(x) is float or type(x) is int or _is_number(x)) and x > 1.0:
+        yield FastError(f'{x!r} is greater than the maximum of 1.0', path, spath + ('maximum',), 'maximum', S['maximum'], x, S)
+
+
+def _ok30(x):
+    if not (type(x) is float or type(x) is int or _is_number(x)):
+        return False
+    if x < 0.0:
+        return False
+    if x > 1.0:
+        return False
+    return True
+
+
+def _err30(x, path, spath):
+    S = _S30
+    if not (type(x) is float or type(x) is int or _is_number(x)):
+        yield FastError(f'{x!r} is not of type ' "'number'", path, spath + ('type',), 'type', S['type'], x, S)
+    if (type(x) is float or type(x) is int or _is_number(x)) and x < 0.0:
+        yield FastError(f'{x!r} is less than the minimum of 0.0', path, spath + ('minimum',), 'minimum', S['minimum'], x, S)
+    if (type(x) is float or type(x) is int or _is_number(x)) and x > 1.0:
+        yield FastError(f'{x!r} is greater than the maximum of 1.0', path, spath + ('maximum',), 'maximum', S['maximum'], x, S)
+
+
+def _ok31(x):
+    if not (type(x) is float or type(x) is int or _is_number(x)):
+        return False
+    if x < -1.0:
+        return False
+    if x > 1.0:
+        return False
+    return True
+
+
+def _err31(x, path, spath):
+    S = _S31
+    if not (type(x) is float or type(x) is int or _is_number(x)):
+        yield FastError(f'{x!r} is not of type ' "'number'", path, spath + ('type',), 'type', S['type'], x, S)
+    if (type(x) is float or type(x) is int or _is_number(x)) and x < -1.0:
+        yield FastError(f'{x!r} is less than the minimum of -1.0', path, spath + ('minimum',), 'minimum', S['minimum'], x, S)
+    if (type(x) is float or type(x) is int or _is_number(x)) and x > 1.0:
+        yield FastError(f'{x!r} is greater than the maximum of 1.0', path, spath + ('maximum',), 'maximum', S['maximum'], x, S)
+
+
+def _ok32(x):
+    if not isinstance(x, list):
+        return False
+    for v in x:
+        if not (isinstance(v, str)):
+            return False
+    return True
+
+
+def _err32(x, path, spath):
+    S = _S32
+    if not isinstance(x, list):
+        yield FastError(f'{x!r} is not of type ' "'array'", path, spath + ('type',), 'type', S['type'], x, S)
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            if not (isinstance(v, str)):
+                yield from _err33(v, path + (i,), spath + ('items',))
+
+
+def _ok33(x):
+    if not isinstance(x, str):
+        return False
+    return True
+
+
+def _err33(x, path, spath):
+    S = _S33
+    if not isinstance(x, str):
+        yield FastError(f'{x!r} is not of type ' "'string'", path, spath + ('type',), 'type', S['type'], x, S)
+
+
+def _ok34(x):
+    if not isinstance(x, dict):
+        return False
+    if not _K10.issuperset(x):
+        return False
+    v = x.get('status', _MISS)
+    if v is not _MISS and not (isinstance(v, str) and (v in _K7)):
+        return False
+    v = x.get('channel', _MISS)
+    if v is not _MISS and not (isinstance(v, str) and (v in _K8)):
+        return False
+    v = x.get('consent', _MISS)
+    if v is not _MISS and not (isinstance(v, bool)):
+        return False
+    v = x.get('timestamp', _MISS)
+    if v is not _MISS and not (isinstance(v, str)):
+        return False
+    if ('status' not in x):
+        return False
+    if not (_ok39(x)):
+        return False
+    return True
+
+
+def _err34(x, path, spath):
+    S = _S34
+    if not isinstance(x, dict):
+        yield FastError(f'{x!r} is not of type ' "'object'", path, spath + ('type',), 'type', S['type'], x, S)
+    if isinstance(x, dict):
+        extras = {k for k in x if k not in _K10}
+        if extras:
+            yield FastError('Additional properties are not allowed (%s %s unexpected)' % _extras_msg(extras), path, spath + ('additionalProperties',), 'additionalProperties', S['additionalProperties'], x, S)
+    if isinstance(x, dict):
+        v = x.get('status', _MISS)
+        if v is not _MISS and not (isinstance(v, str) and (v in _K7)):
+            yield from _err35(v, path + ('status',), spath + ('properties', 'status'))
+        v = x.get('channel', _MISS)
+        if v is not _MISS and not (isinstance(v, str) and (v in _K8)):
+            yield from _err36(v, path + ('channel',), spath + ('properties', 'channel'))
+        v = x.get('consent', _MISS)
+        if v is not _MISS and not (isinstance(v, bool)):
+            yield from _err37(v, path + ('consent',), spath + ('properties', 'consent'))
+        v = x.get('timestamp', _MISS)
+        if v is not _MISS and not (isinstance(v, str)):
+            yield from _err38(v, path + ('timestamp',), spath + ('properties', 'timestamp'))
+    if isinstance(x, dict):
+        if 'status' not in x:
+            yield FastError("'status' is a required property", path, spath + ('required',), 'required', S['required'], x, S)
+    yield from _err39(x, path, spath + ('allOf', 0))
+
+
+def _ok35(x):
+    if not isinstance(x, str):
+        return False
+    if not (x in _K7):
+        return False
+    return True
+
+
+def _err35(x, path, spath):
+    S = _S35
+    if not isinstance(x, str):
+        yield FastError(f'{x!r} is not of type ' "'string'", path, spath + ('type',), 'type', S['type'], x, S)
+    if not (isinstance(x, str) and x in _K7):
+        yield FastError(f'{x!r} is not one of ' "['opt_in', 'skipped']", path, spath + ('enum',), 'enum', S['enum'], x, S)
+
+
+def _ok36(x):
+    if not isinstance(x, str):
+        return False
+    if not (x in _K8):
+        return False
+    return True
+
+
+def _err36(x, path, spath):
+    S = _S36
+    if not isinstance(x, str):
+        yield FastError(f'{x!r} is not of type ' "'string'", path, spath + ('type',), 'type', S['type'], x, S)
+    if not (isinstance(x, str) and x in _K8):
+        yield FastError(f'{x!r} is not one of ' "['image', 'markdown']", path, spath + ('enum',), 'enum', S['enum'], x, S)
+
+
+def _ok37(x):
+    if not isinstance(x, bool):
+        return False
+    return True
+
+
+def _err37(x, path, spath):
+    S = _S37
+    if not isinstance(x, bool):
+        yield FastError(f'{x!r} is not of type ' "'boolean'", path, spath + ('type',), 'type', S['type'], x, S)
+
+
+def _ok38(x):
+    if not isinstance(x, str):
+        return False
+    return True
+
+
+def _err38(x, path, spath):
+    S = _S38
+    if not isinstance(x, str):
+        yield FastError(f'{x!r} is not of type ' "'string'", path, spath + ('type',), 'type', S['type'], x, S)
+
+
+def _ok39(x):
+    if _ok40(x):
+        if not (_ok42(x)):
+            return False
+    return True
+
+
+def _err39(x, path, spath):
+    S = _S39
+    if _ok40(x):
+        yield from _err42(x, path, spath + ('then',))
+
+
+def _ok40(x):
+    if isinstance(x, dict):
+        v = x.get('status', _MISS)
+        if v is not _MISS and not (_equal(v, _K9)):
+            return False
+    if isinstance(x, dict) and ('status' not in x):
+        return False
+    return True
+
+
+def _err40(x, path, spath):
+    S = _S40
+    if isinstance(x, dict):
+        v = x.get('status', _MISS)
+        if v is not _MISS and not (_equal(v, _K9)):
+            yield from _err41(v, path + ('status',), spath + ('properties', 'status'))
+    if isinstance(x, dict):
+        if 'status' not in x:
+            yield FastError("'status' is a required property", path, spath + ('required',), 'required', S['required'], x, S)
+
+
+def _ok41(x):
+    if not _equal(x, _K9):
+        return False
+    return True
+
+
+def _err41(x, path, spath):
+    S = _S41
+    if not _equal(x, _K9):
+        yield FastError("'opt_in' was expected", path, spath + ('const',), 'const', S['const'], x, S)
+
+
+def _ok42(x):
+    if isinstance(x, dict) and ('channel' not in x or 'consent' not in x or 'timestamp' not in x):
+        return False
+    if isinstance(x, dict):
+        v = x.get('consent', _MISS)
+        if v is not _MISS and not (not (v is not True)):
+            return False
+    return True
+
+
+def _err42(x, path, spath):
+    S = _S42
+    if isinstance(x, dict):
+        if 'channel' not in x:
+            yield FastError("'channel' is a required property", path, spath + ('required',), 'required', S['required'], x, S)
+        if 'consent' not in x:
+            yield FastError("'consent' is a required property", path, spath + ('required',), 'required', S['required'], x, S)
+        if 'timestamp' not in x:
+            yield FastError("'timestamp' is a required property", path, spath + ('required',), 'required', S['required'], x, S)
+    if isinstance(x, dict):
+        v = x.get('consent', _MISS)
+        if v is not _MISS and not (not (v is not True)):
+            yield from _err43(v, path + ('consent',), spath + ('properties', 'consent'))
+
+
+def _ok43(x):
+    if x is not True:
+        return False
+    return True
+
+
+def _err43(x, path, spath):
+    S = _S43
+    if x is not True:
+        yield FastError('True was expected', path, spath + ('const',), 'const', S['const'], x, S)
+
+
+def _ok44(x):
+    if not isinstance(x, str):
+        return False
+    return True
+
+
+def _err44(x, path, spath):
+    S = _S44
+    if not isinstance(x, str):
+        yield FastError(f'{x!r} is not of type ' "'string'", path, spath + ('type',), 'type', S['type'], x, S)
+
+
+def is_valid(x):
+    return _ok0(x)
+
+
+def iter_errors(x):
+    if _ok0(x):
+        return iter(())
+    return _err0(x, (), ())
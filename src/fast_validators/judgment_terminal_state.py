@@ -0,0 +1,265 @@
+# GENERATED by src/schema_codegen.py from schemas/judgment_terminal_state.schema.json — do not edit.
+# Regenerate with: python src/schema_codegen.py build
+# flake8: noqa
+from collections import deque
+from collections.abc import Mapping, Sequence
+from numbers import Number
+
+
+class FastError:
+    """A validation error with the fields of jsonschema.ValidationError that callers read."""
+
+    __slots__ = ("message", "path", "schema_path", "validator", "validator_value", "instance", "schema")
+
+    def __init__(self, message, path, schema_path, validator, validator_value, instance, schema):
+        self.message = message
+        self.path = deque(path)
+        self.schema_path = deque(schema_path)
+        self.validator = validator
+        self.validator_value = validator_value
+        self.instance = instance
+        self.schema = schema
+
+    def __repr__(self):
+        return f"<FastError {self.message!r} at {list(self.path)}>"
+
+    __str__ = lambda self: self.message
+
+
+def _is_number(v):
+    return isinstance(v, Number) and not isinstance(v, bool)
+
+
+def _is_integer(v):
+    if isinstance(v, bool):
+        return False
+    return isinstance(v, int) or (isinstance(v, float) and v.is_integer())
+
+
+def _unbool(v, true=object(), false=object()):
+    return true if v is True else false if v is False else v
+
+
+def _equal(one, two):
+    if one is two:
+        return True
+    if isinstance(one, str) or isinstance(two, str):
+        return one == two
+    if isinstance(one, Sequence) and isinstance(two, Sequence):
+        return len(one) == len(two) and all(_equal(i, j) for i, j in zip(one, two))
+    if isinstance(one, Mapping) and isinstance(two, Mapping):
+        return len(one) == len(two) and all(k in two and _equal(v, two[k]) for k, v in one.items())
+    return _unbool(one) == _unbool(two)
+
+
+def _extras_msg(extras):
+    extras = sorted(extras, key=str)
+    return ", ".join(repr(e) for e in extras), "was" if len(extras) == 1 else "were"
+
+SCHEMA_HASH = "53469527f7be579069c1b13af5e81fa8"
+
+_MISS = object()
+
+_SCHEMA = {'$schema': 'http://json-schema.org/draft-07/schema#',
+ '$id': 'https://owlume.com/schemas/judgment_terminal_state.schema.json',
+ 'title': 'Owlume Judgment Terminal State (v1)',
+ 'type': 'object',
+ 'additionalProperties': False,
+ 'required': ['type', 'statement', 'confidence', 'owner', 'acknowledged', 'timestamp'],
+ 'properties': {'type': {'type': 'string', 'enum': ['position', 'boundary', 'deferral']},
+                'statement': {'type': 'string', 'minLength': 10, 'maxLength': 500},
+                'confidence': {'type': 'number', 'minimum': 0.0, 'maximum': 1.0},
+                'owner': {'type': 'string', 'enum': ['user']},
+                'acknowledged': {'type': 'boolean', 'const': True},
+                'timestamp': {'type': 'string', 'format': 'date-time'}}}
+
+_S0 = _SCHEMA
+_S1 = _S0['properties']['type']
+_S2 = _S0['properties']['statement']
+_S3 = _S0['properties']['confidence']
+_S4 = _S0['properties']['owner']
+_S5 = _S0['properties']['acknowledged']
+_S6 = _S0['properties']['timestamp']
+_K0 = frozenset(('boundary', 'deferral', 'position'))
+_K1 = frozenset(('user',))
+_K2 = frozenset(('acknowledged', 'confidence', 'owner', 'statement', 'timestamp', 'type'))
+
+
+def _ok0(x):
+    if not isinstance(x, dict):
+        return False
+    if not _K2.issuperset(x):
+        return False
+    if ('type' not in x or 'statement' not in x or 'confidence' not in x or 'owner' not in x or 'acknowledged' not in x or 'timestamp' not in x):
+        return False
+    v = x.get('type', _MISS)
+    if v is not _MISS and not (isinstance(v, str) and (v in _K0)):
+        return False
+    v = x.get('statement', _MISS)
+    if v is not _MISS and not (isinstance(v, str) and not (len(v) < 10) and not (len(v) > 500)):
+        return False
+    v = x.get('confidence', _MISS)
+    if v is not _MISS and not ((type(v) is float or type(v) is int or _is_number(v)) and not (v < 0.0) and not (v > 1.0)):
+        return False
+    v = x.get('owner', _MISS)
+    if v is not _MISS and not (isinstance(v, str) and (v in _K1)):
+        return False
+    v = x.get('acknowledged', _MISS)
+    if v is not _MISS and not (isinstance(v, bool) and not (v is not True)):
+        return False
+    v = x.get('timestamp', _MISS)
+    if v is not _MISS and not (isinstance(v, str)):
+        return False
+    return True
+
+
+def _err0(x, path, spath):
+    S = _S0
+    if not isinstance(x, dict):
+        yield FastError(f'{x!r} is not of type ' "'object'", path, spath + ('type',), 'type', S['type'], x, S)
+    if isinstance(x, dict):
+        extras = {k for k in x if k not in _K2}
+        if extras:
+            yield FastError('Additional properties are not allowed (%s %s unexpected)' % _extras_msg(extras), path, spath + ('additionalProperties',), 'additionalProperties', S['additionalProperties'], x, S)
+    if isinstance(x, dict):
+        if 'type' not in x:
+            yield FastError("'type' is a required property", path, spath + ('required',), 'required', S['required'], x, S)
+        if 'statement' not in x:
+            yield FastError("'statement' is a required property", path, spath + ('required',), 'required', S['required'], x, S)
+        if 'confidence' not in x:
+            yield FastError("'confidence' is a required property", path, spath + ('required',), 'required', S['required'], x, S)
+        if 'owner' not in x:
+            yield FastError("'owner' is a required property", path, spath + ('required',), 'required', S['required'], x, S)
+        if 'acknowledged' not in x:
+            yield FastError("'acknowledged' is a required property", path, spath + ('required',), 'required', S['required'], x, S)
+        if 'timestamp' not in x:
+            yield FastError("'timestamp' is a required property", path, spath + ('required',), 'required', S['required'], x, S)
+    if isinstance(x, dict):
+        v = x.get('type', _MISS)
+        if v is not _MISS and not (isinstance(v, str) and (v in _K0)):
+            yield from _err1(v, path + ('type',), spath + ('properties', 'type'))
+        v = x.get('statement', _MISS)
+        if v is not _MISS and not (isinstance(v, str) and not (len(v) < 10) and not (len(v) > 500)):
+            yield from _err2(v, path + ('statement',), spath + ('properties', 'statement'))
+        v = x.get('confidence', _MISS)
+        if v is not _MISS and not ((type(v) is float or type(v) is int or _is_number(v)) and not (v < 0.0) and not (v > 1.0)):
+            yield from _err3(v, path + ('confidence',), spath + ('properties', 'confidence'))
+        v = x.get('owner', _MISS)
+        if v is not _MISS and not (isinstance(v, str) and (v in _K1)):
+            yield from _err4(v, path + ('owner',), spath + ('properties', 'owner'))
+        v = x.get('acknowledged', _MISS)
+        if v is not _MISS and not (isinstance(v, bool) and not (v is not True)):
+            yield from _err5(v, path + ('acknowledged',), spath + ('properties', 'acknowledged'))
+        v = x.get('timestamp', _MISS)
+        if v is not _MISS and not (isinstance(v, str)):
+            yield from _err6(v, path + ('timestamp',), spath + ('properties', 'timestamp'))
+
+
+def _ok1(x):
+    if not isinstance(x, str):
+        return False
+    if not (x in _K0):
+        return False
+    return True
+
+
+def _err1(x, path, spath):
+    S = _S1
+    if not isinstance(x, str):
+        yield FastError(f'{x!r} is not of type ' "'string'", path, spath + ('type',), 'type', S['type'], x, S)
+    if not (isinstance(x, str) and x in _K0):
+        yield FastError(f'{x!r} is not one of ' "['position', 'boundary', 'deferral']", path, spath + ('enum',), 'enum', S['enum'], x, S)
+
+
+def _ok2(x):
+    if not isinstance(x, str):
+        return False
+    if len(x) < 10:
+        return False
+    if len(x) > 500:
+        return False
+    return True
+
+
+def _err2(x, path, spath):
+    S = _S2
+    if not isinstance(x, str):
+        yield FastError(f'{x!r} is not of type ' "'string'", path, spath + ('type',), 'type', S['type'], x, S)
+    if isinstance(x, str) and len(x) < 10:
+        yield FastError(f'{x!r} is too short', path, spath + ('minLength',), 'minLength', S['minLength'], x, S)
+    if isinstance(x, str) and len(x) > 500:
+        yield FastError(f'{x!r} is too long', path, spath + ('maxLength',), 'maxLength', S['maxLength'], x, S)
+
+
+def _ok3(x):
+    if not (type(x) is float or type(x) is int or _is_number(x)):
+        return False
+    if x < 0.0:
+        return False
+    if x > 1.0:
+        return False
+    return True
+
+
+def _err3(x, path, spath):
+    S = _S3
+    if not (type(x) is float or type(x) is int or _is_number(x)):
+        yield FastError(f'{x!r} is not of type ' "'number'", path, spath + ('type',), 'type', S['type'], x, S)
+    if (type(x) is float or type(x) is int or _is_number(x)) and x < 0.0:
+        yield FastError(f'{x!r} is less than the minimum of 0.0', path, spath + ('minimum',), 'minimum', S['minimum'], x, S)
+    if (type(x) is float or type(x) is int or _is_number(x)) and x > 1.0:
+        yield FastError(f'{x!r} is greater than the maximum of 1.0', path, spath + ('maximum',), 'maximum', S['maximum'], x, S)
+
+
+def _ok4(x):
+    if not isinstance(x, str):
+        return False
+    if not (x in _K1):
+        return False
+    return True
+
+
+def _err4(x, path, spath):
+    S = _S4
+    if not isinstance(x, str):
+        yield FastError(f'{x!r} is not of type ' "'string'", path, spath + ('type',), 'type', S['type'], x, S)
+    if not (isinstance(x, str) and x in _K1):
+        yield FastError(f'{x!r} is not one of ' "['user']", path, spath + ('enum',), 'enum', S['enum'], x, S)
+
+
+def _ok5(x):
+    if not isinstance(x, bool):
+        return False
+    if x is not True:
+        return False
+    return True
+
+
+def _err5(x, path, spath):
+    S = _S5
+    if not isinstance(x, bool):
+        yield FastError(f'{x!r} is not of type ' "'boolean'", path, spath + ('type',), 'type', S['type'], x, S)
+    if x is not True:
+        yield FastError('True was expected', path, spath + ('const',), 'const', S['const'], x, S)
+
+
+def _ok6(x):
+    if not isinstance(x, str):
+        return False
+    return True
+
+
+def _err6(x, path, spath):
+    S = _S6
+    if not isinstance(x, str):
+        yield FastError(f'{x!r} is not of type ' "'string'", path, spath + ('type',), 'type', S['type'], x, S)
+
+
+def is_valid(x):
+    return _ok0(x)
+
+
+def iter_errors(x):
+    if _ok0(x):
+        return iter(())
+    return _err0(x, (), ())
@@ -26,7 +26,11 @@ from pathlib import Path
 from typing import Dict, Literal, Tuple, Any
 import json
 
-import jsonschema
+
+try:
+    from src.schema_registry import REGISTRY
+except ImportError:  # imported with src/ on sys.path
+    from schema_registry import REGISTRY
 
 
 ConstraintStatus = Literal["NONE", "SOFT", "HARD"]
@@ -54,8 +58,8 @@ def _load_json(path: Path) -> Dict[str, Any]:
         return json.load(f)
 
 
-def _validate_policy(policy: Dict[str, Any], schema: Dict[str, Any]) -> None:
-    jsonschema.validate(instance=policy, schema=schema)
+def _validate_policy(policy: Dict[str, Any], schema_path: Path) -> None:
+    REGISTRY.validate(policy, schema_path)
 
 
 def _enforce_invariants(policy: Dict[str, Any]) -> None:
@@ -107,9 +111,8 @@ class ActionGatingPolicy:
         self._schema_path = schema_path or root / "schemas" / "action_gating_table.schema.json"
 
         policy = _load_json(self._policy_path)
-        schema = _load_json(self._schema_path)
 
-        _validate_policy(policy, schema)
+        _validate_policy(policy, self._schema_path)
         _enforce_invariants(policy)
 
         self._policy = policy
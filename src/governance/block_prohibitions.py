@@ -23,6 +23,11 @@ import json
 
 import jsonschema
 
+try:
+    from src.schema_registry import REGISTRY
+except ImportError:  # imported with src/ on sys.path
+    from schema_registry import REGISTRY
+
 
 @dataclass(frozen=True)
 class ProhibitionViolation:
@@ -70,10 +75,9 @@ class BlockProhibitionsPolicy:
         self._schema_path = schema_path or (root / "schemas" / "block_negative_rules.schema.json")
 
         rules = _load_json(self._rules_path)
-        schema = _load_json(self._schema_path)
 
         try:
-            jsonschema.validate(instance=rules, schema=schema)
+            REGISTRY.validate(rules, self._schema_path)
         except jsonschema.ValidationError as e:
             raise BlockProhibitionsError(f"Negative rules schema validation failed: {e}") from e
 
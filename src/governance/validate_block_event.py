@@ -13,10 +13,14 @@ from __future__ import annotations
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict
-import json
 
 import jsonschema
 
+try:
+    from src.schema_registry import REGISTRY
+except ImportError:  # imported with src/ on sys.path
+    from schema_registry import REGISTRY
+
 
 class BlockEventValidationError(ValueError):
     pass
@@ -27,11 +31,6 @@ def _repo_root() -> Path:
     return Path(__file__).resolve().parents[2]
 
 
-def _load_json(path: Path) -> Dict[str, Any]:
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
-
-
 def validate_block_event(event: Dict[str, Any], schema_path: Path | None = None) -> None:
     """
     Validate the event with JSON Schema + Stage14 invariants.
@@ -40,10 +39,8 @@ def validate_block_event(event: Dict[str, Any], schema_path: Path | None = None)
     root = _repo_root()
     sp = schema_path or (root / "schemas" / "constraint_block_event.schema.json")
 
-    schema = _load_json(sp)
-
     try:
-        jsonschema.validate(instance=event, schema=schema)
+        REGISTRY.validate(event, sp)  # schema read and compiled once per process
     except jsonschema.ValidationError as e:
         raise BlockEventValidationError(f"BLOCK event schema validation failed: {e.message}") from e
 
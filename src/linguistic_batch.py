@@ -0,0 +1,75 @@
+# src/linguistic_batch.py
+# Vectorized linguistic mode scoring for many texts at once.
+#
+# ElenxEngine._score_linguistic_mode scores one text with small dicts:
+# count distinct cue hits per mode, drop modes under LINGUISTIC_MIN_MATCHES,
+# multiply by the learned mode weights, divide by the mean, softmax.
+# BatchLinguisticScorer does the same for a whole batch:
+#
+#   H  (texts × cues, sparse CSR from the scanner hits)
+#   P  (cues × modes, 0/1 pattern→mode; W = P · diag(mode weights))
+#   counts = H @ P, weighted = H @ W   (segment sums via np.bincount)
+#
+# then masks, mean-normalizes and softmaxes every row in NumPy. Row i
+# equals the engine's dict for text i, with absent modes as 0.0.
+from __future__ import annotations
+
+from typing import Hashable, Iterable, Mapping, Sequence, Tuple
+
+import numpy as np
+
+
+class BatchLinguisticScorer:
+    """
+    - cue_ids_by_mode: {mode: cue ids} (the engine's _LING_CUE_IDS)
+    - modes: column order of every returned array
+    """
+
+    def __init__(self, cue_ids_by_mode: Mapping[str, Sequence[Hashable]], min_matches: int = 1):
+        self.modes: Tuple[str, ...] = tuple(cue_ids_by_mode)
+        self.min_matches = int(min_matches)
+        self.cue_ids: Tuple[Hashable, ...] = tuple(c for m in self.modes for c in cue_ids_by_mode[m])
+        self._col = {cid: j for j, cid in enumerate(self.cue_ids)}
+        self._cue_mode = np.array(
+            [i for i, m in enumerate(self.modes) for _ in cue_ids_by_mode[m]], dtype=np.int64
+        )
+        # pattern→mode matrix (kept for callers that want H @ P themselves)
+        self.pattern_mode = np.zeros((len(self.cue_ids), len(self.modes)), dtype=np.float64)
+        self.pattern_mode[np.arange(len(self.cue_ids)), self._cue_mode] = 1.0
+
+    def hit_matrix(self, hits: Iterable[Iterable[Hashable]]) -> Tuple[np.ndarray, np.ndarray, int]:
+        """CSR (indptr, indices, n_rows) of texts × cues; cue ids outside the table are ignored."""
+        col = self._col
+        indptr = [0]
+        indices = []
+        for h in hits:
+            indices.extend(col[c] for c in h if c in col)
+            indptr.append(len(indices))
+        return np.asarray(indptr, dtype=np.int64), np.asarray(indices, dtype=np.int64), len(indptr) - 1
+
+    def score_hits(self, hits: Iterable[Iterable[Hashable]], mode_weights: Sequence[float]) -> np.ndarray:
+        """texts × modes probabilities from per-text cue hit sets."""
+        indptr, indices, n = self.hit_matrix(hits)
+        k = len(self.modes)
+        if n == 0:
+            return np.zeros((0, k), dtype=np.float64)
+
+        rows = np.repeat(np.arange(n, dtype=np.int64), np.diff(indptr))
+        flat = rows * k + self._cue_mode[indices]
+        counts = np.bincount(flat, minlength=n * k).reshape(n, k).astype(np.float64)
+
+        present = counts >= max(self.min_matches, 1)
+        weighted = np.where(present, counts * np.asarray(mode_weights, dtype=np.float64), 0.0)
+
+        # mean over the modes present in each row (as _apply_learned_weights)
+        n_present = present.sum(axis=1)
+        mean = weighted.sum(axis=1) / np.maximum(n_present, 1)
+        scale = np.where(mean > 0, mean, 1.0)
+        weighted = weighted / scale[:, None]
+
+        # row softmax over present modes only; rows with none stay all-zero
+        z = np.where(present, weighted, -np.inf)
+        zmax = np.where(n_present > 0, z.max(axis=1), 0.0)
+        e = np.where(present, np.exp(z - zmax[:, None]), 0.0)
+        denom = e.sum(axis=1)
+        return e / np.where(denom > 0, denom, 1.0)[:, None]
@@ -0,0 +1,223 @@
+# src/matrix_index.py
+# Frozen lookup index over the Questioncraft Matrix.
+#
+# Built once per ElenxEngine (and again only when the matrix pack or the
+# learned weights change). Every engine lookup — hint picks, principle
+# preference, question resolution — reads from these precomputed tables
+# instead of re-coercing and re-walking the raw matrix per call.
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+FALLBACK_MODE = "Analytical"
+FALLBACK_PRINCIPLE = "Evidence & Validation"
+
+
+def norm_label(s: str) -> str:
+    """Forgiving label form used for matrix lookups ("A & B" == "a and b")."""
+    return (s or "").strip().lower().replace("&", "and").replace("  ", " ")
+
+
+def valid_modes(matrix: Dict[str, Any]) -> List[str]:
+    """Only real modes: dict values, non-empty, key not starting with '$'."""
+    if not isinstance(matrix, dict):
+        return []
+    out: List[str] = []
+    for k, v in matrix.items():
+        try:
+            if isinstance(v, dict) and v and not str(k).strip().startswith("$"):
+                out.append(k)
+        except Exception:
+            continue
+    return out
+
+
+def _resolve_partial(norm_index: Mapping[str, Mapping[str, Any]], target_mode: str, target_pr: str) -> Optional[str]:
+    """Steps 2–4 of the forgiving question lookup, over normalized labels."""
+    # 2) Normalized exact
+    if target_mode in norm_index and target_pr in norm_index[target_mode]:
+        return str(norm_index[target_mode][target_pr])
+
+    # 3) Partial within chosen mode(s)
+    for nm, bucket in norm_index.items():
+        if target_mode in nm or nm in target_mode:
+            if target_pr in bucket:
+                return str(bucket[target_pr])
+            for np, qv in bucket.items():
+                if target_pr in np or np in target_pr:
+                    return str(qv)
+
+    # 4) Global partial across all valid modes
+    for nm, bucket in norm_index.items():
+        for np, qv in bucket.items():
+            if target_pr in np or np in target_pr:
+                return str(qv)
+    return None
+
+
+@dataclass(frozen=True)
+class MatrixIndex:
+    """
+    Immutable view of a coerced matrix dict.
+
+    - modes: valid modes in matrix order
+    - principles: {mode: principles in matrix order}
+    - ranked: {mode: principles sorted by learned weight, desc (stable)}
+    - norm_questions: {norm mode: {norm principle: question}}
+    - resolved: precomputed partial-match table {(norm mode, norm principle): question}
+    """
+    source: Any
+    weights_token: Any
+    matrix: Mapping[str, Any]
+    modes: Tuple[str, ...]
+    preferred_modes: Tuple[str, ...]
+    principles: Mapping[str, Tuple[str, ...]]
+    ranked: Mapping[str, Tuple[str, ...]]
+    norm_questions: Mapping[str, Mapping[str, Any]]
+    resolved: Mapping[Tuple[str, str], str]
+    first_mode: str
+    first_principle: str
+    fallback_question: str
+    _picks: Dict[Tuple[Optional[str], Optional[str]], Tuple[str, str]] = field(
+        default_factory=dict, compare=False, repr=False
+    )
+
+    @classmethod
+    def build(
+        cls,
+        matrix: Dict[str, Any],
+        *,
+        preferred_modes: Sequence[str],
+        principle_weight: Callable[[str], float],
+        source: Any = None,
+        weights_token: Any = None,
+    ) -> "MatrixIndex":
+        matrix = matrix if isinstance(matrix, dict) else {}
+        modes = tuple(valid_modes(matrix))
+
+        principles: Dict[str, Tuple[str, ...]] = {}
+        ranked: Dict[str, Tuple[str, ...]] = {}
+        for m in modes:
+            ps = tuple(matrix[m].keys())
+            principles[m] = ps
+            ranked[m] = tuple(sorted(ps, key=principle_weight, reverse=True))
+
+        # first mode (preferred order if possible) and its top-ranked principle
+        if modes:
+            first_mode = next((pm for pm in preferred_modes if pm in modes), modes[0])
+            first_principle = ranked[first_mode][0]
+            try:
+                fallback_question = str(matrix[first_mode][principles[first_mode][0]]) or ""
+            except Exception:
+                fallback_question = ""
+        else:
+            first_mode, first_principle, fallback_question = FALLBACK_MODE, FALLBACK_PRINCIPLE, ""
+
+        norm_index: Dict[str, Dict[str, Any]] = {}
+        for m in modes:
+            bucket = norm_index.setdefault(norm_label(m), {})
+            for p, qv in matrix[m].items():
+                bucket[norm_label(p)] = qv
+
+        # Every (mode, principle) label the engine can produce resolves in O(1)
+        all_norm_pr = {np for bucket in norm_index.values() for np in bucket}
+        all_norm_pr.add(norm_label(FALLBACK_PRINCIPLE))
+        all_norm_modes = set(norm_index) | {norm_label(FALLBACK_MODE)}
+        resolved: Dict[Tuple[str, str], str] = {}
+        for nm in all_norm_modes:
+            for np in all_norm_pr:
+                q = _resolve_partial(norm_index, nm, np)
+                resolved[(nm, np)] = q if q is not None else fallback_question
+
+        return cls(
+            source=source,
+            weights_token=weights_token,
+            matrix=MappingProxyType(matrix),
+            modes=modes,
+            preferred_modes=tuple(preferred_modes),
+            principles=MappingProxyType(principles),
+            ranked=MappingProxyType(ranked),
+            norm_questions=MappingProxyType({k: MappingProxyType(v) for k, v in norm_index.items()}),
+            resolved=MappingProxyType(resolved),
+            first_mode=first_mode,
+            first_principle=first_principle,
+            fallback_question=fallback_question,
+        )
+
+    # ---------- lookups ----------
+
+    def pick(self, pref_mode_contains: Optional[str], pref_principle_contains: Optional[str],
+             default: Tuple[str, str]) -> Tuple[str, str]:
+        """Hint-based Mode × Principle pick (substring match); memoized per hint pair."""
+        key = (pref_mode_contains, pref_principle_contains)
+        hit = self._picks.get(key)
+        if hit is not None:
+            return hit
+        out = self._pick(pref_mode_contains, pref_principle_contains, default)
+        self._picks[key] = out
+        return out
+
+    def _pick(self, pref_mode_contains: Optional[str], pref_principle_contains: Optional[str],
+              default: Tuple[str, str]) -> Tuple[str, str]:
+        if not self.modes:
+            return default
+
+        chosen_mode = self.mode_containing(pref_mode_contains) if pref_mode_contains else None
+        if not chosen_mode:
+            chosen_mode = next((pm for pm in self.preferred_modes if pm in self.modes), self.modes[0])
+
+        ordered = self.ranked[chosen_mode]
+        if pref_principle_contains:
+            h = pref_principle_contains.lower()
+            for p in ordered:
+                if h in p.lower():
+                    return chosen_mode, p
+        return chosen_mode, ordered[0]
+
+    def mode_containing(self, hint: Optional[str]) -> Optional[str]:
+        if not hint:
+            return None
+        h = hint.lower()
+        for m in self.modes:
+            try:
+                if h in m.lower():
+                    return m
+            except Exception:
+                continue
+        return None
+
+    def principle_containing(self, mode: str, hints: Sequence[str]) -> Optional[str]:
+        """First principle (matrix order) under mode containing any hint, hint order first."""
+        principles = self.principles.get(mode)
+        if not principles:
+            return None
+        for hint in hints:
+            h = (hint or "").strip().lower()
+            if not h:
+                continue
+            for pname in principles:
+                if h in pname.lower():
+                    return pname
+        return None
+
+    def question(self, mode: str, principle: str) -> str:
+        """Forgiving Mode × Principle → question lookup."""
+        if not self.modes:
+            return ""
+        # 1) Exact (only within valid modes)
+        try:
+            if mode in self.principles:
+                q = self.matrix[mode].get(principle)
+                if q:
+                    return str(q)
+        except Exception:
+            pass
+        key = (norm_label(mode), norm_label(principle))
+        q = self.resolved.get(key)
+        if q is not None:
+            return q
+        # labels outside the precomputed table (rare): resolve on the fly
+        q = _resolve_partial(self.norm_questions, *key)
+        return q if q is not None else self.fallback_question
@@ -0,0 +1,211 @@
+# src/near_dup.py
+# Near-duplicate reuse of ElenxEngine.analyze results (MinHash + LSH).
+#
+# ResultCache only helps on byte-identical (normalized) texts. Edited
+# retries, pasted-again situations and templated prompts differ by a few
+# words, so this index finds a previously analyzed text whose estimated
+# Jaccard similarity is at least `threshold` and returns its stored result:
+#
+#   near = NearDupIndex(maxsize=4096, threshold=0.85)
+#   eng = ElenxEngine(packs, near_dup=near)
+#   ...
+#   near.stats()  # lookups, reuses, reuse_rate, evictions, ...
+#
+# Text -> character shingles (whitespace collapsed) -> MinHash signature
+# (num_perm multiply-shift hashes, vectorized in NumPy). The signature
+# is cut into `bands` bands; texts sharing any band land in the same LSH
+# bucket and are candidates, verified by the fraction of agreeing signature
+# slots. Entries are scoped (the engine passes empathy flag, pack hash,
+# weights version and cfg), so a reload never reuses stale results.
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Set, Tuple
+
+import numpy as np
+
+DEFAULT_MAXSIZE = 4096
+DEFAULT_THRESHOLD = 0.85
+NUM_PERM = 64
+BANDS = 16
+SHINGLE = 5      # bytes per shingle (UTF-8 of the normalized text)
+MIN_CHARS = 24   # shorter texts are cheap to analyze and too easy to confuse
+EVICTIONS = ("lru", "fifo")
+
+_SHIFT = np.uint64(32)
+
+
+class MinHasher:
+    """
+    Character-shingle MinHash signatures (num_perm uint64 slots).
+
+    A shingle is `shingle` consecutive bytes (<= 8) packed into one uint64,
+    so shingling needs no per-shingle hashing; slot j is
+    min over shingles of ((a_j·x + b_j) mod 2**64) >> 32 (multiply-shift).
+    """
+
+    def __init__(self, num_perm: int = NUM_PERM, shingle: int = SHINGLE, seed: int = 1):
+        if num_perm < 1 or not 1 <= shingle <= 8:
+            raise ValueError("num_perm must be >= 1 and shingle in 1..8")
+        self.num_perm = int(num_perm)
+        self.shingle = int(shingle)
+        rng = np.random.default_rng(seed)
+        bits = rng.integers(0, 1 << 63, (2, self.num_perm), dtype=np.uint64, endpoint=True)
+        self._a = bits[0] | np.uint64(1)  # odd multipliers
+        self._b = bits[1]
+
+    def shingles(self, text: str) -> np.ndarray:
+        """Packed `shingle`-byte windows of the whitespace-collapsed UTF-8 text (may repeat)."""
+        data = np.frombuffer(" ".join(text.split()).encode("utf-8"), dtype=np.uint8).astype(np.uint64)
+        n = len(data) - self.shingle + 1
+        if n < 1:
+            x = np.zeros(1, dtype=np.uint64)
+            for v in data:
+                x = (x << np.uint64(8)) | v
+            return x
+        x = data[:n].copy()
+        for j in range(1, self.shingle):
+            x <<= np.uint64(8)
+            x |= data[j:j + n]
+        return x
+
+    def signature(self, text: str) -> np.ndarray:
+        x = self.shingles(text)[:, None]
+        with np.errstate(over="ignore"):
+            return ((x * self._a + self._b) >> _SHIFT).min(axis=0)
+
+    @staticmethod
+    def similarity(a: np.ndarray, b: np.ndarray) -> float:
+        """Estimated Jaccard similarity of the two signatures' shingle sets."""
+        return float(np.count_nonzero(a == b)) / len(a)
+
+
+class NearDupIndex:
+    """
+    Bounded, thread-safe LSH index of analyzed texts -> stored results.
+
+    - threshold: minimum estimated Jaccard similarity to reuse a result
+    - bands: LSH bands (num_perm must divide evenly); more bands = more
+      candidates at lower similarity, each verified against `threshold`
+    - eviction: "lru" (reuse refreshes an entry) or "fifo" (insertion order)
+    - min_chars: shorter texts are neither indexed nor looked up
+    - counters: lookups, reuses, misses, candidates (verified), evictions
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_MAXSIZE,
+        threshold: float = DEFAULT_THRESHOLD,
+        num_perm: int = NUM_PERM,
+        bands: int = BANDS,
+        eviction: str = "lru",
+        min_chars: int = MIN_CHARS,
+        hasher: Optional[MinHasher] = None,
+    ):
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1")
+        if not 0.0 < threshold <= 1.0:
+            raise ValueError("threshold must be in (0, 1]")
+        if eviction not in EVICTIONS:
+            raise ValueError(f"eviction must be one of {EVICTIONS}, got {eviction!r}")
+        self.hasher = hasher or MinHasher(num_perm)
+        if bands < 1 or self.hasher.num_perm % bands:
+            raise ValueError("bands must divide num_perm")
+        self.maxsize = int(maxsize)
+        self.threshold = float(threshold)
+        self.bands = int(bands)
+        self.eviction = eviction
+        self.min_chars = int(min_chars)
+        self._rows = self.hasher.num_perm // self.bands
+
+        # entry id -> (scope, signature, bucket keys, value); buckets hold entry ids
+        self._entries: "OrderedDict[int, Tuple[Hashable, np.ndarray, Tuple[Hashable, ...], Any]]" = OrderedDict()
+        self._buckets: Dict[Hashable, Set[int]] = {}
+        self._next_id = 0
+        self._lock = threading.Lock()
+        self.lookups = 0
+        self.reuses = 0
+        self.misses = 0
+        self.candidates = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def signature(self, text: str) -> Optional[np.ndarray]:
+        """MinHash signature of a normalized text; None if it is too short to index."""
+        if len(text) < self.min_chars:
+            return None
+        return self.hasher.signature(text)
+
+    def _band_keys(self, scope: Hashable, sig: np.ndarray) -> Tuple[Hashable, ...]:
+        r = self._rows
+        return tuple((scope, i, sig[i * r:(i + 1) * r].tobytes()) for i in range(self.bands))
+
+    def lookup(self, sig: Optional[np.ndarray], scope: Hashable = None) -> Optional[Any]:
+        """Stored value of the most similar indexed text at or above threshold, else None."""
+        if sig is None:
+            return None
+        keys = self._band_keys(scope, sig)
+        with self._lock:
+            self.lookups += 1
+            cand: Set[int] = set()
+            for key in keys:
+                ids = self._buckets.get(key)
+                if ids:
+                    cand |= ids
+            self.candidates += len(cand)
+            best, best_sim = None, self.threshold
+            for eid in cand:
+                sim = MinHasher.similarity(sig, self._entries[eid][1])
+                if sim >= best_sim:
+                    best, best_sim = eid, sim
+            if best is None:
+                self.misses += 1
+                return None
+            self.reuses += 1
+            if self.eviction == "lru":
+                self._entries.move_to_end(best)
+            return self._entries[best][3]
+
+    def add(self, sig: Optional[np.ndarray], value: Any, scope: Hashable = None) -> None:
+        if sig is None:
+            return
+        keys = self._band_keys(scope, sig)
+        with self._lock:
+            eid = self._next_id
+            self._next_id += 1
+            self._entries[eid] = (scope, sig, keys, value)
+            for key in keys:
+                self._buckets.setdefault(key, set()).add(eid)
+            while len(self._entries) > self.maxsize:
+                self._drop(*self._entries.popitem(last=False))
+                self.evictions += 1
+
+    def _drop(self, eid: int, entry: Tuple[Hashable, np.ndarray, Tuple[Hashable, ...], Any]) -> None:
+        for key in entry[2]:
+            ids = self._buckets.get(key)
+            if ids is not None:
+                ids.discard(eid)
+                if not ids:
+                    del self._buckets[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._buckets.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "threshold": self.threshold,
+            "eviction": self.eviction,
+            "lookups": self.lookups,
+            "reuses": self.reuses,
+            "misses": self.misses,
+            "candidates": self.candidates,
+            "evictions": self.evictions,
+            "reuse_rate": round(self.reuses / self.lookups, 4) if self.lookups else 0.0,
+        }
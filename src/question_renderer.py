@@ -1,10 +1,17 @@
 # src/question_renderer.py
 from __future__ import annotations
-from dataclasses import dataclass, asdict
-from typing import List, Dict, Any
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Dict, Any, Iterable, Mapping, Optional, Tuple
+import json
+import os
 import re
 import time
-import uuid
+
+try:
+    from src.result_types import Tags, EMPTY_TAGS
+except ImportError:  # imported with src/ on sys.path
+    from result_types import Tags, EMPTY_TAGS
 
 # -------- helpers --------
 
@@ -15,16 +22,40 @@ def slugify(text: str) -> str:
     s = _SLUG_RE.sub("-", s).strip("-")
     return s or "na"
 
+@lru_cache(maxsize=4096)
+def slug_ids(mode_label: str, principle_label: str) -> Tuple[str, str]:
+    """(mode_id, principle_id) for a Mode × Principle; computed once per pair (the matrix is small)."""
+    return slugify(mode_label), slugify(f"{mode_label}--{principle_label}")
+
+def precompute_slug_ids(pairs: Iterable[Tuple[str, str]]) -> None:
+    """Warm slug_ids for every (mode, principle) of a matrix, e.g. at engine start."""
+    for mode, principle in pairs:
+        slug_ids(mode, principle)
+
+_NOW = [0, ""]
+
 def now_iso() -> str:
-    # Seconds precision is enough; UI can format locally
-    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime())
+    # Seconds precision is enough; UI can format locally (formatted once per second)
+    sec = int(time.time())
+    if _NOW[0] != sec:
+        _NOW[:] = [sec, time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))]
+    return _NOW[1]
 
 # -------- public dataclasses --------
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class QuestionItem:
+    id: str                    # "q-<mode_id>-<principle_id>-<order>"
+    text: str
+    order: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"id": self.id, "text": self.text, "order": self.order}
+
+@dataclass(frozen=True, slots=True)
 class UIPayload:
     """Minimal, stable payload for Owlume’s UI."""
-    id: str                    # e.g., "qpack-<uuid>"
+    id: str                    # e.g., "qpack-<12 hex>"
     created_at: str            # ISO UTC
     mode_id: str               # slug of mode label
     mode_label: str
@@ -32,11 +63,33 @@ class UIPayload:
     principle_label: str
     confidence: float          # overall fused confidence
     empathy_on: bool
-    tags: Dict[str, List[str]] # {"fallacies": [...], "contexts": [...]}
-    questions: List[Dict[str, Any]]  # [{"id","text","order"}]
+    tags: Tags                 # {"fallacies": (...), "contexts": (...)}
+    questions: Tuple[QuestionItem, ...]
+    runner_up: Optional[Tuple[str, str, float]] = None  # (mode, principle, score) ranked second
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        """Plain dict (tag tuples are shared, not copied; they serialize as JSON arrays)."""
+        return {
+            "id": self.id,
+            "created_at": self.created_at,
+            "mode_id": self.mode_id,
+            "mode_label": self.mode_label,
+            "principle_id": self.principle_id,
+            "principle_label": self.principle_label,
+            "confidence": self.confidence,
+            "empathy_on": self.empathy_on,
+            "tags": dict(self.tags),
+            "questions": [q.to_dict() for q in self.questions],
+            "runner_up": None if self.runner_up is None else {
+                "mode_label": self.runner_up[0],
+                "principle_label": self.runner_up[1],
+                "score": round(float(self.runner_up[2]), 4),
+            },
+        }
+
+    def to_json(self, **kw: Any) -> str:
+        kw.setdefault("ensure_ascii", False)
+        return json.dumps(self.to_dict(), **kw)
 
 # -------- rendering API --------
 
@@ -47,23 +100,17 @@ def render_question_pack(
     questions: List[str],
     confidence: float,
     empathy_on: bool,
-    tags: Dict[str, List[str]],
+    tags: Mapping[str, Iterable[str]],
+    runner_up: Optional[Tuple[str, str, float]] = None,
 ) -> UIPayload:
     """
     Turn Engine Shim outputs into a UI pack with stable IDs and clean structure.
-    IDs are slugs + short uuid to avoid collisions if labels change in future.
+    IDs are slugs + 12 random hex chars to avoid collisions if labels change in future.
+    runner_up: DetectionResult.runner_up, the second-ranked cell for dashboards / nudges.
     """
-    mode_id = slugify(mode_label)
-    principle_id = slugify(f"{mode_label}--{principle_label}")
-    pack_id = f"qpack-{uuid.uuid4().hex[:12]}"
-
-    q_items: List[Dict[str, Any]] = []
-    for i, q in enumerate(questions, 1):
-        q_items.append({
-            "id": f"q-{mode_id}-{principle_id}-{i}",
-            "text": q.strip(),
-            "order": i
-        })
+    mode_id, principle_id = slug_ids(mode_label, principle_label)
+    pack_id = f"qpack-{os.urandom(6).hex()}"
+    prefix = f"q-{mode_id}-{principle_id}-"
 
     return UIPayload(
         id=pack_id,
@@ -74,6 +121,7 @@ def render_question_pack(
         principle_label=principle_label,
         confidence=round(float(confidence), 2),
         empathy_on=bool(empathy_on),
-        tags=tags or {"fallacies": [], "contexts": []},
-        questions=q_items
+        tags=Tags.of(tags) if tags else EMPTY_TAGS,
+        questions=tuple(QuestionItem(f"{prefix}{i}", q.strip(), i) for i, q in enumerate(questions, 1)),
+        runner_up=runner_up,
     )
@@ -0,0 +1,166 @@
+# src/regex_fuzz.py
+# Worst-case latency fuzzing for cue patterns.
+#
+# Cue regexes are authored by hand (engine tables, rule/fallacy packs, the
+# T1 blueprint) and run on whatever users paste. A pattern like
+# r"\beither\b.*\bor\b" is fine on a sentence and quadratic on a page of
+# "either either either ...". This module generates pathological inputs at
+# growing sizes, times each pattern on them and fits the growth exponent
+# (time ~ size^k): k ≈ 1 is a linear scan, k ≳ 2 backtracking blow-up.
+#
+#   reports = fuzz_patterns({"cue": re.compile(...)}, sizes=(2000, 8000, 32000))
+#   bad = [r for r in reports if r.superlinear]
+#
+# scripts/fuzz_cue_regex.py runs it over every engine and blueprint pattern.
+from __future__ import annotations
+
+import math
+import re
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+Target = Union["re.Pattern[str]", Callable[[str], object]]
+
+DEFAULT_SIZES: Tuple[int, ...] = (2000, 8000, 32000)
+MAX_EXPONENT = 1.5          # growth exponent above which a pattern counts as super-linear
+TIME_BUDGET_S = 0.5         # stop growing a family once one call takes this long
+
+_PASTE = (
+    "My co-founder and I disagree on pricing; the board wants an answer by Friday. "
+    "Everyone says we must either ship now or lose the quarter, but there is no data yet. "
+    "Looking back, I regret not testing the assumption with a small experiment first.\n"
+)
+_UNICODE = (
+    "e\u0301\u0301\u0301 "                  # stacked combining accents
+    "\U0001F469\u200d\U0001F4BB "             # ZWJ emoji sequence
+    "\u05e9\u05dc\u05d5\u05dd \u202e"         # Hebrew + RTL override
+    "\u00a0\u2009\u3000"                      # NBSP, thin and ideographic spaces
+    "\uff54\uff45\uff41\uff4d "               # fullwidth "team"
+    "\u0130\u0131 \ufb01 \u00df "              # dotted/dotless i, "fi" ligature, sharp s
+    "\U0001D54F\U0001D560 "                    # astral math letters
+)
+_WORD_RX = re.compile(r"(?<!\\)[a-z]{2,}", re.I)
+
+
+def _fill(unit: str, size: int) -> str:
+    return (unit * (size // max(1, len(unit)) + 1))[:size]
+
+
+def pattern_words(pattern: str, limit: int = 6) -> List[str]:
+    """Literal words of a pattern source (escapes like \\b skipped), first `limit` distinct."""
+    out: List[str] = []
+    for w in _WORD_RX.findall(pattern):
+        w = w.lower()
+        if w not in out:
+            out.append(w)
+    return out[:limit]
+
+
+def pathological_inputs(size: int, words: Iterable[str] = ()) -> Dict[str, str]:
+    """
+    {family: text of `size` chars}: long single-char repeats, a huge paste,
+    Unicode edge cases, and for each pattern word a run of that word alone
+    (a prefix repeated without the rest of the pattern) plus a near miss.
+    """
+    out = {
+        "repeat_char": "a" * size,
+        "repeat_space": " " * size,
+        "repeat_newline": "\n" * size,
+        "huge_paste": _fill(_PASTE, size),
+        "unicode": _fill(_UNICODE, size),
+    }
+    for w in words:
+        out[f"word:{w}"] = _fill(w + " ", size)
+        out[f"near:{w}"] = _fill(w + w[-1] + "-", size)
+    return out
+
+
+def growth_exponent(sizes: Sequence[int], seconds: Sequence[float]) -> float:
+    """Least-squares slope of log(time) over log(size)."""
+    pts = [(math.log(n), math.log(max(t, 1e-9))) for n, t in zip(sizes, seconds)]
+    if len(pts) < 2:
+        return 0.0
+    mx = sum(x for x, _ in pts) / len(pts)
+    my = sum(y for _, y in pts) / len(pts)
+    den = sum((x - mx) ** 2 for x, _ in pts)
+    return sum((x - mx) * (y - my) for x, y in pts) / den if den else 0.0
+
+
+def _p99(samples: Sequence[float]) -> float:
+    s = sorted(samples)
+    return s[min(len(s) - 1, math.ceil(0.99 * len(s)) - 1)] if s else 0.0
+
+
+@dataclass(frozen=True)
+class PatternReport:
+    name: str
+    exponent: float                 # worst growth exponent over the input families
+    worst_family: str
+    p99_us: float                   # p99 latency over the calls at each family's largest size
+    max_us: float
+    sizes: Tuple[int, ...]          # sizes actually run for the worst family
+    superlinear: bool
+
+
+def _caller(target: Target) -> Callable[[str], object]:
+    search = getattr(target, "search", None)
+    return search if search is not None else target  # type: ignore[return-value]
+
+
+def fuzz_pattern(
+    name: str,
+    target: Target,
+    sizes: Sequence[int] = DEFAULT_SIZES,
+    reps: int = 5,
+    words: Optional[Iterable[str]] = None,
+    max_exponent: float = MAX_EXPONENT,
+    time_budget_s: float = TIME_BUDGET_S,
+) -> PatternReport:
+    """
+    Time target (a compiled pattern -> .search, or any callable(text)) on
+    every input family at every size. The exponent per family is fitted on
+    the fastest of `reps` calls per size (noise only adds time); p99 is taken
+    over every family's calls at the largest size it reached.
+    """
+    if words is None:
+        words = pattern_words(getattr(target, "pattern", "") or "")
+    words = list(words)
+    call = _caller(target)
+    inputs = {n: pathological_inputs(n, words) for n in sizes}
+    worst = (-math.inf, "", ())
+    top: List[float] = []
+    for family in pathological_inputs(1, words):
+        run_sizes: List[int] = []
+        best: List[float] = []
+        for n in sizes:
+            text = inputs[n][family]
+            samples = []
+            for _ in range(reps):
+                t0 = time.perf_counter()
+                call(text)
+                samples.append(time.perf_counter() - t0)
+            run_sizes.append(n)
+            best.append(min(samples))
+            if min(samples) > time_budget_s:
+                break
+        top.extend(samples)
+        k = growth_exponent(run_sizes, best)
+        if k > worst[0]:
+            worst = (k, family, tuple(run_sizes))
+    k, family, run = worst
+    return PatternReport(
+        name=name,
+        exponent=round(k, 2),
+        worst_family=family,
+        p99_us=round(_p99(top) * 1e6, 1),
+        max_us=round(max(top, default=0.0) * 1e6, 1),
+        sizes=run,
+        superlinear=k > max_exponent,
+    )
+
+
+def fuzz_patterns(targets: Mapping[str, Target], **kw) -> List[PatternReport]:
+    """fuzz_pattern for each {name: target}; worst exponent first."""
+    reports = [fuzz_pattern(name, t, **kw) for name, t in targets.items()]
+    return sorted(reports, key=lambda r: -r.exponent)
@@ -0,0 +1,82 @@
+# src/result_cache.py
+# Bounded LRU/TTL cache for whole ElenxEngine.analyze results.
+#
+# Opt-in: ElenxEngine(packs, result_cache=ResultCache(maxsize=4096, ttl_s=600)).
+# Keys are built by the engine (normalized-text digest, empathy flag, pack
+# content hash, learned-weights version); this module only stores values
+# and keeps hit/miss/eviction counters.
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+DEFAULT_MAXSIZE = 4096
+
+
+class ResultCache:
+    """
+    Thread-safe LRU map with an optional per-entry TTL.
+
+    - maxsize: entries kept; the least recently used is evicted past it
+    - ttl_s: seconds an entry stays valid (None = no expiry); expired
+      entries are dropped when looked up
+    - counters: hits, misses, evictions (LRU), expirations (TTL)
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE, ttl_s: Optional[float] = None):
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1")
+        self.maxsize = int(maxsize)
+        self.ttl_s = None if ttl_s is None else float(ttl_s)
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires, value = entry
+            if expires and time.monotonic() >= expires:
+                del self._data[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        expires = time.monotonic() + self.ttl_s if self.ttl_s else 0.0
+        with self._lock:
+            self._data[key] = (expires, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
@@ -0,0 +1,44 @@
+# src/result_types.py
+# Read-only building blocks shared by engine and UI results.
+#
+# Results are cached (ResultCache, NearDupIndex), handed to many callers and
+# serialized on every request. Their parts are immutable, so a stored result
+# is returned as-is instead of deep-copied, and to_dict() can reference the
+# parts directly.
+from __future__ import annotations
+
+from typing import Any, Iterable, Mapping, NoReturn, Tuple
+
+
+class Tags(dict):
+    """
+    Read-only {"fallacies": (...), "contexts": (...)}; values are tuples.
+
+    A dict subclass, so .get / == / json.dumps behave as for the old
+    dict-of-lists (tuples serialize as JSON arrays). Mutators raise TypeError.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, items: Any = (), **kw: Iterable[str]):
+        src = dict(items, **kw)
+        dict.__init__(self, ((k, tuple(v)) for k, v in src.items()))
+
+    @classmethod
+    def of(cls, tags: Mapping[str, Iterable[str]] | None) -> "Tags":
+        return tags if isinstance(tags, Tags) else cls(tags or {})
+
+    def _readonly(self, *args: Any, **kw: Any) -> NoReturn:
+        raise TypeError("Tags are read-only; build a new Tags instead")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return Tags, (dict(self),)
+
+    def __repr__(self) -> str:
+        return f"Tags({dict.__repr__(self)})"
+
+
+EMPTY_TAGS = Tags({"fallacies": (), "contexts": ()})
@@ -0,0 +1,54 @@
+# src/scan_guard.py
+# Per-stage caps on how much text a cue stage may scan.
+#
+# Cue regexes run on whatever users paste; even a linear pattern costs
+# milliseconds per stage on a megabyte of text, and a backtracking one much
+# more (scripts/fuzz_cue_regex.py finds those). A ScanGuard cuts the text
+# each stage sees to that stage's limit, so one oversized request can't
+# stall a worker:
+#
+#   guard = ScanGuard({"priors": 4000})      # other stages: SCAN_LIMIT
+#   tags = scanner.scan(guard.cap("priors", text))
+#   guard.capped                             # {"priors": 1, ...} times each stage was cut
+from __future__ import annotations
+
+import os
+import threading
+from typing import Dict, Mapping, Optional
+
+# Default chars scanned per stage (0 = no limit)
+SCAN_LIMIT = int(os.getenv("ELENX_SCAN_LIMIT", "16000"))
+
+
+def cap_text(text: str, limit: int) -> str:
+    """First `limit` characters, cut back to a word boundary when there is one in the second half."""
+    if limit <= 0 or len(text) <= limit:
+        return text
+    cut = text[:limit]
+    i = max(cut.rfind(" "), cut.rfind("\n"))
+    return cut[:i] if i > limit // 2 else cut
+
+
+class ScanGuard:
+    """
+    {stage: max chars}; stages without an entry use `default` (0 = no limit).
+
+    - cap(stage, text): the text that stage may scan
+    - capped: {stage: number of texts cut}, for metrics / degraded flags
+    """
+
+    def __init__(self, limits: Optional[Mapping[str, int]] = None, default: int = SCAN_LIMIT):
+        self.limits: Dict[str, int] = dict(limits or {})
+        self.default = int(default)
+        self.capped: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def limit(self, stage: str) -> int:
+        return self.limits.get(stage, self.default)
+
+    def cap(self, stage: str, text: str) -> str:
+        out = cap_text(text, self.limit(stage))
+        if out is not text:
+            with self._lock:
+                self.capped[stage] = self.capped.get(stage, 0) + 1
+        return out
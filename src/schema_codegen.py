@@ -0,0 +1,460 @@
+# src/schema_codegen.py
+# Build step: JSON Schema -> specialized Python validator module.
+#
+# Even compiled, a jsonschema validator walks the schema dict for every
+# instance: one keyword-function call, generator and type-checker lookup per
+# keyword per node. For the few schemas on the hot logging path that walk is
+# unrolled into straight-line Python once, at build time:
+#
+#   python src/schema_codegen.py build            # regenerate src/fast_validators/*.py
+#   python src/schema_codegen.py check            # exit 1 if any is stale
+#
+# Each generated module exposes
+#   is_valid(obj) -> bool        no allocation on the valid path
+#   iter_errors(obj)             the errors Draft7Validator.iter_errors reports, in
+#                                the same order (message, path, schema_path,
+#                                validator, validator_value, instance, schema)
+#   SCHEMA_HASH                  canonical content hash of the source schema
+#
+# The registry (schema_registry.SchemaRegistry.checker) only uses a module
+# whose SCHEMA_HASH matches the schema on disk; tests/test_fast_validators.py
+# checks generated files are current and error-for-error equal to
+# Draft7Validator on fuzzed records.
+#
+# Supported keywords (Draft 7): type, enum, const, properties, required,
+# additionalProperties, items (single schema), minItems, maxItems,
+# minLength, maxLength, minimum, maximum, exclusiveMinimum,
+# exclusiveMaximum, allOf, if/then/else. "format" is an annotation here, as
+# for Draft7Validator without a format_checker. Anything else raises
+# UnsupportedSchema.
+from __future__ import annotations
+
+import pprint
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+try:
+    from src.schema_registry import FAST_DIR, SCHEMA_DIR, schema_hash
+except ImportError:  # run as python src/schema_codegen.py
+    from schema_registry import FAST_DIR, SCHEMA_DIR, schema_hash
+
+FAST_SCHEMAS = ("clarity_gain_record", "judgment_terminal_state")
+
+SUPPORTED = frozenset({
+    "type", "enum", "const", "properties", "required", "additionalProperties", "items",
+    "minItems", "maxItems", "minLength", "maxLength", "minimum", "maximum",
+    "exclusiveMinimum", "exclusiveMaximum", "allOf", "if", "format",
+})
+DRAFT7_KEYWORDS = SUPPORTED | frozenset({
+    "$ref", "additionalItems", "anyOf", "contains", "dependencies", "maxProperties",
+    "minProperties", "multipleOf", "not", "oneOf", "pattern", "patternProperties",
+    "propertyNames", "uniqueItems",
+})
+# keywords that only read the value, so a node made of these is checked inline
+_SCALAR = frozenset({"type", "enum", "const", "minLength", "maxLength", "minItems", "maxItems",
+                     "minimum", "maximum", "exclusiveMinimum", "exclusiveMaximum", "format"})
+
+_TYPE_CHECKS = {
+    "string": "isinstance({v}, str)",
+    "number": "(type({v}) is float or type({v}) is int or _is_number({v}))",
+    "integer": "(type({v}) is int or _is_integer({v}))",
+    "object": "isinstance({v}, dict)",
+    "array": "isinstance({v}, list)",
+    "boolean": "isinstance({v}, bool)",
+    "null": "{v} is None",
+}
+_GUARDS = {  # keyword -> instance type it applies to
+    "minLength": "string", "maxLength": "string",
+    "minimum": "number", "maximum": "number", "exclusiveMinimum": "number", "exclusiveMaximum": "number",
+    "minItems": "array", "maxItems": "array",
+    "properties": "object", "required": "object", "additionalProperties": "object", "items": "array",
+}
+_BOUNDS = {  # keyword -> (failing comparison, message)
+    "minimum": ("<", "is less than the minimum of"),
+    "maximum": (">", "is greater than the maximum of"),
+    "exclusiveMinimum": ("<=", "is less than or equal to the minimum of"),
+    "exclusiveMaximum": (">=", "is greater than or equal to the maximum of"),
+}
+
+_PRELUDE = '''\
+from collections import deque
+from collections.abc import Mapping, Sequence
+from numbers import Number
+
+
+class FastError:
+    """A validation error with the fields of jsonschema.ValidationError that callers read."""
+
+    __slots__ = ("message", "path", "schema_path", "validator", "validator_value", "instance", "schema")
+
+    def __init__(self, message, path, schema_path, validator, validator_value, instance, schema):
+        self.message = message
+        self.path = deque(path)
+        self.schema_path = deque(schema_path)
+        self.validator = validator
+        self.validator_value = validator_value
+        self.instance = instance
+        self.schema = schema
+
+    def __repr__(self):
+        return f"<FastError {self.message!r} at {list(self.path)}>"
+
+    __str__ = lambda self: self.message
+
+
+def _is_number(v):
+    return isinstance(v, Number) and not isinstance(v, bool)
+
+
+def _is_integer(v):
+    if isinstance(v, bool):
+        return False
+    return isinstance(v, int) or (isinstance(v, float) and v.is_integer())
+
+
+def _unbool(v, true=object(), false=object()):
+    return true if v is True else false if v is False else v
+
+
+def _equal(one, two):
+    if one is two:
+        return True
+    if isinstance(one, str) or isinstance(two, str):
+        return one == two
+    if isinstance(one, Sequence) and isinstance(two, Sequence):
+        return len(one) == len(two) and all(_equal(i, j) for i, j in zip(one, two))
+    if isinstance(one, Mapping) and isinstance(two, Mapping):
+        return len(one) == len(two) and all(k in two and _equal(v, two[k]) for k, v in one.items())
+    return _unbool(one) == _unbool(two)
+
+
+def _extras_msg(extras):
+    extras = sorted(extras, key=str)
+    return ", ".join(repr(e) for e in extras), "was" if len(extras) == 1 else "were"
+'''
+
+
+class UnsupportedSchema(ValueError):
+    pass
+
+
+def _types(node: Dict[str, Any]) -> List[str]:
+    t = node.get("type")
+    return [] if t is None else [t] if isinstance(t, str) else list(t)
+
+
+class _Codegen:
+    def __init__(self) -> None:
+        self.nodes: List[str] = []          # schema access expression per node id
+        self.funcs: List[str] = []
+        self.consts: Dict[str, str] = {}    # source -> name
+
+    # ---------- nodes ----------
+
+    def node(self, schema: Any, expr: str) -> int:
+        if not isinstance(schema, dict):
+            raise UnsupportedSchema(f"boolean / non-object subschema at {expr}")
+        unknown = [k for k in schema if k in DRAFT7_KEYWORDS and k not in SUPPORTED]
+        if unknown:
+            raise UnsupportedSchema(f"{expr}: unsupported keywords {unknown}")
+        for t in _types(schema):
+            if t not in _TYPE_CHECKS:
+                raise UnsupportedSchema(f"{expr}: unknown type {t!r}")
+        n = len(self.nodes)
+        self.nodes.append(expr)
+        self.funcs.append("")  # placeholders keep node ids == function ids
+        kids: Dict[str, Any] = {}
+        for key, sub in (schema.get("properties") or {}).items():
+            kids[f"p:{key}"] = self.node(sub, f"_S{n}['properties'][{key!r}]")
+        ap = schema.get("additionalProperties")
+        if isinstance(ap, dict):
+            kids["ap"] = self.node(ap, f"_S{n}['additionalProperties']")
+        elif ap is not None and not isinstance(ap, bool):
+            raise UnsupportedSchema(f"{expr}: additionalProperties must be a bool or schema")
+        if "items" in schema:
+            if not isinstance(schema["items"], dict):
+                raise UnsupportedSchema(f"{expr}: only single-schema items are supported")
+            kids["items"] = self.node(schema["items"], f"_S{n}['items']")
+        for i, sub in enumerate(schema.get("allOf") or ()):
+            kids[f"all:{i}"] = self.node(sub, f"_S{n}['allOf'][{i}]")
+        if "if" in schema:
+            kids["if"] = self.node(schema["if"], f"_S{n}['if']")
+            for branch in ("then", "else"):
+                if branch in schema:
+                    kids[branch] = self.node(schema[branch], f"_S{n}[{branch!r}]")
+        self.funcs[n] = self._ok_fn(n, schema, kids) + "\n\n\n" + self._err_fn(n, schema, kids)
+        return n
+
+    def _simple(self, schema: Dict[str, Any]) -> bool:
+        return all(k in _SCALAR or k not in DRAFT7_KEYWORDS for k in schema)
+
+    def _const(self, value: Any) -> str:
+        """Module-level constant; sets are emitted sorted so the generated source is stable."""
+        src = f"frozenset({tuple(sorted(value))!r})" if isinstance(value, frozenset) else repr(value)
+        return self.consts.setdefault(src, f"_K{len(self.consts)}")
+
+    # ---------- is_valid ----------
+
+    def _type_expr(self, types: Sequence[str], v: str) -> str:
+        parts = [_TYPE_CHECKS[t].format(v=v) for t in types]
+        return parts[0] if len(parts) == 1 else "(" + " or ".join(parts) + ")"
+
+    def _scalar_fails(self, key: str, val: Any, schema: Dict[str, Any], v: str, known: Optional[str]) -> Optional[str]:
+        """Expression true when keyword `key` reports an error for value v (None: never)."""
+        if key == "type":
+            return f"not {self._type_expr(_types(schema), v)}"
+        if key == "enum":
+            if val and all(isinstance(e, str) for e in val):
+                is_str = "" if known == "string" else f"isinstance({v}, str) and "
+                return f"not ({is_str}{v} in {self._const(frozenset(val))})"
+            return f"not any(_equal(e, {v}) for e in {self._const(val)})"
+        if key == "const":
+            if isinstance(val, bool) or val is None:
+                return f"{v} is not {val!r}"
+            return f"not _equal({v}, {self._const(val)})"
+        guard = _GUARDS.get(key)
+        if guard is None:
+            return None  # format / annotations
+        check = "" if known == guard else self._type_expr([guard], v) + " and "
+        if key in ("minLength", "minItems"):
+            return f"{check}len({v}) < {val!r}"
+        if key in ("maxLength", "maxItems"):
+            return f"{check}len({v}) > {val!r}"
+        if key in _BOUNDS:
+            return f"{check}{v} {_BOUNDS[key][0]} {val!r}"
+        return None
+
+    @staticmethod
+    def _known(schema: Dict[str, Any]) -> Optional[str]:
+        """The instance type once a single "type" keyword has passed (checks after it need no guard)."""
+        t = _types(schema)
+        return t[0] if len(t) == 1 and t[0] in _GUARDS.values() else None
+
+    def ok_expr(self, n: int, schema: Dict[str, Any], v: str) -> str:
+        """Inline validity expression for a scalar-only node, else a call to its _ok function."""
+        if not self._simple(schema):
+            return f"_ok{n}({v})"
+        fails, known = [], None
+        for k, val in schema.items():
+            f = self._scalar_fails(k, val, schema, v, known)
+            if f is not None:
+                fails.append(f[4:] if f.startswith("not ") else f"not ({f})")
+            if k == "type":
+                known = self._known(schema)
+        return " and ".join(fails) or "True"
+
+    def _ok_fn(self, n: int, schema: Dict[str, Any], kids: Dict[str, Any]) -> str:
+        out = [f"def _ok{n}(x):"]
+        known: Optional[str] = None
+        guarded = lambda kw: "" if known == _GUARDS[kw] else f"{self._type_expr([_GUARDS[kw]], 'x')} and "
+        for key, val in schema.items():
+            if key in _SCALAR:
+                f = self._scalar_fails(key, val, schema, "x", known)
+                if key == "type":
+                    known = self._known(schema)
+                if f is not None:
+                    out.append(f"    if {f}:\n        return False")
+            elif key == "properties":
+                cond = guarded("properties").removesuffix(" and ")
+                body = []
+                for i, (prop, sub) in enumerate(val.items()):
+                    k = kids[f"p:{prop}"]
+                    body.append(f"v = x.get({prop!r}, _MISS)\n"
+                                f"if v is not _MISS and not ({self.ok_expr(k, sub, 'v')}):\n    return False")
+                out.append(_block(cond, body))
+            elif key == "required":
+                if val:
+                    miss = " or ".join(f"{p!r} not in x" for p in val)
+                    out.append(f"    if {guarded('required')}({miss}):\n        return False")
+            elif key == "additionalProperties":
+                if val is False:
+                    props = self._const(frozenset(schema.get("properties") or {}))
+                    out.append(f"    if {guarded('additionalProperties')}not {props}.issuperset(x):\n        return False")
+                elif isinstance(val, dict):
+                    props = self._const(frozenset(schema.get("properties") or {}))
+                    cond = guarded("additionalProperties").removesuffix(" and ")
+                    out.append(_block(cond, [
+                        f"for k, v in x.items():\n"
+                        f"    if k not in {props} and not ({self.ok_expr(kids['ap'], val, 'v')}):\n"
+                        f"        return False"]))
+            elif key == "items":
+                cond = guarded("items").removesuffix(" and ")
+                out.append(_block(cond, [f"for v in x:\n    if not ({self.ok_expr(kids['items'], val, 'v')}):\n"
+                                         f"        return False"]))
+            elif key == "allOf":
+                for i, sub in enumerate(val):
+                    out.append(f"    if not ({self.ok_expr(kids[f'all:{i}'], sub, 'x')}):\n        return False")
+            elif key == "if":
+                then = schema.get("then")
+                els = schema.get("else")
+                if then is None and els is None:
+                    continue
+                out.append(f"    if {self.ok_expr(kids['if'], val, 'x')}:")
+                out.append(f"        if not ({self.ok_expr(kids['then'], then, 'x')}):\n            return False"
+                           if then is not None else "        pass")
+                if els is not None:
+                    out.append(f"    elif not ({self.ok_expr(kids['else'], els, 'x')}):\n        return False")
+        out.append("    return True")
+        return "\n".join(out)
+
+    # ---------- iter_errors ----------
+
+    def _err_fn(self, n: int, schema: Dict[str, Any], kids: Dict[str, Any]) -> str:
+        out = [f"def _err{n}(x, path, spath):", f"    S = _S{n}"]
+
+        def err(key: str, msg: str, indent: str = "    ") -> str:
+            return f"{indent}yield FastError({msg}, path, spath + ({key!r},), {key!r}, S[{key!r}], x, S)"
+
+        for key, val in schema.items():
+            if key == "type":
+                reprs = ", ".join(repr(t) for t in _types(schema))
+                out.append(f"    if not {self._type_expr(_types(schema), 'x')}:")
+                out.append(err(key, f"f'{{x!r}} is not of type ' {reprs!r}", "        "))
+            elif key == "enum":
+                out.append(f"    if {self._scalar_fails(key, val, schema, 'x', None)}:")
+                out.append(err(key, f"f'{{x!r}} is not one of ' {repr(val)!r}", "        "))
+            elif key == "const":
+                out.append(f"    if {self._scalar_fails(key, val, schema, 'x', None)}:")
+                out.append(err(key, repr(f"{val!r} was expected"), "        "))
+            elif key in ("minLength", "minItems", "maxLength", "maxItems"):
+                empty = (val == 1) if key.startswith("min") else (val == 0)
+                word = ("should be non-empty" if key.startswith("min") else "is expected to be empty") if empty \
+                    else ("is too short" if key.startswith("min") else "is too long")
+                out.append(f"    if {self._scalar_fails(key, val, schema, 'x', None)}:")
+                out.append(err(key, f"f'{{x!r}} {word}'", "        "))
+            elif key in _BOUNDS:
+                out.append(f"    if {self._scalar_fails(key, val, schema, 'x', None)}:")
+                out.append(err(key, f"f'{{x!r}} {_BOUNDS[key][1]} {val!r}'", "        "))
+            elif key == "properties":
+                body = []
+                for prop, sub in val.items():
+                    k = kids[f"p:{prop}"]
+                    body.append(f"v = x.get({prop!r}, _MISS)\n"
+                                f"if v is not _MISS and not ({self.ok_expr(k, sub, 'v')}):\n"
+                                f"    yield from _err{k}(v, path + ({prop!r},), spath + ('properties', {prop!r}))")
+                out.append(_block("isinstance(x, dict)", body))
+            elif key == "required":
+                body = [f"if {p!r} not in x:\n" + err(key, repr(f"{p!r} is a required property")) for p in val]
+                if body:
+                    out.append(_block("isinstance(x, dict)", body))
+            elif key == "additionalProperties":
+                props = self._const(frozenset(schema.get("properties") or {}))
+                if val is False:
+                    out.append(_block("isinstance(x, dict)", [
+                        f"extras = {{k for k in x if k not in {props}}}\n"
+                        "if extras:\n"
+                        + err(key, "'Additional properties are not allowed (%s %s unexpected)' % _extras_msg(extras)")]))
+                elif isinstance(val, dict):
+                    k = kids["ap"]
+                    out.append(_block("isinstance(x, dict)", [
+                        f"for extra in {{k for k in x if k not in {props}}}:\n"
+                        f"    yield from _err{k}(x[extra], path + (extra,), spath + ('additionalProperties',))"]))
+            elif key == "items":
+                k = kids["items"]
+                out.append(_block("isinstance(x, list)", [
+                    f"for i, v in enumerate(x):\n"
+                    f"    if not ({self.ok_expr(k, val, 'v')}):\n"
+                    f"        yield from _err{k}(v, path + (i,), spath + ('items',))"]))
+            elif key == "allOf":
+                for i in range(len(val)):
+                    out.append(f"    yield from _err{kids[f'all:{i}']}(x, path, spath + ('allOf', {i}))")
+            elif key == "if":
+                then, els = schema.get("then"), schema.get("else")
+                if then is None and els is None:
+                    continue
+                out.append(f"    if {self.ok_expr(kids['if'], val, 'x')}:")
+                out.append(f"        yield from _err{kids['then']}(x, path, spath + ('then',))"
+                           if then is not None else "        pass")
+                if els is not None:
+                    out.append(f"    else:\n        yield from _err{kids['else']}(x, path, spath + ('else',))")
+        if len(out) == 2:
+            out.append("    return\n    yield")
+        return "\n".join(out)
+
+
+def _block(cond: str, body: Iterable[str]) -> str:
+    """Indent body statements under `if cond:` (or at function level when cond is empty)."""
+    pad = "        " if cond else "    "
+    lines = [line for stmt in body for line in stmt.split("\n")]
+    text = "\n".join(pad + line for line in lines)
+    return f"    if {cond}:\n{text}" if cond else text
+
+
+def generate_source(schema: Dict[str, Any], source: str = "<schema>") -> str:
+    """Python source of a validator module for schema (see module docstring)."""
+    gen = _Codegen()
+    gen.node(schema, "_SCHEMA")
+    aliases = [f"_S{n} = {expr}" for n, expr in enumerate(gen.nodes)]
+    literal = pprint.pformat(schema, width=100, sort_dicts=False)
+    parts = [
+        f"# GENERATED by src/schema_codegen.py from {source} — do not edit.",
+        "# Regenerate with: python src/schema_codegen.py build",
+        "# flake8: noqa",
+        _PRELUDE,
+        f'SCHEMA_HASH = "{schema_hash(schema)}"',
+        "",
+        "_MISS = object()",
+        "",
+        f"_SCHEMA = {literal}",
+        "",
+        "\n".join(aliases),
+        "\n".join(f"{name} = {src}" for src, name in gen.consts.items()),
+        "",
+        "",
+        "\n\n\n".join(gen.funcs),
+        "",
+        "",
+        "def is_valid(x):",
+        "    return _ok0(x)",
+        "",
+        "",
+        "def iter_errors(x):",
+        "    if _ok0(x):",
+        "        return iter(())",
+        "    return _err0(x, (), ())",
+        "",
+    ]
+    return "\n".join(parts)
+
+
+def _schema_path(name: str) -> Path:
+    return SCHEMA_DIR / f"{name}.schema.json"
+
+
+def _load(name: str) -> Dict[str, Any]:
+    import json
+    return json.loads(_schema_path(name).read_bytes().decode("utf-8-sig"))
+
+
+def build(names: Sequence[str] = FAST_SCHEMAS, out_dir: Path = FAST_DIR) -> List[Path]:
+    """Write one generated module per schema name; returns the paths written."""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    written = []
+    for name in names:
+        src = generate_source(_load(name), f"schemas/{_schema_path(name).name}")
+        path = out_dir / f"{name}.py"
+        path.write_text(src, encoding="utf-8")
+        written.append(path)
+    return written
+
+
+def stale(names: Sequence[str] = FAST_SCHEMAS, out_dir: Path = FAST_DIR) -> List[str]:
+    """Schema names whose generated module is missing or differs from a fresh build."""
+    out = []
+    for name in names:
+        path = out_dir / f"{name}.py"
+        src = generate_source(_load(name), f"schemas/{_schema_path(name).name}")
+        if not path.exists() or path.read_text(encoding="utf-8") != src:
+            out.append(name)
+    return out
+
+
+if __name__ == "__main__":
+    cmd, names = (sys.argv[1:2] or ["build"])[0], tuple(sys.argv[2:]) or FAST_SCHEMAS
+    if cmd == "check":
+        bad = stale(names)
+        print("fast validators: " + (f"STALE {', '.join(bad)}" if bad else "up to date ✓"))
+        sys.exit(1 if bad else 0)
+    for p in build(names):
+        print(f"fast validators ✓ wrote {p}")
@@ -0,0 +1,295 @@
+# src/schema_registry.py
+# Shared, compiled JSON Schema validators.
+#
+# Call sites used to re-read a schema file and build a validator for every
+# record / pack / policy / event they checked. The registry does that once
+# per process:
+#
+#   from schema_registry import validate, iter_errors_many
+#   validate(record, "clarity_gain_record")          # raises jsonschema.ValidationError
+#   for i, err in iter_errors_many(records, "clarity_gain_record"): ...
+#
+# - schema_id: a bare name ("clarity_gain_record" -> schemas/clarity_gain_record.schema.json),
+#   a file name, or a path. Each id is resolved and compiled on first use;
+#   later calls are a dict lookup plus per-instance checking.
+# - Compiled validators are keyed by schema content hash, so copies of one
+#   schema under different paths share a validator.
+# - $refs to sibling schemas (by $id, file name or file URI) resolve through
+#   one registry of schemas/ built on first need.
+# - refresh() re-reads schema files whose size / mtime changed.
+# - checker(schema_id) prefers a generated validator module from
+#   src/fast_validators/ (see schema_codegen.py) when its SCHEMA_HASH matches
+#   the schema; validate / iter_errors_many use it to pass valid objects
+#   without walking the schema (ELENX_FAST_VALIDATORS=0 turns this off).
+#
+# jsonschema is imported on first compile (it dominates import time).
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import json
+import os
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Mapping, Tuple, Union
+
+ROOT = Path(__file__).resolve().parents[1]
+SCHEMA_DIR = ROOT / "schemas"
+FAST_DIR = ROOT / "src" / "fast_validators"
+FAST_VALIDATORS = os.getenv("ELENX_FAST_VALIDATORS", "1") != "0"
+
+SchemaId = Union[str, "os.PathLike[str]"]
+
+INLINE_MAXSIZE = 64  # validators kept for schema dicts passed in directly (for_schema)
+
+
+def schema_hash(schema: Mapping[str, Any]) -> str:
+    """Hash of the canonical JSON (key order / whitespace / BOM don't matter)."""
+    raw = json.dumps(schema, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+_HASH_RX = re.compile(r'^SCHEMA_HASH = "([0-9a-f]+)"$', re.M)
+
+
+class _Entry:
+    __slots__ = ("path", "stamp", "digest", "schema", "validator", "checker")
+
+    def __init__(self, path: Path, stamp: Tuple[int, int], digest: str, schema: Dict[str, Any],
+                 validator: Any, checker: Any):
+        self.path = path
+        self.stamp = stamp
+        self.digest = digest
+        self.schema = schema
+        self.validator = validator
+        self.checker = checker  # generated module or the validator; both have is_valid / iter_errors
+
+
+class SchemaRegistry:
+    """
+    Compiled validators by schema path + content hash.
+
+    - validator(schema_id): the compiled validator (jsonschema Validator)
+    - validate(obj, schema_id): raise the best-matching ValidationError, like jsonschema.validate
+    - iter_errors(obj, schema_id) / iter_errors_many(objs, schema_id)
+    - for_schema(schema): validator for an already-loaded schema dict
+    - checker(schema or schema_id): generated fast validator if current, else the validator
+    """
+
+    def __init__(self, schema_dir: Path = SCHEMA_DIR, fast_dir: Path = FAST_DIR, use_fast: bool = FAST_VALIDATORS):
+        self.schema_dir = Path(schema_dir)
+        self.fast_dir = Path(fast_dir)
+        self.use_fast = use_fast
+        self._fast: Dict[str, Any] = {}            # digest -> generated module
+        self._fast_files: Any = None               # digest -> generated file (read on first need)
+        self._by_id: Dict[Any, _Entry] = {}
+        self._by_path: Dict[Path, _Entry] = {}
+        self._by_digest: Dict[str, Any] = {}
+        self._inline: "OrderedDict[int, Tuple[Mapping[str, Any], Any, Any]]" = OrderedDict()
+        self._refs: Any = None
+        self._lock = threading.RLock()
+        self.compiles = 0
+
+    # ---------- lookup ----------
+
+    def resolve(self, schema_id: SchemaId) -> Path:
+        """Schema file for an id: a path as given, else a name under schema_dir."""
+        p = Path(schema_id)
+        if p.exists():
+            return p.resolve()
+        name = p.name if p.name.endswith(".json") else f"{p.name}.schema.json"
+        return (self.schema_dir / name).resolve()
+
+    def _entry(self, schema_id: SchemaId) -> _Entry:
+        try:
+            return self._by_id[schema_id]
+        except (KeyError, TypeError):
+            pass
+        with self._lock:
+            path = self.resolve(schema_id)
+            entry = self._by_path.get(path) or self._load(path)
+            try:
+                self._by_id[schema_id] = entry
+            except TypeError:  # unhashable id
+                pass
+            return entry
+
+    def _load(self, path: Path) -> _Entry:
+        st = path.stat()
+        schema = json.loads(path.read_bytes().decode("utf-8-sig"))
+        digest = schema_hash(schema)
+        validator = self._by_digest.get(digest)
+        if validator is None:
+            validator = self._by_digest[digest] = self._compile(schema)
+        checker = self._fast_module(digest) or validator
+        entry = self._by_path[path] = _Entry(path, (st.st_mtime_ns, st.st_size), digest, schema, validator, checker)
+        return entry
+
+    def validator(self, schema_id: SchemaId) -> Any:
+        return self._entry(schema_id).validator
+
+    def schema(self, schema_id: SchemaId) -> Dict[str, Any]:
+        return self._entry(schema_id).schema
+
+    def for_schema(self, schema: Mapping[str, Any]) -> Any:
+        """Validator for a schema dict; cached by identity (the dict is kept alive while cached)."""
+        return self._inline_entry(schema)[1]
+
+    def _inline_entry(self, schema: Mapping[str, Any]) -> Tuple[Mapping[str, Any], Any, Any]:
+        key = id(schema)
+        hit = self._inline.get(key)
+        if hit is not None and hit[0] is schema:
+            return hit
+        with self._lock:
+            digest = schema_hash(schema)
+            validator = self._by_digest.get(digest)
+            if validator is None:
+                validator = self._by_digest[digest] = self._compile(schema)
+            hit = self._inline[key] = (schema, validator, self._fast_module(digest) or validator)
+            while len(self._inline) > INLINE_MAXSIZE:
+                self._inline.popitem(last=False)
+            return hit
+
+    def checker(self, schema: Union[Mapping[str, Any], SchemaId]) -> Any:
+        """
+        Fastest current checker with is_valid(obj) / iter_errors(obj): the
+        generated module for this schema content if there is one, else the
+        compiled validator. Generated modules yield FastError (message, path,
+        schema_path, validator, validator_value, instance, schema).
+        """
+        if isinstance(schema, Mapping):
+            return self._inline_entry(schema)[2]
+        return self._entry(schema).checker
+
+    def _fast_module(self, digest: str) -> Any:
+        """Generated validator module whose SCHEMA_HASH is digest, or None."""
+        if not self.use_fast:
+            return None
+        if digest in self._fast:
+            return self._fast[digest]
+        if self._fast_files is None:
+            files: Dict[str, Path] = {}
+            for p in sorted(self.fast_dir.glob("*.py")) if self.fast_dir.is_dir() else ():
+                m = _HASH_RX.search(p.read_text(encoding="utf-8"))
+                if m:
+                    files[m.group(1)] = p
+            self._fast_files = files
+        path = self._fast_files.get(digest)
+        mod = None
+        if path is not None:
+            spec = importlib.util.spec_from_file_location(f"fast_validators.{path.stem}", path)
+            mod = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(mod)  # type: ignore[union-attr]
+        self._fast[digest] = mod
+        return mod
+
+    # ---------- checking ----------
+
+    def validate(self, obj: Any, schema_id: SchemaId) -> None:
+        entry = self._entry(schema_id)
+        if entry.checker.is_valid(obj):
+            return
+        from jsonschema.exceptions import best_match
+
+        error = best_match(entry.validator.iter_errors(obj))
+        if error is not None:
+            raise error
+
+    def iter_errors(self, obj: Any, schema_id: SchemaId) -> Iterator[Any]:
+        return self._entry(schema_id).validator.iter_errors(obj)
+
+    def iter_errors_many(self, objs: Iterable[Any], schema_id: SchemaId) -> Iterator[Tuple[int, Any]]:
+        """(index, error) for every error of every object; one validator lookup for the batch."""
+        entry = self._entry(schema_id)
+        ok, it = entry.checker.is_valid, entry.validator.iter_errors
+        for i, obj in enumerate(objs):
+            if ok(obj):
+                continue
+            for err in it(obj):
+                yield i, err
+
+    # ---------- compile / refresh ----------
+
+    def _compile(self, schema: Mapping[str, Any]) -> Any:
+        from jsonschema.validators import Draft7Validator, validator_for
+
+        cls = validator_for(schema, default=Draft7Validator)
+        cls.check_schema(schema)
+        self.compiles += 1
+        if "$ref" not in json.dumps(schema):
+            return cls(schema)
+        refs = self._ref_registry()
+        if refs is None:  # jsonschema < 4.18: RefResolver with the same store
+            from jsonschema import RefResolver
+
+            return cls(schema, resolver=RefResolver(base_uri=self.schema_dir.as_uri() + "/", referrer=schema,
+                                                    store=self._ref_store()))
+        return cls(schema, registry=refs)
+
+    def _ref_store(self) -> Dict[str, Any]:
+        """{uri: schema} for every schema file: by $id, file name and file URI."""
+        store: Dict[str, Any] = {}
+        for p in sorted(self.schema_dir.glob("*.json")):
+            try:
+                doc = json.loads(p.read_bytes().decode("utf-8-sig"))
+            except (OSError, ValueError):
+                continue
+            if not isinstance(doc, dict):
+                continue
+            for uri in (doc.get("$id"), p.name, p.resolve().as_uri()):
+                if isinstance(uri, str) and uri:
+                    store.setdefault(uri, doc)
+        return store
+
+    def _ref_registry(self) -> Any:
+        if self._refs is None:
+            try:
+                from referencing import Registry, Resource
+                from referencing.jsonschema import DRAFT7
+            except ImportError:
+                return None
+            resources = [(uri, Resource.from_contents(doc, default_specification=DRAFT7))
+                         for uri, doc in self._ref_store().items()]
+            self._refs = Registry().with_resources(resources).crawl()
+        return self._refs
+
+    def refresh(self) -> int:
+        """Recompile schemas whose file changed on disk; returns how many were reloaded."""
+        n = 0
+        with self._lock:
+            for path, old in list(self._by_path.items()):
+                try:
+                    st = path.stat()
+                except OSError:
+                    continue
+                if (st.st_mtime_ns, st.st_size) == old.stamp:
+                    continue
+                self._refs = None
+                new = self._load(path)
+                for k, v in list(self._by_id.items()):
+                    if v is old:
+                        self._by_id[k] = new
+                n += 1
+        return n
+
+    def stats(self) -> Dict[str, int]:
+        return {"schemas": len(self._by_path), "validators": len(self._by_digest),
+                "inline": len(self._inline), "compiles": self.compiles,
+                "fast": sum(1 for m in self._fast.values() if m is not None)}
+
+
+REGISTRY = SchemaRegistry()
+
+
+def get_validator(schema_id: SchemaId) -> Any:
+    return REGISTRY.validator(schema_id)
+
+
+def validate(obj: Any, schema_id: SchemaId) -> None:
+    REGISTRY.validate(obj, schema_id)
+
+
+def iter_errors_many(objs: Iterable[Any], schema_id: SchemaId) -> Iterator[Tuple[int, Any]]:
+    return REGISTRY.iter_errors_many(objs, schema_id)
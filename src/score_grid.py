@@ -0,0 +1,207 @@
+# src/score_grid.py
+# Ranked Mode × Principle distribution over every valid matrix cell.
+#
+# The detection cascade returns one pick (plus the second-order alternative).
+# Dashboards and nudges want the runner-up for every record, so the engine
+# also scores all (mode, principle) cells from the cue hits it already has:
+#
+#   evidence[c] = FLOOR
+#               + confidence of every detection rule that fired on c
+#               + LING_WEIGHT per linguistic cue hit of c's mode
+#               + PRIOR_WEIGHT per prior cue whose hint c's principle contains
+#               (+ base confidence on the default cell when no rule fired)
+#               + the detection's confidence on the picked cell
+#   score[c]    = evidence[c] · w_mode(mode) · w_principle(principle), sum-normalized
+#
+# The cascade's priority rules can pick a cell the cue tally alone would
+# rank lower; its weighted evidence is then raised to the best other cell's,
+# so the pick is always the argmax (winning ties) and the ranking is
+# consistent: top_k() is non-increasing and top_k(2)[1] is the runner-up.
+#
+# ScoreGrid resolves every cue to its (cell, amount) contributions once per
+# MatrixIndex (so learned weights and matrix swaps recompile it), so scoring
+# a request is one pass over its hits. CellScores is computed on first access.
+from __future__ import annotations
+
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, FrozenSet, Hashable, List, Mapping, Optional, Sequence, Tuple
+
+try:
+    from src.cue_scanner import CueHits
+    from src.decision_table import DecisionTable
+    from src.matrix_index import MatrixIndex
+except ImportError:  # imported with src/ on sys.path
+    from cue_scanner import CueHits
+    from decision_table import DecisionTable
+    from matrix_index import MatrixIndex
+
+SEED_PATH = Path(__file__).resolve().parents[1] / "data" / "mode_detector_seed.json"
+
+FLOOR = 0.01          # every cell is scored, so unscored cells still rank by learned weight
+LING_WEIGHT = 0.05    # per distinct linguistic cue hit, on every cell of the cue's mode
+PRIOR_WEIGHT = 0.05   # per prior cue hit, on cells whose principle contains the prior's hint
+
+Cell = Tuple[str, str]
+
+
+@lru_cache(maxsize=1)
+def seed_defaults() -> Tuple[int, float]:
+    """(top_k_modes, mixed_mode_margin) from data/mode_detector_seed.json (2, 0.15 if unreadable)."""
+    try:
+        with open(SEED_PATH, "r", encoding="utf-8-sig") as f:
+            d = json.load(f).get("defaults", {}) or {}
+        return int(d.get("top_k_modes", 2)), float(d.get("mixed_mode_margin", 0.15))
+    except (OSError, ValueError, TypeError, AttributeError):
+        return 2, 0.15
+
+
+class ScoreGrid:
+    """
+    Per-cue contributions to the cell vector, compiled against one MatrixIndex.
+
+    - cells: every valid (mode, principle), matrix order
+    - cell_weight: learned w_mode · w_principle per cell
+    """
+
+    def __init__(
+        self,
+        table: DecisionTable,
+        ling_cue_ids: Mapping[str, Sequence[Hashable]],
+        prior_hints: Mapping[Hashable, Sequence[str]],
+        weight: Callable[[str, str], float],
+    ):
+        mx: MatrixIndex = table.index
+        self.index = mx
+        self.cells: Tuple[Cell, ...] = tuple((m, p) for m in mx.modes for p in mx.principles[m])
+        pos = {c: i for i, c in enumerate(self.cells)}
+        self._pos = pos
+        self.cell_weight: Tuple[float, ...] = tuple(weight("mode", m) * weight("principle", p) for m, p in self.cells)
+
+        # linguistic cues count per mode (every cell of the mode gets the bonus)
+        modes = tuple(ling_cue_ids)
+        self._ling_mode: Dict[Hashable, int] = {cid: j for j, m in enumerate(modes) for cid in ling_cue_ids[m]}
+        self._n_modes = len(modes)
+        self._cell_mode: Tuple[int, ...] = tuple(modes.index(m) if m in modes else -1 for m, _ in self.cells)
+
+        # rule and prior cues add to individual cells
+        contrib: Dict[Hashable, List[Tuple[int, float]]] = {}
+        for cue, _update, m, p, conf in table.rows:
+            if (m, p) in pos:
+                contrib.setdefault(cue, []).append((pos[(m, p)], conf))
+        for cid, hints in prior_hints.items():
+            hs = [h.lower() for h in hints]
+            idx = [i for i, (_, p) in enumerate(self.cells) if any(h in p.lower() for h in hs)]
+            contrib.setdefault(cid, []).extend((i, PRIOR_WEIGHT) for i in idx)
+
+        self._contrib: Dict[Hashable, Tuple[Tuple[int, float], ...]] = {k: tuple(v) for k, v in contrib.items()}
+        self._rule_cues: FrozenSet[Hashable] = frozenset(table.cues)
+        self._default = pos.get(table.default)
+        self._base = table.base_confidence
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def position(self, mode: str, principle: str) -> Optional[int]:
+        return self._pos.get((mode, principle))
+
+    def score(self, hits: CueHits, pick: Optional[int] = None, confidence: float = 0.0) -> Tuple[float, ...]:
+        """Normalized cell scores for one request's cue hits (sums to 1); `pick` is the argmax."""
+        counts = [0] * (self._n_modes + 1)  # [-1]: cells of modes without linguistic cues
+        ling = self._ling_mode
+        for cid in hits:
+            j = ling.get(cid)
+            if j is not None:
+                counts[j] += 1
+        ev = [FLOOR + LING_WEIGHT * counts[j] for j in self._cell_mode]
+        for cid, parts in self._contrib.items():  # fixed order: float sums don't depend on set order
+            if cid in hits:
+                for i, amt in parts:
+                    ev[i] += amt
+        if self._default is not None and self._rule_cues.isdisjoint(hits):
+            ev[self._default] += self._base
+        if pick is not None:
+            ev[pick] += confidence
+        raw = [e * w for e, w in zip(ev, self.cell_weight)]
+        if pick is not None:
+            raw[pick] = max(raw)
+        total = sum(raw)
+        return tuple(x / total for x in raw) if total > 0 else tuple(raw)
+
+    def scores(self, hits: CueHits, pick: Optional[Cell] = None, confidence: float = 0.0) -> "CellScores":
+        return CellScores(self, hits, None if pick is None else self.position(*pick), confidence)
+
+
+class CellScores:
+    """
+    Lazy ranked distribution for one result.
+
+    - values: score per cell (cells order), computed on first access; the
+      grid is dropped then, and pickling sends only cells/pick/values
+    - top_k(k): [(mode, principle, score)] by score; the detection pick
+      (the argmax) first
+    - top_modes(k): [(mode, summed score)] by score, the pick's mode on ties
+    - mixed(): top-1 and top-2 cells within mixed_mode_margin
+    """
+
+    def __init__(self, grid: Optional[ScoreGrid], hits: CueHits, pick: Optional[int], confidence: float = 0.0):
+        self._grid = grid
+        self._hits = hits
+        self._confidence = confidence
+        self._cells: Tuple[Cell, ...] = grid.cells if grid is not None else ()
+        self._values: Optional[Tuple[float, ...]] = None
+        self.pick = pick
+
+    @classmethod
+    def _restore(cls, cells: Tuple[Cell, ...], pick: Optional[int], values: Tuple[float, ...]) -> "CellScores":
+        out = cls(None, frozenset(), pick)
+        out._cells, out._values = cells, values
+        return out
+
+    def __reduce__(self):
+        return CellScores._restore, (self._cells, self.pick, self.values)
+
+    @property
+    def values(self) -> Tuple[float, ...]:
+        if self._values is None:
+            self._values = self._grid.score(self._hits, self.pick, self._confidence)
+            self._grid = self._hits = None
+        return self._values
+
+    @property
+    def cells(self) -> Tuple[Cell, ...]:
+        return self._cells
+
+    def as_dict(self) -> Dict[Cell, float]:
+        return dict(zip(self._cells, self.values))
+
+    def top_k(self, k: Optional[int] = None) -> List[Tuple[str, str, float]]:
+        k = seed_defaults()[0] if k is None else k
+        if k <= 0:
+            return []
+        cells, v, pick = self._cells, self.values, self.pick
+        idx = sorted(range(len(v)), key=lambda i: (-v[i], i != pick))[:k]  # stable: other ties keep matrix order
+        return [(*cells[i], v[i]) for i in idx]
+
+    def top_modes(self, k: Optional[int] = None) -> List[Tuple[str, float]]:
+        k = seed_defaults()[0] if k is None else k
+        totals: Dict[str, float] = {}
+        for (m, _), x in zip(self._cells, self.values):
+            totals[m] = totals.get(m, 0.0) + x
+        first = self._cells[self.pick][0] if self.pick is not None else None
+        ranked = sorted(totals.items(), key=lambda kv: (-kv[1], kv[0] != first))
+        return ranked[:max(0, k)]
+
+    def mixed(self, margin: Optional[float] = None) -> bool:
+        margin = seed_defaults()[1] if margin is None else margin
+        top = self.top_k(2)
+        return len(top) > 1 and top[0][2] - top[1][2] < margin
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CellScores):
+            return NotImplemented
+        return self._cells == other._cells and self.pick == other.pick and self.values == other.values
+
+    def __repr__(self) -> str:
+        return f"CellScores(top={self.top_k()!r})"
@@ -0,0 +1,169 @@
+# src/stemmer.py
+# Light suffix-stripping stemmer and pre-stemmed cue lexicons.
+#
+# Cue regexes used to spell out inflections by hand (improv(e|ing|ement),
+# regret(s|ted|ting)?). Here a term is stemmed once when its lexicon is
+# built, text tokens are stemmed through a bounded memo (token -> stem), and
+# matching is set lookups (and phrase substring checks) on stems:
+#
+#   lex = StemLexicon({"growth:improve": ["improve"], "crit:2nd": ["second order", "second-order"]})
+#   lex.match(tokenize("we keep improving; second order effects"))
+#   -> frozenset({"growth:improve", "crit:2nd"})
+#
+# The stemmer is deliberately small (no dependency, ~Porter step 1 plus a few
+# derivational endings): it only has to map a word's common forms onto one
+# key, the same way for lexicon terms and text.
+from __future__ import annotations
+
+import os
+from functools import lru_cache
+from typing import Callable, Dict, FrozenSet, Hashable, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+
+try:
+    from src.text_features import tokenize
+except ImportError:  # imported with src/ on sys.path
+    from text_features import tokenize
+
+STEM_CACHE_SIZE = int(os.getenv("ELENX_STEM_CACHE_SIZE", "50000"))
+
+_VOWELS = frozenset("aeiouy")
+_NO_UNDOUBLE = frozenset("lsz")  # fall / miss / buzz keep their double letter
+# derivational endings, longest first; stripped only if >= 4 characters remain
+_DERIVATIONAL = ("ation", "ative", "ement", "ment", "ness", "ity", "ion", "ive", "ate", "ize", "ise")
+# words (as written, or once plural / verbal endings are off) the suffix rules
+# would fold onto an unrelated cue's stem: improvise -> improv (improve),
+# valid(ity) -> valid (validate), learn(ing) -> learn (learned)
+_EXCEPTIONS: Dict[str, str] = {
+    "learned": "learned",
+    "improvise": "improvis", "improvis": "improvis", "improvisation": "improvis",
+    "validate": "validat", "validation": "validat",
+}
+
+
+def _has_vowel(s: str) -> bool:
+    return any(c in _VOWELS for c in s)
+
+
+def _plural(w: str) -> str:
+    if w.endswith("sses"):
+        return w[:-2]
+    if w.endswith("ies") and len(w) > 4:
+        return w[:-3] + "y"
+    if w.endswith(("ses", "xes", "zes", "ches", "shes")):
+        w = w[:-2]  # biases -> bias, then the plain -s rule below
+    if len(w) > 3 and w.endswith("s") and not w.endswith(("ss", "us", "is", "ias")):
+        return w[:-1]
+    return w
+
+
+def _verbal(w: str) -> str:
+    for suf in ("ingly", "edly", "ing", "ed"):
+        if w.endswith(suf) and not w.endswith("eed"):
+            base = w[:-len(suf)]
+            if len(base) < 3 or not _has_vowel(base):
+                return w
+            if len(base) > 2 and base[-1] == base[-2] and base[-1] not in _VOWELS | _NO_UNDOUBLE:
+                return base[:-1]  # regretted -> regret
+            if base.endswith(("at", "bl", "iz")):
+                return base + "e"  # validated -> validate (-ate stripped next)
+            return base
+    return w
+
+
+def _derivational(w: str) -> str:
+    for _ in range(2):  # experimenting -> experiment -> experi
+        for suf in _DERIVATIONAL:
+            if w.endswith(suf) and len(w) - len(suf) >= 4:
+                w = w[:-len(suf)]
+                break
+        else:
+            break
+    return w
+
+
+def _stem_word(w: str) -> str:
+    if len(w) <= 3 or not w.isalpha():
+        return w
+    if w in _EXCEPTIONS:
+        return _EXCEPTIONS[w]
+    w = _verbal(_plural(w))
+    if w in _EXCEPTIONS:
+        return _EXCEPTIONS[w]
+    w = _derivational(w)
+    if len(w) > 4 and w.endswith("e"):
+        w = w[:-1]  # imagine / imagination -> imagin
+    return w
+
+
+@lru_cache(maxsize=STEM_CACHE_SIZE)
+def stem(token: str) -> str:
+    """Stem of a lowercase token (tokenize output); hyphenated tokens stem their last part."""
+    if token.endswith("'s"):
+        token = token[:-2]
+    head, sep, last = token.rpartition("-")
+    return head + sep + _stem_word(last)
+
+
+def stems(tokens: Iterable[str]) -> Tuple[str, ...]:
+    return tuple(stem(t) for t in tokens)
+
+
+def stem_cache_info():
+    """functools cache stats of the token -> stem memo (hits, misses, maxsize, currsize)."""
+    return stem.cache_info()
+
+
+class StemLexicon:
+    """
+    {cue_id: terms} compiled to stem keys. A term is one word or a phrase
+    (tokenized like the text); a cue hits if any of its terms occurs.
+
+    - stemmer=None matches exact tokens (no stemming)
+    - max_n: longest phrase, in tokens
+    """
+
+    def __init__(self, terms: Mapping[Hashable, Iterable[str]],
+                 stemmer: Optional[Callable[[str], str]] = stem):
+        self._stem = stemmer or (lambda t: t)
+        single: Dict[str, List[Hashable]] = {}
+        multi: Dict[Tuple[str, ...], List[Hashable]] = {}
+        self.max_n = 1
+        for cid, ts in terms.items():
+            for term in ts:
+                key = tuple(self._stem(t) for t in tokenize(term.lower()))
+                if not key:
+                    continue
+                if len(key) == 1:
+                    single.setdefault(key[0], []).append(cid)
+                else:
+                    multi.setdefault(key, []).append(cid)
+                    self.max_n = max(self.max_n, len(key))
+        self._single: Dict[str, Tuple[Hashable, ...]] = {k: tuple(dict.fromkeys(v)) for k, v in single.items()}
+        # phrases as " stem stem " needles into the space-joined stems (stems never contain spaces)
+        self._phrases: Tuple[Tuple[str, str, Tuple[Hashable, ...]], ...] = tuple(
+            (k[0], f" {' '.join(k)} ", tuple(dict.fromkeys(v))) for k, v in multi.items()
+        )
+        self._firsts: FrozenSet[str] = frozenset(k[0] for k in multi)
+        self.cue_ids: Tuple[Hashable, ...] = tuple(terms)
+
+    def stems(self, tokens: Iterable[str]) -> Tuple[str, ...]:
+        return tuple(map(self._stem, tokens))
+
+    def match(self, tokens: Sequence[str]) -> FrozenSet[Hashable]:
+        return frozenset(self.match_stems(self.stems(tokens)))
+
+    def match_stems(self, seq: Sequence[str], start: int = 0) -> Set[Hashable]:
+        """Cue ids with a term occurrence starting at seq[start:] (phrases may not run past the end)."""
+        hits: Set[Hashable] = set()
+        tail = seq[start:] if start else seq
+        present = set(tail)
+        single = self._single
+        for s in single.keys() & present:
+            hits.update(single[s])
+        firsts = self._firsts & present
+        if firsts:
+            joined = f" {' '.join(tail)} "
+            for first, needle, ids in self._phrases:
+                if first in firsts and needle in joined:
+                    hits.update(ids)
+        return hits
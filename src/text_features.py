@@ -0,0 +1,129 @@
+# src/text_features.py
+# Per-request text features shared by every ElenxEngine stage.
+#
+# The input is normalized once (NFKC, lowercase, typographic hyphens and
+# quotes folded to ASCII) and scanned once for cue hits; every stage then
+# reads this object instead of lowercasing/searching the text again.
+# Rule checks are set-membership tests on `hits`, so their cost does not
+# grow with the length of the text.
+from __future__ import annotations
+
+import re
+import unicodedata
+from functools import cached_property
+from typing import TYPE_CHECKING, Optional, Tuple
+
+try:
+    from src.cue_scanner import CueHits, CueScanner
+except ImportError:  # imported with src/ on sys.path
+    from cue_scanner import CueHits, CueScanner
+
+if TYPE_CHECKING:
+    from src.stemmer import StemLexicon
+
+# Applied after NFKC (which already maps U+2011 -> U+2010, NBSP -> space, fullwidth -> ASCII)
+_FOLD: Tuple[Tuple[str, str], ...] = (
+    ("\u2010", "-"),   # hyphen (NFKC form of the non-breaking hyphen U+2011)
+    ("\u2011", "-"),   # non-breaking hyphen
+    ("\u2012", "-"),   # figure dash
+    ("\u2212", "-"),   # minus sign
+    ("\u00ad", ""),    # soft hyphen
+    ("\u2018", "'"),
+    ("\u2019", "'"),
+    ("\u201c", '"'),
+    ("\u201d", '"'),
+)
+
+_TOKEN_RX = re.compile(r"[a-z0-9]+(?:['-][a-z0-9]+)*")
+
+
+def normalize_fragment(text: str) -> str:
+    """normalize_text without the strip (ASCII input skips NFKC)."""
+    if not text.isascii():
+        text = unicodedata.normalize("NFKC", text)
+        for src, dst in _FOLD:
+            if src in text:
+                text = text.replace(src, dst)
+    return text.lower()
+
+
+def normalize_text(text: Optional[str]) -> str:
+    """Stripped, Unicode-normalized, lowercased text."""
+    return normalize_fragment((text or "").strip())
+
+
+class IncrementalNormalizer:
+    """
+    normalize_text() of an append-only text, re-normalizing only the tail.
+
+    Text up to the last ASCII space/newline is settled: NFKC composition and
+    reordering, the fold table and str.lower()'s final-sigma rule never look
+    across such a space, so normalize(a + b) == normalize(a) + normalize(b)
+    whenever a ends with one.
+    """
+
+    def __init__(self) -> None:
+        self._raw = ""
+        self._k = 0            # raw[:k] is settled and ends with a space (or k == 0)
+        self._settled = ""     # normalize_fragment(raw[:k].lstrip())
+
+    @property
+    def raw(self) -> str:
+        return self._raw
+
+    def append(self, delta: str) -> str:
+        """Add delta; return normalize_text(raw)."""
+        self._raw += delta
+        k = self._k
+        body = self._raw[k:].rstrip()  # raw.strip() ends inside the tail
+        j = max(body.rfind(" "), body.rfind("\n"))
+        if j >= 0:  # settle through the last space before trailing non-whitespace
+            chunk = body[:j + 1]
+            if self._settled:
+                self._settled += normalize_fragment(chunk)
+            else:
+                self._settled = normalize_fragment(chunk.lstrip())
+            self._k = k + j + 1
+            body = body[j + 1:]
+        if not self._settled:
+            return normalize_fragment(body.lstrip())
+        return self._settled + normalize_fragment(body)
+
+
+def tokenize(norm_text: str) -> Tuple[str, ...]:
+    """Word tokens of normalized text; keeps intra-word hyphens/apostrophes ("co-founder", "i'm")."""
+    return tuple(_TOKEN_RX.findall(norm_text))
+
+
+class TextFeatures:
+    """
+    One request's view of the input.
+
+    - text: normalized lowercase text (normalize_text)
+    - hits: cue ids hit in `text` (one CueScanner pass)
+    - tokens: computed on first access
+    """
+
+    def __init__(self, text: str, hits: CueHits):
+        self.text = text
+        self.hits = hits
+
+    @classmethod
+    def build(cls, text: Optional[str], scanner: CueScanner,
+              lexicon: Optional["StemLexicon"] = None) -> "TextFeatures":
+        return cls.from_normalized(normalize_text(text), scanner, lexicon)
+
+    @classmethod
+    def from_normalized(cls, norm: str, scanner: CueScanner,
+                        lexicon: Optional["StemLexicon"] = None) -> "TextFeatures":
+        """Scanner hits plus (optionally) stem-lexicon hits on the tokens."""
+        feats = cls(norm, scanner.scan(norm))
+        if lexicon is not None:
+            lex_hits = lexicon.match(feats.tokens)
+            if lex_hits:
+                feats.hits = feats.hits | lex_hits
+        return feats
+
+    @cached_property
+    def tokens(self) -> Tuple[str, ...]:
+        return tokenize(self.text)
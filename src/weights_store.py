@@ -0,0 +1,124 @@
+# src/weights_store.py
+# L1 — Hot-reloadable learned weights.
+#
+# data/metrics/learned_weights.json is rewritten by scripts/update_weights.py.
+# WeightsStore watches the file by (inode, mtime_ns, size) from a daemon
+# thread and re-parses it off the request path. Each successful parse is
+# published as a new immutable WeightsSnapshot; readers just dereference
+# `store.snapshot` (a single attribute read — no locks, no per-request I/O).
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Mapping, Optional, Tuple
+
+Stamp = Tuple[int, int, int]  # (inode, mtime_ns, size)
+
+DEFAULT_POLL_S = 2.0
+
+
+def _freeze(obj: Any) -> Any:
+    if isinstance(obj, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(v) for v in obj)
+    return obj
+
+
+@dataclass(frozen=True)
+class WeightsSnapshot:
+    """One published version of the learned weights ({"mode","principle","empathy"})."""
+    version: int
+    weights: Mapping[str, Any]
+    stamp: Optional[Stamp] = None
+    loaded_at: float = 0.0
+
+
+class WeightsStore:
+    """
+    File-backed learned weights with atomic snapshot swap.
+
+    - check(): stat the file; re-parse and publish only if the stamp changed.
+      A file that fails to parse (e.g. mid-write) keeps the previous snapshot
+      and is retried on the next check.
+    - start(): background polling every poll_s seconds (idempotent; restarts
+      after fork, since threads do not survive it).
+    """
+
+    def __init__(self, path: Path, poll_s: float = DEFAULT_POLL_S):
+        self.path = Path(path)
+        self.poll_s = float(poll_s)
+        self._snapshot = WeightsSnapshot(version=0, weights=MappingProxyType({}))
+        self._reload_lock = threading.Lock()  # serializes writers only
+        self._thread: Optional[threading.Thread] = None
+        self._thread_pid: Optional[int] = None
+        self._stop = threading.Event()
+        self.check()
+
+    @property
+    def snapshot(self) -> WeightsSnapshot:
+        return self._snapshot
+
+    def _stat(self) -> Optional[Stamp]:
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return st.st_ino, st.st_mtime_ns, st.st_size
+
+    def publish(self, weights: Mapping[str, Any], stamp: Optional[Stamp] = None) -> WeightsSnapshot:
+        """Swap in a new snapshot (used by check(); also handy for in-process updates)."""
+        with self._reload_lock:
+            snap = WeightsSnapshot(
+                version=self._snapshot.version + 1,
+                weights=_freeze(dict(weights or {})),
+                stamp=stamp,
+                loaded_at=time.time(),
+            )
+            self._snapshot = snap
+        return snap
+
+    def check(self) -> bool:
+        """Reload if the file changed since the current snapshot. Returns True on swap."""
+        stamp = self._stat()
+        if stamp is None or stamp == self._snapshot.stamp:
+            return False
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                weights = json.load(f).get("weights", {})
+        except Exception:
+            return False
+        if not isinstance(weights, dict):
+            weights = {}
+        self.publish(weights, stamp=stamp)
+        return True
+
+    def start(self) -> None:
+        pid = os.getpid()
+        if self._thread is not None and self._thread_pid == pid and self._thread.is_alive():
+            return
+        if self._thread_pid is not None and self._thread_pid != pid:
+            self._reload_lock = threading.Lock()  # may have been held at fork time
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="elenx-weights-watch", daemon=True)
+        self._thread_pid = pid
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        t = self._thread
+        if t is not None and t.is_alive() and self._thread_pid == os.getpid():
+            t.join(timeout=self.poll_s + 1.0)
+        self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.poll_s):
+            try:
+                self.check()
+            except Exception:
+                pass  # never let the watcher die on a transient error
@@ -0,0 +1,53 @@
+from src import elenx_engine as EE
+from src.elenx_loader import load_packs
+from src.result_cache import ResultCache
+
+TEXT = "My co-founder and I disagree; the board wants a decision and I'm unsure what to do next."
+
+
+def test_generous_deadline_matches_plain_analyze():
+    eng = EE.ElenxEngine(load_packs())
+    plain, plain_qs = eng.analyze(TEXT)
+    assert plain.degraded is False and plain.stages is None
+
+    det, qs = eng.analyze(TEXT, deadline_ms=10_000)
+    assert qs == plain_qs
+    assert (det.mode, det.principle, det.confidence, det.tags) == (plain.mode, plain.principle, plain.confidence, plain.tags)
+    assert det.degraded is False
+    assert det.stages == dict.fromkeys(EE.STAGES, "ok")
+
+
+def test_spent_budget_returns_degraded_defaults(monkeypatch):
+    eng = EE.ElenxEngine(load_packs())
+    det, qs = eng.analyze(TEXT, deadline_ms=0)
+    assert det.degraded and qs == []
+    assert det.stages == dict.fromkeys(EE.STAGES, "skipped")
+    assert (det.mode, det.principle, det.confidence) == (eng._default_mode, eng._default_principle, 0.0)
+    assert det.tags == {"contexts": (), "fallacies": ()}
+
+    # budget runs out after rule detection: keep the detected pick, skip the rest
+    clock = iter([0.0, 0.0, 0.0, 0.0, 1.0, 1.0])
+    monkeypatch.setattr(EE.time, "perf_counter", lambda: next(clock))
+    det, qs = eng.analyze(TEXT, deadline_ms=500)
+    assert det.stages == {"features": "ok", "priors": "ok", "rules": "ok", "contexts": "skipped", "render": "skipped"}
+    assert det.mode == "Critical" and det.degraded and qs == []
+
+
+def test_degraded_results_are_not_cached():
+    cache = ResultCache(maxsize=8)
+    eng = EE.ElenxEngine(load_packs(), result_cache=cache)
+    eng.analyze(TEXT, deadline_ms=0)
+    assert len(cache) == 0
+    det, _ = eng.analyze(TEXT, deadline_ms=10_000)
+    assert len(cache) == 1 and det.stages == dict.fromkeys(EE.STAGES, "ok")
+    det, _ = eng.analyze(TEXT)
+    assert det.stages is None and not det.degraded
+
+
+def test_long_input_is_truncated():
+    eng = EE.ElenxEngine(load_packs())
+    eng.cfg["MAX_INPUT_CHARS"] = 100
+    det, qs = eng.analyze("What to do next? " + "x" * 200 + " I regret it.")
+    assert det.degraded and det.stages["input"] == "truncated"
+    assert det.mode == "Analytical" and qs  # the regret cue was cut off; everything else ran
+    assert eng.analyze("What to do next?")[0].stages is None
@@ -0,0 +1,170 @@
+import datetime as dt
+import importlib.util
+import json
+import multiprocessing as mp
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+import clarity_log_shards as LS  # noqa: E402
+import clarity_logger as CL  # noqa: E402
+from aggregator import Aggregator  # noqa: E402
+from clarity_log_store import LogStore, SegmentAppender  # noqa: E402
+
+MONTH = dt.datetime.now().strftime("%Y%m")
+
+
+def _record(sid, ts):
+    return {
+        "session_id": sid, "user_text": "x", "timestamp": ts,
+        "judgment_landing": {"type": "position", "statement": "We ship the smaller scope first.",
+                             "confidence": 0.7, "acknowledged": True},
+        "detected": {"mode": "Critical"},
+        "cg_pre": 0.2, "cg_post": 0.6, "cg_delta": 0.4,
+    }
+
+
+def _worker(logs_dir, wid, n):
+    for i in range(n):
+        CL.log_record(_record(f"w{wid}-{i}", dt.datetime.now(dt.timezone.utc).isoformat()), logs_dir, shard=True)
+
+
+def _lines(path):
+    return [json.loads(s) for s in Path(path).read_text(encoding="utf-8-sig").splitlines() if s.strip()]
+
+
+def _load_script(name):
+    spec = importlib.util.spec_from_file_location(f"_script_{name}", ROOT / "scripts" / f"{name}.py")
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+@pytest.mark.skipif(LS.fcntl is None, reason="merge-while-writing needs flock")
+def test_workers_shard_and_concurrent_merges_lose_nothing(tmp_path):
+    logs = str(tmp_path)
+    procs = [mp.get_context("fork").Process(target=_worker, args=(logs, w, 300)) for w in range(4)]
+    for p in procs:
+        p.start()
+    merges = 0
+    while any(p.is_alive() for p in procs):
+        merges += sum(v > 0 for v in LS.merge_shards(logs, fsync=False).values())
+    for p in procs:
+        p.join()
+        assert p.exitcode == 0
+    LS.merge_shards(logs)
+
+    assert LS.month_files(logs, MONTH) == [os.path.join(logs, LS.canonical_name(MONTH))]
+    recs = _lines(LS.month_files(logs, MONTH)[0])
+    assert sorted(r["session_id"] for r in recs) == sorted(f"w{w}-{i}" for w in range(4) for i in range(300))
+    assert merges >= 1
+
+
+def test_merge_appends_time_ordered_batches_to_the_segment(tmp_path):
+    logs = str(tmp_path)
+    seg = os.path.join(logs, LS.canonical_name("202601"))
+    for sid, ts in (("a", "2026-01-01T00:00:01Z"), ("c", "2026-01-01T00:00:03Z")):
+        with open(seg, "a", encoding="utf-8-sig") as f:
+            f.write(json.dumps(_record(sid, ts)) + "\n")
+    LS.append_line(os.path.join(logs, "clarity_gain_202601.w7.jsonl"),
+                   (json.dumps(_record("b", "2026-01-01T01:00:02+01:00")) + "\n" +
+                    json.dumps(_record("d", "2026-01-01 00:00:04")) + "\n").encode())
+    LS.append_line(os.path.join(logs, "clarity_gain_202601.w9.jsonl"),
+                   (json.dumps(_record("e", "not a time")) + "\n").encode())
+
+    assert [os.path.basename(f) for f in LS.log_files(logs)] == [
+        "clarity_gain_202601.jsonl", "clarity_gain_202601.w7.jsonl", "clarity_gain_202601.w9.jsonl"]
+    assert LS.merge_shards(logs) == {"202601": 3}
+    raw = Path(seg).read_bytes()
+    assert raw.count(b"\xef\xbb\xbf") == 1 and raw.startswith(b"\xef\xbb\xbf")
+    assert [r["session_id"] for r in _lines(seg)] == ["a", "c", "e", "b", "d"]
+    assert LS.merge_shards(logs) == {}
+
+
+def test_merge_never_loses_lines_of_an_open_segment_writer(tmp_path):
+    logs = str(tmp_path)
+    month_path = os.path.join(logs, LS.canonical_name("202601"))
+    app = SegmentAppender(keep_open=True)  # as the non-shard ClarityLogWriter holds it
+
+    def line(sid):
+        rec = _record(sid, "2026-01-02T00:00:00Z")
+        return (json.dumps(rec) + "\n").encode(), LS.record_meta(rec)
+
+    app.write(month_path, [line("A")])
+    LS.append_line(os.path.join(logs, "clarity_gain_202601.w7.jsonl"), line("B")[0])
+    assert LS.merge_shards(logs) == {"202601": 1}
+    app.write(month_path, [line("C")])
+    app.close()
+
+    assert [r["session_id"] for r in _lines(month_path)] == ["A", "B", "C"]
+    store = LogStore(logs)
+    assert [r["session_id"] for sid in "ABC" for r in store.get(sid)] == ["A", "B", "C"]
+    assert store.stats["scanned_bytes"] == 0  # every sidecar offset points at its own line
+
+
+def test_merge_rolls_segments_and_writes_only_the_new_tail(tmp_path):
+    logs = str(tmp_path)
+    shard = os.path.join(logs, "clarity_gain_202601.w7.jsonl")
+
+    def fill(lo, hi):
+        for i in range(lo, hi):
+            LS.append_line(shard, (json.dumps(_record(f"s{i}", f"2026-01-02T00:00:{i:02d}Z")) + "\n").encode())
+
+    fill(0, 20)
+    assert LS.merge_shards(logs, max_bytes=3000) == {"202601": 20}
+    first = {s: (os.stat(s).st_ino, Path(s).read_bytes()) for s in LS.month_segments(logs, "202601")}
+    fill(20, 40)
+    assert LS.merge_shards(logs, max_bytes=3000) == {"202601": 20}
+    segs = LS.month_segments(logs, "202601")
+    assert len(segs) > 3 and all(os.path.getsize(s) <= 3000 for s in segs)
+    assert [r["session_id"] for s in segs for r in _lines(s)] == [f"s{i}" for i in range(40)]
+    for s, (ino, data) in first.items():  # earlier segments are only ever appended to
+        assert os.stat(s).st_ino == ino and Path(s).read_bytes().startswith(data)
+
+
+def test_retried_merge_appends_a_crashed_merges_lines_once(tmp_path):
+    logs = str(tmp_path)
+    shard = os.path.join(logs, "clarity_gain_202601.w7.jsonl")
+    LS.append_line(shard, (json.dumps(_record("first", "2026-01-02T00:00:00Z")) + "\n").encode())
+    LS.merge_shards(logs)
+
+    # a merge that appended but died before unlinking its shard: the retry appends only what is new
+    LS.append_line(shard, (json.dumps(_record("late", "2026-01-02T00:01:00Z")) + "\n").encode())
+    taken = LS._take(shard)
+    crashed = Path(taken).read_bytes()
+    LS.merge_month(logs, "202601")
+    Path(taken).write_bytes(crashed + (json.dumps(_record("more", "2026-01-02T00:02:00Z")) + "\n").encode())
+    assert LS.merge_shards(logs) == {"202601": 1}
+    ids = [r["session_id"] for s in LS.month_segments(logs, "202601") for r in _lines(s)]
+    assert ids == ["first", "late", "more"]
+
+
+def test_readers_see_segment_plus_shards(tmp_path, monkeypatch):
+    logs = tmp_path / "data" / "logs"
+    logs.mkdir(parents=True)
+    CL.log_record(_record("seg", "2026-01-05T10:00:00Z"), str(logs))
+    with CL.ClarityLogWriter(str(logs), shard=True) as w:
+        w.log(_record("shard", "2026-01-05T11:00:00Z"))
+    seg = CL.segment_path(str(logs))
+    assert len(LS.month_files(str(logs), MONTH)) == 2
+
+    agg = Aggregator([seg])
+    assert agg.load() == 2  # BOM line of the segment included
+
+    am = _load_script("aggregate_metrics")
+    monkeypatch.setattr(am, "LOG_DIR", logs)
+    recs, paths = am.load_records()
+    assert len(recs) == 2 and len(paths) == 2
+
+    monkeypatch.chdir(tmp_path)
+    _load_script("check_log_contract").main()  # exits non-zero on a contract violation
+
+    LS.merge_shards(str(logs))
+    assert Aggregator([seg]).load() == 2
+    assert len(am.load_records()[0]) == 2
+    # a shard path recorded before the merge still reads the whole month
+    assert Aggregator([LS.shard_path(str(logs))]).load() == 2
@@ -0,0 +1,124 @@
+import datetime as dt
+import json
+import os
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+import clarity_log_shards as LS  # noqa: E402
+import clarity_logger as CL  # noqa: E402
+from clarity_log_store import LogStore  # noqa: E402
+
+T0 = dt.datetime(2026, 1, 1, tzinfo=dt.timezone.utc)
+
+
+def _record(i, did=None):
+    rec = {
+        "session_id": f"S-{i}", "user_text": "padding " * 20,
+        "timestamp": (T0 + dt.timedelta(minutes=20 * i)).isoformat(),
+        "judgment_landing": {"type": "position", "statement": "We ship the smaller scope first.",
+                             "confidence": 0.7, "acknowledged": True},
+        "detected": {"mode": "Critical"},
+    }
+    if did:
+        rec["did"] = did
+    return rec
+
+
+def _segments(logs):
+    return [f for f in LS.log_files(str(logs)) if LS.parse_log_name(f).pid is None]
+
+
+def test_segments_are_capped_and_indexed(tmp_path, monkeypatch):
+    monkeypatch.setattr(CL._SEGMENTS, "max_bytes", 4000)
+    paths = [CL.log_record(_record(i, did=f"d{i % 3}"), str(tmp_path)) for i in range(40)]
+    segs = _segments(tmp_path)
+    assert len(segs) > 3 and sorted(set(paths), key=segs.index) == segs
+    assert all(os.path.getsize(s) <= 4000 for s in segs)
+    assert LS.parse_log_name(segs[1]).seq == 2 and segs[1].endswith(".s2.jsonl")
+    for s in segs:
+        header = json.loads(Path(LS.index_path(s)).read_text().splitlines()[0])
+        assert header["ino"] == os.stat(s).st_ino
+
+    store = LogStore(str(tmp_path))
+    rec = store.get("S-17")
+    assert [r["session_id"] for r in rec] == ["S-17"]
+    assert store.stats["scanned_bytes"] == 0  # everything came from the sidecars
+    one_line = len(json.dumps(rec[0], ensure_ascii=False).encode()) + 1
+    assert store.stats["read_bytes"] == one_line
+    assert [r["session_id"] for r in store.get_did("d1")] == [f"S-{i}" for i in range(40) if i % 3 == 1]
+    assert store.get("nope") == []
+
+
+def test_range_reads_only_matching_buckets(tmp_path):
+    for i in range(60):  # 20 hours of records, three per hour
+        CL.log_record(_record(i), str(tmp_path))
+    total = sum(os.path.getsize(s) for s in _segments(tmp_path))
+
+    store = LogStore(str(tmp_path))
+    t0, t1 = T0 + dt.timedelta(hours=5, minutes=10), T0 + dt.timedelta(hours=7)
+    got = [r["session_id"] for r in store.range(t0, t1)]
+    want = [f"S-{i}" for i in range(60) if t0 <= T0 + dt.timedelta(minutes=20 * i) < t1]
+    assert got == want == ["S-16", "S-17", "S-18", "S-19", "S-20"]
+    assert store.stats["read_bytes"] < total / 5
+    assert list(store.range(t1, t0)) == []
+    assert len(list(store.range(T0.timestamp(), (T0 + dt.timedelta(days=1)).timestamp()))) == 60
+
+
+def test_unindexed_tails_shards_and_merges(tmp_path):
+    logs = str(tmp_path)
+    for i in range(5):
+        CL.log_record(_record(i), logs)
+    seg = _segments(tmp_path)[0]
+    store = LogStore(logs)
+    assert len(store.get("S-1")) == 1
+
+    # a record whose index line never made it (crash), one in a worker shard, one new indexed record
+    with open(seg, "ab") as f:
+        f.write((json.dumps(_record(100)) + "\n").encode())
+    CL.log_record(_record(101), logs, shard=True)
+    CL.log_record(_record(102), logs)
+    scanned = store.stats["scanned_bytes"]
+    assert [len(store.get(f"S-{i}")) for i in (100, 101, 102)] == [1, 1, 1]
+    assert 0 < store.stats["scanned_bytes"] - scanned < 3 * os.path.getsize(LS.shard_path(logs))
+
+    # merge appends the shard with sidecar lines; a new store only scans the crashed line
+    LS.merge_shards(logs)
+    fresh = LogStore(logs)
+    assert sorted(r["session_id"] for r in fresh.range(T0, T0 + dt.timedelta(days=30))) == \
+        sorted([f"S-{i}" for i in range(5)] + ["S-100", "S-101", "S-102"])
+    assert fresh.stats["scanned_bytes"] == len(json.dumps(_record(100))) + 1
+    assert len(store.get("S-101")) == 1  # the old store follows the shard into the segment
+
+
+def test_writer_rolls_segments_and_store_sees_everything(tmp_path):
+    with CL.ClarityLogWriter(str(tmp_path), batch_size=4) as w:
+        w._segments.max_bytes = 3000
+        for i in range(30):
+            w.log(_record(i))
+    assert len(_segments(tmp_path)) > 1
+    store = LogStore(str(tmp_path))
+    assert [r["session_id"] for i in range(30) for r in store.get(f"S-{i}")] == [f"S-{i}" for i in range(30)]
+    assert store.stats["scanned_bytes"] == 0
+
+
+def test_legacy_month_gets_a_backfilled_sidecar(tmp_path):
+    logs = str(tmp_path)
+    seg = CL.segment_path(logs)
+    with open(seg, "w", encoding="utf-8-sig") as f:  # a monthly log from before segments
+        for i in range(3):
+            f.write(json.dumps(_record(i)) + "\n")
+    idx = LS.index_path(seg)
+    for stale in (None, b"", b'[3,10,null,"S-0",null]\n'):  # no sidecar, empty, headerless
+        if stale is None:
+            assert not os.path.exists(idx)
+        else:
+            Path(idx).write_bytes(stale)
+        CL.log_record(_record(10 + len(stale or b"")), logs)
+        assert json.loads(Path(idx).read_text().splitlines()[0])["ino"] == os.stat(seg).st_ino
+
+    store = LogStore(logs)
+    assert [r["session_id"] for r in store.get("S-1")] == ["S-1"]
+    assert len(list(store.range(T0, T0 + dt.timedelta(days=30)))) == 6
+    assert store.stats["scanned_bytes"] == 0
@@ -0,0 +1,126 @@
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+import clarity_logger as CL  # noqa: E402
+
+
+def _record(i):
+    return {
+        "session_id": f"S-{i}",
+        "user_text": f"text {i} — ünïcode",
+        "judgment_landing": {"type": "position", "statement": "We ship the smaller scope first.",
+                             "confidence": 0.7, "acknowledged": True},
+        "detected": {"mode": "Critical"},
+        "timestamp": "2026-01-01T00:00:00Z",
+    }
+
+
+def test_writer_output_matches_log_record(tmp_path):
+    sync_dir, async_dir = tmp_path / "sync", tmp_path / "async"
+    for i in range(5):
+        CL.log_record(_record(i), str(sync_dir))
+    with CL.ClarityLogWriter(str(async_dir), batch_size=2) as w:
+        paths = {w.log(_record(i)) for i in range(5)}
+    assert paths == {CL.segment_path(str(async_dir))}
+
+    seg = Path(CL.segment_path(str(sync_dir))).name
+    a, b = (sync_dir / seg).read_bytes(), (async_dir / seg).read_bytes()
+    assert b.startswith(b"\xef\xbb\xbf") and b.count(b"\xef\xbb\xbf") == 1
+    # the judgment terminal state timestamps differ; everything else is byte-identical
+    strip = lambda raw: [dict(r, detected={k: v for k, v in r["detected"].items() if k != "judgment_terminal_state"})
+                         for r in map(json.loads, raw.decode("utf-8-sig").splitlines())]
+    assert strip(a) == strip(b)
+    assert [r["session_id"] for r in strip(b)] == [f"S-{i}" for i in range(5)]
+
+
+def test_gate_stays_synchronous_and_closed_writer_refuses(tmp_path):
+    w = CL.ClarityLogWriter(str(tmp_path))
+    bad = _record(0)
+    bad["judgment_landing"]["acknowledged"] = False
+    with pytest.raises(CL.JudgmentLandingError):
+        w.log(bad)
+    w.log(_record(1))
+    w.flush()
+    assert w.stats["logged"] == w.stats["written"] == 1
+    w.close()
+    w.close()  # idempotent
+    with pytest.raises(CL.ClarityLogWriterError):
+        w.log(_record(2))
+
+
+def test_backpressure_and_group_commit(tmp_path):
+    gate = threading.Event()
+    w = CL.ClarityLogWriter(str(tmp_path), durability="fsync", every_n=4, max_queue=2, batch_size=2,
+                            put_timeout=0.05)
+    real_write = w._write
+    w._write = lambda path, lines: (gate.wait(), real_write(path, lines))
+    try:
+        with pytest.raises(CL.ClarityLogWriterError, match="queue full"):
+            for i in range(10):
+                w.log(_record(i))
+        assert w.stats["waits"] >= 1
+    finally:
+        gate.set()
+        w.close()
+    lines = Path(CL.segment_path(str(tmp_path))).read_text(encoding="utf-8-sig").splitlines()
+    assert len(lines) == w.stats["written"] == w.stats["logged"]
+    assert w.stats["syncs"] < w.stats["written"]
+
+
+def test_bad_durability_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        CL.ClarityLogWriter(str(tmp_path), durability="sometimes")
+
+
+def test_time_based_sync_without_new_records(tmp_path):
+    with CL.ClarityLogWriter(str(tmp_path), every_n=0, every_ms=20) as w:
+        w.log(_record(0))
+        deadline = time.monotonic() + 5
+        while w.stats["syncs"] == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert w.stats["syncs"] == 1
+        assert Path(CL.segment_path(str(tmp_path))).read_text(encoding="utf-8-sig").count("\n") == 1
+
+
+def _lines_in(path):
+    p = Path(path)
+    return p.read_text(encoding="utf-8-sig").count("\n") if p.exists() else 0
+
+
+def _settle(w, batches):
+    deadline = time.monotonic() + 5
+    while w.stats["batches"] < batches and time.monotonic() < deadline:
+        time.sleep(0.005)
+    time.sleep(0.02)
+
+
+@pytest.mark.parametrize("durability, every_n, held_at_2", [("none", 1, True), ("flush", 3, True), ("fsync", 3, False)])
+def test_durability_policies_differ(tmp_path, durability, every_n, held_at_2):
+    seg = CL.segment_path(str(tmp_path))
+    with CL.ClarityLogWriter(str(tmp_path), durability=durability, every_n=every_n, batch_size=3) as w:
+        for i in range(2):
+            w.log(_record(i))
+            _settle(w, i + 1)
+        assert _lines_in(seg) == (0 if held_at_2 else 2)
+        w.log(_record(2))
+        _settle(w, 3)
+        assert _lines_in(seg) == 3  # batch_size ("none") / every_n ("flush", "fsync") reached
+        assert w.stats["syncs"] == {"none": 0, "flush": 1, "fsync": 1}[durability]
+        w.log(_record(3))
+        w.flush()
+        assert _lines_in(seg) == 4
+
+
+def test_shard_writes_sync_on_every_n(tmp_path, monkeypatch):
+    synced = []
+    monkeypatch.setattr(CL, "_fsync_path", synced.append)
+    with CL.ClarityLogWriter(str(tmp_path), shard=True, durability="fsync", every_n=3, batch_size=1) as w:
+        for i in range(6):
+            w.log(_record(i))
+    assert w.stats["written"] == 6 and w.stats["syncs"] == len(synced) == 2
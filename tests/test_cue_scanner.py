@@ -0,0 +1,44 @@
+import re
+
+from src.cue_scanner import CueScanner
+from src import elenx_engine as EE
+
+
+def _expected(cues, text):
+    return {cid for cid, pat in cues.items() if re.search(pat, text)}
+
+
+def test_scanner_matches_per_pattern_search_on_overlaps_and_boundaries():
+    cues = {
+        "idea_plural": r"\bidea(s)?\b",
+        "idea_or_whatif": r"\b(idea|what if)\b",
+        "whatif": r"\bwhat if\b",
+        "validate_quirk": r"\bvalidate|validation\b",
+        "team_substring": "team",
+        "team_word": r"\bteam\b",
+        "lookbehind": r"(?<=my )plan",
+    }
+    sc = CueScanner(cues)
+    for text in [
+        "an idea, what if?",
+        "ideas only",
+        "steam invalidation",
+        "my plan for the team",
+        "validated",
+        "",
+    ]:
+        assert set(sc.scan(text)) == _expected(cues, text), text
+
+
+def test_engine_scanner_matches_every_engine_cue_table():
+    cues = {}
+    for table in (EE.PRIOR_CUES, EE.RULE_CUES, EE.FALLACY_CUES, EE.CONTEXT_CUES):
+        cues.update(table)
+
+    text = (
+        "My co-founder and I keep a habit of second-order thinking; "
+        "trade-offs, tradeoff data and a prototype, what if we rush the deadline?"
+    ).lower()
+    ling = {"ling:Growth:0", "ling:Critical:3", "ling:Analytical:3", "ling:Analytical:9",
+            "ling:Creative:7", "ling:Creative:5"}
+    assert set(EE.scan_cues(text)) == _expected(cues, text) | ling
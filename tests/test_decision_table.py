@@ -0,0 +1,68 @@
+import pytest
+
+from src import elenx_engine as EE
+from src.decision_table import RuleSet, compile_rules, default_rules
+from src.elenx_loader import load_packs
+from src.matrix_index import MatrixIndex
+from src.weights_store import WeightsStore
+
+MATRIX = {
+    "Analytical": {"Evidence & Validation": "q-ev", "Assumption": "q-as"},
+    "Critical": {"Second-Order Effects": "q-so", "Stakeholder Map": "q-st"},
+    "Growth": {"Iteration": "q-it"},
+}
+
+
+def _index(weights=None):
+    weights = weights or {}
+    return MatrixIndex.build(MATRIX, preferred_modes=["Analytical", "Critical"],
+                             principle_weight=lambda p: weights.get(p, 1.0))
+
+
+def test_default_pack_resolves_hints_once_against_the_matrix():
+    table = compile_rules(default_rules(), _index())
+    rows = {cue: (m, p, conf) for cue, _, m, p, conf in table.rows}
+    assert rows["rule:critical"] == ("Critical", "Stakeholder Map", 0.64)  # preferred over "Second"
+    assert rows["rule:evidence"] == ("Analytical", "Evidence & Validation", 0.62)
+    assert rows["rule:creative"][:2] == ("Analytical", "Evidence & Validation")  # no Creative mode: defaults
+
+    assert table.decide(frozenset()) == ("Analytical", "Evidence & Validation", 0.55,
+                                         {"alt_mode": None, "alt_principle": None, "alt_confidence": None})
+    mode, principle, conf, alt = table.decide(frozenset({"rule:critical", "rule:next_step", "rule:second_order"}))
+    assert (mode, principle, conf) == ("Critical", "Stakeholder Map", 0.64)  # next_step only fires below 0.60
+    assert alt == {"alt_mode": "Critical", "alt_principle": "Second-Order Effects", "alt_confidence": 0.48}
+    assert table.decide(frozenset({"rule:critical", "rule:growth"}))[:3] == ("Growth", "Iteration", 0.64)
+
+
+def test_fallback_ranked_vs_first():
+    rules = RuleSet.from_pack({"rules": [
+        {"id": "a", "cue": "a", "mode": "Analytical", "principles": ["Nope"], "confidence": 0.6, "update": "max"},
+        {"id": "b", "cue": "b", "mode": "Analytical", "principles": ["Nope"], "fallback": "first",
+         "confidence": 0.6, "update": "max"},
+    ]})
+    table = compile_rules(rules, _index({"Assumption": 2.0}))
+    assert [r[2:4] for r in table.rows] == [("Analytical", "Assumption"), ("Analytical", "Evidence & Validation")]
+
+    with pytest.raises(ValueError):
+        RuleSet.from_pack({"rules": [{"id": "x", "cue": "x", "mode": "M", "confidence": 1, "update": "sometimes"}]})
+
+
+def test_engine_uses_pack_rules_and_recompiles_on_weight_reload(monkeypatch):
+    packs = load_packs()
+    rules = packs["detection_rules"][0]
+    custom = dict(rules, rules=rules["rules"] + [
+        {"id": "budget", "cue": "rule:budget", "pattern": r"\bbudget\b", "mode": "Growth",
+         "principles": ["Iteration"], "confidence": 0.7, "update": "max"},
+    ])
+    eng = EE.ElenxEngine(dict(packs, detection_rules=custom))
+    det, _ = eng.analyze("We blew the budget again.")
+    assert (det.mode, det.principle, det.confidence) == ("Growth", "Iteration", 0.7)
+    assert eng.analyze("We blew the budget again.")[0] == det
+    assert EE.ElenxEngine(packs).analyze("We blew the budget again.")[0].mode != "Growth"
+
+    store = WeightsStore(EE._LEARNED_PATH)
+    monkeypatch.setattr(EE, "_WEIGHTS", store)
+    first = eng._decisions
+    assert eng._decisions is first
+    store.publish({"principle": {"Iteration": 2.0}})
+    assert eng._decisions is not first and eng._decisions.index is eng._mx
@@ -0,0 +1,44 @@
+import json
+
+import numpy as np
+
+from engine.adaptive.detect_mode_semantic import SemanticModeDetector, SEED_PATH
+
+
+def test_prototypes_score_highest_for_their_own_mode(tmp_path):
+    det = SemanticModeDetector(cache_dir=tmp_path)
+    seed = json.loads(SEED_PATH.read_text(encoding="utf-8"))
+    texts, labels = [], []
+    for m in seed["modes"]:
+        texts.extend(m["prototypes"])
+        labels.extend([m["id"]] * len(m["prototypes"]))
+
+    emb = det.embedding_scores(texts)
+    assert emb.shape == (len(texts), len(det.modes))
+    assert np.allclose(emb.sum(axis=1), 1.0, atol=1e-5)
+    predicted = [det.modes[j] for j in emb.argmax(axis=1)]
+    assert predicted == labels
+
+
+def test_centroid_store_is_cached_and_memory_mapped(tmp_path):
+    first = SemanticModeDetector(cache_dir=tmp_path)
+    assert first.store_path is not None and first.store_path.exists()
+    again = SemanticModeDetector(cache_dir=tmp_path)
+    assert isinstance(again.store, np.memmap)
+    text = "What evidence supports the claim, and what is the baseline?"
+    assert np.allclose(first.embedding_scores([text]), again.embedding_scores([text]))
+
+
+def test_fusion_uses_seed_weights_and_batch_matches_single(tmp_path):
+    det = SemanticModeDetector(cache_dir=tmp_path)
+    texts = ["What is the risk if this assumption is wrong?", "", "Let us brainstorm a prototype."]
+    batch = det.detect_batch(texts)
+    assert [r.scores for r in batch] == [det.detect(t).scores for t in texts]
+
+    w = det.fusion_weights
+    r = batch[0]
+    expect = {m: (w["rule"] * r.rule[m] + w["embedding"] * r.embedding[m]) / (w["rule"] + w["embedding"])
+              for m in det.modes}
+    assert all(abs(r.scores[m] - expect[m]) < 1e-6 for m in det.modes)
+    assert r.mode == "Critical"
+    assert len(r.top_k) == det.top_k_modes
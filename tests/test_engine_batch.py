@@ -0,0 +1,25 @@
+import types
+
+from src.elenx_engine import ElenxEngine
+from src.elenx_loader import load_packs
+
+TEXTS = [
+    "We need a test of the data before we commit.",
+    "My co-founder seems distant and the team feels the tension.",
+    "Let's brainstorm a new approach with a prototype.",
+    "Looking back, I regret how we handled the rollout.",
+] * 5
+
+
+def test_analyze_batch_keeps_input_order_across_workers():
+    eng = ElenxEngine(load_packs())
+    expected = [eng.analyze(t, empathy_on=False) for t in TEXTS]
+    assert eng.analyze_batch(TEXTS, empathy_on=False, workers=2, chunksize=3) == expected
+    assert eng.analyze_batch(TEXTS, empathy_on=False, workers=1) == expected
+
+
+def test_analyze_batch_stream_returns_generator():
+    eng = ElenxEngine(load_packs())
+    gen = eng.analyze_batch(iter(TEXTS), workers=2, stream=True)
+    assert isinstance(gen, types.GeneratorType)
+    assert [det.mode for det, _ in gen] == [eng.analyze(t)[0].mode for t in TEXTS]
@@ -0,0 +1,82 @@
+import random
+
+from src import elenx_engine as EE
+from src.cue_scanner import CueScanner
+from src.elenx_loader import load_packs
+from src.engine_session import EngineSession
+from src.text_features import IncrementalNormalizer, normalize_text
+
+
+def _assert_matches_analyze(eng, parts):
+    s = EngineSession(eng)
+    acc = ""
+    for p in parts:
+        acc += p
+        got = s.append(p)
+        want = eng.analyze(acc)
+        assert got[0] == want[0] and got[1] == want[1], repr(acc)
+        assert s.hits == eng.features(acc).hits, repr(acc)
+    assert s.text == acc and s.turns == len(parts)
+    return s
+
+
+def test_session_equals_analyze_on_concatenated_text():
+    eng = EE.ElenxEngine(load_packs())
+    _assert_matches_analyze(eng, ["My co", "‑founder and I ", "disagree on pricing. "])
+    _assert_matches_analyze(eng, ["I don't know what to  do", " next"])
+    _assert_matches_analyze(eng, ["Our team", "s are stuck; ", "the board wants it by Friday."])
+    # a combining mark renormalizes the previous turn's last character
+    _assert_matches_analyze(eng, ["Should we rethink the cafe", "́ idea?"])
+
+    s = _assert_matches_analyze(eng, ["What if we ", "paused hiring? Everyone is exhausted."])
+    assert s.tags == eng.analyze(s.text)[0].tags
+    assert set(s.mode_counts) == set(EE.LINGUISTIC_MODES)
+    s.reset()
+    assert s.text == "" and s.hits == frozenset()
+
+
+def test_session_random_splits():
+    eng = EE.ElenxEngine(load_packs())
+    words = ("what to do next step where to start team teams always never co‑founder "
+             "second-order what if trade-off bonus deadline rush regret idea é Σ").split()
+    rng = random.Random(3)
+    for _ in range(40):
+        full = "".join(rng.choice(words) + rng.choice([" ", "  ", "\n", "", ". ", "́"])
+                       for _ in range(rng.randint(1, 20)))
+        cuts = sorted(rng.sample(range(len(full) + 1), min(len(full) + 1, rng.randint(1, 6))))
+        _assert_matches_analyze(eng, [full[a:b] for a, b in zip([0] + cuts, cuts + [len(full)])])
+
+
+def test_extend_matches_equals_first_matches():
+    sc = CueScanner({"a": r"\bteam\b", "b": r"what\s*to\s*do", "c": r"(co[- ]?founder)"})
+    text = "my co founder asked what to   do with the team"
+    for cut in range(len(text) + 1):
+        prev = sc.first_matches(text[:cut])
+        assert sc.extend_matches(text, prev, cut) == sc.first_matches(text), cut
+
+
+def test_incremental_normalizer():
+    chars = list("ab Σ\n\t'é́‑’ 　") + ["­", "ᄀ", "ᅡ", "ΑΣ "]
+    rng = random.Random(5)
+    for _ in range(300):
+        n, acc = IncrementalNormalizer(), ""
+        for _ in range(rng.randint(1, 10)):
+            d = "".join(rng.choice(chars) for _ in range(rng.randint(0, 5)))
+            acc += d
+            assert n.append(d) == normalize_text(acc), repr(acc)
+
+
+def test_session_applies_the_input_cap_like_analyze():
+    eng = EE.ElenxEngine(load_packs())
+    eng.cfg["MAX_INPUT_CHARS"] = 120
+    parts = ["I keep going back and forth about the new role. ", "Everyone says take it, ",
+             "but I regret how the last move went and want to learn from that pattern. ",
+             "What if I just wait? " * 30]
+    s = _assert_matches_analyze(eng, parts)
+    det, _ = s.append("The data says otherwise.")
+    assert det.degraded and det.stages["input"] == "truncated"
+    assert (det, s.hits) == (eng.analyze(s.text)[0], eng.features(s.text).hits)
+    assert len(s.features.text) <= 120
+
+    # the cap cuts back to a word boundary inside text scanned by an earlier turn
+    _assert_matches_analyze(eng, ["x" * 100 + " word", "y" * 10, "zzzz more text here"])
@@ -0,0 +1,40 @@
+import json
+
+from engine.adaptive.fallacy_context_fusion import FallacyContextFusion
+from src import elenx_engine as EE
+from src.elenx_loader import DATA_DIR
+
+
+def _pack(name):
+    return json.loads((DATA_DIR / name).read_text(encoding="utf-8"))
+
+
+def test_builtin_rules_bind_to_pack_labels():
+    fusion = FallacyContextFusion.from_packs(_pack("fallacies.json"), _pack("context_drivers.json"))
+    tags = fusion.tag("Everyone says the bonus scheme is fine, but the deadline is brutal")
+    assert tags == {
+        "fallacies": ["Hasty Generalization"],
+        "contexts": ["Misaligned Incentives", "Time Pressure", "Overload"],
+    }
+    # rules whose labels are absent from the pack are not compiled at all
+    assert not any("stakeholder" in cid or "conflict" in cid for cid in fusion.cues)
+    assert fusion.tag("a quiet afternoon") == {"fallacies": [], "contexts": []}
+
+
+def test_item_cues_tag_in_the_same_pass_and_reach_the_engine():
+    drivers = [
+        {"id": "d1", "label": "Scope Creep", "definition": "x", "cues": ["Feature Request", "just one more"]},
+        {"id": "d2", "label": "Moral Hazard", "definition": "x"},
+    ] + [{"id": f"n{i}", "label": f"Noise {i}", "definition": "x", "cues": [f"noiseword{i}"]} for i in range(500)]
+    fallacies = [{"id": "bandwagon", "label": "Bandwagon", "definition": "popular", "cues": ["everybody does it"]}]
+
+    fusion = FallacyContextFusion.from_packs({"fallacies": fallacies}, {"drivers": drivers})
+    tags = fusion.tag("Everybody does it: just one more feature request, then ship")
+    assert tags == {"fallacies": ["Bandwagon"], "contexts": ["Scope Creep"]}
+    assert fusion.tag("featurerequest")["contexts"] == []  # word-bounded
+
+    eng = EE.ElenxEngine({"fallacies": {"fallacies": fallacies}, "context_drivers": {"drivers": drivers}})
+    det, _ = eng.analyze("Just one more sprint, everybody does it.")
+    assert det.tags["fallacies"] == ("Bandwagon",)
+    assert det.tags["contexts"] == ("Scope Creep",)
+    assert det.priors_used
@@ -0,0 +1,95 @@
+import copy
+import json
+import random
+
+import jsonschema
+import pytest
+
+from src.schema_codegen import FAST_SCHEMAS, UnsupportedSchema, generate_source, stale
+from src.schema_registry import SCHEMA_DIR, SchemaRegistry
+
+JTS = {"type": "position", "statement": "We ship the smaller scope first.", "confidence": 0.7,
+       "owner": "user", "acknowledged": True, "timestamp": "2026-01-01T00:00:00Z"}
+ODD_VALUES = (None, True, False, 0, -1, 1.5, 2, "", "x", "user", [], ["x"], [1, None], {}, {"k": 1})
+
+
+def _load(name):
+    return json.loads((SCHEMA_DIR / f"{name}.schema.json").read_text(encoding="utf-8-sig"))
+
+
+def _seeds(name):
+    schema = _load(name)
+    return schema.get("examples") or [JTS]
+
+
+def _slots(obj):
+    """Every (container, key) reachable from obj."""
+    items = obj.items() if isinstance(obj, dict) else enumerate(obj) if isinstance(obj, list) else ()
+    for k, v in items:
+        yield obj, k
+        yield from _slots(v)
+
+
+def _mutate(record, rng):
+    rec = copy.deepcopy(record)
+    for _ in range(rng.randint(1, 3)):
+        slots = list(_slots(rec))
+        if not slots:
+            break
+        parent, key = rng.choice(slots)
+        op = rng.random()
+        if op < 0.2 and isinstance(parent, dict):
+            del parent[key]
+        elif op < 0.3 and isinstance(parent, dict):
+            parent[rng.choice(["extra", "zz", "0"])] = rng.choice(ODD_VALUES)
+        elif op < 0.4 and isinstance(parent[key], str):
+            parent[key] = parent[key][: rng.randint(0, 3)] or "x" * rng.choice([0, 501, 2000])
+        else:
+            parent[key] = copy.deepcopy(rng.choice(ODD_VALUES))
+    return rec
+
+
+def _fields(err):
+    return (err.message, tuple(err.path), tuple(err.schema_path), err.validator, err.validator_value, err.instance)
+
+
+def test_generated_modules_are_current():
+    assert stale() == []
+
+
+@pytest.mark.parametrize("name", FAST_SCHEMAS)
+def test_errors_match_draft7_on_fuzzed_records(name):
+    ref = jsonschema.Draft7Validator(_load(name))
+    fast = SchemaRegistry().checker(name)
+    assert fast.__name__.startswith("fast_validators.")
+
+    rng = random.Random(20260)
+    cases = list(_seeds(name)) + [None, [], "x", {}]
+    cases += [_mutate(rng.choice(_seeds(name)), rng) for _ in range(1500)]
+    failing = 0
+    for rec in cases:
+        expected = [_fields(e) for e in ref.iter_errors(rec)]
+        assert [_fields(e) for e in fast.iter_errors(rec)] == expected, rec
+        assert fast.is_valid(rec) == (not expected)
+        failing += bool(expected)
+    assert failing > len(cases) // 2
+
+
+def test_registry_uses_fast_module_only_for_matching_schema():
+    schema = _load("judgment_terminal_state")
+    reg = SchemaRegistry()
+    assert reg.checker(schema) is reg.checker("judgment_terminal_state")
+    reg.validate(JTS, "judgment_terminal_state")
+    with pytest.raises(jsonschema.ValidationError):
+        reg.validate(dict(JTS, confidence=2), "judgment_terminal_state")
+
+    schema = copy.deepcopy(schema)
+    schema["properties"]["confidence"]["maximum"] = 2
+    assert reg.checker(schema) is reg.for_schema(schema)  # edited schema: no generated module
+    slow = SchemaRegistry(use_fast=False)
+    assert slow.checker("judgment_terminal_state") is slow.validator("judgment_terminal_state")
+
+
+def test_unsupported_keywords_are_refused():
+    with pytest.raises(UnsupportedSchema):
+        generate_source({"type": "object", "patternProperties": {"^x": {}}})
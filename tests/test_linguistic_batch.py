@@ -0,0 +1,36 @@
+import numpy as np
+
+from src import elenx_engine as EE
+from src.elenx_loader import load_packs
+from src.weights_store import WeightsStore
+
+TEXTS = [
+    "",
+    "We need a test to validate the data and the model assumptions.",
+    "What if we brainstorm a novel prototype idea?",
+    "Looking back, the lesson I learned was about patterns and regret.",
+    "My coach says feedback and a daily routine help me improve.",
+    "The incentive bias creates pressure and conflict; a real risk.",
+    "weather",
+]
+
+
+def _scalar_rows(eng):
+    rows = [eng._score_linguistic_mode(t) for t in TEXTS]
+    return np.array([[r.get(m, 0.0) for m in EE.LINGUISTIC_MODES] for r in rows])
+
+
+def test_batch_scores_match_per_text_scorer(monkeypatch):
+    store = WeightsStore(EE._LEARNED_PATH)
+    monkeypatch.setattr(EE, "_WEIGHTS", store)
+    store.publish({"mode": {"Critical": 1.7, "Growth": 0.4}})
+    eng = EE.ElenxEngine(load_packs())
+
+    out = eng.score_linguistic_batch(TEXTS)
+    assert out.shape == (len(TEXTS), len(EE.LINGUISTIC_MODES))
+    assert np.allclose(out, _scalar_rows(eng), rtol=0, atol=1e-12)
+    assert not out[0].any() and not out[-1].any()
+
+    eng.cfg["LINGUISTIC_MIN_MATCHES"] = 2
+    assert np.allclose(eng.score_linguistic_batch(TEXTS), _scalar_rows(eng), rtol=0, atol=1e-12)
+    assert eng.score_linguistic_batch([]).shape == (0, len(EE.LINGUISTIC_MODES))
@@ -0,0 +1,40 @@
+from src import elenx_engine as EE
+from src.matrix_index import MatrixIndex
+from src.weights_store import WeightsStore
+
+MATRIX = {
+    "$schema": "x",
+    "Analytical": {"Evidence & Validation": "q-ev", "Assumption": "q-as"},
+    "Critical": {"Assumption": "q-cas", "Stakeholder": "q-st"},
+}
+
+
+def test_index_ranks_principles_by_weight_and_resolves_forgiving_lookups():
+    weights = {"Assumption": 2.0}
+    idx = MatrixIndex.build(
+        MATRIX,
+        preferred_modes=["Critical", "Analytical"],
+        principle_weight=lambda p: weights.get(p, 1.0),
+    )
+    assert idx.modes == ("Analytical", "Critical")
+    assert idx.ranked["Analytical"] == ("Assumption", "Evidence & Validation")
+    assert (idx.first_mode, idx.first_principle) == ("Critical", "Assumption")
+
+    assert idx.question("Analytical", "evidence and validation") == "q-ev"
+    assert idx.question("Critical", "Stakeholders") == "q-st"  # partial within mode
+    assert idx.pick("crit", "stake", ("Analytical", "Assumption")) == ("Critical", "Stakeholder")
+
+
+def test_engine_rebuilds_index_only_when_weights_or_matrix_swap(monkeypatch):
+    eng = EE.ElenxEngine({"matrix": MATRIX})
+    first = eng._mx
+    assert eng._mx is first
+
+    store = WeightsStore(EE._LEARNED_PATH)
+    monkeypatch.setattr(EE, "_WEIGHTS", store)
+    store.publish({"principle": {"Stakeholder": 5.0}})
+    assert eng._mx is not first
+    assert eng._pick_from_matrix("Critical", None) == ("Critical", "Stakeholder")
+
+    eng._matrix_raw = {"Growth": {"Iteration": "q-it"}}
+    assert eng._get_matrix_question("Growth", "Iteration") == "q-it"
@@ -0,0 +1,83 @@
+import pytest
+
+from src import elenx_engine as EE
+from src.elenx_loader import load_packs
+from src.near_dup import MinHasher, NearDupIndex
+from src.text_features import normalize_text
+from src.weights_store import WeightsStore
+
+BASE = "My co-founder and I disagree on pricing; the board wants an answer by Friday."
+RETRY = "My cofounder and I disagree on pricing, the board wants an answer by Friday!"
+OTHER = "We are hiring a new engineer and the team is split on how senior they should be."
+
+
+def test_signatures_estimate_jaccard():
+    h = MinHasher()
+    a, b, c = (h.signature(normalize_text(t)) for t in (BASE, RETRY, OTHER))
+    assert MinHasher.similarity(a, a) == 1.0
+    assert MinHasher.similarity(a, b) > 0.6 > MinHasher.similarity(a, c)
+    assert h.signature("ok").shape == (h.num_perm,)
+    with pytest.raises(ValueError):
+        NearDupIndex(num_perm=64, bands=10)
+
+
+def test_engine_reuses_near_duplicates_and_counts_them():
+    near = NearDupIndex(maxsize=8, threshold=0.6)
+    eng = EE.ElenxEngine(load_packs(), near_dup=near)
+    eng.analyze(BASE)
+    reused, reused_qs = eng.analyze(RETRY)
+    assert (reused, reused_qs) == EE.ElenxEngine(load_packs()).analyze(BASE)
+    assert eng.analyze(RETRY, empathy_on=False)[0].empathy_on is False  # other scope: no reuse
+    eng.analyze(OTHER)
+    stats = near.stats()
+    assert (stats["reuses"], stats["misses"], stats["size"]) == (1, 3, 3)
+    assert stats["reuse_rate"] == 0.25
+
+    eng.analyze("Short text.")  # under min_chars: not indexed
+    assert near.stats()["lookups"] == 4
+
+
+def test_weights_reload_changes_scope(monkeypatch):
+    store = WeightsStore(EE._LEARNED_PATH)
+    monkeypatch.setattr(EE, "_WEIGHTS", store)
+    near = NearDupIndex(threshold=0.6)
+    eng = EE.ElenxEngine(load_packs(), near_dup=near)
+    eng.analyze(BASE)
+    store.publish({"mode": {"Critical": 3.0}})
+    eng.analyze(RETRY)
+    assert near.stats()["reuses"] == 0
+
+
+@pytest.mark.parametrize("eviction, survivor", [("lru", "a"), ("fifo", "b")])
+def test_bounded_index_eviction_policies(eviction, survivor):
+    near = NearDupIndex(maxsize=2, threshold=0.9, eviction=eviction, min_chars=1)
+    texts = {k: f"{k * 3} the same old dilemma about hiring, pricing and timing {k * 3}" for k in "abc"}
+    sigs = {k: near.signature(t) for k, t in texts.items()}
+    near.add(sigs["a"], "A")
+    near.add(sigs["b"], "B")
+    assert near.lookup(sigs["a"]) == "A"  # refreshes "a" under lru only
+    near.add(sigs["c"], "C")
+    assert len(near) == 2 and near.stats()["evictions"] == 1
+    assert near.lookup(sigs[survivor]) == survivor.upper()
+    assert not near._buckets.keys() - {k for e in near._entries.values() for k in e[2]}
+
+
+def test_truncated_inputs_do_not_leak_degraded_into_reuse():
+    near = NearDupIndex(maxsize=8, threshold=0.6)
+    eng = EE.ElenxEngine(load_packs(), near_dup=near)
+    eng.cfg["MAX_INPUT_CHARS"] = len(BASE) + 5
+    long_text = BASE + " " + BASE
+
+    det, _ = eng.analyze(long_text)  # truncated, still indexed
+    assert det.degraded and det.stages["input"] == "truncated"
+    det, _ = eng.analyze(RETRY)  # fits the limit: a clean result
+    assert near.stats()["reuses"] == 1
+    assert det.degraded is False and det.stages is None
+
+    near = NearDupIndex(maxsize=8, threshold=0.6)
+    eng = EE.ElenxEngine(load_packs(), near_dup=near)
+    eng.cfg["MAX_INPUT_CHARS"] = len(BASE) + 5
+    assert eng.analyze(RETRY)[0].degraded is False
+    det, _ = eng.analyze(long_text)
+    assert near.stats()["reuses"] == 1
+    assert det.degraded is True and det.stages == {"input": "truncated", **dict.fromkeys(EE.STAGES, "ok")}
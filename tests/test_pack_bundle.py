@@ -0,0 +1,41 @@
+import json
+import os
+import shutil
+
+from src import elenx_loader
+
+
+def _tmp_packs(tmp_path, monkeypatch):
+    for name in elenx_loader.FILES:
+        shutil.copy(elenx_loader.DATA_DIR / elenx_loader.FILES[name][0], tmp_path)
+    monkeypatch.setattr(elenx_loader, "DATA_DIR", tmp_path)
+    return tmp_path / "packs.bundle"
+
+
+def test_fast_load_matches_full_load_and_survives_touch(tmp_path, monkeypatch):
+    bundle = _tmp_packs(tmp_path, monkeypatch)
+    elenx_loader.compile_packs(bundle)
+
+    fast = elenx_loader._load_bundle(bundle)
+    assert fast is not None
+    assert fast == elenx_loader.load_packs()
+
+    # mtime change without a content change keeps the bundle (hash check)
+    st = os.stat(tmp_path / "voices.json")
+    os.utime(tmp_path / "voices.json", ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    assert elenx_loader._load_bundle(bundle) == fast
+
+
+def test_stale_or_missing_bundle_falls_back_to_full_load(tmp_path, monkeypatch):
+    bundle = _tmp_packs(tmp_path, monkeypatch)
+    assert elenx_loader.load_packs(fast=True, bundle=bundle) == elenx_loader.load_packs()
+
+    elenx_loader.compile_packs(bundle)
+    path = tmp_path / "matrix.json"
+    data = json.loads(path.read_text(encoding="utf-8"))
+    data["Analytical"]["Evidence & Validation"] = "What would change your mind?"
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+
+    assert elenx_loader._load_bundle(bundle) is None
+    packs = elenx_loader.load_packs(fast=True, bundle=bundle)
+    assert packs["matrix"][0]["Analytical"]["Evidence & Validation"] == "What would change your mind?"
@@ -0,0 +1,37 @@
+import json
+import shutil
+
+from src import elenx_loader
+from src.elenx_engine import ElenxEngine
+
+
+def test_question_table_prerenders_every_matrix_cell():
+    eng = ElenxEngine(elenx_loader.load_packs())
+    table = eng._question_table()
+    mx = eng._mx
+    assert len(table) == 4 * sum(len(mx.principles[m]) for m in mx.modes)
+
+    det, qs = eng.analyze("We need a test to validate the data.")
+    qs.append("mutated by caller")
+    assert eng.analyze("We need a test to validate the data.")[1] == qs[:-1]
+    assert eng._question_table() is table
+
+
+def test_refresh_packs_rebuilds_table_when_matrix_file_changes(tmp_path, monkeypatch):
+    for name in elenx_loader.FILES:
+        shutil.copy(elenx_loader.DATA_DIR / elenx_loader.FILES[name][0], tmp_path)
+    monkeypatch.setattr(elenx_loader, "DATA_DIR", tmp_path)
+
+    eng = ElenxEngine(elenx_loader.load_packs())
+    assert eng.refresh_packs() is False
+    table = eng._question_table()
+
+    path = tmp_path / "matrix.json"
+    data = json.loads(path.read_text(encoding="utf-8"))
+    data["Analytical"]["Evidence & Validation"] = "What single observation would change your mind here?"
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+
+    assert eng.refresh_packs() is True
+    assert eng._question_table() is not table
+    _, qs = eng.analyze("We need a test to validate the data.")
+    assert any("What single observation would change your mind here?" in q for q in qs)
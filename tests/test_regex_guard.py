@@ -0,0 +1,61 @@
+import re
+
+import pytest
+
+import src.T1_elenx_engine_blueprint as T1
+from src import elenx_engine as EE
+from src.elenx_loader import load_packs
+from src.regex_fuzz import fuzz_pattern, growth_exponent, pathological_inputs, pattern_words
+from src.scan_guard import ScanGuard, cap_text
+
+SIZES = (1000, 8000)
+
+
+def test_inputs_and_exponent_fit():
+    inputs = pathological_inputs(500, pattern_words(r"\beither\b.*\bor\b"))
+    assert {"repeat_char", "huge_paste", "unicode", "word:either", "near:or"} <= inputs.keys()
+    assert all(len(t) == 500 for t in inputs.values())
+    assert growth_exponent([1000, 2000, 4000], [1.0, 2.0, 4.0]) == pytest.approx(1.0)
+    assert growth_exponent([1000, 2000, 4000], [1.0, 4.0, 16.0]) == pytest.approx(2.0)
+
+
+def test_fuzz_flags_backtracking_and_passes_engine_and_blueprint_cues():
+    rep = fuzz_pattern("either-or", re.compile(r"\beither\b.*\bor\b", re.I), sizes=SIZES, reps=3)
+    assert rep.superlinear and rep.worst_family == "word:either"
+
+    targets = dict(T1.PriorScanner({}, {}).fallacy_patterns)
+    scanner = EE.ElenxEngine(load_packs())._scanner
+    targets["scanner"] = scanner.scan
+    for name, target in targets.items():
+        words = pattern_words(" ".join(p.pattern for p in scanner._compiled.values())) if name == "scanner" else None
+        rep = fuzz_pattern(name, target, sizes=SIZES, reps=3, words=words)
+        assert not rep.superlinear, rep
+        assert rep.p99_us > 0
+
+
+def test_scan_guard_caps_each_stage():
+    text = "word " * 100  # 500 chars
+    assert cap_text(text, 0) is text and cap_text(text, 1000) is text
+    assert cap_text(text, 23) == "word word word word"
+
+    guard = ScanGuard({"priors": 50, "empathy": 0}, default=200)
+    assert len(guard.cap("priors", text)) <= 50
+    assert len(guard.cap("mode", text)) <= 200
+    assert guard.cap("empathy", text) is text
+    assert guard.capped == {"priors": 1, "mode": 1}
+
+
+def test_blueprint_stages_only_see_their_cap():
+    text = "Let us plan the launch. " * 10 + "I feel worried about it."  # empathy cue after char 240
+    eng = T1.ElenxEngine(T1.DataLoader(), guard=ScanGuard({"empathy": 100}, default=0))
+    assert not any(q.empathy for q in eng.generate(text, n=1))
+    assert T1.ElenxEngine(T1.DataLoader()).generate(text, n=1)[0].empathy
+
+
+def test_engine_features_are_capped_like_analyze():
+    eng = EE.ElenxEngine(load_packs())
+    eng.cfg["MAX_INPUT_CHARS"] = 100
+    text = "plain words " * 20 + "our board and investor"
+    assert not eng.features(text).hits & {"prior:stakeholder", "rule:critical"}
+    eng.cfg["MAX_INPUT_CHARS"] = 0
+    assert "prior:stakeholder" in eng.features(text).hits
@@ -0,0 +1,79 @@
+import dataclasses
+
+import pytest
+
+from src import elenx_engine as EE
+from src.elenx_loader import load_packs
+from src.result_cache import ResultCache
+from src.weights_store import WeightsStore
+
+
+def test_cache_returns_equal_copies_and_counts_hits():
+    cache = ResultCache(maxsize=8)
+    eng = EE.ElenxEngine(load_packs(), result_cache=cache)
+    plain = EE.ElenxEngine(load_packs())
+    text = "Our board keeps pushing the sales team on quota; always the same risk."
+
+    det, qs = eng.analyze(text)
+    assert (det, qs) == plain.analyze(text)
+    with pytest.raises(TypeError):
+        det.tags["contexts"] = ("mutated",)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        det.mode = "mutated"
+    qs.append("mutated")
+
+    det2, qs2 = eng.analyze("  " + text.upper() + " ")
+    assert (det2, qs2) == plain.analyze(text)
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+    eng.analyze(text, empathy_on=False)
+    assert cache.stats()["misses"] == 2
+
+
+def test_weights_reload_invalidates_and_lru_evicts(monkeypatch):
+    store = WeightsStore(EE._LEARNED_PATH)
+    monkeypatch.setattr(EE, "_WEIGHTS", store)
+    cache = ResultCache(maxsize=2)
+    eng = EE.ElenxEngine(load_packs(), result_cache=cache)
+
+    eng.analyze("a")
+    store.publish({"mode": {"Critical": 3.0}})
+    eng.analyze("a")
+    assert cache.stats()["hits"] == 0
+
+    eng.analyze("b")
+    assert cache.stats()["evictions"] == 1
+    assert len(cache) == 2
+
+
+def test_ttl_expiry(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("src.result_cache.time.monotonic", lambda: now[0])
+    cache = ResultCache(maxsize=4, ttl_s=10)
+    cache.put("k", 1)
+    assert cache.get("k") == 1
+    now[0] += 11
+    assert cache.get("k") is None
+    assert cache.stats()["expirations"] == 1
+
+
+def test_degraded_comes_from_the_request_not_the_stored_result():
+    eng = EE.ElenxEngine(load_packs(), result_cache=ResultCache(maxsize=8))
+    eng.cfg["MAX_INPUT_CHARS"] = 100
+    long_text = "My co-founder and I disagree on pricing and the board wants an answer. " * 4
+    capped = EE.cap_text(long_text, 100)
+
+    # truncated run stored first, then the same text arrives within the limit
+    det, _ = eng.analyze(long_text)
+    assert det.degraded and det.stages["input"] == "truncated"
+    det, _ = eng.analyze(capped)
+    assert eng.result_cache.stats()["hits"] == 1
+    assert det.degraded is False and det.stages is None
+
+    # and the other way round
+    eng = EE.ElenxEngine(load_packs(), result_cache=ResultCache(maxsize=8))
+    eng.cfg["MAX_INPUT_CHARS"] = 100
+    assert eng.analyze(capped)[0].degraded is False
+    det, _ = eng.analyze(long_text)
+    assert eng.result_cache.stats()["hits"] == 1
+    assert det.degraded is True and det.stages == {"input": "truncated", **dict.fromkeys(EE.STAGES, "ok")}
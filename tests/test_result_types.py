@@ -0,0 +1,46 @@
+import dataclasses
+import json
+import pickle
+
+import pytest
+
+from src import elenx_engine as EE
+from src.elenx_loader import load_packs
+from src.question_renderer import render_question_pack, slug_ids
+from src.result_types import Tags
+
+
+def test_tags_are_read_only_tuples_that_pickle_and_serialize():
+    tags = Tags({"fallacies": ["Bandwagon"], "contexts": []})
+    assert tags == {"fallacies": ("Bandwagon",), "contexts": ()}
+    assert Tags.of(tags) is tags
+    for mutate in (lambda: tags.__setitem__("x", ()), lambda: tags.update(x=()), tags.clear,
+                   lambda: tags.setdefault("x", ()), lambda: tags.pop("contexts")):
+        with pytest.raises(TypeError):
+            mutate()
+    clone = pickle.loads(pickle.dumps(tags))
+    assert clone == tags and isinstance(clone, Tags)
+    assert json.loads(json.dumps(tags)) == {"fallacies": ["Bandwagon"], "contexts": []}
+
+
+def test_ui_payload_fast_to_dict_matches_the_old_shape():
+    eng = EE.ElenxEngine(load_packs())
+    det, qs = eng.analyze("Everyone on the team is chasing the quarterly bonus; is that a risk?")
+    pack = render_question_pack(mode_label=det.mode, principle_label=det.principle, questions=qs,
+                                confidence=det.confidence, empathy_on=det.empathy_on, tags=det.tags)
+    d = pack.to_dict()
+    mode_id, principle_id = slug_ids(det.mode, det.principle)
+    assert slug_ids(det.mode, det.principle) is slug_ids(det.mode, det.principle)
+    assert (d["mode_id"], d["principle_id"]) == (mode_id, principle_id)
+    assert d["id"].startswith("qpack-") and len(d["id"]) == len("qpack-") + 12
+    assert d["questions"] == [{"id": f"q-{mode_id}-{principle_id}-{i}", "text": q.strip(), "order": i}
+                              for i, q in enumerate(qs, 1)]
+    assert d["tags"]["contexts"] is det.tags["contexts"]  # shared, not deep-copied
+    assert json.loads(pack.to_json()) == json.loads(json.dumps(d))
+
+    empty = render_question_pack(mode_label="A", principle_label="B", questions=[], confidence=0.5,
+                                 empathy_on=False, tags={})
+    assert empty.to_dict()["tags"] == {"fallacies": (), "contexts": ()}
+    assert not hasattr(empty, "__dict__")  # slotted
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        empty.confidence = 1.0
@@ -0,0 +1,76 @@
+import json
+from pathlib import Path
+
+import jsonschema
+import pytest
+
+from src.governance.action_gating import ActionGatingPolicy
+from src.schema_registry import REGISTRY, SCHEMA_DIR, SchemaRegistry, iter_errors_many, validate
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _load(path: Path):
+    with path.open("r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_one_compiled_validator_per_schema():
+    reg = SchemaRegistry()
+    v = reg.validator("clarity_gain_record")
+    assert reg.validator("clarity_gain_record.schema.json") is v
+    assert reg.validator(SCHEMA_DIR / "clarity_gain_record.schema.json") is v
+    schema = reg.schema("clarity_gain_record")
+    assert reg.for_schema(schema) is v  # same content hash
+    assert reg.for_schema(json.loads(json.dumps(schema))) is v
+    assert reg.stats()["compiles"] == 1
+
+
+def test_validate_matches_jsonschema_validate():
+    policy = _load(ROOT / "data" / "policy" / "stage14_action_gating_table.v1.json")
+    schema_path = SCHEMA_DIR / "action_gating_table.schema.json"
+    validate(policy, schema_path)
+
+    policy["rows"][0]["action"] = "EXPLODE"
+    with pytest.raises(jsonschema.ValidationError) as ours:
+        validate(policy, schema_path)
+    with pytest.raises(jsonschema.ValidationError) as ref:
+        jsonschema.validate(instance=policy, schema=_load(schema_path))
+    assert ours.value.message == ref.value.message
+    assert list(ours.value.path) == list(ref.value.path)
+
+    # policies built repeatedly share the compiled schema
+    ActionGatingPolicy()
+    before = REGISTRY.stats()["compiles"]
+    ActionGatingPolicy()
+    assert REGISTRY.stats()["compiles"] == before
+
+
+def test_iter_errors_many_reports_indices():
+    records = [{"session_id": "a"}, {"session_id": 1}, {"bogus": True}, {}]
+    bad = sorted({i for i, _ in iter_errors_many(records, "clarity_gain_record")})
+    v = jsonschema.Draft7Validator(_load(SCHEMA_DIR / "clarity_gain_record.schema.json"))
+    assert bad == [i for i, r in enumerate(records) if list(v.iter_errors(r))]
+    assert 1 in bad and 2 in bad
+
+
+def test_refs_resolve_across_files_and_refresh(tmp_path):
+    (tmp_path / "item.schema.json").write_text(json.dumps(
+        {"$id": "https://example.test/item.schema.json", "type": "object", "required": ["id"],
+         "properties": {"id": {"type": "integer"}}}), encoding="utf-8")
+    (tmp_path / "list.schema.json").write_text(json.dumps(
+        {"type": "array", "items": {"$ref": "https://example.test/item.schema.json"}}), encoding="utf-8")
+    (tmp_path / "by_name.schema.json").write_text(json.dumps(
+        {"type": "array", "items": {"$ref": "item.schema.json"}}), encoding="utf-8")
+
+    reg = SchemaRegistry(tmp_path)
+    for sid in ("list", "by_name"):
+        reg.validate([{"id": 1}], sid)
+        with pytest.raises(jsonschema.ValidationError):
+            reg.validate([{"id": "x"}], sid)
+
+    assert reg.refresh() == 0
+    (tmp_path / "list.schema.json").write_text(json.dumps({"type": "array", "maxItems": 0}), encoding="utf-8")
+    assert reg.refresh() == 1
+    with pytest.raises(jsonschema.ValidationError):
+        reg.validate([{"id": 1}], "list")
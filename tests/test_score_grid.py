@@ -0,0 +1,88 @@
+import dataclasses
+import json
+import pickle
+import random
+
+import pytest
+
+from src import elenx_engine as EE
+from src.elenx_loader import load_packs
+from src.question_renderer import render_question_pack
+from src.score_grid import seed_defaults
+from src.weights_store import WeightsStore
+
+
+def test_distribution_covers_every_cell_and_ranks_the_pick_first():
+    eng = EE.ElenxEngine(load_packs())
+    det, _ = eng.analyze("My co-founder and I are unsure what to do next; should we test the pricing idea?")
+    sc = det.scores
+    mx = eng._mx
+    assert len(sc.values) == sum(len(mx.principles[m]) for m in mx.modes)
+    assert sum(sc.values) == pytest.approx(1.0)
+
+    top = sc.top_k(3)
+    assert top[0][:2] == (det.mode, det.principle)
+    assert len(top) == 3 and len({t[:2] for t in top}) == 3
+    assert top[1][2] >= top[2][2]
+    assert sc.as_dict()[(top[1][0], top[1][1])] == top[1][2]
+    assert len(sc.top_k()) == seed_defaults()[0]
+    assert sc.top_modes(1)[0][0] == det.mode
+    assert isinstance(sc.mixed(), bool) and sc.mixed(margin=1.0)
+
+
+def test_cues_move_mass_and_results_survive_pickling_and_cache_copies():
+    eng = EE.ElenxEngine(load_packs())
+    plain = eng.analyze("Tell me about lunch.")[0].scores
+    creative = eng.analyze("Let's brainstorm a new approach and prototype the idea.")[0].scores
+    cell = ("Creative", "Exploration")
+    assert creative.as_dict()[cell] > plain.as_dict()[cell]
+
+    det = eng.analyze("The board is worried about compliance risk.")[0]
+    clone = pickle.loads(pickle.dumps(det))
+    assert clone == det and clone.scores.top_k(3) == det.scores.top_k(3)
+    assert dataclasses.replace(det, stages={}).scores is det.scores
+
+    degraded, _ = eng.analyze("The board is worried.", deadline_ms=0)
+    assert degraded.scores is None
+
+
+def test_learned_principle_weights_reorder_the_runner_up(monkeypatch):
+    store = WeightsStore(EE._LEARNED_PATH)
+    monkeypatch.setattr(EE, "_WEIGHTS", store)
+    eng = EE.ElenxEngine(load_packs())
+    text = "Hello there."
+    runner_up = eng.analyze(text)[0].scores.top_k(2)[1]
+
+    store.publish({"principle": {runner_up[1]: 0.01}})
+    assert eng.analyze(text)[0].scores.top_k(2)[1][:2] != runner_up[:2]
+
+
+def test_pick_is_the_argmax_and_top_k_never_increases():
+    eng = EE.ElenxEngine(load_packs())
+    words = ("data lesson risk evidence regret brainstorm idea stakeholder board compliance "
+             "assume test pricing incentive bonus decide option learned improve why").split()
+    rng = random.Random(7)
+    for _ in range(300):
+        det, _ = eng.analyze(" ".join(rng.sample(words, rng.randint(1, 5))))
+        top = det.scores.top_k(4)
+        assert top[0][:2] == (det.mode, det.principle)
+        assert all(a[2] >= b[2] for a, b in zip(top, top[1:]))
+        assert det.runner_up == top[1]
+        assert det.scores.mixed() == (top[0][2] - top[1][2] < seed_defaults()[1])
+        assert det.scores.top_modes(1)[0][1] == max(s for _, s in det.scores.top_modes(99))
+
+
+def test_runner_up_reaches_the_ui_payload():
+    eng = EE.ElenxEngine(load_packs())
+    det, qs = eng.analyze("data lesson risk")
+    pack = render_question_pack(mode_label=det.mode, principle_label=det.principle, questions=qs,
+                                confidence=det.confidence, empathy_on=det.empathy_on, tags=det.tags,
+                                runner_up=det.runner_up)
+    ru = json.loads(pack.to_json())["runner_up"]
+    assert (ru["mode_label"], ru["principle_label"]) == det.runner_up[:2]
+    assert ru["score"] <= det.scores.top_k(1)[0][2]
+
+    degraded, _ = eng.analyze("data lesson risk", deadline_ms=0)
+    assert degraded.runner_up is None
+    assert render_question_pack(mode_label="A", principle_label="B", questions=[], confidence=0.5,
+                                empathy_on=False, tags={}).to_dict()["runner_up"] is None
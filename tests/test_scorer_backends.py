@@ -0,0 +1,142 @@
+import threading
+import time
+
+import pytest
+
+from src import elenx_engine as EE
+from src.elenx_loader import load_packs
+from src.result_cache import ResultCache
+from engine.adaptive.detect_mode_semantic import SemanticModeDetector
+from engine.adaptive.scorer_backends import (
+    REGISTRY,
+    FusedModeScorer,
+    LLMBackend,
+    LocalLLMServer,
+    ScorerBackend,
+    ScorerRegistry,
+)
+
+TEXT = "What is the risk if this assumption is wrong?"
+
+
+class _Sleepy(ScorerBackend):
+    def __init__(self, name, delay, mode, timeout_s=1.0):
+        self.name = name
+        super().__init__(timeout_s)
+        self.delay, self.mode = delay, mode
+
+    def score(self, text):
+        time.sleep(self.delay)
+        return {self.mode: 1.0}
+
+
+class _Stuck(ScorerBackend):
+    name = "llm"
+
+    def __init__(self, gate):
+        super().__init__(timeout_s=1.0)
+        self.gate, self.calls = gate, 0
+
+    def score(self, text):
+        self.calls += 1
+        self.gate.wait()
+        return {"Critical": 1.0}
+
+
+@pytest.fixture(scope="module")
+def detector(tmp_path_factory):
+    return SemanticModeDetector(cache_dir=tmp_path_factory.mktemp("semantic"))
+
+
+def test_all_backends_fuse_with_seed_weights(detector):
+    with FusedModeScorer.from_seed(detector) as scorer:
+        res = scorer.score(TEXT)
+        assert res.used == ("rule", "embedding", "llm") and not res.timed_out and not res.errors
+        assert res.weights_used == pytest.approx(detector.fusion_weights)
+        assert sum(res.scores.values()) == pytest.approx(1.0)
+        assert res.mode == "Critical" and len(res.top_k) == detector.top_k_modes
+        assert scorer.score(TEXT).scores == res.scores  # the local llm stand-in is deterministic
+
+
+def test_late_backend_is_dropped_and_weights_renormalized(detector):
+    slow = LLMBackend(LocalLLMServer.from_seed(detector.seed, latency_s=0.5), detector.modes, timeout_s=0.05)
+    registry = ScorerRegistry()
+    for name in ("rule", "embedding"):
+        registry.register(name, lambda det, n=name: REGISTRY.create(n, det))
+    registry.register("llm", lambda det: slow)
+    with FusedModeScorer.from_seed(detector, registry=registry) as scorer:
+        res = scorer.score(TEXT)
+    assert res.timed_out == ["llm"] and res.used == ("rule", "embedding")
+    assert res.elapsed_ms < 400
+    assert res.weights_used == pytest.approx({"rule": 0.4 / 0.7, "embedding": 0.3 / 0.7})
+    expect = detector.detect(TEXT).scores  # the detector fuses the same two components
+    assert res.scores == pytest.approx(expect, abs=1e-6)
+
+
+def test_backends_run_concurrently_under_a_deadline():
+    backends = [_Sleepy("a", 0.2, "X"), _Sleepy("b", 0.2, "Y"), _Sleepy("c", 1.0, "X")]
+    with FusedModeScorer(backends, ["X", "Y"], {"a": 1.0, "b": 3.0, "c": 1.0}) as scorer:
+        res = scorer.score("t", deadline_ms=600)
+    assert res.used == ("a", "b") and res.timed_out == ["c"]
+    assert res.elapsed_ms < 1000
+    assert res.scores == pytest.approx({"X": 0.25, "Y": 0.75})
+
+
+def test_failing_backend_and_registry_errors(detector):
+    broken = LLMBackend(LocalLLMServer.from_seed(detector.seed, fail=True), detector.modes)
+    with FusedModeScorer([broken], detector.modes, detector.fusion_weights) as scorer:
+        res = scorer.score(TEXT)
+    assert "llm" in res.errors and not res.used
+    assert res.scores == pytest.approx({m: 1 / len(detector.modes) for m in detector.modes})
+
+    with pytest.raises(ValueError):
+        REGISTRY.register("rule", lambda det: None)
+    with pytest.raises(KeyError):
+        REGISTRY.create("nope", detector)
+    with pytest.raises(ValueError):
+        FusedModeScorer([_Sleepy("a", 0, "X"), _Sleepy("a", 0, "X")], ["X"], {})
+
+
+def test_stuck_backend_only_starves_itself(detector):
+    gate = threading.Event()
+    stuck = _Stuck(gate)
+    registry = ScorerRegistry()
+    for name in ("rule", "embedding"):
+        registry.register(name, lambda det, n=name: REGISTRY.create(n, det))
+    registry.register("llm", lambda det: stuck)
+    try:
+        with FusedModeScorer.from_seed(detector, registry=registry, max_workers=2) as scorer:
+            results = [scorer.score(TEXT, deadline_ms=200) for _ in range(6)]
+    finally:
+        gate.set()
+    assert all(r.used == ("rule", "embedding") and r.timed_out == ["llm"] for r in results)
+    assert len({tuple(sorted(r.scores.items())) for r in results}) == 1
+    assert stuck.calls == 2  # once both llm workers hang, later requests skip it without queuing
+    assert all(r.elapsed_ms < 150 for r in results[2:])
+
+
+def test_backend_must_implement_score():
+    class Half(ScorerBackend):
+        name = "half"
+
+    with pytest.raises(TypeError):
+        Half()
+
+
+def test_engine_fusion_stage_runs_last_on_the_remaining_budget(detector):
+    slow = _Sleepy("llm", 1.0, "Creative")
+    with FusedModeScorer([REGISTRY.create("rule", detector), slow], detector.modes, detector.fusion_weights) as scorer:
+        eng = EE.ElenxEngine(load_packs(), result_cache=ResultCache(maxsize=8), fusion=scorer)
+        plain, plain_qs = EE.ElenxEngine(load_packs()).analyze(TEXT)
+        det, qs = eng.analyze(TEXT, deadline_ms=300)
+        assert (det.mode, det.principle, qs) == (plain.mode, plain.principle, plain_qs)
+        assert det.stages == {**dict.fromkeys(EE.STAGES, "ok"), EE.FUSION_STAGE: "ok"} and not det.degraded
+        assert det.fusion.used == ("rule",) and det.fusion.timed_out == ["llm"]
+        assert det.fusion.elapsed_ms < 600
+
+        again, _ = eng.analyze(TEXT)  # cached rule result, fresh fusion
+        assert again.fusion is not None and again.fusion is not det.fusion and again.stages is None
+
+        spent, _ = eng.analyze(TEXT, deadline_ms=0)
+        assert spent.fusion is None and spent.degraded and spent.stages[EE.FUSION_STAGE] == "skipped"
+    assert EE.ElenxEngine(load_packs()).analyze(TEXT)[0].fusion is None
@@ -0,0 +1,65 @@
+from src import elenx_engine as EE
+from src.elenx_loader import load_packs
+from src.engine_session import EngineSession
+from src.stemmer import StemLexicon, stem, stem_cache_info
+from src.text_features import normalize_text, tokenize
+
+
+def test_inflections_share_a_stem():
+    for forms in (
+        ("improve", "improving", "improved", "improvement", "improvements"),
+        ("regret", "regrets", "regretted", "regretting"),
+        ("imagine", "imagination", "imaginative"),
+        ("validate", "validated", "validation"),
+        ("bias", "biases"),
+        ("trade-off", "trade-offs"),
+    ):
+        assert len({stem(f) for f in forms}) == 1, forms
+    assert stem("team's") == stem("team")
+    assert stem("miss") == "miss" and stem("as") == "as"
+    assert stem_cache_info().maxsize > 0
+
+
+def test_stems_do_not_widen_cues_onto_other_words():
+    for word, cue in (
+        ("improvise", "improve"), ("improvised", "improve"), ("improvisation", "improvement"),
+        ("valid", "validate"), ("validity", "validation"),
+        ("learn", "learned"), ("learning", "learned"), ("learns", "learned"),
+    ):
+        assert stem(word) != stem(cue), (word, cue)
+
+    def cue_id(mode: str, term: str) -> str:
+        terms = [t.split("|")[0] for t in EE.LINGUISTIC_CUES[mode]]
+        return f"ling:{mode}:{terms.index(term)}"
+
+    hits = EE.scan_cues("I improvise a lot; the point is valid, and we keep learning.")
+    assert not hits & {cue_id("Growth", "improve"), cue_id("Analytical", "validate"), cue_id("Reflective", "learned")}
+
+
+def test_lexicon_matches_words_and_phrases_on_stems():
+    lex = StemLexicon({"imp": ["improve"], "so": ["second order", "second-order"], "wi": ["what if"]})
+    assert lex.max_n == 2
+    assert lex.match(tokenize("we keep improving; second order effects")) == {"imp", "so"}
+    assert lex.match(tokenize("what... if")) == {"wi"}
+    assert lex.match(tokenize("what was it, if anything")) == frozenset()
+    exact = StemLexicon({"imp": ["improve"]}, stemmer=None)
+    assert exact.match(tokenize("improving")) == frozenset()
+
+
+def test_engine_linguistic_cues_cover_word_forms():
+    hits = EE.scan_cues("Looking back, we regretted the improvements and kept contradicting ourselves.")
+    assert {"ling:Reflective:6", "ling:Reflective:0", "ling:Growth:6", "ling:Critical:5"} <= hits
+    assert "ling:Creative:5" not in EE.scan_cues("What did the team decide, if anything?")
+
+
+def test_session_stem_hits_match_full_analysis():
+    eng = EE.ElenxEngine(load_packs())
+    session = EngineSession(eng)
+    turns = ["We kept improv", "ing the pricing page. What ", "if we looked ", "back at the trade-", "offs?"]
+    for i, turn in enumerate(turns):
+        det, qs = session.append(turn)
+        full = "".join(turns[:i + 1])
+        assert session.hits == EE.scan_cues(full)
+        assert (det, qs) == eng.analyze(full)
+    assert {"ling:Growth:6", "ling:Creative:5", "ling:Reflective:6", "ling:Analytical:3"} <= session.hits
+    assert EE._LING_LEXICON.match(tokenize(normalize_text(session.text))) <= session.hits
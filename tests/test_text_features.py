@@ -0,0 +1,25 @@
+from src import elenx_engine as EE
+from src.elenx_loader import load_packs
+from src.text_features import TextFeatures, normalize_text
+
+
+def test_normalization_folds_typographic_hyphens_and_quotes():
+    assert normalize_text("  My Co‑Founder’s  call ") == "my co-founder's  call"
+    assert normalize_text("power‐user flow") == "power-user flow"
+    assert normalize_text("Plain ASCII") == "plain ascii"
+
+
+def test_features_tokens_and_engine_consume_them_once():
+    eng = EE.ElenxEngine(load_packs())
+    feats = eng.features("My co‑founder and I can’t agree on next steps.")
+    assert "rule:critical" in feats.hits  # co[- ]?founder after folding U+2011
+    assert feats.tokens[:3] == ("my", "co-founder", "and")
+
+    nb = eng.analyze("My co‑founder keeps missing our board prep.")
+    ascii_ = eng.analyze("My co-founder keeps missing our board prep.")
+    assert nb[0] == ascii_[0] and nb[1] == ascii_[1]
+    assert nb[0].mode == "Critical"
+
+    # stages accept prebuilt features instead of re-scanning
+    f = TextFeatures("regret", frozenset({"rule:reflective"}))
+    assert eng._detect_mode_principle("ignored", f)[0] == "Reflective"
@@ -0,0 +1,54 @@
+import json
+import os
+
+from src.weights_store import WeightsStore
+
+
+def _write(path, weights, notes=""):
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps({"spec": {"notes": notes}, "weights": weights}), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def test_store_publishes_new_snapshot_only_when_file_changes(tmp_path):
+    path = tmp_path / "learned_weights.json"
+    _write(path, {"mode": {"Critical": 1.2}})
+    store = WeightsStore(path, poll_s=0.05)
+    first = store.snapshot
+    assert first.weights["mode"]["Critical"] == 1.2
+
+    assert store.check() is False
+    assert store.snapshot is first
+
+    _write(path, {"mode": {"Critical": 1.5}}, notes="rewritten by update_weights")
+    assert store.check() is True
+    assert store.snapshot.version == first.version + 1
+    assert store.snapshot.weights["mode"]["Critical"] == 1.5
+    assert first.weights["mode"]["Critical"] == 1.2  # old snapshot untouched
+
+
+def test_store_keeps_last_good_snapshot_on_partial_write(tmp_path):
+    path = tmp_path / "learned_weights.json"
+    _write(path, {"empathy": {"bias": 0.1}})
+    store = WeightsStore(path)
+    good = store.snapshot
+
+    path.write_text('{"weights": {"empathy": ', encoding="utf-8")
+    assert store.check() is False
+    assert store.snapshot is good
+
+
+def test_watcher_thread_picks_up_changes(tmp_path):
+    path = tmp_path / "learned_weights.json"
+    _write(path, {"principle": {"Risk": 1.0}})
+    store = WeightsStore(path, poll_s=0.02)
+    store.start()
+    try:
+        _write(path, {"principle": {"Risk": 1.3}}, notes="next")
+        for _ in range(200):
+            if store.snapshot.weights["principle"]["Risk"] == 1.3:
+                break
+            store._stop.wait(0.02)
+        assert store.snapshot.weights["principle"]["Risk"] == 1.3
+    finally:
+        store.stop()